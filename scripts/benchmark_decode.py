@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark decoding of Polygon aggregates responses.
+
+Compares the original path (RESTClient model objects, then per-bar
+float/int/strftime conversions) with decode_aggregates, which reads the
+raw JSON straight into NumPy columns, and with the list of OHLCV dicts
+get_stock_aggregates builds from those columns.
+
+Usage:
+    python scripts/benchmark_decode.py                 # Default sizes
+    python scripts/benchmark_decode.py 1000 50000      # Custom sizes
+    python scripts/benchmark_decode.py --json          # Machine-readable output
+"""
+
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from polygon.rest.models import Agg
+
+# Make the package importable without installation
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from stockagent.data.bars import columns_to_bars, decode_aggregates  # noqa: E402
+from stockagent.utils.synthetic import generate_bar_columns  # noqa: E402
+
+DEFAULT_SIZES = [250, 5_000, 50_000]
+
+
+def _payload(size: int) -> bytes:
+    """A raw aggregates response body with ``size`` daily bars."""
+    columns = generate_bar_columns(size, seed=42)
+    # Polygon stamps daily bars at midnight US/Eastern
+    timestamps = columns["timestamp"].astype(np.int64) + 5 * 3600 * 1000
+    results = [
+        {"v": float(v), "vw": c, "o": o, "c": c, "h": h, "l": lo, "t": t, "n": 1000}
+        for o, h, lo, c, v, t in zip(
+            columns["open"].tolist(),
+            columns["high"].tolist(),
+            columns["low"].tolist(),
+            columns["close"].tolist(),
+            columns["volume"].tolist(),
+            timestamps.tolist(),
+        )
+    ]
+    return json.dumps({"ticker": "AAPL", "resultsCount": size, "results": results, "status": "OK"}).encode()
+
+
+def _baseline_decode(payload: bytes) -> list[dict]:
+    """Original path: RESTClient model objects, then per-bar conversions."""
+    aggs = [Agg.from_dict(result) for result in json.loads(payload)["results"]]
+    return [
+        {
+            "open": float(agg.open),
+            "high": float(agg.high),
+            "low": float(agg.low),
+            "close": float(agg.close),
+            "volume": int(agg.volume),
+            "timestamp": datetime.fromtimestamp(agg.timestamp / 1000).strftime("%Y-%m-%d"),
+        }
+        for agg in aggs
+    ]
+
+
+def _decode_bars(payload: bytes) -> list[dict]:
+    """get_stock_aggregates path: columns, then OHLCV dicts."""
+    columns, _ = decode_aggregates(payload)
+    columns["timestamp"] = columns["timestamp"].astype("datetime64[D]").astype("datetime64[ms]")
+    return columns_to_bars(columns)
+
+
+def _without_dates(bars: list[dict]) -> list[dict]:
+    return [{key: value for key, value in bar.items() if key != "timestamp"} for bar in bars]
+
+
+def _time(func, *args, repeat: int = 5) -> float:
+    """Best-of-N wall time in milliseconds."""
+    func(*args)  # Warm up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(sizes: list[int]) -> list[dict]:
+    """Run all decode benchmarks.
+
+    Args:
+        sizes: Bars per response
+
+    Returns:
+        List of result dicts with path, size, ms and speedup over the baseline
+    """
+    results = []
+    for size in sizes:
+        payload = _payload(size)
+        # The baseline formats dates in local time, so only prices and volumes are compared
+        if _without_dates(_decode_bars(payload)) != _without_dates(_baseline_decode(payload)):
+            raise AssertionError(f"Decoded bars differ from the baseline at {size} bars")
+
+        cases = {
+            "models": _baseline_decode,
+            "columns": decode_aggregates,
+            "bars": _decode_bars,
+        }
+        baseline = None
+        for path, case in cases.items():
+            ms = _time(case, payload)
+            baseline = baseline or ms
+            results.append({"path": path, "size": size, "ms": ms, "speedup": baseline / ms})
+    return results
+
+
+def main():
+    args = sys.argv[1:]
+    as_json = "--json" in args
+    sizes = [int(arg) for arg in args if arg.isdigit()] or DEFAULT_SIZES
+
+    results = run(sizes)
+
+    if as_json:
+        print(json.dumps({"results": results}, indent=2))
+        return
+
+    print(f"{'path':<8} {'size':>9} {'ms':>12} {'speedup':>8}")
+    for r in results:
+        print(f"{r['path']:<8} {r['size']:>9} {r['ms']:>12.3f} {r['speedup']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Import-time benchmark for StockAgent entry points.
+
+Runs each import statement in a fresh interpreter with ``python -X importtime``
+and reports the cumulative import cost (interpreter start-up excluded), the
+slowest modules by self time, and which heavy third-party packages were
+loaded. Budgets are checked with ``--check``; the test suite enforces them.
+
+Usage:
+    python scripts/benchmark_imports.py                  # Report all targets
+    python scripts/benchmark_imports.py --check          # Exit 1 if over budget
+    python scripts/benchmark_imports.py --top 15         # Show more slow modules
+    python scripts/benchmark_imports.py --output imports.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).parent.parent / "src"
+
+HEAVY_PACKAGES = ("numpy", "numba", "langgraph", "langchain_core", "polygon", "duckduckgo_search", "streamlit")
+
+# Import statement -> (budget in ms, heavy packages it must not load).
+# Budgets are generous ceilings for slow CI machines; typical costs are far
+# lower. Tighten them when an entry point gets cheaper.
+TARGETS: dict[str, tuple[float, tuple[str, ...]]] = {
+    "import stockagent": (50, HEAVY_PACKAGES),
+    "import stockagent.analysis": (50, HEAVY_PACKAGES),
+    "import stockagent.data": (50, HEAVY_PACKAGES),
+    "import stockagent.graph": (50, HEAVY_PACKAGES),
+    "from stockagent.analysis import scoring": (50, HEAVY_PACKAGES),
+    "from stockagent.analysis import synthesis": (50, HEAVY_PACKAGES),
+    "from stockagent.analysis import generate_recommendation": (50, HEAVY_PACKAGES),
+    "from stockagent.analysis import analyze_sentiment": (
+        250, ("numpy", "numba", "langgraph", "polygon", "streamlit"),
+    ),
+    "from stockagent.analysis import calculate_all_indicators": (
+        400, ("numba", "langgraph", "polygon", "duckduckgo_search", "streamlit"),
+    ),
+    "from stockagent.data import bars_to_columns": (
+        400, ("numba", "langgraph", "polygon", "duckduckgo_search", "streamlit"),
+    ),
+    "from stockagent.data import PolygonClient": (
+        1000, ("numba", "langgraph", "duckduckgo_search", "streamlit"),
+    ),
+    "from stockagent.graph import run_analysis": (3000, ("numba", "streamlit")),
+}
+
+
+def _importtime(statement: str) -> list[tuple[int, int, int, str]]:
+    """Run a statement under -X importtime.
+
+    Returns:
+        List of (depth, self_us, cumulative_us, module) in report order
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC), os.getenv("PYTHONPATH")]))}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((depth, int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def measure(statement: str, repeat: int = 3, top: int = 10) -> dict:
+    """Measure the import cost of a statement.
+
+    Args:
+        statement: Python import statement
+        repeat: Fresh interpreters to run (the fastest is reported)
+        top: Number of slowest modules (by self time) to include
+
+    Returns:
+        dict with statement, total_ms, heavy (third-party packages loaded)
+        and slowest ([module, self_ms] pairs)
+    """
+    baseline = {name for _, _, _, name in _importtime("pass")}
+    best = None
+    for _ in range(repeat):
+        rows = [row for row in _importtime(statement) if row[3] not in baseline]
+        total_us = sum(cumulative for depth, _, cumulative, _ in rows if depth == 0)
+        if best is None or total_us < best[0]:
+            best = (total_us, rows)
+
+    total_us, rows = best
+    loaded = {name.split(".")[0] for _, _, _, name in rows}
+    slowest = sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+    return {
+        "statement": statement,
+        "total_ms": total_us / 1000,
+        "heavy": sorted(p for p in HEAVY_PACKAGES if p in loaded),
+        "slowest": [[name, self_us / 1000] for _, self_us, _, name in slowest],
+    }
+
+
+def check(result: dict) -> list[str]:
+    """Budget violations for a measure() result."""
+    budget_ms, forbidden = TARGETS[result["statement"]]
+    problems = []
+    if result["total_ms"] > budget_ms:
+        problems.append(f"{result['total_ms']:.1f}ms exceeds budget of {budget_ms:.0f}ms")
+    unexpected = sorted(set(result["heavy"]) & set(forbidden))
+    if unexpected:
+        problems.append(f"loads {', '.join(unexpected)}")
+    return problems
+
+
+def run(statements: list[str] | None = None, repeat: int = 3, top: int = 10) -> list[dict]:
+    """Measure every target (or the given statements).
+
+    Returns:
+        List of measure() results, each with a "violations" list
+    """
+    results = []
+    for statement in statements or TARGETS:
+        result = measure(statement, repeat, top)
+        result["violations"] = check(result) if statement in TARGETS else []
+        results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("statements", nargs="*", help="Import statements (default: all targets)")
+    parser.add_argument("--repeat", type=int, default=3, help="Interpreters per statement")
+    parser.add_argument("--top", type=int, default=5, help="Slowest modules to show")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 on budget violations")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    results = run(args.statements, args.repeat, args.top)
+
+    for r in results:
+        status = "; ".join(r["violations"]) or "ok"
+        print(f"{r['total_ms']:>9.1f} ms  {r['statement']:<60} {status}")
+        if r["heavy"]:
+            print(f"{'':>14}heavy: {', '.join(r['heavy'])}")
+        for name, self_ms in r["slowest"]:
+            print(f"{'':>14}{self_ms:>8.1f} ms  {name}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.check and any(r["violations"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
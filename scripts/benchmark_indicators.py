@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for indicators, scoring and headline sentiment.
+
+Uses seeded synthetic data so results are comparable across commits.
+Per-series functions are measured at several history lengths; per-ticker
+functions (scoring, interpretation, sentiment) at several universe sizes.
+
+Usage:
+    python scripts/benchmark_indicators.py                      # Full suite
+    python scripts/benchmark_indicators.py --quick              # Small sizes only
+    python scripts/benchmark_indicators.py --output bench.json  # Save JSON results
+    python scripts/benchmark_indicators.py --compare bench.json # Compare to a saved run
+    python scripts/benchmark_indicators.py --filter macd        # Only matching benchmarks
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+# Make the package importable without installation
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from stockagent.analysis import indicators, kernels, scoring, streaming  # noqa: E402
+from stockagent.analysis.news_sentiment import analyze_sentiment  # noqa: E402
+from stockagent.utils.synthetic import (  # noqa: E402
+    generate_bar_columns,
+    generate_bars,
+    generate_headlines,
+    generate_sentiments,
+    generate_technical_signals,
+    generate_universe,
+)
+
+BAR_SIZES = [100, 1_000, 10_000, 100_000]
+TICKER_COUNTS = [1, 100, 5_000]
+QUICK_BAR_SIZES = [100, 1_000]
+QUICK_TICKER_COUNTS = [1, 100]
+
+# History length used for each ticker in universe benchmarks (~1 trading year)
+UNIVERSE_BARS = 250
+HEADLINES_PER_TICKER = 8
+SEED = 42
+
+# Bars per chunk fed to the streaming indicators (a page of minute bars)
+STREAM_CHUNK = 10_000
+
+
+def measure(func, min_time: float = 0.2, min_repeat: int = 3, max_repeat: int = 100) -> dict:
+    """Time a callable repeatedly.
+
+    Args:
+        func: Zero-argument callable
+        min_time: Keep repeating until this many seconds have elapsed
+        min_repeat: Minimum number of timed runs
+        max_repeat: Maximum number of timed runs
+
+    Returns:
+        dict with repeat count and min/median/mean milliseconds
+    """
+    func()  # Warm up (imports, JIT compilation, caches)
+
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < max_repeat:
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+        if len(timings) >= min_repeat and time.perf_counter() - started >= min_time:
+            break
+
+    return {
+        "repeat": len(timings),
+        "min_ms": min(timings),
+        "median_ms": statistics.median(timings),
+        "mean_ms": statistics.fmean(timings),
+    }
+
+
+def series_cases(n_bars: int) -> dict:
+    """Benchmarks that depend on the length of one price history."""
+    bars = generate_bars(n_bars, seed=SEED)
+    prices = [bar["close"] for bar in bars]
+    columns = generate_bar_columns(n_bars, seed=SEED)
+    chunks = [
+        {name: values[i : i + STREAM_CHUNK] for name, values in columns.items()}
+        for i in range(0, n_bars, STREAM_CHUNK)
+    ]
+
+    return {
+        "indicators.calculate_sma": lambda: indicators.calculate_sma(prices, 200),
+        "indicators.calculate_rsi": lambda: indicators.calculate_rsi(prices, 14),
+        "indicators.calculate_ema": lambda: indicators.calculate_ema(prices, 26),
+        "indicators.calculate_macd": lambda: indicators.calculate_macd(prices),
+        "indicators.calculate_bollinger_bands": lambda: indicators.calculate_bollinger_bands(prices),
+        "indicators.calculate_all_indicators": lambda: indicators.calculate_all_indicators(bars),
+        "streaming.stream_indicators": lambda: list(streaming.stream_indicators(chunks)),
+    }
+
+
+def universe_cases(n_tickers: int) -> dict:
+    """Benchmarks that depend on the number of tickers analyzed."""
+    universe = list(generate_universe(n_tickers, UNIVERSE_BARS, seed=SEED).values())
+    signals = generate_technical_signals(n_tickers, seed=SEED)
+    sentiments = generate_sentiments(n_tickers, seed=SEED)
+    headlines = generate_headlines(n_tickers * HEADLINES_PER_TICKER, seed=SEED)
+    pairs = list(zip(signals, sentiments))
+
+    return {
+        "indicators.calculate_all_indicators[universe]": lambda: [
+            indicators.calculate_all_indicators(bars) for bars in universe
+        ],
+        "indicators.interpret_rsi": lambda: [indicators.interpret_rsi(s["rsi"]) for s in signals],
+        "indicators.interpret_macd": lambda: [indicators.interpret_macd(s["macd"]) for s in signals],
+        "scoring.score_rsi": lambda: [scoring.score_rsi(s["rsi"]) for s in signals],
+        "scoring.score_macd": lambda: [scoring.score_macd(s["macd"]) for s in signals],
+        "scoring.score_moving_averages": lambda: [scoring.score_moving_averages(s) for s in signals],
+        "scoring.score_bollinger": lambda: [
+            scoring.score_bollinger(s["bollinger"], s["current_price"]) for s in signals
+        ],
+        "scoring.score_sentiment": lambda: [scoring.score_sentiment(s) for s in sentiments],
+        "scoring.calculate_composite_score": lambda: [
+            scoring.calculate_composite_score(t, s) for t, s in pairs
+        ],
+        "scoring.generate_recommendation": lambda: [
+            scoring.generate_recommendation(score) for score in np.linspace(-100, 100, n_tickers)
+        ],
+        "scoring.get_explanation_factors": lambda: [
+            scoring.get_explanation_factors(t, s) for t, s in pairs
+        ],
+        "news_sentiment.analyze_sentiment": lambda: [analyze_sentiment(h) for h in headlines],
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent,
+            check=True,
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    bar_sizes: list[int] = BAR_SIZES,
+    ticker_counts: list[int] = TICKER_COUNTS,
+    name_filter: str = "",
+    min_time: float = 0.2,
+) -> dict:
+    """Run the benchmark suite.
+
+    Args:
+        bar_sizes: History lengths for per-series benchmarks
+        ticker_counts: Universe sizes for per-ticker benchmarks
+        name_filter: Only run benchmarks whose name contains this string
+        min_time: Minimum seconds spent timing each benchmark
+
+    Returns:
+        dict with "meta" (environment) and "results" (one entry per benchmark/size)
+    """
+    results = []
+
+    for n_bars in bar_sizes:
+        for name, case in series_cases(n_bars).items():
+            if name_filter in name:
+                results.append({"name": name, "bars": n_bars, "tickers": 1, **measure(case, min_time)})
+
+    for n_tickers in ticker_counts:
+        for name, case in universe_cases(n_tickers).items():
+            if name_filter in name:
+                results.append({
+                    "name": name,
+                    "bars": UNIVERSE_BARS,
+                    "tickers": n_tickers,
+                    **measure(case, min_time),
+                })
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "kernel_backend": kernels.BACKEND,
+            "seed": SEED,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict) -> list[dict]:
+    """Compare two runs by median time.
+
+    Args:
+        current: Output of run()
+        baseline: Earlier output of run()
+
+    Returns:
+        List of dicts with name, bars, tickers, both medians and the ratio
+        (current / baseline; < 1 means faster)
+    """
+    previous = {(r["name"], r["bars"], r["tickers"]): r["median_ms"] for r in baseline["results"]}
+    rows = []
+    for r in current["results"]:
+        key = (r["name"], r["bars"], r["tickers"])
+        if key in previous and previous[key] > 0:
+            rows.append({
+                "name": r["name"],
+                "bars": r["bars"],
+                "tickers": r["tickers"],
+                "baseline_ms": previous[key],
+                "current_ms": r["median_ms"],
+                "ratio": r["median_ms"] / previous[key],
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="Only run small sizes")
+    parser.add_argument("--bars", type=int, nargs="+", help="History lengths to benchmark")
+    parser.add_argument("--tickers", type=int, nargs="+", help="Universe sizes to benchmark")
+    parser.add_argument("--filter", default="", help="Only run benchmarks containing this string")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="Compare against a saved JSON run")
+    args = parser.parse_args()
+
+    bar_sizes = args.bars or (QUICK_BAR_SIZES if args.quick else BAR_SIZES)
+    ticker_counts = args.tickers or (QUICK_TICKER_COUNTS if args.quick else TICKER_COUNTS)
+
+    report = run(bar_sizes, ticker_counts, args.filter)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Wrote {len(report['results'])} results to {args.output}")
+
+    print(f"{'benchmark':<48} {'bars':>7} {'tickers':>7} {'median ms':>12}")
+    for r in report["results"]:
+        print(f"{r['name']:<48} {r['bars']:>7} {r['tickers']:>7} {r['median_ms']:>12.4f}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        print(f"\nCompared to {baseline['meta'].get('commit') or args.compare}:")
+        for row in compare(report, baseline):
+            flag = "  SLOWER" if row["ratio"] > 1.2 else ""
+            print(
+                f"{row['name']:<48} {row['bars']:>7} {row['tickers']:>7} "
+                f"{row['ratio']:>8.2f}x{flag}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Benchmark indicator kernels across backends.
+
+Compares the NumPy fallback and (when installed) the Numba backend for each
+kernel, plus the original O(n^2) MACD history as a baseline.
+
+Usage:
+    python scripts/benchmark_kernels.py                 # Default sizes
+    python scripts/benchmark_kernels.py 1000 100000     # Custom sizes
+    python scripts/benchmark_kernels.py --json          # Machine-readable output
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Make the package importable without installation
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from stockagent.analysis import kernels  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+# The quadratic baseline becomes impractically slow beyond this size
+BASELINE_MAX_SIZE = 2_000
+
+
+def _baseline_macd(prices: np.ndarray) -> list[float]:
+    """Original MACD history: both EMAs recomputed for every prefix."""
+
+    def ema(values, period):
+        multiplier = 2 / (period + 1)
+        value = np.mean(values[:period])
+        for price in values[period:]:
+            value = (price - value) * multiplier + value
+        return value
+
+    return [ema(prices[:i], 12) - ema(prices[:i], 26) for i in range(26, len(prices) + 1)]
+
+
+def _time(func, *args, repeat: int = 5) -> float:
+    """Best-of-N wall time in milliseconds."""
+    func(*args)  # Warm up (triggers JIT compilation)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(sizes: list[int]) -> list[dict]:
+    """Run all kernel benchmarks.
+
+    Args:
+        sizes: Series lengths to benchmark
+
+    Returns:
+        List of result dicts with kernel, backend, size and ms
+    """
+    rng = np.random.default_rng(42)
+    results = []
+
+    for size in sizes:
+        prices = 100 + np.cumsum(rng.normal(0, 1, size))
+
+        if size <= BASELINE_MAX_SIZE:
+            results.append({
+                "kernel": "macd_series",
+                "backend": "baseline",
+                "size": size,
+                "ms": _time(_baseline_macd, prices, repeat=1),
+            })
+
+        for backend in kernels.available_backends():
+            cases = {
+                "ema_series": lambda: kernels.ema_series(prices, 26, backend=backend),
+                "macd_series": lambda: kernels.macd_series(prices, backend=backend),
+                "rsi_series": lambda: kernels.rsi_series(prices, 14, backend=backend),
+                "rolling_std": lambda: kernels.rolling_std(prices, 20, backend=backend),
+            }
+            for name, case in cases.items():
+                results.append({
+                    "kernel": name,
+                    "backend": backend,
+                    "size": size,
+                    "ms": _time(case),
+                })
+
+    return results
+
+
+def main():
+    args = sys.argv[1:]
+    as_json = "--json" in args
+    sizes = [int(arg) for arg in args if arg.isdigit()] or DEFAULT_SIZES
+
+    results = run(sizes)
+
+    if as_json:
+        print(json.dumps({"active_backend": kernels.BACKEND, "results": results}, indent=2))
+        return
+
+    print(f"Active backend: {kernels.BACKEND}")
+    print(f"{'kernel':<14} {'backend':<10} {'size':>9} {'ms':>12}")
+    for r in results:
+        print(f"{r['kernel']:<14} {r['backend']:<10} {r['size']:>9} {r['ms']:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""End-to-end workflow benchmark against local Polygon and news stand-ins.
+
+Starts a FakePolygonServer and installs a FakeNewsClient, then runs the full
+LangGraph workflow for a synthetic ticker universe at each concurrency level.
+Concurrency 1 calls run_analysis() sequentially; higher levels use
+run_batch_analysis(). Reports p50/p95/p99 latency and throughput for every
+node and for the whole analysis, plus error counts and stand-in request stats.
+
+No network access or API key is needed.
+
+Usage:
+    python scripts/benchmark_workflow.py                          # Defaults
+    python scripts/benchmark_workflow.py --tickers 200 --concurrency 1 8 32
+    python scripts/benchmark_workflow.py --latency 50 --news-latency 200
+    python scripts/benchmark_workflow.py --error-rate 0.05 --rate-limit-rate 0.02
+    python scripts/benchmark_workflow.py --output workflow.json   # Save JSON results
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+# Make the package importable without installation
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from stockagent.analysis import IndicatorMemo, set_indicator_memo, set_news_client_factory  # noqa: E402
+from stockagent.config import reload_settings  # noqa: E402
+from stockagent.graph import create_workflow, run_analysis, run_batch_analysis  # noqa: E402
+from stockagent.testing import FakeNewsClient, FakePolygonServer  # noqa: E402
+from stockagent.utils.synthetic import generate_tickers  # noqa: E402
+
+DEFAULT_TICKERS = 50
+DEFAULT_CONCURRENCY = [1, 4, 16]
+PERCENTILES = (50, 95, 99)
+SEED = 42
+
+
+class NodeTimer:
+    """Collects wall-clock durations of workflow nodes across threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.durations: dict[str, list[float]] = {}
+
+    def wrap(self, name, node):
+        """Node wrapper for create_workflow()."""
+
+        def timed(state):
+            start = time.perf_counter()
+            try:
+                return node(state)
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    self.durations.setdefault(name, []).append(elapsed)
+
+        return timed
+
+
+def summarize(durations_ms: list[float], wall_s: float) -> dict:
+    """Latency percentiles and throughput for a list of durations.
+
+    Args:
+        durations_ms: Individual durations in milliseconds
+        wall_s: Wall-clock seconds the durations were collected over
+
+    Returns:
+        dict with count, throughput_per_s, mean_ms and pNN_ms entries
+    """
+    values = np.asarray(durations_ms, dtype=np.float64)
+    stats = {
+        "count": len(values),
+        "throughput_per_s": len(values) / wall_s if wall_s > 0 else 0.0,
+        "mean_ms": float(values.mean()) if len(values) else 0.0,
+    }
+    for p in PERCENTILES:
+        stats[f"p{p}_ms"] = float(np.percentile(values, p)) if len(values) else 0.0
+    return stats
+
+
+def run_level(tickers: list[str], concurrency: int) -> dict:
+    """Analyze every ticker once at the given concurrency.
+
+    Args:
+        tickers: Ticker symbols to analyze
+        concurrency: Number of concurrent analyses
+
+    Returns:
+        dict with wall time, end-to-end and per-node summaries and error count
+    """
+    timer = NodeTimer()
+    workflow = create_workflow(node_wrapper=timer.wrap)
+    latencies = []
+    errors = 0
+
+    # Fresh memo so every level computes indicators from scratch
+    previous_memo = set_indicator_memo(IndicatorMemo())
+    started = time.perf_counter()
+    try:
+        if concurrency == 1:
+            for ticker in tickers:
+                start = time.perf_counter()
+                result = run_analysis(ticker, workflow)
+                latencies.append((time.perf_counter() - start) * 1000)
+                errors += bool(result.get("errors"))
+        else:
+            # Analyses overlap in batch mode, so their latency is derived
+            # from node times below instead of being timed directly
+            for result in run_batch_analysis(tickers, max_workers=concurrency, workflow=workflow):
+                errors += bool(result.get("errors"))
+        wall = time.perf_counter() - started
+    finally:
+        set_indicator_memo(previous_memo)
+
+    if not latencies:
+        latencies = _analysis_latencies(timer.durations)
+
+    return {
+        "concurrency": concurrency,
+        "tickers": len(tickers),
+        "wall_s": wall,
+        "errors": errors,
+        "analysis": summarize(latencies, wall),
+        "nodes": {name: summarize(d, wall) for name, d in sorted(timer.durations.items())},
+    }
+
+
+def _analysis_latencies(durations: dict[str, list[float]]) -> list[float]:
+    """Approximate per-analysis latency from node durations (critical path)."""
+    counts = {len(d) for d in durations.values()}
+    if len(counts) != 1:
+        return []
+    parallel = zip(durations.get("technical_analysis", []), durations.get("news_sentiment", []))
+    branch = [max(t, n) for t, n in parallel]
+    serial = [
+        sum(values)
+        for values in zip(
+            *(durations[name] for name in ("fetch_data", "recommend", "synthesize") if name in durations)
+        )
+    ]
+    return [s + b for s, b in zip(serial, branch)]
+
+
+def run(
+    n_tickers: int = DEFAULT_TICKERS,
+    concurrency_levels: list[int] = DEFAULT_CONCURRENCY,
+    latency_ms: float = 0.0,
+    news_latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    error_rate: float = 0.0,
+    rate_limit_rate: float = 0.0,
+) -> dict:
+    """Run the workflow benchmark.
+
+    Args:
+        n_tickers: Number of synthetic tickers analyzed per level
+        concurrency_levels: Concurrency levels to run
+        latency_ms: Fake Polygon per-request latency
+        news_latency_ms: Fake news per-search latency
+        jitter_ms: Extra random latency for both stand-ins
+        error_rate: Fraction of stand-in requests that fail
+        rate_limit_rate: Fraction of stand-in requests that are rate limited
+
+    Returns:
+        dict with "meta", "levels" (one summary per concurrency level) and
+        "stand_ins" (request counters)
+    """
+    tickers = generate_tickers(n_tickers)
+    server = FakePolygonServer(
+        latency=latency_ms / 1000,
+        jitter=jitter_ms / 1000,
+        error_rate=error_rate,
+        rate_limit_rate=rate_limit_rate,
+        seed=SEED,
+    )
+    news = FakeNewsClient(
+        latency=news_latency_ms / 1000,
+        jitter=jitter_ms / 1000,
+        error_rate=error_rate,
+        rate_limit_rate=rate_limit_rate,
+        seed=SEED,
+    )
+
+    saved_env = {name: os.environ.get(name) for name in ("POLYGON_API_KEY", "POLYGON_BASE_URL")}
+    previous_factory = set_news_client_factory(news)
+    levels = []
+    try:
+        with server:
+            os.environ["POLYGON_API_KEY"] = "benchmark"
+            os.environ["POLYGON_BASE_URL"] = server.url
+            reload_settings()
+            run_analysis("WARMUP")  # Imports, JIT compilation, connection setup
+            for concurrency in concurrency_levels:
+                levels.append(run_level(tickers, concurrency))
+    finally:
+        set_news_client_factory(previous_factory)
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        reload_settings()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "latency_ms": latency_ms,
+            "news_latency_ms": news_latency_ms,
+            "jitter_ms": jitter_ms,
+            "error_rate": error_rate,
+            "rate_limit_rate": rate_limit_rate,
+            "seed": SEED,
+        },
+        "levels": levels,
+        "stand_ins": {"polygon": server.stats, "news": news.stats},
+    }
+
+
+def _print_level(level: dict) -> None:
+    print(
+        f"\nconcurrency={level['concurrency']}  tickers={level['tickers']}  "
+        f"wall={level['wall_s']:.2f}s  errors={level['errors']}"
+    )
+    print(f"{'stage':<20} {'count':>6} {'per s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    rows = [("analysis", level["analysis"]), *level["nodes"].items()]
+    for name, s in rows:
+        print(
+            f"{name:<20} {s['count']:>6} {s['throughput_per_s']:>9.1f} "
+            f"{s['p50_ms']:>9.2f} {s['p95_ms']:>9.2f} {s['p99_ms']:>9.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickers", type=int, default=DEFAULT_TICKERS, help="Tickers analyzed per level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--latency", type=float, default=0.0, help="Polygon latency per request (ms)")
+    parser.add_argument("--news-latency", type=float, default=0.0, help="News latency per search (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of failing requests")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of 429 responses")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    report = run(
+        args.tickers,
+        args.concurrency,
+        latency_ms=args.latency,
+        news_latency_ms=args.news_latency,
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+    )
+
+    for level in report["levels"]:
+        _print_level(level)
+    print(f"\nstand-in requests: {json.dumps(report['stand_ins'])}")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Wrote results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
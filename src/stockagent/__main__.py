@@ -0,0 +1,7 @@
+"""Allow ``python -m stockagent``."""
+
+import sys
+
+from stockagent.cli import main
+
+sys.exit(main())
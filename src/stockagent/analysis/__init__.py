@@ -1,31 +1,89 @@
 """Analysis layer for technical indicators and sentiment."""
 
-from stockagent.analysis.indicators import (
-    calculate_all_indicators,
-    calculate_bollinger_bands,
-    calculate_ema,
-    calculate_macd,
-    calculate_rsi,
-    calculate_sma,
-    interpret_macd,
-    interpret_rsi,
-)
-from stockagent.analysis.news_sentiment import (
-    analyze_news_sentiment,
-    analyze_sentiment,
-    fetch_news,
-)
-from stockagent.analysis.scoring import (
-    calculate_composite_score,
-    generate_recommendation,
-    get_explanation_factors,
-    score_bollinger,
-    score_macd,
-    score_moving_averages,
-    score_rsi,
-    score_sentiment,
-)
-from stockagent.analysis.synthesis import generate_report
+from typing import TYPE_CHECKING
+
+from stockagent.utils.lazy import lazy_exports
+
+# Public name -> defining submodule. Submodules (and their third-party
+# dependencies) are imported on first attribute access.
+_EXPORTS = {
+    "calculate_all_indicators": "indicators",
+    "calculate_bollinger_bands": "indicators",
+    "calculate_ema": "indicators",
+    "calculate_macd": "indicators",
+    "calculate_rsi": "indicators",
+    "calculate_sma": "indicators",
+    "interpret_macd": "indicators",
+    "interpret_rsi": "indicators",
+    "IndicatorMemo": "memo",
+    "get_indicator_memo": "memo",
+    "make_indicator_key": "memo",
+    "memoized_indicators": "memo",
+    "set_indicator_memo": "memo",
+    "analyze_news_sentiment": "news_sentiment",
+    "analyze_sentiment": "news_sentiment",
+    "fetch_news": "news_sentiment",
+    "set_news_client_factory": "news_sentiment",
+    "TIMEFRAMES": "resample",
+    "resample_bars": "resample",
+    "resample_columns": "resample",
+    "StreamingEMA": "streaming",
+    "StreamingIndicators": "streaming",
+    "stream_indicators": "streaming",
+    "calculate_composite_score": "scoring",
+    "generate_recommendation": "scoring",
+    "get_explanation_factors": "scoring",
+    "score_bollinger": "scoring",
+    "score_macd": "scoring",
+    "score_moving_averages": "scoring",
+    "score_rsi": "scoring",
+    "score_sentiment": "scoring",
+    "generate_report": "synthesis",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from stockagent.analysis.indicators import (
+        calculate_all_indicators,
+        calculate_bollinger_bands,
+        calculate_ema,
+        calculate_macd,
+        calculate_rsi,
+        calculate_sma,
+        interpret_macd,
+        interpret_rsi,
+    )
+    from stockagent.analysis.memo import (
+        IndicatorMemo,
+        get_indicator_memo,
+        make_indicator_key,
+        memoized_indicators,
+        set_indicator_memo,
+    )
+    from stockagent.analysis.news_sentiment import (
+        analyze_news_sentiment,
+        analyze_sentiment,
+        fetch_news,
+        set_news_client_factory,
+    )
+    from stockagent.analysis.resample import (
+        TIMEFRAMES,
+        resample_bars,
+        resample_columns,
+    )
+    from stockagent.analysis.scoring import (
+        calculate_composite_score,
+        generate_recommendation,
+        get_explanation_factors,
+        score_bollinger,
+        score_macd,
+        score_moving_averages,
+        score_rsi,
+        score_sentiment,
+    )
+    from stockagent.analysis.streaming import StreamingEMA, StreamingIndicators, stream_indicators
+    from stockagent.analysis.synthesis import generate_report
 
 __all__ = [
     # Indicators
@@ -37,10 +95,25 @@ __all__ = [
     "calculate_bollinger_bands",
     "interpret_rsi",
     "interpret_macd",
+    # Indicator memoization
+    "IndicatorMemo",
+    "get_indicator_memo",
+    "make_indicator_key",
+    "memoized_indicators",
+    "set_indicator_memo",
     # News sentiment
     "analyze_news_sentiment",
     "analyze_sentiment",
     "fetch_news",
+    "set_news_client_factory",
+    # Resampling
+    "TIMEFRAMES",
+    "resample_bars",
+    "resample_columns",
+    # Streaming indicators
+    "StreamingEMA",
+    "StreamingIndicators",
+    "stream_indicators",
     # Scoring
     "calculate_composite_score",
     "generate_recommendation",
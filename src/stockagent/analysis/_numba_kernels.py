@@ -0,0 +1,79 @@
+"""Numba JIT-compiled indicator kernels.
+
+Imported by stockagent.analysis.kernels on first use of the numba backend,
+so importing the package does not pay Numba's start-up cost. Results agree
+with the NumPy fallback to within floating-point tolerance: the rolling
+kernels accumulate sequential sums where NumPy sums pairwise.
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True)
+def _ema_series_numba(values, period, seed):  # pragma: no cover - compiled
+    n = values.shape[0]
+    out = np.empty(n - period + 1)
+    ema = seed
+    multiplier = 2.0 / (period + 1)
+    out[0] = ema
+    for i in range(period, n):
+        ema = (values[i] - ema) * multiplier + ema
+        out[i - period + 1] = ema
+    return out
+
+
+@numba.njit(cache=True)
+def _rolling_mean_numba(values, window):  # pragma: no cover - compiled
+    n = values.shape[0]
+    out = np.empty(n - window + 1)
+    for i in range(n - window + 1):
+        total = 0.0
+        for j in range(i, i + window):
+            total += values[j]
+        out[i] = total / window
+    return out
+
+
+@numba.njit(cache=True)
+def _rolling_std_numba(values, window):  # pragma: no cover - compiled
+    n = values.shape[0]
+    out = np.empty(n - window + 1)
+    for i in range(n - window + 1):
+        total = 0.0
+        for j in range(i, i + window):
+            total += values[j]
+        mean = total / window
+        sq = 0.0
+        for j in range(i, i + window):
+            sq += (values[j] - mean) ** 2
+        out[i] = np.sqrt(sq / window)
+    return out
+
+
+@numba.njit(cache=True)
+def _rsi_series_numba(values, period):  # pragma: no cover - compiled
+    n = values.shape[0]
+    gains = np.zeros(n - 1)
+    losses = np.zeros(n - 1)
+    for i in range(n - 1):
+        delta = values[i + 1] - values[i]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+
+    out = np.empty(n - period)
+    for i in range(n - period):
+        gain = 0.0
+        loss = 0.0
+        for j in range(i, i + period):
+            gain += gains[j]
+            loss += losses[j]
+        avg_gain = gain / period
+        avg_loss = loss / period
+        if avg_loss == 0:
+            out[i] = 100.0 if avg_gain > 0 else 50.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
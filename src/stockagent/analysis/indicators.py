@@ -2,6 +2,8 @@
 
 import numpy as np
 
+from stockagent.analysis.kernels import ema_series, macd_series, rolling_mean, rolling_std, rsi_series
+from stockagent.analysis.resample import resample_bars
 from stockagent.models import TechnicalSignals
 
 
@@ -37,31 +39,8 @@ def calculate_rsi(prices: list[float], period: int = 14) -> float | None:
     if len(prices) < period + 1:
         return None
 
-    # Calculate price changes
-    prices_arr = np.array(prices)
-    deltas = np.diff(prices_arr)
-
-    # Separate gains and losses
-    gains = np.where(deltas > 0, deltas, 0)
-    losses = np.where(deltas < 0, -deltas, 0)
-
-    # Use only the last 'period' changes
-    recent_gains = gains[-(period):]
-    recent_losses = losses[-(period):]
-
-    # Calculate averages
-    avg_gain = np.mean(recent_gains)
-    avg_loss = np.mean(recent_losses)
-
-    # Avoid division by zero
-    if avg_loss == 0:
-        return 100.0 if avg_gain > 0 else 50.0
-
-    # Calculate RSI
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-
-    return float(rsi)
+    # Only the last 'period' changes count, so the kernel sees one window
+    return float(rsi_series(prices[-(period + 1):], period)[-1])
 
 
 def calculate_ema(prices: list[float], period: int) -> float | None:
@@ -77,17 +56,7 @@ def calculate_ema(prices: list[float], period: int) -> float | None:
     if len(prices) < period:
         return None
 
-    prices_arr = np.array(prices)
-    multiplier = 2 / (period + 1)
-
-    # Start with SMA for first EMA value
-    ema = np.mean(prices_arr[:period])
-
-    # Calculate EMA for remaining prices
-    for price in prices_arr[period:]:
-        ema = (price - ema) * multiplier + ema
-
-    return float(ema)
+    return float(ema_series(prices, period)[-1])
 
 
 def calculate_macd(prices: list[float]) -> dict | None:
@@ -104,24 +73,11 @@ def calculate_macd(prices: list[float]) -> dict | None:
     if len(prices) < 26:
         return None
 
-    # Calculate EMAs for MACD line
-    ema_12 = calculate_ema(prices, 12)
-    ema_26 = calculate_ema(prices, 26)
-
-    if ema_12 is None or ema_26 is None:
-        return None
-
-    macd_line = ema_12 - ema_26
-
-    # Calculate MACD values for signal line
-    # We need enough history to calculate 9-period EMA of MACD
-    macd_values = []
-    for i in range(26, len(prices) + 1):
-        subset = prices[:i]
-        e12 = calculate_ema(subset, 12)
-        e26 = calculate_ema(subset, 26)
-        if e12 is not None and e26 is not None:
-            macd_values.append(e12 - e26)
+    # MACD line (12-EMA minus 26-EMA) for every prefix of at least 26
+    # prices, computed in a single O(n) pass; the history feeds the
+    # 9-period signal EMA
+    macd_values = macd_series(prices, 12, 26)
+    macd_line = float(macd_values[-1])
 
     if len(macd_values) < 9:
         # Not enough for signal line, but we can return MACD line
@@ -162,8 +118,8 @@ def calculate_bollinger_bands(
         return None
 
     recent_prices = prices[-period:]
-    middle = float(np.mean(recent_prices))
-    std = float(np.std(recent_prices, ddof=0))
+    middle = float(rolling_mean(recent_prices, period)[-1])
+    std = float(rolling_std(recent_prices, period)[-1])
 
     upper = middle + (std_dev * std)
     lower = middle - (std_dev * std)
@@ -217,15 +173,20 @@ def interpret_macd(macd: dict | None) -> str:
         return "neutral"
 
 
-def calculate_all_indicators(bars: list[dict]) -> TechnicalSignals:
+def calculate_all_indicators(bars: list[dict], timeframe: str = "day") -> TechnicalSignals:
     """Calculate all technical indicators from OHLCV bars.
 
     Args:
-        bars: List of OHLCV dicts with 'close' prices
+        bars: List of daily OHLCV dicts with 'close' prices
+        timeframe: Timeframe to evaluate indicators on ("day", "week" or
+            "month"). Coarser timeframes are resampled from the daily bars.
 
     Returns:
         TechnicalSignals dict with all indicator values and interpretations
     """
+    if timeframe != "day":
+        bars = resample_bars(bars, timeframe)
+
     # Extract close prices
     prices = [bar["close"] for bar in bars if "close" in bar]
 
@@ -0,0 +1,259 @@
+"""Numeric kernels for recursive and rolling indicator calculations.
+
+EMA-style recursions are inherently sequential and cannot be vectorized
+with plain NumPy. When Numba is installed these kernels are JIT-compiled;
+otherwise a pure NumPy/Python fallback is used, whose results agree to
+within floating-point tolerance.
+
+The backend is selected once at import time, but Numba itself is only
+imported when a kernel first runs. Set the environment variable
+``STOCKAGENT_KERNELS`` to ``numpy`` or ``numba`` to force a backend
+(``auto``, the default, prefers Numba when available).
+
+All kernels take a 1-D float64 array (most recent last) and return the
+full indicator series, so the last element is the current value.
+"""
+
+import importlib
+import importlib.util
+import logging
+from typing import Callable
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from stockagent.config import get_settings
+
+# Numba is only imported when its kernels are first needed (see get_kernels)
+_NUMBA_INSTALLED = importlib.util.find_spec("numba") is not None
+
+logger = logging.getLogger(__name__)
+
+
+# -- NumPy fallback ---------------------------------------------------------
+
+
+def _ema_series_numpy(values: np.ndarray, period: int, seed: float) -> np.ndarray:
+    """EMA recursion starting from `seed` (the SMA of the first `period` values).
+
+    Element i of the result is the EMA after consuming values[: period + i].
+    """
+    multiplier = 2 / (period + 1)
+    ema = seed
+
+    # Iterating Python floats is much faster than NumPy scalars
+    series = [float(ema)]
+    for price in values[period:].tolist():
+        ema = (price - ema) * multiplier + ema
+        series.append(float(ema))
+
+    return np.array(series, dtype=np.float64)
+
+
+def _rolling_mean_numpy(values: np.ndarray, window: int) -> np.ndarray:
+    """Mean of each trailing window; element i covers values[i : i + window]."""
+    return sliding_window_view(values, window).mean(axis=1)
+
+
+def _rolling_std_numpy(values: np.ndarray, window: int) -> np.ndarray:
+    """Population standard deviation of each trailing window."""
+    return sliding_window_view(values, window).std(axis=1)
+
+
+def _rsi_series_numpy(values: np.ndarray, period: int) -> np.ndarray:
+    """RSI using simple averages of the last `period` gains and losses.
+
+    Element i is the RSI of values[: period + 1 + i].
+    """
+    deltas = np.diff(values)
+    avg_gain = _rolling_mean_numpy(np.where(deltas > 0, deltas, 0.0), period)
+    avg_loss = _rolling_mean_numpy(np.where(deltas < 0, -deltas, 0.0), period)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    flat = np.where(avg_gain > 0, 100.0, 50.0)
+    return np.where(avg_loss == 0, flat, rsi)
+
+
+_BACKENDS: dict[str, dict[str, Callable]] = {
+    "numpy": {
+        "ema_series": _ema_series_numpy,
+        "rolling_mean": _rolling_mean_numpy,
+        "rolling_std": _rolling_std_numpy,
+        "rsi_series": _rsi_series_numpy,
+    },
+}
+
+_NUMBA_KERNELS = ("ema_series", "rolling_mean", "rolling_std", "rsi_series")
+
+
+def _load_numba() -> dict[str, Callable] | None:
+    """Import the Numba kernels, or None if Numba cannot be imported."""
+    try:
+        module = importlib.import_module("stockagent.analysis._numba_kernels")
+    except ImportError as e:  # pragma: no cover - depends on the environment
+        logger.warning(f"Numba is installed but could not be imported: {e}")
+        return None
+    return {name: getattr(module, f"_{name}_numba") for name in _NUMBA_KERNELS}
+
+
+def available_backends() -> list[str]:
+    """List the kernel backends usable in this environment."""
+    backends = list(_BACKENDS)
+    if _NUMBA_INSTALLED and "numba" not in backends:
+        backends.append("numba")
+    return backends
+
+
+def _select_backend() -> str:
+    requested = get_settings().kernels
+    backends = available_backends()
+
+    if requested in backends:
+        return requested
+
+    if requested not in ("", "auto"):
+        logger.warning(
+            f"Kernel backend '{requested}' is not available; "
+            f"choosing from: {', '.join(backends)}"
+        )
+
+    return "numba" if "numba" in backends else "numpy"
+
+
+BACKEND = _select_backend()
+
+
+def get_kernels(backend: str | None = None) -> dict[str, Callable]:
+    """Get the raw kernel functions for a backend.
+
+    Args:
+        backend: Backend name, or None for the active backend
+
+    Returns:
+        dict mapping kernel name to function
+
+    Raises:
+        ValueError: If the backend is not available
+    """
+    global _NUMBA_INSTALLED
+
+    backend = backend or BACKEND
+    if backend == "numba" and backend not in _BACKENDS and _NUMBA_INSTALLED:
+        kernels = _load_numba()
+        if kernels is None:
+            _NUMBA_INSTALLED = False
+            return _BACKENDS["numpy"]
+        _BACKENDS["numba"] = kernels
+    if backend not in _BACKENDS:
+        raise ValueError(
+            f"Kernel backend '{backend}' is not available. "
+            f"Available: {', '.join(available_backends())}"
+        )
+    return _BACKENDS[backend]
+
+
+def _as_array(values) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _ema(kernels: dict[str, Callable], values: np.ndarray, period: int) -> np.ndarray:
+    # The SMA seed is always taken with np.mean so every backend starts the
+    # recursion from the same value as the reference implementation
+    return kernels["ema_series"](values, period, float(np.mean(values[:period])))
+
+
+def ema_series(values, period: int, backend: str | None = None) -> np.ndarray:
+    """Exponential moving average series seeded with an SMA.
+
+    Args:
+        values: Prices (most recent last)
+        period: EMA period
+        backend: Kernel backend to use (defaults to the active backend)
+
+    Returns:
+        Array of len(values) - period + 1 EMA values, or an empty array if
+        there are fewer than `period` values
+    """
+    values = _as_array(values)
+    if len(values) < period:
+        return np.array([], dtype=np.float64)
+    return _ema(get_kernels(backend), values, period)
+
+
+def rolling_mean(values, window: int, backend: str | None = None) -> np.ndarray:
+    """Trailing simple moving average series.
+
+    Args:
+        values: Prices (most recent last)
+        window: Window length
+        backend: Kernel backend to use (defaults to the active backend)
+
+    Returns:
+        Array of len(values) - window + 1 means (empty if too short)
+    """
+    values = _as_array(values)
+    if len(values) < window:
+        return np.array([], dtype=np.float64)
+    return get_kernels(backend)["rolling_mean"](values, window)
+
+
+def rolling_std(values, window: int, backend: str | None = None) -> np.ndarray:
+    """Trailing population standard deviation series.
+
+    Args:
+        values: Prices (most recent last)
+        window: Window length
+        backend: Kernel backend to use (defaults to the active backend)
+
+    Returns:
+        Array of len(values) - window + 1 standard deviations (empty if too short)
+    """
+    values = _as_array(values)
+    if len(values) < window:
+        return np.array([], dtype=np.float64)
+    return get_kernels(backend)["rolling_std"](values, window)
+
+
+def rsi_series(values, period: int = 14, backend: str | None = None) -> np.ndarray:
+    """RSI series matching calculate_rsi() for every prefix of the input.
+
+    Args:
+        values: Prices (most recent last)
+        period: RSI period
+        backend: Kernel backend to use (defaults to the active backend)
+
+    Returns:
+        Array of len(values) - period RSI values (empty if too short)
+    """
+    values = _as_array(values)
+    if len(values) < period + 1:
+        return np.array([], dtype=np.float64)
+    return get_kernels(backend)["rsi_series"](values, period)
+
+
+def macd_series(values, fast: int = 12, slow: int = 26, backend: str | None = None) -> np.ndarray:
+    """MACD line series (fast EMA minus slow EMA) for every prefix.
+
+    Element i is the MACD line of values[: slow + i].
+
+    Args:
+        values: Prices (most recent last)
+        fast: Fast EMA period
+        slow: Slow EMA period
+        backend: Kernel backend to use (defaults to the active backend)
+
+    Returns:
+        Array of len(values) - slow + 1 MACD values (empty if too short)
+    """
+    values = _as_array(values)
+    if len(values) < slow:
+        return np.array([], dtype=np.float64)
+
+    kernels = get_kernels(backend)
+    fast_ema = _ema(kernels, values, fast)
+    slow_ema = _ema(kernels, values, slow)
+
+    # Align the fast EMA so both series start at prefix length `slow`
+    return fast_ema[slow - fast :] - slow_ema
@@ -0,0 +1,197 @@
+"""Content-addressed memoization of technical indicator results."""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from stockagent.analysis.indicators import calculate_all_indicators
+from stockagent.config import get_settings
+from stockagent.models import TechnicalSignals
+from stockagent.utils.cache import LRUCache
+from stockagent.utils.tracing import increment
+
+logger = logging.getLogger(__name__)
+
+# Fingerprint of the parameters used by calculate_all_indicators.
+# Bump this whenever indicator periods or formulas change so stale
+# memoized results (including on-disk ones) are never reused.
+INDICATOR_FINGERPRINT = "rsi=14;macd=12,26,9;bollinger=20,2;sma=20,50,200;v1"
+
+DEFAULT_MEMO_SIZE = 256
+
+
+def make_indicator_key(bars: list[dict], timeframe: str = "day") -> str:
+    """Build a content hash for a set of bars and indicator parameters.
+
+    The key covers the close prices (the only input the indicators read),
+    the timestamps when resampling is needed, the timeframe and the
+    indicator fingerprint.
+
+    Args:
+        bars: List of OHLCV dicts
+        timeframe: Indicator timeframe
+
+    Returns:
+        Hex digest identifying the indicator computation
+    """
+    bars = [bar for bar in bars if "close" in bar]
+    closes = np.fromiter((bar["close"] for bar in bars), dtype=np.float64, count=len(bars))
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{INDICATOR_FINGERPRINT}|{timeframe}|{len(bars)}".encode())
+    digest.update(closes.tobytes())
+    if timeframe != "day":
+        digest.update("|".join(str(bar.get("timestamp", "")) for bar in bars).encode())
+
+    return digest.hexdigest()
+
+
+class IndicatorMemo:
+    """Bounded LRU memo of indicator results with optional disk persistence.
+
+    Results are keyed by make_indicator_key(). When a directory is given,
+    results are also written there as JSON files so they survive process
+    restarts; the in-memory LRU is always consulted first.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MEMO_SIZE, path: str | Path | None = None):
+        """Initialize the memo.
+
+        Args:
+            maxsize: Maximum number of results kept in memory
+            path: Optional directory for on-disk persistence
+        """
+        self._cache = LRUCache(maxsize)
+        self._path = Path(path) if path else None
+        if self._path:
+            self._path.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def hits(self) -> int:
+        """Number of in-memory lookups that found a result."""
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        """Number of in-memory lookups that found nothing."""
+        return self._cache.misses
+
+    def _file_for(self, key: str) -> Path:
+        return self._path / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> TechnicalSignals | None:
+        """Look up a memoized result.
+
+        Args:
+            key: Key from make_indicator_key()
+
+        Returns:
+            A copy of the stored TechnicalSignals, or None if not memoized
+        """
+        signals = self._cache.get(key)
+
+        if signals is None and self._path:
+            try:
+                signals = json.loads(self._file_for(key).read_text())
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable indicator memo entry {key}: {e}")
+                return None
+            self._cache.put(key, signals)
+
+        # Callers (e.g. the workflow) mutate the returned dict
+        return copy.deepcopy(signals) if signals is not None else None
+
+    def put(self, key: str, signals: TechnicalSignals) -> None:
+        """Store a result.
+
+        Args:
+            key: Key from make_indicator_key()
+            signals: TechnicalSignals to memoize
+        """
+        signals = copy.deepcopy(signals)
+        self._cache.put(key, signals)
+
+        if self._path:
+            target = self._file_for(key)
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+                with os.fdopen(fd, "w") as f:
+                    json.dump(signals, f)
+                os.replace(tmp_name, target)
+            except OSError as e:
+                logger.warning(f"Could not persist indicator memo entry {key}: {e}")
+
+    def clear(self) -> None:
+        """Clear the in-memory memo (on-disk entries are kept)."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_default_memo: IndicatorMemo | None = None
+
+
+def get_indicator_memo() -> IndicatorMemo:
+    """Get the process-wide indicator memo.
+
+    Created on first use from the settings (STOCKAGENT_INDICATOR_CACHE_SIZE,
+    and STOCKAGENT_CACHE_DIR for on-disk persistence under "indicators").
+    """
+    global _default_memo
+    if _default_memo is None:
+        settings = get_settings()
+        _default_memo = IndicatorMemo(settings.indicator_cache_size, settings.cache_path("indicators"))
+    return _default_memo
+
+
+def set_indicator_memo(memo: IndicatorMemo | None) -> IndicatorMemo | None:
+    """Replace the process-wide indicator memo.
+
+    Args:
+        memo: New memo (e.g. one with on-disk persistence), or None to
+            recreate the default from the settings on next use
+
+    Returns:
+        The previously installed memo (None if none was created yet)
+    """
+    global _default_memo
+    previous, _default_memo = _default_memo, memo
+    return previous
+
+
+def memoized_indicators(
+    bars: list[dict], timeframe: str = "day", memo: IndicatorMemo | None = None
+) -> TechnicalSignals:
+    """Calculate all indicators, reusing a memoized result when available.
+
+    Args:
+        bars: List of OHLCV dicts with 'close' prices
+        timeframe: Indicator timeframe (see calculate_all_indicators)
+        memo: Memo to use (defaults to the process-wide memo)
+
+    Returns:
+        TechnicalSignals dict, identical to calculate_all_indicators()
+    """
+    if memo is None:
+        memo = get_indicator_memo()
+    key = make_indicator_key(bars, timeframe)
+
+    signals = memo.get(key)
+    if signals is None:
+        increment("cache_misses")
+        signals = calculate_all_indicators(bars, timeframe)
+        memo.put(key, signals)
+    else:
+        increment("cache_hits")
+
+    return signals
@@ -1,14 +1,24 @@
 """News sentiment analysis using DuckDuckGo search."""
 
 import logging
-from typing import Any
+import time
+from typing import Any, Callable
 
 from duckduckgo_search import DDGS
+from duckduckgo_search.exceptions import RatelimitException
 
+from stockagent.config import get_settings
+from stockagent.data.response_cache import get_response_cache
+from stockagent.data.scheduler import get_scheduler
 from stockagent.models import SentimentResult
+from stockagent.utils.metrics import NEWS_REQUEST_SECONDS, NEWS_REQUESTS
+from stockagent.utils.tracing import increment
 
 logger = logging.getLogger(__name__)
 
+# Optional replacement for DDGS (e.g. a local stand-in for benchmarks)
+_news_client_factory: Callable[[], Any] | None = None
+
 # Sentiment keyword lists (lowercase)
 POSITIVE_KEYWORDS = [
     "surge",
@@ -133,11 +143,31 @@ def analyze_sentiment(headline: str) -> dict:
     }
 
 
+def set_news_client_factory(factory: Callable[[], Any] | None) -> Callable[[], Any] | None:
+    """Replace the news search client used by fetch_news().
+
+    The factory must return a context manager exposing a DDGS-compatible
+    ``news(query, max_results=...)`` method.
+
+    Args:
+        factory: Client factory, or None to restore DuckDuckGo search
+
+    Returns:
+        The previously installed factory (None for the default)
+    """
+    global _news_client_factory
+    previous, _news_client_factory = _news_client_factory, factory
+    return previous
+
+
 def fetch_news(
     ticker: str, company_name: str = "", max_results: int = 8
 ) -> list[dict[str, Any]]:
     """Fetch recent news headlines for a stock.
 
+    Results are served from the local response cache when one is
+    configured; failed or empty searches are not cached.
+
     Args:
         ticker: Stock ticker symbol
         company_name: Company name for better search results
@@ -152,26 +182,50 @@ def fetch_news(
     else:
         query = f"{ticker} stock"
 
-    try:
-        with DDGS() as ddgs:
-            results = list(ddgs.news(query, max_results=max_results))
-
-        # Transform results to our format
-        articles = []
-        for result in results:
-            article = {
-                "title": result.get("title", ""),
-                "url": result.get("url", ""),
-                "date": result.get("date", ""),
-                "source": result.get("source", ""),
-            }
-            articles.append(article)
-
-        return articles
-
-    except Exception as e:
-        logger.warning(f"Error fetching news for {ticker}: {e}")
-        return []
+    # Headlines pre-fetched by the cache warmer or an earlier analysis
+    cache = get_response_cache()
+    cache_key = f"{query}:{max_results}"
+    if cache is not None:
+        cached = cache.get("news", cache_key)
+        if cached is not None:
+            return cached
+
+    # Interactive searches go ahead of queued batch searches
+    with get_scheduler("news").turn():
+        start = time.perf_counter()
+        try:
+            if _news_client_factory is not None:
+                client = _news_client_factory()
+            else:
+                timeout = get_settings().news_timeout
+                client = DDGS(timeout=timeout) if timeout is not None else DDGS()
+            increment("api_calls")
+            with client as ddgs:
+                results = list(ddgs.news(query, max_results=max_results))
+
+            # Transform results to our format
+            articles = []
+            for result in results:
+                article = {
+                    "title": result.get("title", ""),
+                    "url": result.get("url", ""),
+                    "date": result.get("date", ""),
+                    "source": result.get("source", ""),
+                }
+                articles.append(article)
+
+            NEWS_REQUESTS.labels("ok").inc()
+            if cache is not None and articles:
+                cache.put("news", cache_key, articles)
+            return articles
+
+        except Exception as e:
+            NEWS_REQUESTS.labels("rate_limited" if isinstance(e, RatelimitException) else "error").inc()
+            logger.warning(f"Error fetching news for {ticker}: {e}")
+            return []
+
+        finally:
+            NEWS_REQUEST_SECONDS.observe(time.perf_counter() - start)
 
 
 def analyze_news_sentiment(ticker: str, company_name: str = "") -> SentimentResult:
@@ -0,0 +1,99 @@
+"""Multi-timeframe resampling of daily OHLCV bars."""
+
+import numpy as np
+
+from stockagent.data.bars import BarColumns, bars_to_columns, columns_to_bars
+from stockagent.models import OHLCV
+
+# Supported timeframes, from finest to coarsest
+TIMEFRAMES = ("day", "week", "month")
+
+
+def _period_keys(timestamps: np.ndarray, timeframe: str) -> np.ndarray:
+    """Map each timestamp to the start of its resampling period.
+
+    Args:
+        timestamps: datetime64 array of bar timestamps
+        timeframe: "week" (Monday-based) or "month"
+
+    Returns:
+        datetime64[D] array of period start dates
+    """
+    days = timestamps.astype("datetime64[D]")
+
+    if timeframe == "week":
+        # 1970-01-01 was a Thursday, so (day + 3) % 7 is 0 on Mondays
+        weekday = (days.astype(np.int64) + 3) % 7
+        return days - weekday.astype("timedelta64[D]")
+
+    return days.astype("datetime64[M]").astype("datetime64[D]")
+
+
+def resample_columns(columns: BarColumns, timeframe: str) -> BarColumns:
+    """Aggregate daily bar columns into a coarser timeframe.
+
+    Each output bar takes the first open, highest high, lowest low, last
+    close and total volume of its period. The output timestamp is that of
+    the last daily bar in the period, i.e. the day the period closed.
+
+    Args:
+        columns: Daily BarColumns
+        timeframe: One of TIMEFRAMES
+
+    Returns:
+        BarColumns with one entry per period (oldest first)
+
+    Raises:
+        ValueError: If timeframe is not supported
+    """
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(
+            f"Unsupported timeframe '{timeframe}'. Expected one of: {', '.join(TIMEFRAMES)}"
+        )
+
+    timestamps = columns["timestamp"]
+    if timeframe == "day" or len(timestamps) == 0:
+        return columns
+
+    # Group-by relies on contiguous periods, so sort out-of-order input
+    if np.any(timestamps[1:] < timestamps[:-1]):
+        order = np.argsort(timestamps, kind="stable")
+        columns = {key: values[order] for key, values in columns.items()}
+        timestamps = columns["timestamp"]
+
+    keys = _period_keys(timestamps, timeframe)
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    ends = np.concatenate((starts[1:], [len(keys)])) - 1
+
+    return {
+        "timestamp": timestamps[ends],
+        "open": columns["open"][starts],
+        "high": np.maximum.reduceat(columns["high"], starts),
+        "low": np.minimum.reduceat(columns["low"], starts),
+        "close": columns["close"][ends],
+        "volume": np.add.reduceat(columns["volume"], starts),
+    }
+
+
+def resample_bars(bars: list[dict], timeframe: str) -> list[OHLCV]:
+    """Aggregate daily OHLCV bars into a coarser timeframe.
+
+    Args:
+        bars: List of daily OHLCV dicts (most recent last)
+        timeframe: One of TIMEFRAMES ("day", "week", "month")
+
+    Returns:
+        List of OHLCV dicts, one per period
+
+    Raises:
+        ValueError: If timeframe is not supported or bars lack timestamps
+    """
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(
+            f"Unsupported timeframe '{timeframe}'. Expected one of: {', '.join(TIMEFRAMES)}"
+        )
+
+    if timeframe == "day":
+        return bars
+
+    return columns_to_bars(resample_columns(bars_to_columns(bars), timeframe))
@@ -0,0 +1,193 @@
+"""Incremental indicators over a stream of bar chunks.
+
+The batch functions in stockagent.analysis.indicators need a series' whole
+price history in memory. For long intraday histories (millions of minute
+bars, fetched page by page with PolygonClient.iter_aggregates or read
+partition by partition from the bar store) StreamingIndicators consumes
+one chunk of bars at a time instead, keeping only the state needed to
+continue: EMA values for MACD and the last 200 closes for the rolling
+indicators. The values it produces are those the batch functions compute
+on every prefix of the stream (RSI and MACD exactly, rolling means to
+floating-point rounding).
+"""
+
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from stockagent.analysis.indicators import interpret_macd, interpret_rsi
+from stockagent.analysis.kernels import get_kernels, rolling_mean, rolling_std, rsi_series
+from stockagent.data.bars import BarColumns
+from stockagent.models import TechnicalSignals
+
+RSI_PERIOD = 14
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+BOLLINGER_PERIOD, BOLLINGER_STD = 20, 2
+SMA_PERIODS = (20, 50, 200)
+
+# Closes carried between chunks for the rolling indicators
+_TAIL = max(RSI_PERIOD + 1, BOLLINGER_PERIOD, *SMA_PERIODS)
+
+
+def _align(series: np.ndarray, n: int) -> np.ndarray:
+    """The last ``n`` values of a series, NaN-padded in front if shorter."""
+    if len(series) >= n:
+        return series[len(series) - n :]
+    return np.concatenate((np.full(n - len(series), np.nan), series))
+
+
+def _last(series: np.ndarray) -> float | None:
+    if not len(series) or np.isnan(series[-1]):
+        return None
+    return float(series[-1])
+
+
+class StreamingEMA:
+    """Exponential moving average updated a chunk at a time.
+
+    Seeded with the SMA of the first ``period`` values, like ema_series().
+
+    Args:
+        period: EMA period
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self.value: float | None = None
+        self._seed = np.array([], dtype=np.float64)
+
+    def update(self, values) -> np.ndarray:
+        """Consume values (oldest first).
+
+        Returns:
+            EMA after each value, NaN until ``period`` values have been seen
+        """
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        out = np.full(len(values), np.nan)
+        start = 0
+        if self.value is None:
+            start = self.period - len(self._seed)
+            self._seed = np.concatenate((self._seed, values[:start]))
+            if len(self._seed) < self.period:
+                return out
+            self.value = float(np.mean(self._seed))
+            out[start - 1] = self.value
+        if start < len(values):
+            # The kernel treats its first `period` inputs as the seed window
+            padded = np.concatenate((np.zeros(self.period), values[start:]))
+            series = get_kernels()["ema_series"](padded, self.period, self.value)[1:]
+            out[start:] = series
+            self.value = float(series[-1])
+        return out
+
+
+class StreamingIndicators:
+    """RSI, MACD, Bollinger Bands and SMAs of one series, fed chunk by chunk.
+
+    Memory use is bounded by the largest chunk, whatever the stream length.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.current_price: float | None = None
+        self._tail = np.array([], dtype=np.float64)
+        self._fast = StreamingEMA(MACD_FAST)
+        self._slow = StreamingEMA(MACD_SLOW)
+        self._signal = StreamingEMA(MACD_SIGNAL)
+        self._macd_seen = 0
+        self._last: dict[str, float | None] = {}
+
+    def update(self, columns: BarColumns) -> dict[str, np.ndarray]:
+        """Consume the next chunk of bars (oldest first, after any earlier chunk).
+
+        Args:
+            columns: BarColumns (only timestamp and close are used)
+
+        Returns:
+            dict of arrays aligned with the chunk: timestamp, close, rsi,
+            macd_line, macd_signal, macd_histogram, bollinger_upper,
+            bollinger_middle, bollinger_lower, sma_20, sma_50 and sma_200
+            (NaN where the history is still too short)
+        """
+        closes = np.ascontiguousarray(columns["close"], dtype=np.float64)
+        n = len(closes)
+        history = np.concatenate((self._tail, closes))
+
+        middle = _align(rolling_mean(history, BOLLINGER_PERIOD), n)
+        std = _align(rolling_std(history, BOLLINGER_PERIOD), n)
+        result = {
+            "timestamp": columns["timestamp"],
+            "close": closes,
+            "rsi": _align(rsi_series(history, RSI_PERIOD), n),
+            **self._update_macd(closes),
+            "bollinger_upper": middle + BOLLINGER_STD * std,
+            "bollinger_middle": middle,
+            "bollinger_lower": middle - BOLLINGER_STD * std,
+        }
+        for period in SMA_PERIODS:
+            result[f"sma_{period}"] = _align(rolling_mean(history, period), n)
+
+        if n:
+            self.count += n
+            self.current_price = float(closes[-1])
+            self._tail = history[-_TAIL:]
+            self._last = {name: _last(values) for name, values in result.items() if name not in ("timestamp", "close")}
+        return result
+
+    def _update_macd(self, closes: np.ndarray) -> dict[str, np.ndarray]:
+        macd = self._fast.update(closes) - self._slow.update(closes)
+        ready = ~np.isnan(macd)
+        signal = np.full(len(closes), np.nan)
+        signal[ready] = self._signal.update(macd[ready])
+
+        # As calculate_macd(): until the signal EMA is seeded, it equals the MACD line
+        (positions,) = np.nonzero(ready)
+        early = positions[self._macd_seen + np.arange(len(positions)) < MACD_SIGNAL - 1]
+        signal[early] = macd[early]
+        self._macd_seen += len(positions)
+        return {"macd_line": macd, "macd_signal": signal, "macd_histogram": macd - signal}
+
+    def signals(self) -> TechnicalSignals:
+        """Indicator values after the last bar, as calculate_all_indicators() returns them."""
+        last = self._last
+        rsi = last.get("rsi")
+        macd = None
+        if last.get("macd_line") is not None:
+            macd = {
+                "macd_line": last["macd_line"],
+                "signal_line": last["macd_signal"],
+                "histogram": last["macd_histogram"],
+            }
+        bollinger = None
+        if last.get("bollinger_middle") is not None:
+            bollinger = {
+                "upper": last["bollinger_upper"],
+                "middle": last["bollinger_middle"],
+                "lower": last["bollinger_lower"],
+            }
+        return {
+            "rsi": rsi,
+            "rsi_interpretation": interpret_rsi(rsi),
+            "macd": macd,
+            "macd_interpretation": interpret_macd(macd),
+            "bollinger": bollinger,
+            "sma_20": last.get("sma_20"),
+            "sma_50": last.get("sma_50"),
+            "sma_200": last.get("sma_200"),
+            "current_price": self.current_price or 0.0,
+        }
+
+
+def stream_indicators(chunks: Iterable[BarColumns]) -> Iterator[dict[str, np.ndarray]]:
+    """Compute indicators over a stream of bar chunks.
+
+    Args:
+        chunks: BarColumns in time order, e.g. PolygonClient.iter_aggregates()
+            pages or BarStore.iter_partitions()
+
+    Yields:
+        StreamingIndicators.update() output per chunk
+    """
+    indicators = StreamingIndicators()
+    for chunk in chunks:
+        yield indicators.update(chunk)
@@ -0,0 +1,376 @@
+"""Command-line interface for StockAgent.
+
+Usage:
+    stockagent serve [--host HOST] [--port PORT] [--workers N] [--ttl SECONDS]
+    stockagent batch [TICKERS_FILE | -] [-o OUTPUT.jsonl] [--resume] [--checkpoint DB] [--workers N]
+    stockagent warm [TICKERS_FILE | -] [--at HH:MM] [--once] [--workers N]
+    stockagent backfill [TICKERS_FILE | -] --from YYYY-MM-DD [--to YYYY-MM-DD] [--timespan day] [--workers N] [--no-adjust]
+    stockagent live [TICKERS_FILE | -] [--sessions N] [--url WS_URL] [--duration SECONDS]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from collections import Counter
+from contextlib import ExitStack
+from datetime import date, time
+from pathlib import Path
+from typing import Any
+
+from stockagent.config import get_settings
+from stockagent.utils.tickers import read_tickers, result_status
+
+logger = logging.getLogger(__name__)
+
+# Fields written per ticker by `stockagent batch` (unless --full)
+SUMMARY_FIELDS = (
+    "ticker",
+    "company_name",
+    "current_price",
+    "previous_close",
+    "recommendation",
+    "confidence",
+    "score",
+    "explanation_factors",
+    "errors",
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with one subparser per command."""
+    parser = argparse.ArgumentParser(prog="stockagent", description="LangGraph-based stock analysis agent")
+    parser.add_argument("--log-level", default="INFO", help="Logging level (default: INFO)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Run the HTTP/JSON analysis service")
+    serve.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8000, help="Port to bind (default: 8000)")
+    serve.add_argument("--workers", type=int, help="Concurrent analyses (default: STOCKAGENT_MAX_WORKERS)")
+    serve.add_argument("--ttl", type=float, help="Seconds to reuse a result (default: STOCKAGENT_RESULT_TTL)")
+    serve.add_argument("--max-pending", type=int, help="Distinct tickers queued before answering 503 (default: 100)")
+
+    batch = commands.add_parser("batch", help="Analyze tickers from a file or stdin, writing JSON lines")
+    batch.add_argument(
+        "input", nargs="?", default="-", help="File with tickers separated by newlines, commas or spaces (default: stdin)"
+    )
+    batch.add_argument("-o", "--output", type=Path, help="JSONL output file (default: stdout)")
+    batch.add_argument("--resume", action="store_true", help="Skip tickers already completed in --output")
+    batch.add_argument("--workers", type=int, help="Concurrent analyses (default: STOCKAGENT_MAX_WORKERS)")
+    batch.add_argument(
+        "--calls-per-minute",
+        type=int,
+        help="Polygon request limit, 0 for none (default: STOCKAGENT_POLYGON_CALLS_PER_MINUTE)",
+    )
+    batch.add_argument("--full", action="store_true", help="Write the complete analysis state per ticker")
+    batch.add_argument(
+        "--checkpoint",
+        type=Path,
+        help="SQLite file for per-node checkpoints, so a restarted run skips completed work",
+    )
+    batch.add_argument("--run-id", help="Checkpointed run to create or continue (default: the --output file name)")
+
+    warm = commands.add_parser(
+        "warm", help="Pre-fetch market data and news for a watchlist into the cache on trading days"
+    )
+    warm.add_argument(
+        "input", nargs="?", default="-", help="File with tickers separated by newlines, commas or spaces (default: stdin)"
+    )
+    warm.add_argument(
+        "--at", type=time.fromisoformat, default=time(8, 30), help="Time to warm, US/Eastern (default: 08:30)"
+    )
+    warm.add_argument("--once", action="store_true", help="Warm now and exit instead of running daily")
+    warm.add_argument("--workers", type=int, help="Tickers fetched concurrently (default: STOCKAGENT_MAX_WORKERS)")
+    warm.add_argument(
+        "--calls-per-minute",
+        type=int,
+        help="Polygon requests per minute, spread evenly; 0 for no pacing (default: STOCKAGENT_POLYGON_CALLS_PER_MINUTE)",
+    )
+
+    backfill = commands.add_parser("backfill", help="Fetch historical bars into the local bar store")
+    backfill.add_argument(
+        "input", nargs="?", default="-", help="File with tickers separated by newlines, commas or spaces (default: stdin)"
+    )
+    backfill.add_argument(
+        "--from", dest="start", type=date.fromisoformat, required=True, help="First date to fetch (YYYY-MM-DD)"
+    )
+    backfill.add_argument("--to", dest="end", type=date.fromisoformat, help="Last date to fetch (default: today)")
+    backfill.add_argument(
+        "--timespan",
+        choices=("minute", "hour", "day", "week", "month"),
+        default="day",
+        help="Bar timespan (default: day)",
+    )
+    backfill.add_argument("--multiplier", type=int, default=1, help="Bar size in timespans (default: 1)")
+    backfill.add_argument("--workers", type=int, help="Date shards fetched concurrently (default: STOCKAGENT_MAX_WORKERS)")
+    backfill.add_argument(
+        "--calls-per-minute",
+        type=int,
+        help="Polygon request limit, 0 for none (default: STOCKAGENT_POLYGON_CALLS_PER_MINUTE)",
+    )
+    backfill.add_argument(
+        "--no-adjust",
+        action="store_true",
+        help="Skip re-adjusting stored bars for stock splits since they were fetched",
+    )
+
+    live = commands.add_parser("live", help="Stream minute bars and write recommendation changes as JSON lines")
+    live.add_argument(
+        "input", nargs="?", default="-", help="File with tickers separated by newlines, commas or spaces (default: stdin)"
+    )
+    live.add_argument(
+        "--sessions",
+        type=int,
+        default=2,
+        help="Past trading sessions of minute bars to prime indicators with; 0 to skip (default: 2)",
+    )
+    live.add_argument("--url", help="Stocks stream URL (default: POLYGON_WS_URL or Polygon's real-time feed)")
+    live.add_argument("--duration", type=float, help="Stop after this many seconds (default: run until interrupted)")
+    return parser
+
+
+def make_record(result: dict[str, Any], full: bool = False) -> dict[str, Any]:
+    """Build the JSON line written for one analysis."""
+    fields = result if full else {name: result[name] for name in SUMMARY_FIELDS if name in result}
+    return {**fields, "status": result_status(result)}
+
+
+def read_completed(path: Path) -> set[str]:
+    """Tickers already written successfully to a batch output file.
+
+    A truncated last line (from an interrupted run) is removed so appended
+    records start on a fresh line. Failed tickers are not counted, so a
+    resumed run retries them.
+
+    Args:
+        path: Existing JSONL output (a missing file counts as empty)
+
+    Returns:
+        Set of completed ticker symbols
+    """
+    if not path.exists():
+        return set()
+
+    with path.open("rb+") as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            logger.warning(f"Discarding truncated last line of {path}")
+            f.truncate(end)
+
+    completed = set()
+    for line in data[:end].splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if record.get("status") in ("ok", "partial"):
+            completed.add(record["ticker"])
+    return completed
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """Run `stockagent batch`.
+
+    Returns:
+        0 if every ticker produced price data, 1 otherwise
+    """
+    from stockagent.data import TokenBucket, set_rate_limiter
+    from stockagent.graph import create_workflow, run_batch_analysis, sqlite_checkpointer
+
+    completed = read_completed(args.output) if args.resume else set()
+    if completed:
+        logger.info(f"Resuming: {len(completed)} tickers already in {args.output}")
+
+    calls = args.calls_per_minute
+    if calls is None:
+        calls = get_settings().polygon_calls_per_minute
+
+    with ExitStack() as stack:
+        source = sys.stdin if args.input == "-" else stack.enter_context(open(args.input))
+        out = stack.enter_context(args.output.open("a" if args.resume else "w")) if args.output else sys.stdout
+        checkpointer = stack.enter_context(sqlite_checkpointer(args.checkpoint)) if args.checkpoint else None
+
+        previous_limiter = set_rate_limiter(TokenBucket.per_minute(calls) if calls > 0 else None)
+        stack.callback(set_rate_limiter, previous_limiter)
+
+        tickers = (ticker for ticker in read_tickers(source) if ticker not in completed)
+        workflow = create_workflow(checkpointer=checkpointer)
+        counts: Counter[str] = Counter()
+        try:
+            for result in run_batch_analysis(tickers, args.workers, workflow, args.run_id if checkpointer else None):
+                record = make_record(result, args.full)
+                out.write(json.dumps(record, default=str) + "\n")
+                out.flush()
+                counts[record["status"]] += 1
+        except BrokenPipeError:
+            # Downstream reader exited (e.g. `| head`); silence the final flush
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 1
+
+    logger.info(
+        f"Analyzed {sum(counts.values())} tickers: "
+        f"{counts['ok']} ok, {counts['partial']} partial, {counts['failed']} failed"
+    )
+    return 1 if counts["failed"] else 0
+
+
+def run_warm(args: argparse.Namespace) -> int:
+    """Run `stockagent warm`.
+
+    Returns:
+        With --once, 0 if every ticker was warmed and 1 otherwise; 0 when
+        a daily run is interrupted
+    """
+    from stockagent.warmer import CacheWarmer
+
+    if args.input == "-":
+        tickers = list(read_tickers(sys.stdin))
+    else:
+        with open(args.input) as source:
+            tickers = list(read_tickers(source))
+
+    try:
+        warmer = CacheWarmer(tickers, args.at, args.calls_per_minute, args.workers)
+    except ValueError as e:
+        logger.error(str(e))
+        return 2
+
+    if args.once:
+        counts = warmer.run_once()
+        return 1 if counts["failed"] else 0
+    try:
+        warmer.run_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def run_backfill(args: argparse.Namespace) -> int:
+    """Run `stockagent backfill`.
+
+    Tickers are backfilled one after another, each with its date shards
+    fetched concurrently. Completed shards are skipped on a rerun. Bars
+    already stored are first brought onto the current split-adjustment
+    basis (unless --no-adjust).
+
+    Returns:
+        0 if every shard was fetched, 1 if any failed, 2 without a bar store
+    """
+    from stockagent.data import (
+        PolygonClient,
+        TokenBucket,
+        backfill_ticker,
+        get_bar_store,
+        reconcile_splits,
+        set_rate_limiter,
+    )
+
+    store = get_bar_store()
+    if store is None:
+        logger.error("Backfill requires STOCKAGENT_CACHE_DIR to be set")
+        return 2
+
+    calls = args.calls_per_minute
+    if calls is None:
+        calls = get_settings().polygon_calls_per_minute
+
+    with ExitStack() as stack:
+        source = sys.stdin if args.input == "-" else stack.enter_context(open(args.input))
+        previous_limiter = set_rate_limiter(TokenBucket.per_minute(calls) if calls > 0 else None)
+        stack.callback(set_rate_limiter, previous_limiter)
+
+        client = PolygonClient()
+        failed = 0
+        for ticker in read_tickers(source):
+            if not args.no_adjust:
+                reconcile_splits(ticker, args.timespan, args.multiplier, store=store, client=client)
+            result = backfill_ticker(
+                ticker,
+                args.start,
+                args.end,
+                args.timespan,
+                args.multiplier,
+                store=store,
+                client=client,
+                max_workers=args.workers,
+            )
+            failed += result.failed
+    return 1 if failed else 0
+
+
+def run_live(args: argparse.Namespace) -> int:
+    """Run `stockagent live`.
+
+    Each recommendation change is written to stdout as one JSON line.
+
+    Returns:
+        0 when stopped, 1 if the stream connection ended, 2 without tickers
+    """
+    from stockagent.live import LiveIngestor, LiveScorer, prime_from_api
+
+    if args.input == "-":
+        tickers = list(read_tickers(sys.stdin))
+    else:
+        with open(args.input) as source:
+            tickers = list(read_tickers(source))
+    if not tickers:
+        logger.error("No tickers given")
+        return 2
+
+    scorer = LiveScorer()
+    if args.sessions > 0:
+        prime_from_api(scorer, tickers, args.sessions)
+
+    def write_change(change) -> None:
+        print(json.dumps(change.to_dict()), flush=True)
+
+    ingestor = LiveIngestor(tickers, scorer, write_change, url=args.url).start()
+    try:
+        ended = ingestor.join(args.duration)
+    except KeyboardInterrupt:
+        ended = False
+    finally:
+        ingestor.stop()
+    return 1 if ended else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the CLI.
+
+    Args:
+        argv: Arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit status
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "batch":
+        if args.resume and args.output is None:
+            parser.error("--resume requires --output")
+        if args.checkpoint and args.run_id is None:
+            if args.output is None:
+                parser.error("--checkpoint requires --run-id or --output")
+            args.run_id = args.output.name
+    logging.basicConfig(
+        level=args.log_level.upper(),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        stream=sys.stderr,
+    )
+
+    if args.command == "serve":
+        # Imported here so --help does not load the workflow
+        from stockagent.service import serve
+
+        serve(args.host, args.port, args.workers, args.ttl, args.max_pending)
+    elif args.command == "batch":
+        return run_batch(args)
+    elif args.command == "warm":
+        return run_warm(args)
+    elif args.command == "backfill":
+        return run_backfill(args)
+    elif args.command == "live":
+        return run_live(args)
+    return 0
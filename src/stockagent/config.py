@@ -1,15 +1,174 @@
-"""Configuration management for StockAgent."""
+"""Configuration management for StockAgent.
+
+Settings are parsed from the environment (and the project .env file) once
+per process by get_settings() and cached; call reload_settings() after
+changing the environment to pick up new values.
+"""
 
 import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+# Path: config.py -> stockagent -> src -> project_root
+ENV_PATH = Path(__file__).parent.parent.parent / ".env"
+
+MISSING_API_KEY_MESSAGE = (
+    "POLYGON_API_KEY environment variable is required. "
+    "Please set it in your .env file or environment. "
+    "Get a free API key at https://polygon.io/"
+)
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Typed, immutable StockAgent settings.
+
+    Optional tunables left as None fall back to the library default
+    (e.g. the Polygon client's own timeouts).
+
+    Attributes:
+        polygon_api_key: POLYGON_API_KEY (validated by get_polygon_api_key)
+        polygon_base_url: POLYGON_BASE_URL, an alternative REST endpoint
+        polygon_ws_url: POLYGON_WS_URL, an alternative real-time stocks stream
+        polygon_timeout: STOCKAGENT_POLYGON_TIMEOUT, connect/read timeout in seconds
+        polygon_retries: STOCKAGENT_POLYGON_RETRIES, retries per request (see RetryPolicy)
+        polygon_calls_per_minute: STOCKAGENT_POLYGON_CALLS_PER_MINUTE, API quota
+        polygon_max_concurrency: STOCKAGENT_POLYGON_MAX_CONCURRENCY, ceiling of the
+            adaptive concurrent-request limit (0 disables the limiter)
+        news_timeout: STOCKAGENT_NEWS_TIMEOUT, news search timeout in seconds
+        max_workers: STOCKAGENT_MAX_WORKERS, concurrent analyses in a batch or the service
+        result_ttl: STOCKAGENT_RESULT_TTL, seconds the service and web UI reuse an analysis
+            during market hours
+        cache_dir: STOCKAGENT_CACHE_DIR, root for on-disk caches (None: indicators
+            are memoized in memory only and API responses are not cached)
+        indicator_cache_size: STOCKAGENT_INDICATOR_CACHE_SIZE, memoized indicator results
+        kernels: STOCKAGENT_KERNELS, indicator kernel backend ("auto", "numpy" or "numba")
+        trace_file: STOCKAGENT_TRACE_FILE, OTLP/JSON lines file for trace spans
+        otlp_endpoint: OTEL_EXPORTER_OTLP_ENDPOINT, OTLP/HTTP collector base URL
+        metrics_port: STOCKAGENT_METRICS_PORT, scrape endpoint port (None: disabled)
+        metrics_host: STOCKAGENT_METRICS_HOST, scrape endpoint bind address
+    """
+
+    polygon_api_key: str | None = None
+    polygon_base_url: str | None = None
+    polygon_ws_url: str | None = None
+    polygon_timeout: float | None = None
+    polygon_retries: int | None = None
+    polygon_calls_per_minute: int = 5
+    polygon_max_concurrency: int = 16
+    news_timeout: float | None = None
+    max_workers: int = 4
+    result_ttl: float = 300.0
+    cache_dir: Path | None = None
+    indicator_cache_size: int = 256
+    kernels: str = "auto"
+    trace_file: str | None = None
+    otlp_endpoint: str | None = None
+    metrics_port: int | None = None
+    metrics_host: str = "127.0.0.1"
+
+    def cache_path(self, name: str) -> Path | None:
+        """Directory for a named on-disk cache, or None when caching to disk is off."""
+        return self.cache_dir / name if self.cache_dir else None
+
+
+def _parse(name: str, convert):
+    """Read and convert an environment variable, treating empty as unset."""
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        return convert(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a valid {convert.__name__}, got {value!r}") from None
+
+
+def load_settings() -> Settings:
+    """Parse settings from the environment, loading .env first.
+
+    Always re-reads; most callers want the cached get_settings().
+
+    Returns:
+        A new Settings instance
+
+    Raises:
+        ValueError: If a numeric setting cannot be parsed
+    """
+    load_dotenv(ENV_PATH)
+    defaults = Settings()
+    cache_dir = os.getenv("STOCKAGENT_CACHE_DIR")
+
+    def with_default(value, default):
+        return default if value is None else value
+
+    return Settings(
+        polygon_api_key=os.getenv("POLYGON_API_KEY") or None,
+        polygon_base_url=os.getenv("POLYGON_BASE_URL") or None,
+        polygon_ws_url=os.getenv("POLYGON_WS_URL") or None,
+        polygon_timeout=_parse("STOCKAGENT_POLYGON_TIMEOUT", float),
+        polygon_retries=_parse("STOCKAGENT_POLYGON_RETRIES", int),
+        polygon_calls_per_minute=with_default(
+            _parse("STOCKAGENT_POLYGON_CALLS_PER_MINUTE", int), defaults.polygon_calls_per_minute
+        ),
+        polygon_max_concurrency=with_default(
+            _parse("STOCKAGENT_POLYGON_MAX_CONCURRENCY", int), defaults.polygon_max_concurrency
+        ),
+        news_timeout=_parse("STOCKAGENT_NEWS_TIMEOUT", float),
+        max_workers=with_default(_parse("STOCKAGENT_MAX_WORKERS", int), defaults.max_workers),
+        result_ttl=with_default(_parse("STOCKAGENT_RESULT_TTL", float), defaults.result_ttl),
+        cache_dir=Path(cache_dir).expanduser() if cache_dir else None,
+        indicator_cache_size=with_default(
+            _parse("STOCKAGENT_INDICATOR_CACHE_SIZE", int), defaults.indicator_cache_size
+        ),
+        kernels=(os.getenv("STOCKAGENT_KERNELS") or defaults.kernels).strip().lower(),
+        trace_file=os.getenv("STOCKAGENT_TRACE_FILE") or None,
+        otlp_endpoint=os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT") or None,
+        metrics_port=_parse("STOCKAGENT_METRICS_PORT", int),
+        metrics_host=os.getenv("STOCKAGENT_METRICS_HOST") or defaults.metrics_host,
+    )
+
+
+_settings: Settings | None = None
+_settings_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+    """Get the process-wide settings, parsing them on first use.
+
+    Returns:
+        The cached Settings instance
+    """
+    global _settings
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                _settings = load_settings()
+    return _settings
+
+
+def reload_settings() -> Settings:
+    """Re-read the environment and .env file, replacing the cached settings.
+
+    Objects that copied a setting when they were created (e.g. an existing
+    PolygonClient) keep the old value.
+
+    Returns:
+        The new Settings instance
+    """
+    global _settings
+    with _settings_lock:
+        _settings = load_settings()
+    return _settings
+
 
 def load_config() -> dict[str, str]:
     """Load configuration from environment variables.
 
     Loads .env file if present, then reads required environment variables.
+    Unlike get_settings(), this always re-reads the environment.
 
     Returns:
         dict with configuration values including POLYGON_API_KEY
@@ -17,20 +176,13 @@ def load_config() -> dict[str, str]:
     Raises:
         ValueError: If required environment variables are missing
     """
-    # Load .env file from project root if it exists
-    # Path: config.py -> stockagent -> src -> project_root
-    env_path = Path(__file__).parent.parent.parent / ".env"
-    load_dotenv(env_path)
+    load_dotenv(ENV_PATH)
 
     # Get required API key
     polygon_api_key = os.getenv("POLYGON_API_KEY")
 
     if not polygon_api_key:
-        raise ValueError(
-            "POLYGON_API_KEY environment variable is required. "
-            "Please set it in your .env file or environment. "
-            "Get a free API key at https://polygon.io/"
-        )
+        raise ValueError(MISSING_API_KEY_MESSAGE)
 
     return {
         "POLYGON_API_KEY": polygon_api_key,
@@ -46,5 +198,19 @@ def get_polygon_api_key() -> str:
     Raises:
         ValueError: If API key is not configured
     """
-    config = load_config()
-    return config["POLYGON_API_KEY"]
+    api_key = get_settings().polygon_api_key
+    if not api_key:
+        raise ValueError(MISSING_API_KEY_MESSAGE)
+    return api_key
+
+
+def get_polygon_base_url() -> str | None:
+    """Get an alternative Polygon.io REST base URL, if configured.
+
+    Set POLYGON_BASE_URL to point the client at a proxy or a local
+    stand-in server (e.g. for benchmarks).
+
+    Returns:
+        Base URL string, or None to use the default Polygon endpoint
+    """
+    return get_settings().polygon_base_url
@@ -1,15 +1,110 @@
 """Data layer for fetching market data."""
 
-from stockagent.data.polygon_client import (
-    PolygonAPIError,
-    PolygonClient,
-    RateLimitError,
-    TickerNotFoundError,
-)
+from typing import TYPE_CHECKING
+
+from stockagent.utils.lazy import lazy_exports
+
+# Public name -> defining submodule. Submodules (and their third-party
+# dependencies) are imported on first attribute access.
+_EXPORTS = {
+    "AdaptiveLimiter": "concurrency",
+    "get_concurrency_limiter": "concurrency",
+    "set_concurrency_limiter": "concurrency",
+    "BarColumns": "bars",
+    "bars_to_columns": "bars",
+    "columns_to_bars": "bars",
+    "empty_columns": "bars",
+    "BarStore": "bar_store",
+    "get_bar_store": "bar_store",
+    "set_bar_store": "bar_store",
+    "BackfillResult": "backfill",
+    "backfill_ticker": "backfill",
+    "AdjustmentResult": "adjustments",
+    "reconcile_splits": "adjustments",
+    "PolygonAPIError": "polygon_client",
+    "PolygonClient": "polygon_client",
+    "RateLimitError": "polygon_client",
+    "TickerNotFoundError": "polygon_client",
+    "BATCH": "scheduler",
+    "INTERACTIVE": "scheduler",
+    "PREFETCH": "scheduler",
+    "PriorityScheduler": "scheduler",
+    "get_scheduler": "scheduler",
+    "request_priority": "scheduler",
+    "set_scheduler": "scheduler",
+    "Backoff": "retry",
+    "RetryPolicy": "retry",
+    "get_retry_policy": "retry",
+    "set_retry_policy": "retry",
+    "TokenBucket": "rate_limit",
+    "ensure_rate_limiter": "rate_limit",
+    "get_rate_limiter": "rate_limit",
+    "set_rate_limiter": "rate_limit",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from stockagent.data.bars import (
+        BarColumns,
+        bars_to_columns,
+        columns_to_bars,
+        empty_columns,
+    )
+    from stockagent.data.adjustments import AdjustmentResult, reconcile_splits
+    from stockagent.data.backfill import BackfillResult, backfill_ticker
+    from stockagent.data.bar_store import BarStore, get_bar_store, set_bar_store
+    from stockagent.data.concurrency import AdaptiveLimiter, get_concurrency_limiter, set_concurrency_limiter
+    from stockagent.data.polygon_client import (
+        PolygonAPIError,
+        PolygonClient,
+        RateLimitError,
+        TickerNotFoundError,
+    )
+    from stockagent.data.rate_limit import TokenBucket, ensure_rate_limiter, get_rate_limiter, set_rate_limiter
+    from stockagent.data.retry import Backoff, RetryPolicy, get_retry_policy, set_retry_policy
+    from stockagent.data.scheduler import (
+        BATCH,
+        INTERACTIVE,
+        PREFETCH,
+        PriorityScheduler,
+        get_scheduler,
+        request_priority,
+        set_scheduler,
+    )
 
 __all__ = [
+    "AdaptiveLimiter",
+    "get_concurrency_limiter",
+    "set_concurrency_limiter",
+    "BarColumns",
+    "bars_to_columns",
+    "columns_to_bars",
+    "empty_columns",
+    "BarStore",
+    "get_bar_store",
+    "set_bar_store",
+    "BackfillResult",
+    "backfill_ticker",
+    "AdjustmentResult",
+    "reconcile_splits",
     "PolygonClient",
     "PolygonAPIError",
     "TickerNotFoundError",
     "RateLimitError",
+    "TokenBucket",
+    "ensure_rate_limiter",
+    "get_rate_limiter",
+    "set_rate_limiter",
+    "Backoff",
+    "RetryPolicy",
+    "get_retry_policy",
+    "set_retry_policy",
+    "INTERACTIVE",
+    "BATCH",
+    "PREFETCH",
+    "PriorityScheduler",
+    "get_scheduler",
+    "set_scheduler",
+    "request_priority",
 ]
@@ -0,0 +1,176 @@
+"""Stock split awareness for the bar store.
+
+Polygon serves bars split-adjusted as of the day of the request, so bars
+cached before a split are on a different basis than bars fetched after
+it, and every SMA or Bollinger value spanning the two is silently wrong.
+reconcile_splits() compares a series' recorded adjustment basis with the
+ticker's splits and re-adjusts only the bars that newer splits affect
+(BarStore.apply_split). Partitions stored before bases were recorded are
+deleted instead and dropped from the backfill manifest, so the next
+backfill fetches them again.
+
+When the splits endpoint is unavailable, the stored bars are scanned for
+split-like price discontinuities instead (find_discontinuities). Cash
+dividends need no handling: Polygon's adjusted bars reflect splits only.
+"""
+
+import logging
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from stockagent.data.backfill import MANIFEST_NAME, BackfillManifest
+from stockagent.data.bar_store import BarStore, bar_days, get_bar_store, partition_range
+from stockagent.data.bars import BarColumns
+from stockagent.data.polygon_client import PolygonAPIError, PolygonClient
+from stockagent.utils.metrics import BAR_ADJUSTMENTS
+
+logger = logging.getLogger(__name__)
+
+# Smallest bar-to-bar price jump (either way) considered a possible split
+MIN_SPLIT_JUMP = 1.4
+
+
+def _split_ratio(jump: float, tolerance: float, max_denominator: int) -> float | None:
+    """The split ratio (p/q, q <= max_denominator) a price jump matches, if any."""
+    factor = max(jump, 1 / jump)
+    for q in range(1, max_denominator + 1):
+        p = round(factor * q)
+        if p > q and abs(factor - p / q) <= tolerance * factor:
+            return p / q if jump >= 1 else q / p
+    return None
+
+
+def find_discontinuities(
+    columns: BarColumns,
+    previous_close: float | None = None,
+    tolerance: float = 0.03,
+    max_denominator: int = 4,
+) -> list[tuple[np.datetime64, float]]:
+    """Find split-like price jumps between consecutive bars.
+
+    A jump from one bar's close to the next bar's open of at least
+    MIN_SPLIT_JUMP (either way) that is within ``tolerance`` of a simple
+    ratio (2-for-1, 3-for-2, 1-for-10, ...) is taken to be an unadjusted
+    split.
+
+    Args:
+        columns: Bars, oldest first
+        previous_close: Close of the bar before ``columns`` (to scan chunk by chunk)
+        tolerance: Relative distance allowed from the nearest split ratio
+        max_denominator: Largest ``q`` of the p/q ratios considered
+
+    Returns:
+        List of (timestamp of the first bar after the jump, ratio), where
+        ratio is the split's new shares per old share
+    """
+    opens = np.asarray(columns["open"], dtype=np.float64)
+    if not len(opens):
+        return []
+    previous = np.concatenate(([np.nan if previous_close is None else previous_close], columns["close"][:-1]))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        jumps = previous / opens
+    (candidates,) = np.nonzero((jumps >= MIN_SPLIT_JUMP) | (jumps <= 1 / MIN_SPLIT_JUMP))
+    found = []
+    for i in candidates:
+        ratio = _split_ratio(float(jumps[i]), tolerance, max_denominator)
+        if ratio is not None:
+            found.append((columns["timestamp"][i], ratio))
+    return found
+
+
+@dataclass
+class AdjustmentResult:
+    """Outcome of reconciling one stored series with its stock splits."""
+
+    ticker: str
+    source: str = "splits"
+    splits: list[dict] = field(default_factory=list)
+    adjusted: list[str] = field(default_factory=list)
+    invalidated: list[str] = field(default_factory=list)
+
+
+def _stored_discontinuities(store: BarStore, ticker: str, timespan: str, multiplier: int) -> list[tuple]:
+    """Discontinuities of a stored series as (date, ratio, basis of the bar after the jump)."""
+    found = []
+    previous = None
+    for columns in store.iter_partitions(ticker, timespan, multiplier):
+        for timestamp, ratio in find_discontinuities(columns, previous):
+            basis = store.basis_at(ticker, timestamp, timespan, multiplier)
+            found.append((str(bar_days(np.array([timestamp]), timespan)[0]), ratio, basis))
+        previous = float(columns["close"][-1])
+    return found
+
+
+def reconcile_splits(
+    ticker: str,
+    timespan: str = "day",
+    multiplier: int = 1,
+    store: BarStore | None = None,
+    client: PolygonClient | None = None,
+) -> AdjustmentResult:
+    """Bring a stored series onto the current split-adjustment basis.
+
+    Splits executed after the oldest stored bar's basis are applied to the
+    partitions holding older-basis bars before them; other partitions are
+    not touched. Nothing is requested for a series without stored bars.
+
+    Args:
+        ticker: Ticker symbol
+        timespan: Bar timespan
+        multiplier: Bar size in timespans
+        store: Bar store (default: get_bar_store())
+        client: Polygon client for the splits endpoint (default: a new PolygonClient)
+
+    Returns:
+        AdjustmentResult with the splits applied ("execution_date", "ratio")
+        and the re-adjusted and deleted partitions; ``source`` is
+        "discontinuities" when the splits could not be listed
+
+    Raises:
+        ValueError: If no store is given and STOCKAGENT_CACHE_DIR is not set
+    """
+    store = store or get_bar_store()
+    if store is None:
+        raise ValueError("Split reconciliation requires STOCKAGENT_CACHE_DIR to be set")
+    ticker = ticker.upper().strip()
+    result = AdjustmentResult(ticker)
+    bases = store.adjustment_basis(ticker, timespan, multiplier)
+    if not bases:
+        return result
+
+    try:
+        # A split is reflected in bars fetched on or after its execution date
+        splits = [
+            (split["execution_date"], split["split_to"] / split["split_from"], split["execution_date"])
+            for split in (client or PolygonClient()).get_splits(ticker)
+        ]
+    except PolygonAPIError as e:
+        logger.warning(f"Could not list splits of {ticker}; checking stored bars for discontinuities: {e}")
+        result.source = "discontinuities"
+        splits = _stored_discontinuities(store, ticker, timespan, multiplier)
+
+    oldest = None if None in bases.values() else min(bases.values())
+    for execution_date, ratio, basis in splits:
+        # Every stored bar already reflects this split
+        if oldest is not None and basis is not None and np.datetime64(basis, "D") <= oldest:
+            continue
+        adjusted, invalidated = store.apply_split(ticker, execution_date, ratio, timespan, multiplier, basis)
+        if adjusted or invalidated:
+            result.splits.append({"execution_date": execution_date, "ratio": ratio})
+        result.adjusted += [name for name in adjusted if name not in result.adjusted]
+        result.invalidated += invalidated
+
+    if result.invalidated:
+        manifest = BackfillManifest(store.series_dir(ticker, timespan, multiplier) / MANIFEST_NAME)
+        for name in result.invalidated:
+            first, last = partition_range(name, timespan)
+            manifest.discard(first.item(), last.item())
+    BAR_ADJUSTMENTS.labels("adjusted").inc(len(result.adjusted))
+    BAR_ADJUSTMENTS.labels("invalidated").inc(len(result.invalidated))
+    if result.splits:
+        logger.info(
+            f"Applied {len(result.splits)} split(s) to {ticker}: {len(result.adjusted)} partitions re-adjusted, "
+            f"{len(result.invalidated)} deleted for refetching"
+        )
+    return result
@@ -0,0 +1,208 @@
+"""Paginated, date-sharded backfill of historical bars.
+
+Years of daily bars, or even weeks of minute bars, are far more than one
+aggregates request returns. A backfill splits the requested range into
+date shards aligned with the bar store's partitions (calendar years for
+daily bars, months for intraday bars), fetches the shards concurrently,
+follows each shard's pagination and writes every page to the bar store as
+it arrives, so memory stays bounded by a page and a partition whatever
+the range.
+
+Requests go through the Polygon client's rate limiters and scheduler at
+batch priority. Completed shards are recorded in a manifest next to the
+bars, so an interrupted backfill resumes where it stopped; shards reaching
+today are never recorded, as their bars are not final yet.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+
+from stockagent.config import get_settings
+from stockagent.data.bar_store import BarStore, get_bar_store, partition_unit
+from stockagent.data.calendar import EXCHANGE_TZ
+from stockagent.data.polygon_client import PolygonAPIError, PolygonClient
+from stockagent.data.scheduler import BATCH, request_priority
+from stockagent.utils.metrics import BACKFILL_BARS, BACKFILL_SHARDS
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "backfill.json"
+
+Shard = tuple[date, date]
+
+
+def date_shards(start: date, end: date, timespan: str = "day") -> list[Shard]:
+    """Split a date range into shards aligned with bar store partitions.
+
+    Args:
+        start: First date (inclusive)
+        end: Last date (inclusive)
+        timespan: Bar timespan; intraday bars are sharded by month, others by year
+
+    Returns:
+        List of (first, last) dates covering the range, oldest first
+    """
+    monthly = partition_unit(timespan) == "M"
+    shards = []
+    first = start
+    while first <= end:
+        if monthly:
+            next_first = date(first.year + first.month // 12, first.month % 12 + 1, 1)
+        else:
+            next_first = date(first.year + 1, 1, 1)
+        last = min(date.fromordinal(next_first.toordinal() - 1), end)
+        shards.append((first, last))
+        first = next_first
+    return shards
+
+
+class BackfillManifest:
+    """Completed shards of one series, persisted as JSON.
+
+    Args:
+        path: Manifest file (created on the first completed shard)
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        try:
+            self._complete = set(json.loads(self.path.read_text())["complete"])
+        except FileNotFoundError:
+            self._complete = set()
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable backfill manifest {self.path}: {e}")
+            self._complete = set()
+
+    @staticmethod
+    def _key(shard: Shard) -> str:
+        return f"{shard[0]}/{shard[1]}"
+
+    def __contains__(self, shard: Shard) -> bool:
+        with self._lock:
+            return self._key(shard) in self._complete
+
+    def add(self, shard: Shard) -> None:
+        """Record a shard as complete."""
+        with self._lock:
+            self._complete.add(self._key(shard))
+            self._save()
+
+    def discard(self, first: date, last: date) -> int:
+        """Forget completed shards overlapping a date range, so they are fetched again.
+
+        Returns:
+            Number of shards forgotten
+        """
+        with self._lock:
+            overlapping = {
+                key
+                for key in self._complete
+                if date.fromisoformat(key[:10]) <= last and date.fromisoformat(key[11:]) >= first
+            }
+            if overlapping:
+                self._complete -= overlapping
+                self._save()
+            return len(overlapping)
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"complete": sorted(self._complete)}, f)
+        os.replace(tmp_name, self.path)
+
+
+@dataclass
+class BackfillResult:
+    """Outcome of backfilling one ticker."""
+
+    ticker: str
+    shards: int = 0
+    skipped: int = 0
+    failed: int = 0
+    bars: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+def backfill_ticker(
+    ticker: str,
+    start: date,
+    end: date | None = None,
+    timespan: str = "day",
+    multiplier: int = 1,
+    store: BarStore | None = None,
+    client: PolygonClient | None = None,
+    max_workers: int | None = None,
+    priority: str = BATCH,
+) -> BackfillResult:
+    """Fetch a ticker's bars for a date range into the bar store.
+
+    Args:
+        ticker: Ticker symbol
+        start: First date (inclusive)
+        end: Last date (inclusive; default: today)
+        timespan: Bar timespan ("day", "hour", "minute", ...)
+        multiplier: Bar size in timespans
+        store: Bar store to write to (default: get_bar_store())
+        client: Polygon client (default: a new PolygonClient)
+        max_workers: Shards fetched concurrently (default: STOCKAGENT_MAX_WORKERS)
+        priority: Scheduling class of the requests
+
+    Returns:
+        BackfillResult with shard and bar counts
+
+    Raises:
+        ValueError: If no store is given and STOCKAGENT_CACHE_DIR is not set
+    """
+    store = store or get_bar_store()
+    if store is None:
+        raise ValueError("Backfill requires STOCKAGENT_CACHE_DIR to be set")
+    ticker = ticker.upper().strip()
+    today = datetime.now(EXCHANGE_TZ).date()
+    end = end or today
+    client = client or PolygonClient()
+    manifest = BackfillManifest(store.series_dir(ticker, timespan, multiplier) / MANIFEST_NAME)
+
+    shards = date_shards(start, end, timespan)
+    pending = [shard for shard in shards if shard not in manifest]
+    result = BackfillResult(ticker, shards=len(shards), skipped=len(shards) - len(pending))
+    BACKFILL_SHARDS.labels("skipped").inc(result.skipped)
+
+    def fetch(shard: Shard) -> int:
+        # Executor threads do not inherit the caller's context
+        with request_priority(priority, flow=ticker):
+            bars = 0
+            for page in client.iter_aggregates(ticker, shard[0], shard[1], timespan, multiplier):
+                bars += store.write(ticker, page, timespan, multiplier)
+                BACKFILL_BARS.inc(len(page["timestamp"]))
+        if shard[1] < today:
+            manifest.add(shard)
+        return bars
+
+    workers = max_workers or get_settings().max_workers
+    with ThreadPoolExecutor(workers, thread_name_prefix="backfill") as executor:
+        futures = {shard: executor.submit(fetch, shard) for shard in pending}
+        for shard, future in futures.items():
+            try:
+                result.bars += future.result()
+            except PolygonAPIError as e:
+                logger.warning(f"Backfill of {ticker} {shard[0]}..{shard[1]} failed: {e}")
+                result.failed += 1
+                result.errors.append(f"{shard[0]}..{shard[1]}: {e}")
+                BACKFILL_SHARDS.labels("failed").inc()
+            else:
+                BACKFILL_SHARDS.labels("fetched").inc()
+
+    logger.info(
+        f"Backfilled {ticker}: {result.bars} bars, {len(pending) - result.failed} shards fetched, "
+        f"{result.skipped} already complete, {result.failed} failed"
+    )
+    return result
@@ -0,0 +1,414 @@
+"""Local columnar store of historical bars.
+
+Bars are kept per ticker and timespan in time partitions (one .npz file
+per calendar year for daily and longer bars, per month for intraday
+bars, both by trading day like the backfill's date shards), so long histories are written and read a partition at a time
+instead of all at once. Writes merge into existing partitions: bars are
+deduplicated by timestamp, with the newest write winning, so re-fetching
+a range is safe.
+
+Polygon's bars are split-adjusted as of the day they are fetched, so
+every bar is stored with its adjustment basis: the date up to which its
+prices reflect stock splits. After a split, apply_split() re-adjusts just
+the older-basis bars before the split date, in the partitions holding
+them, instead of the cache being wiped (see stockagent.data.adjustments).
+
+Layout::
+
+    <root>/<TICKER>/<multiplier><timespan>/<partition>.npz
+"""
+
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from stockagent.config import get_settings
+from stockagent.data.bars import BarColumns, empty_columns
+from stockagent.data.calendar import EXCHANGE_TZ
+
+COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+PRICE_COLUMNS = ("open", "high", "low", "close")
+
+# Timespans stored in monthly rather than yearly partitions
+INTRADAY_TIMESPANS = ("second", "minute", "hour")
+
+
+def partition_unit(timespan: str) -> str:
+    """NumPy datetime unit of a timespan's partitions ("Y" or "M")."""
+    return "M" if timespan in INTRADAY_TIMESPANS else "Y"
+
+
+def concat_columns(chunks: list[BarColumns]) -> BarColumns:
+    """Concatenate bar columns (in the given order)."""
+    if not chunks:
+        return empty_columns()
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in COLUMNS}
+
+
+def _take(columns: BarColumns, index: np.ndarray | slice) -> BarColumns:
+    return {name: columns[name][index] for name in COLUMNS}
+
+
+def partition_range(name: str, timespan: str = "day") -> tuple[np.datetime64, np.datetime64]:
+    """First and last day (datetime64[D]) covered by a partition."""
+    key = np.datetime64(name, partition_unit(timespan))
+    return key.astype("datetime64[D]"), (key + 1).astype("datetime64[D]") - 1
+
+
+def _exchange_offsets(timestamps: np.ndarray) -> np.ndarray:
+    """UTC offset of the exchange time zone at each timestamp (timedelta64[ms])."""
+    # Offsets change on the hour, so one lookup per distinct hour suffices
+    hours, inverse = np.unique(timestamps.astype("datetime64[h]"), return_inverse=True)
+    offsets = [
+        datetime.fromtimestamp(int(hour.astype("datetime64[s]").astype(np.int64)), EXCHANGE_TZ).utcoffset()
+        // timedelta(milliseconds=1)
+        for hour in hours
+    ]
+    return np.array(offsets, dtype="timedelta64[ms]")[inverse.reshape(-1)]
+
+
+def bar_days(timestamps: np.ndarray, timespan: str = "day") -> np.ndarray:
+    """Trading day (datetime64[D]) of each bar.
+
+    Intraday bars belong to their date in exchange time: in winter, bars
+    from 19:00 US/Eastern fall on the next UTC day. Daily and longer bars
+    are stamped at the start of their day, so their UTC date is the day.
+    """
+    timestamps = np.asarray(timestamps, dtype="datetime64[ms]")
+    if timespan in INTRADAY_TIMESPANS:
+        timestamps = timestamps + _exchange_offsets(timestamps)
+    return timestamps.astype("datetime64[D]")
+
+
+def partition_keys(timestamps: np.ndarray, timespan: str = "day") -> np.ndarray:
+    """Partition of each bar: the year or month of its trading day."""
+    return bar_days(timestamps, timespan).astype(f"datetime64[{partition_unit(timespan)}]")
+
+
+def exchange_midnight(day: date | str | np.datetime64) -> np.datetime64:
+    """Start of a day in the exchange time zone, as UTC datetime64[ms]."""
+    day = np.datetime64(day, "D").astype(date)
+    start = datetime.combine(day, time(), EXCHANGE_TZ).astimezone(timezone.utc)
+    return np.datetime64(start.replace(tzinfo=None), "ms")
+
+
+def _bound(value: np.datetime64 | str, timespan: str, after: bool = False) -> np.datetime64:
+    """Start of a range bound (or of the period after it, for an inclusive end) as UTC ms.
+
+    Dates, months and years start at midnight of their trading day.
+    """
+    value = np.datetime64(value) + int(after)
+    if np.datetime_data(value.dtype)[0] not in ("Y", "M", "W", "D"):
+        return value.astype("datetime64[ms]")
+    day = value.astype("datetime64[D]")
+    return exchange_midnight(day) if timespan in INTRADAY_TIMESPANS else day.astype("datetime64[ms]")
+
+
+def _today() -> np.datetime64:
+    return np.datetime64(datetime.now(EXCHANGE_TZ).date(), "D")
+
+
+class BarStore:
+    """Thread-safe partitioned store of BarColumns on disk.
+
+    Args:
+        root: Directory holding the store
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self._locks: defaultdict[Path, threading.Lock] = defaultdict(threading.Lock)
+        self._locks_lock = threading.Lock()
+
+    def series_dir(self, ticker: str, timespan: str = "day", multiplier: int = 1) -> Path:
+        """Directory holding one ticker's bars of one size."""
+        return self.root / ticker.upper() / f"{multiplier}{timespan}"
+
+    def _lock(self, path: Path) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks[path]
+
+    def partitions(self, ticker: str, timespan: str = "day", multiplier: int = 1) -> list[str]:
+        """Names of a series' stored partitions, oldest first (e.g. ["2023", "2024"])."""
+        directory = self.series_dir(ticker, timespan, multiplier)
+        if not directory.is_dir():
+            return []
+        return sorted(path.stem for path in directory.glob("*.npz"))
+
+    def _load(self, path: Path) -> tuple[BarColumns, np.ndarray]:
+        """A partition's bars and their adjustment basis (NaT if not recorded)."""
+        try:
+            with np.load(path) as data:
+                columns = {name: data[name] for name in COLUMNS}
+                if "basis" in data.files:
+                    return columns, data["basis"]
+        except FileNotFoundError:
+            return empty_columns(), np.array([], dtype="datetime64[D]")
+        # Written before bases were recorded
+        return columns, np.full(len(columns["timestamp"]), np.datetime64("NaT"), dtype="datetime64[D]")
+
+    def _save(self, path: Path, columns: BarColumns, basis: np.ndarray) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, basis=basis, **columns)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def write(
+        self,
+        ticker: str,
+        columns: BarColumns,
+        timespan: str = "day",
+        multiplier: int = 1,
+        basis: date | str | None = None,
+    ) -> int:
+        """Merge bars into the store.
+
+        Only the partitions the bars fall in are read and rewritten.
+
+        Args:
+            ticker: Ticker symbol
+            columns: Bars to store (any order)
+            timespan: Bar timespan ("day", "minute", ...)
+            multiplier: Bar size in timespans
+            basis: Date up to which the bars are split-adjusted (default:
+                today, as for bars just fetched from Polygon)
+
+        Returns:
+            Number of bars written
+        """
+        count = len(columns["timestamp"])
+        if not count:
+            return 0
+        basis = _today() if basis is None else np.datetime64(basis, "D")
+        keys = partition_keys(columns["timestamp"], timespan)
+        directory = self.series_dir(ticker, timespan, multiplier)
+
+        for key in np.unique(keys):
+            path = directory / f"{key}.npz"
+            chunk = _take(columns, keys == key)
+            chunk["timestamp"] = chunk["timestamp"].astype("datetime64[ms]")
+            with self._lock(path):
+                stored, stored_basis = self._load(path)
+                merged = concat_columns([stored, chunk])
+                merged_basis = np.concatenate((stored_basis, np.full(len(chunk["timestamp"]), basis)))
+                # Keep the last occurrence of each timestamp (the new bar)
+                reversed_ts = merged["timestamp"][::-1]
+                _, first = np.unique(reversed_ts, return_index=True)
+                keep = len(reversed_ts) - 1 - first
+                self._save(path, _take(merged, keep), merged_basis[keep])
+        return count
+
+    def adjustment_basis(self, ticker: str, timespan: str = "day", multiplier: int = 1) -> dict[str, np.datetime64 | None]:
+        """Oldest adjustment basis of each stored partition.
+
+        Returns:
+            Partition name -> datetime64[D], or None for partitions written
+            before bases were recorded
+        """
+        directory = self.series_dir(ticker, timespan, multiplier)
+        bases = {}
+        for name in self.partitions(ticker, timespan, multiplier):
+            path = directory / f"{name}.npz"
+            with self._lock(path):
+                _, basis = self._load(path)
+            bases[name] = None if np.isnat(basis).any() else basis.min()
+        return bases
+
+    def basis_at(
+        self, ticker: str, timestamp: np.datetime64 | str, timespan: str = "day", multiplier: int = 1
+    ) -> np.datetime64 | None:
+        """Adjustment basis of the stored bar at a timestamp (None if absent or not recorded)."""
+        timestamp = np.datetime64(timestamp, "ms")
+        key = partition_keys(np.array([timestamp]), timespan)[0]
+        path = self.series_dir(ticker, timespan, multiplier) / f"{key}.npz"
+        with self._lock(path):
+            columns, basis = self._load(path)
+        (index,) = np.nonzero(columns["timestamp"] == timestamp)
+        if not len(index) or np.isnat(basis[index[0]]):
+            return None
+        return basis[index[0]]
+
+    def apply_split(
+        self,
+        ticker: str,
+        execution_date: date | str,
+        ratio: float,
+        timespan: str = "day",
+        multiplier: int = 1,
+        basis: date | str | None = None,
+    ) -> tuple[list[str], list[str]]:
+        """Re-adjust stored bars for a stock split.
+
+        Bars of trading days before the execution date whose basis predates ``basis`` have
+        their prices divided and volumes multiplied by ``ratio``, and take
+        ``basis`` as their own. Partitions without a recorded basis cannot
+        be re-adjusted safely and are deleted instead.
+
+        Args:
+            ticker: Ticker symbol
+            execution_date: First trading day on the post-split basis
+            ratio: New shares per old share (split_to / split_from)
+            timespan: Bar timespan
+            multiplier: Bar size in timespans
+            basis: First basis reflecting the split (default: the execution date)
+
+        Returns:
+            Tuple of (re-adjusted partition names, deleted partition names)
+        """
+        split_day = np.datetime64(execution_date, "D")
+        basis = split_day if basis is None else np.datetime64(basis, "D")
+        directory = self.series_dir(ticker, timespan, multiplier)
+        adjusted, invalidated = [], []
+
+        for name in self.partitions(ticker, timespan, multiplier):
+            if partition_range(name, timespan)[0] >= split_day:
+                break
+            path = directory / f"{name}.npz"
+            with self._lock(path):
+                columns, stored_basis = self._load(path)
+                before = bar_days(columns["timestamp"], timespan) < split_day
+                if (before & np.isnat(stored_basis)).any():
+                    path.unlink()
+                    invalidated.append(name)
+                    continue
+                stale = before & (stored_basis < basis)
+                if not stale.any():
+                    continue
+                for column in PRICE_COLUMNS:
+                    columns[column] = np.where(stale, columns[column] / ratio, columns[column])
+                columns["volume"] = np.where(
+                    stale, np.rint(columns["volume"] * ratio).astype(np.int64), columns["volume"]
+                )
+                self._save(path, columns, np.where(stale, basis, stored_basis))
+            adjusted.append(name)
+        return adjusted, invalidated
+
+    def invalidate(
+        self, ticker: str, timespan: str = "day", multiplier: int = 1, partitions: list[str] | None = None
+    ) -> list[str]:
+        """Delete stored partitions of a series.
+
+        Args:
+            ticker: Ticker symbol
+            timespan: Bar timespan
+            multiplier: Bar size in timespans
+            partitions: Partition names to delete (default: all)
+
+        Returns:
+            Names of the deleted partitions
+        """
+        directory = self.series_dir(ticker, timespan, multiplier)
+        stored = self.partitions(ticker, timespan, multiplier)
+        removed = []
+        for name in stored if partitions is None else [name for name in partitions if name in stored]:
+            path = directory / f"{name}.npz"
+            with self._lock(path):
+                path.unlink(missing_ok=True)
+            removed.append(name)
+        return removed
+
+    def iter_partitions(
+        self,
+        ticker: str,
+        timespan: str = "day",
+        multiplier: int = 1,
+        start: np.datetime64 | str | None = None,
+        end: np.datetime64 | str | None = None,
+    ) -> Iterator[BarColumns]:
+        """Yield stored bars one partition at a time, oldest first.
+
+        Args:
+            ticker: Ticker symbol
+            timespan: Bar timespan
+            multiplier: Bar size in timespans
+            start: Earliest bar time to include (inclusive; a date starts at
+                midnight in exchange time for intraday bars)
+            end: Latest bar time to include (inclusive; a date includes the whole trading day)
+
+        Yields:
+            Non-empty BarColumns sorted by timestamp
+        """
+        start_ms = _bound(start, timespan) if start is not None else None
+        end_ms = _bound(end, timespan, after=True) if end is not None else None
+        directory = self.series_dir(ticker, timespan, multiplier)
+        last = None
+
+        for name in self.partitions(ticker, timespan, multiplier):
+            # Bars of a partition lie between UTC midnight of its first day
+            # and exchange midnight after its last
+            first_day, last_day = partition_range(name, timespan)
+            if start_ms is not None and exchange_midnight(last_day + 1) <= start_ms:
+                continue
+            if end_ms is not None and first_day.astype("datetime64[ms]") >= end_ms:
+                break
+            path = directory / f"{name}.npz"
+            with self._lock(path):
+                columns, _ = self._load(path)
+            mask = np.ones(len(columns["timestamp"]), dtype=bool)
+            if start_ms is not None:
+                mask &= columns["timestamp"] >= start_ms
+            if end_ms is not None:
+                mask &= columns["timestamp"] < end_ms
+            # Stores partitioned by UTC month may hold a month's last evening
+            # bars in the next partition too
+            if last is not None:
+                mask &= columns["timestamp"] > last
+            if mask.any():
+                chunk = _take(columns, mask)
+                last = chunk["timestamp"][-1]
+                yield chunk
+
+    def read(
+        self,
+        ticker: str,
+        timespan: str = "day",
+        multiplier: int = 1,
+        start: np.datetime64 | str | None = None,
+        end: np.datetime64 | str | None = None,
+    ) -> BarColumns:
+        """Read stored bars in a time range (see iter_partitions) as one set of columns."""
+        return concat_columns(list(self.iter_partitions(ticker, timespan, multiplier, start, end)))
+
+
+_default_store: BarStore | None = None
+_configured = False
+
+
+def get_bar_store() -> BarStore | None:
+    """Get the process-wide bar store.
+
+    Created on first use under STOCKAGENT_CACHE_DIR ("bars"); None when no
+    cache directory is configured.
+    """
+    global _default_store, _configured
+    if not _configured:
+        path = get_settings().cache_path("bars")
+        _default_store = BarStore(path) if path else None
+        _configured = True
+    return _default_store
+
+
+def set_bar_store(store: BarStore | None) -> BarStore | None:
+    """Replace the process-wide bar store.
+
+    Args:
+        store: New store, or None for none
+
+    Returns:
+        The previously installed store
+    """
+    global _default_store, _configured
+    previous = get_bar_store()
+    _default_store, _configured = store, True
+    return previous
@@ -0,0 +1,163 @@
+"""Columnar representation of OHLCV price bars."""
+
+import json
+from operator import itemgetter
+from typing import TypedDict
+
+import numpy as np
+
+from stockagent.models import OHLCV
+
+
+class BarColumns(TypedDict):
+    """OHLCV bars stored as parallel NumPy arrays (oldest first)."""
+
+    timestamp: np.ndarray  # datetime64[ms]
+    open: np.ndarray  # float64
+    high: np.ndarray  # float64
+    low: np.ndarray  # float64
+    close: np.ndarray  # float64
+    volume: np.ndarray  # int64
+
+
+def empty_columns() -> BarColumns:
+    """Create an empty set of bar columns.
+
+    Returns:
+        BarColumns with zero-length arrays of the correct dtypes
+    """
+    return {
+        "timestamp": np.array([], dtype="datetime64[ms]"),
+        "open": np.array([], dtype=np.float64),
+        "high": np.array([], dtype=np.float64),
+        "low": np.array([], dtype=np.float64),
+        "close": np.array([], dtype=np.float64),
+        "volume": np.array([], dtype=np.int64),
+    }
+
+
+def bars_to_columns(bars: list[dict]) -> BarColumns:
+    """Convert a list of OHLCV dicts into columnar arrays.
+
+    Bars without a close price are skipped. Missing open/high/low values
+    fall back to the close price and missing volume to zero, so partial
+    bars (e.g. close-only test data) still convert cleanly.
+
+    Args:
+        bars: List of OHLCV dicts (most recent last)
+
+    Returns:
+        BarColumns with one entry per bar
+
+    Raises:
+        ValueError: If a bar with a close price has no timestamp
+    """
+    bars = [bar for bar in bars if "close" in bar]
+    if not bars:
+        return empty_columns()
+
+    if any(not bar.get("timestamp") for bar in bars):
+        raise ValueError("All bars must have a timestamp to build bar columns")
+
+    close = np.array([bar["close"] for bar in bars], dtype=np.float64)
+
+    return {
+        "timestamp": np.array([bar["timestamp"] for bar in bars], dtype="datetime64[ms]"),
+        "open": np.array([bar.get("open", bar["close"]) for bar in bars], dtype=np.float64),
+        "high": np.array([bar.get("high", bar["close"]) for bar in bars], dtype=np.float64),
+        "low": np.array([bar.get("low", bar["close"]) for bar in bars], dtype=np.float64),
+        "close": close,
+        "volume": np.array([bar.get("volume", 0) for bar in bars], dtype=np.int64),
+    }
+
+
+def aggregates_to_columns(results: list[dict]) -> BarColumns:
+    """Convert Polygon aggregate results (JSON objects) into columnar arrays.
+
+    Args:
+        results: The "results" list of an aggregates response, with keys
+            t (Unix ms), o, h, l, c and v
+
+    Returns:
+        BarColumns in the order given
+    """
+    n = len(results)
+
+    def column(key: str, dtype) -> np.ndarray:
+        return np.fromiter(map(itemgetter(key), results), dtype=dtype, count=n)
+
+    return {
+        "timestamp": column("t", np.int64).astype("datetime64[ms]"),
+        "open": column("o", np.float64),
+        "high": column("h", np.float64),
+        "low": column("l", np.float64),
+        "close": column("c", np.float64),
+        # Volume can be fractional (e.g. with fractional shares)
+        "volume": column("v", np.float64).astype(np.int64),
+    }
+
+
+def decode_aggregates(payload: bytes | str) -> tuple[BarColumns, str | None]:
+    """Decode a raw Polygon aggregates response body into columnar arrays.
+
+    The JSON is parsed once and each field is read straight into a NumPy
+    column, without the per-bar model objects and conversions of the
+    RESTClient's decoded responses.
+
+    Args:
+        payload: Response body of an aggregates (or next_url) request
+
+    Returns:
+        Tuple of (BarColumns, empty without results; next page URL or None)
+    """
+    page = json.loads(payload)
+    results = page.get("results")
+    columns = aggregates_to_columns(results) if results else empty_columns()
+    return columns, page.get("next_url") or None
+
+
+def format_timestamps(timestamps: np.ndarray) -> list[str]:
+    """Format bar timestamps as strings.
+
+    Daily bars (all at midnight) are formatted as ``YYYY-MM-DD`` to match
+    the Polygon client output; intraday bars keep minute resolution.
+
+    Args:
+        timestamps: datetime64 array
+
+    Returns:
+        List of formatted timestamp strings
+    """
+    timestamps = timestamps.astype("datetime64[ms]")
+    days = timestamps.astype("datetime64[D]")
+    unit = "D" if np.array_equal(days, timestamps) else "m"
+    return np.datetime_as_string(timestamps, unit=unit).tolist()
+
+
+def columns_to_bars(columns: BarColumns) -> list[OHLCV]:
+    """Convert columnar arrays back into a list of OHLCV dicts.
+
+    Args:
+        columns: BarColumns to convert
+
+    Returns:
+        List of OHLCV dicts (most recent last)
+    """
+    return [
+        {
+            "open": o,
+            "high": h,
+            "low": lo,
+            "close": c,
+            "volume": v,
+            "timestamp": ts,
+        }
+        for o, h, lo, c, v, ts in zip(
+            columns["open"].tolist(),
+            columns["high"].tolist(),
+            columns["low"].tolist(),
+            columns["close"].tolist(),
+            columns["volume"].tolist(),
+            format_timestamps(columns["timestamp"]),
+        )
+    ]
@@ -0,0 +1,179 @@
+"""US equity market calendar (NYSE/Nasdaq regular sessions).
+
+Holidays and early closes are computed from the exchanges' rules rather
+than fetched, so the calendar works offline and for any year. Times are
+in the exchange's time zone (America/New_York).
+"""
+
+import functools
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+EXCHANGE_TZ = ZoneInfo("America/New_York")
+SESSION_OPEN = time(9, 30)
+SESSION_CLOSE = time(16, 0)
+EARLY_CLOSE = time(13, 0)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The n-th given weekday (0 = Monday) of a month; n = -1 for the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Western Easter Sunday (anonymous Gregorian algorithm)."""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    m = (32 + 2 * e + 2 * i - h - k) % 7
+    n = (a + 11 * h + 19 * m) // 433
+    month = (h + m - 7 * n + 90) // 25
+    return date(year, month, (h + m - 7 * n + 33 * month + 19) % 32)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed on Friday, Sunday holidays on Monday."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@functools.lru_cache(maxsize=64)
+def market_holidays(year: int) -> dict[date, str]:
+    """Full-day market closures in a year.
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        dict of date -> holiday name
+    """
+    holidays = {
+        _nth_weekday(year, 1, 0, 3): "Martin Luther King Jr. Day",
+        _nth_weekday(year, 2, 0, 3): "Washington's Birthday",
+        _easter(year) - timedelta(days=2): "Good Friday",
+        _nth_weekday(year, 5, 0, -1): "Memorial Day",
+        _observed(date(year, 7, 4)): "Independence Day",
+        _nth_weekday(year, 9, 0, 1): "Labor Day",
+        _nth_weekday(year, 11, 3, 4): "Thanksgiving Day",
+        _observed(date(year, 12, 25)): "Christmas Day",
+    }
+    # A Saturday New Year's Day is not observed on the Friday before
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays[_observed(new_year)] = "New Year's Day"
+    if year >= 2022:
+        holidays[_observed(date(year, 6, 19))] = "Juneteenth"
+    return holidays
+
+
+@functools.lru_cache(maxsize=64)
+def early_closes(year: int) -> dict[date, str]:
+    """Trading days in a year on which the market closes at EARLY_CLOSE.
+
+    The day before Independence Day, the day after Thanksgiving and
+    Christmas Eve, when they are trading days.
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        dict of date -> name
+    """
+    days = {
+        date(year, 7, 3): "Independence Day Eve",
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1): "Day after Thanksgiving",
+        date(year, 12, 24): "Christmas Eve",
+    }
+    return {day: name for day, name in days.items() if is_trading_day(day)}
+
+
+def is_trading_day(day: date) -> bool:
+    """Whether the market has a regular session on a day."""
+    return day.weekday() < 5 and day not in market_holidays(day.year)
+
+
+def next_trading_day(day: date) -> date:
+    """The first trading day strictly after ``day``."""
+    day += timedelta(days=1)
+    while not is_trading_day(day):
+        day += timedelta(days=1)
+    return day
+
+
+def previous_trading_day(day: date) -> date:
+    """The last trading day strictly before ``day``."""
+    day -= timedelta(days=1)
+    while not is_trading_day(day):
+        day -= timedelta(days=1)
+    return day
+
+
+def session_open(day: date) -> datetime:
+    """Opening time of a day's regular session (exchange time zone)."""
+    return datetime.combine(day, SESSION_OPEN, EXCHANGE_TZ)
+
+
+def session_close(day: date) -> datetime:
+    """Closing time of a day's regular session (exchange time zone), early on early-close days."""
+    close = EARLY_CLOSE if day in early_closes(day.year) else SESSION_CLOSE
+    return datetime.combine(day, close, EXCHANGE_TZ)
+
+
+def exchange_time(now: datetime | None = None) -> datetime:
+    """``now`` (default: now) in the exchange time zone; naive values are taken as UTC."""
+    if now is None:
+        return datetime.now(EXCHANGE_TZ)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=ZoneInfo("UTC"))
+    return now.astimezone(EXCHANGE_TZ)
+
+
+def is_market_open(now: datetime | None = None) -> bool:
+    """Whether a regular session is in progress at ``now`` (default: now)."""
+    now = exchange_time(now)
+    day = now.date()
+    return is_trading_day(day) and session_open(day) <= now < session_close(day)
+
+
+def next_session_open(now: datetime | None = None) -> datetime:
+    """The first session open strictly after ``now`` (default: now)."""
+    now = exchange_time(now)
+    day = now.date()
+    if not is_trading_day(day) or session_open(day) <= now:
+        day = next_trading_day(day)
+    return session_open(day)
+
+
+def next_session_close(now: datetime | None = None) -> datetime:
+    """The first session close strictly after ``now`` (default: now)."""
+    now = exchange_time(now)
+    day = now.date()
+    if not is_trading_day(day) or session_close(day) <= now:
+        day = next_trading_day(day)
+    return session_close(day)
+
+
+def next_trading_time(at: time, now: datetime | None = None) -> datetime:
+    """The next time of day ``at`` (exchange time) on a trading day.
+
+    Args:
+        at: Exchange-local time of day, e.g. time(8, 30) for pre-market
+        now: Current time (default: now); naive values are taken as UTC
+
+    Returns:
+        Timezone-aware datetime strictly after ``now``
+    """
+    now = exchange_time(now)
+    day = now.date()
+    if not is_trading_day(day) or datetime.combine(day, at, EXCHANGE_TZ) <= now:
+        day = next_trading_day(day)
+    return datetime.combine(day, at, EXCHANGE_TZ)
@@ -0,0 +1,189 @@
+"""Adaptive limit on concurrent Polygon.io requests.
+
+A fixed number of workers either leaves a paid plan's capacity unused or
+trips 429s. AdaptiveLimiter applies AIMD (additive increase, multiplicative
+decrease), as in TCP congestion control: while requests succeed the limit
+grows by about one per round of ``limit`` requests; a 429 or a sustained
+rise in latency cuts it by ``backoff``. One limiter is shared by every
+PolygonClient in the process, so single-ticker analyses, the service and
+batch runs all respect the same limit.
+"""
+
+import math
+import threading
+import time
+from typing import Callable
+
+from stockagent.config import get_settings
+from stockagent.utils.metrics import (
+    POLYGON_CONCURRENCY_DECREASES,
+    POLYGON_CONCURRENCY_LIMIT,
+    POLYGON_IN_FLIGHT,
+)
+
+# Request statuses (as recorded in metrics) that say the provider is overloaded
+_THROTTLED = "rate_limited"
+_SUCCESS = ("ok", "not_found")
+
+
+class AdaptiveLimiter:
+    """Thread-safe AIMD concurrency limit.
+
+    Latency is tracked with a fast and a slow moving average of successful
+    requests; when the fast one exceeds ``latency_tolerance`` times the
+    slow one, the provider is treated as congested. After a decrease,
+    further signals are ignored for ``cooldown`` seconds so that a burst
+    of in-flight failures counts once.
+
+    Args:
+        initial_limit: Starting limit
+        min_limit: Lowest limit
+        max_limit: Highest limit
+        backoff: Factor applied to the limit on congestion (0 < backoff < 1)
+        latency_tolerance: Fast/slow latency ratio treated as congestion
+        warmup: Successful requests observed before latency is judged
+        cooldown: Seconds after a decrease during which no further decrease happens
+        clock: Monotonic time source (injectable for tests)
+
+    Raises:
+        ValueError: If the limits or backoff are out of range
+    """
+
+    FAST_ALPHA = 0.3
+    SLOW_ALPHA = 0.02
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        warmup: int = 20,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.warmup = warmup
+        self.cooldown = cooldown
+        self._clock = clock
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._fast_latency = 0.0
+        self._slow_latency = 0.0
+        self._samples = 0
+        self._last_decrease = -math.inf
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current maximum number of concurrent requests."""
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        return self._in_flight
+
+    def acquire(self) -> float:
+        """Take a slot, blocking while the limit is reached.
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.perf_counter()
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+        return time.perf_counter() - start
+
+    def release(self, status: str, latency: float) -> None:
+        """Return a slot and adjust the limit from the request's outcome.
+
+        Args:
+            status: Request status as recorded in metrics ("ok", "not_found",
+                "rate_limited" or "error"); errors leave the limit unchanged
+            latency: Request latency in seconds
+        """
+        with self._condition:
+            # Only grow while the limit is what holds requests back
+            saturated = 2 * self._in_flight >= self.limit
+            self._in_flight -= 1
+            if status == _THROTTLED:
+                self._decrease("throttled")
+            elif status in _SUCCESS:
+                if self._latency_rising(latency):
+                    self._decrease("latency")
+                elif saturated:
+                    # Additive increase: about +1 per round of `limit` requests
+                    self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+    def _latency_rising(self, latency: float) -> bool:
+        if self._samples == 0:
+            self._fast_latency = self._slow_latency = latency
+        else:
+            self._fast_latency += self.FAST_ALPHA * (latency - self._fast_latency)
+            self._slow_latency += self.SLOW_ALPHA * (latency - self._slow_latency)
+        self._samples += 1
+        return self._samples > self.warmup and self._fast_latency > self.latency_tolerance * self._slow_latency
+
+    def _decrease(self, reason: str) -> None:
+        now = self._clock()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self.backoff)
+        # Let the slow average catch up so one slow period counts once
+        self._slow_latency = self._fast_latency
+        POLYGON_CONCURRENCY_DECREASES.labels(reason).inc()
+
+
+_limiter: AdaptiveLimiter | None = None
+_configured = False
+_lock = threading.Lock()
+
+
+def get_concurrency_limiter() -> AdaptiveLimiter | None:
+    """Get the process-wide Polygon concurrency limiter.
+
+    Created on first use with max_limit STOCKAGENT_POLYGON_MAX_CONCURRENCY
+    (0 disables it, returning None).
+    """
+    global _limiter, _configured
+    if not _configured:
+        with _lock:
+            if not _configured:
+                max_limit = get_settings().polygon_max_concurrency
+                if max_limit > 0:
+                    _limiter = AdaptiveLimiter(initial_limit=min(4, max_limit), max_limit=max_limit)
+                _configured = True
+    return _limiter
+
+
+def set_concurrency_limiter(limiter: AdaptiveLimiter | None) -> AdaptiveLimiter | None:
+    """Install the process-wide Polygon concurrency limiter.
+
+    Args:
+        limiter: Limiter applied to every Polygon request, or None to disable
+
+    Returns:
+        The previously installed limiter
+    """
+    global _limiter, _configured
+    previous = get_concurrency_limiter()
+    with _lock:
+        _limiter, _configured = limiter, True
+    return previous
+
+
+POLYGON_CONCURRENCY_LIMIT.set_function(lambda: _limiter.limit if _limiter else 0)
+POLYGON_IN_FLIGHT.set_function(lambda: _limiter.in_flight if _limiter else 0)
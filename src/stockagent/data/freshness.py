@@ -0,0 +1,78 @@
+"""Market-hours-aware freshness of cached data.
+
+A fixed TTL either refetches data that cannot have changed (overnight,
+on weekends and holidays) or serves stale data during the session. Bars
+only change while the market is open, so FreshnessPolicy ties a cached
+value's lifetime to the trading calendar instead: daily bars stay fresh
+until the next session close, and other data keeps its TTL during the
+session but is not refetched before the next open.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from stockagent.data.calendar import (
+    exchange_time,
+    is_trading_day,
+    next_session_close,
+    next_session_open,
+    session_close,
+    session_open,
+)
+
+# Until the next session close (after which the day's bar is final)
+CLOSE = "close"
+# At least until the next session open while the market is closed
+OPEN = "open"
+
+# Time after the close until Polygon's bars for the session are final
+SETTLE_DELAY = timedelta(minutes=15)
+
+
+def in_session(now: datetime | None = None) -> bool:
+    """Whether ``now`` (default: now) falls in a session or before its bars are final."""
+    now = exchange_time(now)
+    day = now.date()
+    return is_trading_day(day) and session_open(day) <= now < session_close(day) + SETTLE_DELAY
+
+
+@dataclass(frozen=True)
+class FreshnessPolicy:
+    """How long one kind of cached data stays fresh.
+
+    Attributes:
+        ttl: Seconds a value stays fresh after it is stored (during the
+            session, for ``until=OPEN``)
+        until: CLOSE to keep a value until the next session close plus
+            SETTLE_DELAY (``ttl`` is ignored), OPEN to keep a value stored
+            outside the session until the next open, or None for ``ttl`` only
+    """
+
+    ttl: float | None = None
+    until: str | None = None
+
+    def __post_init__(self):
+        if self.until not in (CLOSE, OPEN, None):
+            raise ValueError(f"until must be {CLOSE!r}, {OPEN!r} or None, not {self.until!r}")
+        if self.ttl is None and self.until is None:
+            raise ValueError("A policy needs a ttl or a calendar boundary")
+
+    def expires(self, now: datetime | None = None) -> datetime:
+        """When a value stored at ``now`` (default: now) stops being fresh."""
+        now = exchange_time(now)
+        if self.until == CLOSE:
+            return next_session_close(now - SETTLE_DELAY) + SETTLE_DELAY
+        expires = now + timedelta(seconds=self.ttl or 0)
+        if self.until == OPEN and (self.ttl is None or not in_session(now)):
+            expires = max(expires, next_session_open(now))
+        return expires
+
+    def seconds(self, now: datetime | None = None) -> float:
+        """Seconds a value stored at ``now`` (default: now) stays fresh."""
+        now = exchange_time(now)
+        return (self.expires(now) - now).total_seconds()
+
+    def expires_at(self, timestamp: float) -> float:
+        """Unix time at which a value stored at Unix time ``timestamp`` stops being fresh."""
+        return self.expires(datetime.fromtimestamp(timestamp, timezone.utc)).timestamp()
+
@@ -1,11 +1,34 @@
 """Polygon.io API client for fetching stock market data."""
 
-from datetime import datetime, timedelta
+import json
+import logging
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Iterator
+from urllib.parse import urlsplit
 
 from polygon import RESTClient
 from polygon.exceptions import BadResponse
-
-from stockagent.config import get_polygon_api_key
+from urllib3 import Timeout
+from urllib3.exceptions import HTTPError as TransportError
+
+from stockagent.config import get_polygon_api_key, get_settings
+from stockagent.data.bars import BarColumns, columns_to_bars, decode_aggregates
+from stockagent.data.concurrency import get_concurrency_limiter
+from stockagent.data.rate_limit import get_rate_limiter
+from stockagent.data.response_cache import get_response_cache
+from stockagent.data.retry import REASON_RATE_LIMITED, REASON_SERVER_ERROR, get_retry_policy, parse_retry_after
+from stockagent.data.scheduler import get_scheduler
+from stockagent.utils.metrics import (
+    POLYGON_RETRIES,
+    POLYGON_RETRIES_EXHAUSTED,
+    POLYGON_RETRY_WAIT_SECONDS,
+    RATE_LIMIT_ERRORS,
+    record_polygon_request,
+)
+from stockagent.utils.tracing import increment
+
+logger = logging.getLogger(__name__)
 
 
 class PolygonAPIError(Exception):
@@ -26,9 +49,14 @@ class TickerNotFoundError(PolygonAPIError):
 
 
 class RateLimitError(PolygonAPIError):
-    """Raised when API rate limit is exceeded."""
+    """Raised when API rate limit is exceeded (after any retries).
+
+    Attributes:
+        retry_after: Seconds the server asked to wait, if it said
+    """
 
-    def __init__(self):
+    def __init__(self, retry_after: float | None = None):
+        self.retry_after = retry_after
         message = (
             "API rate limit exceeded. Please wait a moment and try again. "
             "Free tier allows 5 calls per minute."
@@ -36,6 +64,81 @@ class RateLimitError(PolygonAPIError):
         super().__init__(message)
 
 
+class HTTPStatusError(BadResponse):
+    """Non-200 Polygon response, keeping the status code and Retry-After.
+
+    RESTClient's own BadResponse carries only the response body.
+    """
+
+    def __init__(self, status: int, body: str, retry_after: float | None = None):
+        self.status = status
+        self.retry_after = retry_after
+        super().__init__(body)
+
+
+class _ErrorResponsePool:
+    """Wraps RESTClient's urllib3 PoolManager to raise HTTPStatusError.
+
+    urllib3's built-in retries are disabled, so each attempt goes through
+    PolygonClient._request (rate limiter, metrics and retry policy). The
+    timeout is applied here because RESTClient does not pass its own
+    connect/read timeouts on to the pool's requests.
+    """
+
+    def __init__(self, pool: Any, timeout: Timeout | None = None):
+        self._pool = pool
+        self._timeout = timeout
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        response = self._pool.request(method, url, retries=False, **kwargs)
+        if response.status != 200:
+            raise HTTPStatusError(
+                response.status,
+                response.data.decode("utf-8", "replace"),
+                parse_retry_after(response.headers.get("Retry-After")),
+            )
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool, name)
+
+
+def _retry_reason(error: Exception) -> str | None:
+    """Retry policy reason for a failed request, or None if it is not transient."""
+    if isinstance(error, TransportError):
+        return REASON_SERVER_ERROR
+    status = getattr(error, "status", None)
+    if status == 429:
+        return REASON_RATE_LIMITED
+    if status is not None and status >= 500:
+        return REASON_SERVER_ERROR
+    return None
+
+
+def _error_status(error: BadResponse) -> str:
+    """Classify a BadResponse for metrics labels."""
+    status = getattr(error, "status", None)
+    if status == 429:
+        return "rate_limited"
+    if status == 404:
+        return "not_found"
+    message = str(error).lower()
+    if "429" in message or "rate limit" in message or "exceeded the maximum requests" in message:
+        return "rate_limited"
+    if "404" in message or "not found" in message:
+        return "not_found"
+    return "error"
+
+
+# Largest page Polygon serves for aggregates
+MAX_PAGE_SIZE = 50_000
+
+# Bar timespans of the aggregates endpoint
+TIMESPANS = ("second", "minute", "hour", "day", "week", "month", "quarter", "year")
+
+
 class PolygonClient:
     """Client for interacting with Polygon.io API.
 
@@ -44,20 +147,38 @@ class PolygonClient:
     - Ticker/company details
     - Previous close prices
 
+    Responses are served from the local response cache when one is
+    configured (see stockagent.data.response_cache).
+
     Rate Limits (Free Tier):
     - 5 API calls per minute
     - Historical data limited to 2 years
     - Data is delayed (not real-time)
     """
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, base_url: str | None = None):
         """Initialize the Polygon client.
 
         Args:
             api_key: Polygon API key. If not provided, will be loaded from config.
+            base_url: REST base URL override (e.g. a local stand-in server).
+                If not provided, POLYGON_BASE_URL from config is used, falling
+                back to the public Polygon endpoint.
         """
+        settings = get_settings()
         self._api_key = api_key or get_polygon_api_key()
-        self._client = RESTClient(api_key=self._api_key)
+        base_url = base_url or settings.polygon_base_url
+
+        # Only pass options that are configured so RESTClient keeps its defaults
+        options = {}
+        if base_url:
+            options["base"] = base_url.rstrip("/")
+        self._client = RESTClient(api_key=self._api_key, **options)
+        timeout = None
+        if settings.polygon_timeout is not None:
+            timeout = Timeout(connect=settings.polygon_timeout, read=settings.polygon_timeout)
+        # Retries are handled per request by the retry policy (see _request)
+        self._client.client = _ErrorResponsePool(self._client.client, timeout)
 
     def get_previous_close(self, ticker: str) -> dict:
         """Get the previous close price for a ticker.
@@ -76,10 +197,12 @@ class PolygonClient:
             PolygonAPIError: For other API errors
         """
         ticker = ticker.upper().strip()
+        return self._cached("previous_close", ticker, lambda: self._fetch_previous_close(ticker))
 
+    def _fetch_previous_close(self, ticker: str) -> dict:
         try:
             # get_previous_close_agg returns a list directly
-            results = self._client.get_previous_close_agg(ticker)
+            results = self._request("previous_close", self._client.get_previous_close_agg, ticker)
 
             if not results or len(results) == 0:
                 raise TickerNotFoundError(ticker)
@@ -112,9 +235,11 @@ class PolygonClient:
             PolygonAPIError: For other API errors
         """
         ticker = ticker.upper().strip()
+        return self._cached("ticker_details", ticker, lambda: self._fetch_ticker_details(ticker))
 
+    def _fetch_ticker_details(self, ticker: str) -> dict:
         try:
-            response = self._client.get_ticker_details(ticker)
+            response = self._request("ticker_details", self._client.get_ticker_details, ticker)
 
             if not response:
                 raise TickerNotFoundError(ticker)
@@ -153,45 +278,225 @@ class PolygonClient:
             PolygonAPIError: For other API errors
         """
         ticker = ticker.upper().strip()
+        return self._cached("aggregates", f"{ticker}:{days}", lambda: self._fetch_aggregates(ticker, days))
 
+    def _fetch_aggregates(self, ticker: str, days: int) -> list[dict]:
         # Calculate date range
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
 
         try:
-            # Fetch daily aggregates
-            aggs = self._client.get_aggs(
+            # Fetch daily aggregates as raw JSON (see decode_aggregates)
+            response = self._request(
+                "aggregates",
+                self._client.get_aggs,
                 ticker=ticker,
                 multiplier=1,
                 timespan="day",
                 from_=start_date.strftime("%Y-%m-%d"),
                 to=end_date.strftime("%Y-%m-%d"),
                 limit=days + 10,  # Buffer for weekends/holidays
+                raw=True,
             )
+            columns, _ = decode_aggregates(response.data)
 
-            if not aggs or len(aggs) == 0:
+            if len(columns["close"]) == 0:
                 raise TickerNotFoundError(ticker)
 
-            # Transform to OHLCV format
-            bars = []
-            for agg in aggs:
-                bar = {
-                    "open": float(agg.open),
-                    "high": float(agg.high),
-                    "low": float(agg.low),
-                    "close": float(agg.close),
-                    "volume": int(agg.volume),
-                    "timestamp": datetime.fromtimestamp(agg.timestamp / 1000).strftime(
-                        "%Y-%m-%d"
-                    ),
+            # Daily bars start at midnight US/Eastern; keep just the date
+            columns["timestamp"] = columns["timestamp"].astype("datetime64[D]").astype("datetime64[ms]")
+            return columns_to_bars(columns)
+
+        except BadResponse as e:
+            self._handle_api_error(e, ticker)
+
+    def get_splits(self, ticker: str) -> list[dict]:
+        """Get a ticker's stock splits.
+
+        Args:
+            ticker: Stock ticker symbol (e.g., 'AAPL')
+
+        Returns:
+            List of dicts, oldest first, each containing:
+                - execution_date: str - First trading day on the new basis (YYYY-MM-DD)
+                - split_from: float - Old shares
+                - split_to: float - New shares for split_from old shares
+
+        Raises:
+            RateLimitError: If API rate limit is exceeded
+            PolygonAPIError: For other API errors
+        """
+        ticker = ticker.upper().strip()
+        return self._cached("splits", ticker, lambda: self._fetch_splits(ticker))
+
+    def _fetch_splits(self, ticker: str) -> list[dict]:
+        try:
+            response = self._request(
+                "splits",
+                self._client.list_splits,
+                ticker=ticker,
+                sort="execution_date",
+                order="asc",
+                limit=1000,
+                raw=True,
+            )
+            results = json.loads(response.data).get("results") or []
+            return [
+                {
+                    "execution_date": split["execution_date"],
+                    "split_from": float(split["split_from"]),
+                    "split_to": float(split["split_to"]),
                 }
-                bars.append(bar)
+                for split in sorted(results, key=lambda split: split["execution_date"])
+            ]
+
+        except BadResponse as e:
+            self._handle_api_error(e, ticker)
+
+    def iter_aggregates(
+        self,
+        ticker: str,
+        start: date | str,
+        end: date | str,
+        timespan: str = "day",
+        multiplier: int = 1,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> Iterator[BarColumns]:
+        """Fetch bars for a date range page by page.
+
+        Follows the response's ``next_url`` until the range is exhausted, so
+        ranges of any length (e.g. years of minute bars) can be fetched
+        without holding them in memory; feed the pages to
+        stockagent.analysis.streaming to compute indicators as they arrive.
+        Every page is a separate request through the rate limiters and retry
+        policy. Responses are not cached.
 
-            return bars
+        Args:
+            ticker: Stock ticker symbol
+            start: First date (inclusive, YYYY-MM-DD)
+            end: Last date (inclusive, YYYY-MM-DD)
+            timespan: Bar timespan ("minute", "hour", "day", ...)
+            multiplier: Bar size in timespans (e.g. 5 with "minute")
+            page_size: Bars per request (Polygon allows up to 50,000)
 
+        Yields:
+            BarColumns per page, oldest first (nothing for a range without bars)
+
+        Raises:
+            ValueError: If the timespan is not one of TIMESPANS
+            TickerNotFoundError: If the ticker is not found
+            RateLimitError: If API rate limit is exceeded
+            PolygonAPIError: For other API errors
+        """
+        if timespan not in TIMESPANS:
+            raise ValueError(f"Unsupported timespan '{timespan}'. Expected one of: {', '.join(TIMESPANS)}")
+        ticker = ticker.upper().strip()
+        try:
+            response = self._request(
+                "aggregates",
+                self._client.get_aggs,
+                ticker=ticker,
+                multiplier=multiplier,
+                timespan=timespan,
+                from_=str(start),
+                to=str(end),
+                sort="asc",
+                limit=page_size,
+                raw=True,
+            )
+            while True:
+                columns, next_url = decode_aggregates(response.data)
+                if len(columns["close"]):
+                    yield columns
+                if not next_url:
+                    return
+                parts = urlsplit(next_url)
+                path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+                response = self._request("aggregates", self._client._get, path=path, raw=True)
         except BadResponse as e:
             self._handle_api_error(e, ticker)
 
+    def _cached(self, kind: str, key: str, fetch: Callable[[], Any]) -> Any:
+        """Serve a response from the local response cache, fetching it on a miss."""
+        cache = get_response_cache()
+        return fetch() if cache is None else cache.cached(kind, key, fetch)
+
+    def _request(self, endpoint: str, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call a RESTClient method, retrying transient failures.
+
+        Rate limits (429), server errors (5xx) and connection failures are
+        retried according to the process-wide RetryPolicy. Every attempt
+        waits for the rate limiter (if installed) and a slot from the
+        adaptive concurrency limiter, and is recorded in the trace counters
+        and metrics.
+
+        Args:
+            endpoint: Short endpoint name used as the metrics label
+            method: Bound RESTClient method
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            The method's return value
+
+        Raises:
+            BadResponse: If the request failed and was not (or no longer) retried
+            PolygonAPIError: If the connection kept failing
+        """
+        policy = get_retry_policy()
+        attempt = 1
+        while True:
+            try:
+                return self._attempt(endpoint, method, *args, **kwargs)
+            except (BadResponse, TransportError) as e:
+                reason = _retry_reason(e)
+                if reason is None:
+                    raise
+                delay = policy.delay(reason, attempt, getattr(e, "retry_after", None))
+                if delay is None:
+                    POLYGON_RETRIES_EXHAUSTED.labels(endpoint, reason).inc()
+                    if isinstance(e, TransportError):
+                        raise PolygonAPIError(f"Polygon request failed after {attempt} attempts: {e}") from e
+                    raise
+
+            POLYGON_RETRIES.labels(endpoint, reason).inc()
+            POLYGON_RETRY_WAIT_SECONDS.observe(delay)
+            increment("api_retries")
+            logger.info(f"Retrying {endpoint} after {reason} in {delay:.2f}s (attempt {attempt})")
+            policy.sleep(delay)
+            attempt += 1
+
+    def _attempt(self, endpoint: str, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Make one request, waiting for the rate and concurrency limiters and recording metrics.
+
+        Requests wait for the limiters one at a time, in priority order (see
+        stockagent.data.scheduler), so an interactive request is the next to
+        run even when a batch run has many requests queued.
+        """
+        limiter = get_rate_limiter()
+        concurrency = get_concurrency_limiter()
+        with get_scheduler("polygon").turn():
+            if limiter is not None:
+                limiter.acquire()
+            if concurrency is not None:
+                concurrency.acquire()
+
+        increment("api_calls")
+        status = "error"
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+            status = "ok"
+            return result
+        except BadResponse as e:
+            status = _error_status(e)
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            record_polygon_request(endpoint, status, elapsed)
+            if concurrency is not None:
+                concurrency.release(status, elapsed)
+
     def _handle_api_error(self, error: BadResponse, ticker: str) -> None:
         """Handle API errors and raise appropriate exceptions.
 
@@ -207,11 +512,13 @@ class PolygonClient:
         error_str = str(error).lower()
 
         # Check for rate limit (429)
-        if "429" in str(error) or "rate limit" in error_str:
-            raise RateLimitError()
+        status = getattr(error, "status", None)
+        if status == 429 or "429" in str(error) or "rate limit" in error_str:
+            RATE_LIMIT_ERRORS.inc()
+            raise RateLimitError(getattr(error, "retry_after", None))
 
         # Check for not found (404)
-        if "404" in str(error) or "not found" in error_str:
+        if status == 404 or "404" in str(error) or "not found" in error_str:
             raise TickerNotFoundError(ticker)
 
         # Generic API error
@@ -0,0 +1,112 @@
+"""Client-side rate limiting for Polygon.io requests.
+
+A token bucket shared by every PolygonClient in the process keeps batch
+runs under the API quota instead of tripping 429 responses. No limiter is
+installed by default; batch tools install one with set_rate_limiter() and
+the web UI with ensure_rate_limiter().
+"""
+
+import threading
+import time
+from typing import Callable
+
+from stockagent.config import get_settings
+from stockagent.utils.metrics import RATE_LIMIT_WAIT_SECONDS
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers that find the bucket empty reserve a future token and sleep
+    until it is due, so waiting threads are served in arrival order.
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum burst size
+        clock: Monotonic time source (injectable for tests)
+        sleep: Sleep function (injectable for tests)
+
+    Raises:
+        ValueError: If rate or capacity is not positive
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, calls: int, **kwargs) -> "TokenBucket":
+        """Bucket allowing ``calls`` requests per minute, in bursts of up to ``calls``."""
+        return cls(calls / 60, calls, **kwargs)
+
+    def acquire(self) -> float:
+        """Take one token, blocking until it is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            self._sleep(wait)
+        RATE_LIMIT_WAIT_SECONDS.observe(wait)
+        return wait
+
+
+_limiter: TokenBucket | None = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucket | None:
+    """Get the process-wide Polygon rate limiter (None when unlimited)."""
+    return _limiter
+
+
+def set_rate_limiter(limiter: TokenBucket | None) -> TokenBucket | None:
+    """Install the process-wide Polygon rate limiter.
+
+    Args:
+        limiter: Limiter applied to every Polygon request, or None to disable
+
+    Returns:
+        The previously installed limiter
+    """
+    global _limiter
+    previous, _limiter = _limiter, limiter
+    return previous
+
+
+def ensure_rate_limiter() -> TokenBucket | None:
+    """Install a limiter for STOCKAGENT_POLYGON_CALLS_PER_MINUTE once per process.
+
+    Safe to call repeatedly (e.g. on every Streamlit rerun). Keeps a limiter
+    that is already installed, and installs none when the quota is 0.
+
+    Returns:
+        The installed limiter, or None when requests are unlimited
+    """
+    global _limiter
+    with _limiter_lock:
+        calls = get_settings().polygon_calls_per_minute
+        if _limiter is None and calls > 0:
+            _limiter = TokenBucket.per_minute(calls)
+        return _limiter
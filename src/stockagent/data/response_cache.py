@@ -0,0 +1,178 @@
+"""Local cache of market data and news responses.
+
+Bars, ticker details and headlines change at most a few times a day, yet
+every analysis fetched them again. ResponseCache keeps decoded responses
+in memory and, with STOCKAGENT_CACHE_DIR set, as JSON files under
+"responses", so they are shared with other processes: the cache warmer
+(`stockagent warm`) fills them before the open and the first analyses of
+the day are cache hits. How long each kind stays fresh follows the
+trading calendar (see stockagent.data.freshness), so nothing is fetched
+again overnight or over a weekend.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from stockagent.config import get_settings
+from stockagent.data.freshness import CLOSE, OPEN, FreshnessPolicy
+from stockagent.utils.cache import LRUCache
+from stockagent.utils.metrics import RESPONSE_CACHE_REQUESTS
+from stockagent.utils.tracing import increment
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESPONSE_CACHE_SIZE = 1024
+
+# How long each kind of response stays fresh. Daily bars only change when
+# a session closes and splits take effect at an open; headlines are
+# refreshed during the session but not overnight; company details rarely
+# change.
+RESPONSE_FRESHNESS = {
+    "aggregates": FreshnessPolicy(until=CLOSE),
+    "previous_close": FreshnessPolicy(until=CLOSE),
+    "ticker_details": FreshnessPolicy(7 * 24 * 3600.0),
+    "splits": FreshnessPolicy(until=OPEN),
+    "news": FreshnessPolicy(2 * 3600.0, OPEN),
+}
+
+
+class ResponseCache:
+    """Bounded LRU of responses by (kind, key), expiring per kind.
+
+    Entries carry their expiry as a Unix time so that persisted entries
+    stay valid across processes. When a directory is given, entries are
+    also written there as JSON files; the in-memory LRU is consulted first.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_RESPONSE_CACHE_SIZE,
+        path: str | Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of responses kept in memory
+            path: Optional directory for on-disk persistence
+            clock: Wall-clock time source (injectable for tests)
+        """
+        self._cache = LRUCache(maxsize)
+        self._path = Path(path) if path else None
+        self._clock = clock
+        if self._path:
+            self._path.mkdir(parents=True, exist_ok=True)
+
+    def _file_for(self, kind: str, key: str) -> Path:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self._path / kind / f"{digest}.json"
+
+    def get(self, kind: str, key: str) -> Any:
+        """Look up a fresh response.
+
+        Args:
+            kind: Response kind, e.g. "aggregates"
+            key: Request key within the kind, e.g. "AAPL:90"
+
+        Returns:
+            A copy of the stored response, or None if missing or expired
+        """
+        entry = self._cache.get((kind, key))
+        if entry is None and self._path:
+            try:
+                entry = json.loads(self._file_for(kind, key).read_text())
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable {kind} cache entry {key}: {e}")
+            else:
+                self._cache.put((kind, key), entry)
+
+        if entry is None or entry["expires_at"] <= self._clock():
+            RESPONSE_CACHE_REQUESTS.labels(kind, "miss").inc()
+            increment("cache_misses")
+            return None
+        RESPONSE_CACHE_REQUESTS.labels(kind, "hit").inc()
+        increment("cache_hits")
+        # Callers (e.g. the workflow) mutate the returned data
+        return copy.deepcopy(entry["value"])
+
+    def put(self, kind: str, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a response.
+
+        Args:
+            kind: Response kind
+            key: Request key within the kind
+            value: JSON-serializable response
+            ttl: Seconds the response stays fresh (default: RESPONSE_FRESHNESS[kind])
+        """
+        now = self._clock()
+        expires_at = RESPONSE_FRESHNESS[kind].expires_at(now) if ttl is None else now + ttl
+        entry = {"expires_at": expires_at, "value": copy.deepcopy(value)}
+        self._cache.put((kind, key), entry)
+
+        if self._path:
+            target = self._file_for(kind, key)
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_name, target)
+            except OSError as e:
+                logger.warning(f"Could not persist {kind} cache entry {key}: {e}")
+
+    def cached(self, kind: str, key: str, fetch: Callable[[], Any]) -> Any:
+        """Return a fresh cached response, or call ``fetch`` and cache its result."""
+        value = self.get(kind, key)
+        if value is None:
+            value = fetch()
+            self.put(kind, key, value)
+        return value
+
+    def clear(self) -> None:
+        """Clear the in-memory cache (on-disk entries are kept)."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_default_cache: ResponseCache | None = None
+_configured = False
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Get the process-wide response cache.
+
+    Created on first use under STOCKAGENT_CACHE_DIR ("responses"); None
+    when no cache directory is configured, so every request is fetched.
+    """
+    global _default_cache, _configured
+    if not _configured:
+        path = get_settings().cache_path("responses")
+        _default_cache = ResponseCache(path=path) if path else None
+        _configured = True
+    return _default_cache
+
+
+def set_response_cache(cache: ResponseCache | None) -> ResponseCache | None:
+    """Replace the process-wide response cache.
+
+    Args:
+        cache: New cache (e.g. a memory-only one), or None to disable caching
+
+    Returns:
+        The previously installed cache
+    """
+    global _default_cache, _configured
+    previous = get_response_cache()
+    _default_cache, _configured = cache, True
+    return previous
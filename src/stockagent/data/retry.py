@@ -0,0 +1,159 @@
+"""Retry policy for Polygon.io requests.
+
+Transient failures are retried with exponential backoff and jitter instead
+of surfacing as errors in the analysis. Rate limits (HTTP 429) and server
+errors (5xx, connection failures, timeouts) use separate backoff settings:
+a 429 means "wait for the quota window", so it waits longer and honors the
+server's Retry-After header.
+"""
+
+import random
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+from stockagent.config import get_settings
+
+REASON_RATE_LIMITED = "rate_limited"
+REASON_SERVER_ERROR = "server_error"
+
+
+@dataclass(frozen=True)
+class Backoff:
+    """Exponential backoff for one kind of failure.
+
+    The delay before retry n (n = 1 for the first retry) is
+    ``min(max_delay, base_delay * multiplier ** (n - 1))``, reduced by a
+    random fraction of up to ``jitter`` (1.0 = "full jitter") so that
+    concurrent clients do not retry in lockstep.
+
+    Attributes:
+        max_attempts: Total attempts including the first (1 disables retries)
+        base_delay: Seconds before the first retry (before jitter)
+        max_delay: Upper bound on any single delay in seconds
+        multiplier: Growth factor per retry
+        jitter: Fraction of the delay that is randomized, 0 to 1
+    """
+
+    max_attempts: int
+    base_delay: float
+    max_delay: float
+    multiplier: float = 2.0
+    jitter: float = 1.0
+
+    def delay(self, retry: int, rand: float) -> float:
+        """Seconds to wait before retry number ``retry`` given a uniform random draw in [0, 1)."""
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** (retry - 1))
+        return ceiling * (1.0 - self.jitter * rand)
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Parse a Retry-After header (delay in seconds or an HTTP date).
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When, and how long to wait before, retrying a failed request.
+
+    Attributes:
+        rate_limits: Backoff for HTTP 429 responses
+        server_errors: Backoff for HTTP 5xx responses and connection errors
+        max_retry_after: Longest Retry-After honored; a longer one is not
+            retried, since waiting would stall the whole batch
+        sleep: Sleep function (injectable for tests)
+        random: Uniform [0, 1) source for jitter (injectable for tests)
+    """
+
+    rate_limits: Backoff = Backoff(max_attempts=5, base_delay=2.0, max_delay=60.0, jitter=0.5)
+    server_errors: Backoff = Backoff(max_attempts=3, base_delay=0.5, max_delay=8.0)
+    max_retry_after: float = 60.0
+    sleep: Callable[[float], None] = field(default=time.sleep, compare=False)
+    random: Callable[[], float] = field(default=random.random, compare=False)
+
+    @classmethod
+    def with_retries(cls, retries: int, **kwargs) -> "RetryPolicy":
+        """Policy allowing ``retries`` retries (after the first attempt) for every kind of failure."""
+        policy = cls(**kwargs)
+        return replace(
+            policy,
+            rate_limits=replace(policy.rate_limits, max_attempts=retries + 1),
+            server_errors=replace(policy.server_errors, max_attempts=retries + 1),
+        )
+
+    def backoff(self, reason: str) -> Backoff:
+        """Backoff settings for a failure reason."""
+        return self.rate_limits if reason == REASON_RATE_LIMITED else self.server_errors
+
+    def delay(self, reason: str, attempt: int, retry_after: float | None = None) -> float | None:
+        """Seconds to wait before the next attempt, or None to give up.
+
+        Args:
+            reason: REASON_RATE_LIMITED or REASON_SERVER_ERROR
+            attempt: Number of the attempt that just failed (1 = first)
+            retry_after: Server-requested delay, if any
+
+        Returns:
+            Delay in seconds, or None if attempts are exhausted or the
+            server asked for a longer wait than max_retry_after
+        """
+        backoff = self.backoff(reason)
+        if attempt >= backoff.max_attempts:
+            return None
+        if retry_after is not None:
+            # The server knows when the quota resets; add a little jitter so
+            # throttled workers do not all return at the same instant
+            if retry_after > self.max_retry_after:
+                return None
+            return retry_after + self.random() * min(1.0, backoff.base_delay)
+        return backoff.delay(attempt, self.random())
+
+
+_policy: RetryPolicy | None = None
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Get the process-wide Polygon retry policy.
+
+    Defaults to RetryPolicy(), or RetryPolicy.with_retries() when
+    STOCKAGENT_POLYGON_RETRIES is set.
+    """
+    if _policy is not None:
+        return _policy
+    retries = get_settings().polygon_retries
+    return RetryPolicy() if retries is None else RetryPolicy.with_retries(retries)
+
+
+def set_retry_policy(policy: RetryPolicy | None) -> RetryPolicy | None:
+    """Install the process-wide Polygon retry policy.
+
+    Args:
+        policy: Policy applied to every Polygon request, or None to restore
+            the default from the settings
+
+    Returns:
+        The previously installed policy
+    """
+    global _policy
+    previous, _policy = _policy, policy
+    return previous
+
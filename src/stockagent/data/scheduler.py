@@ -0,0 +1,216 @@
+"""Priority scheduling of outbound requests.
+
+The rate and concurrency limiters decide how many requests may run; the
+scheduler decides which waiting request goes next. Every request carries a
+priority class (interactive, batch or prefetch) taken from the calling
+context, so a user's analysis started while a batch scan holds the Polygon
+quota overtakes the scan's queued calls instead of waiting behind them.
+Within a class, waiting requests are served round-robin by flow (by
+default the ticker being analyzed), so one long analysis cannot starve
+the others in its class.
+
+Priorities are strict: a prefetch request only runs when no interactive
+or batch request is waiting.
+"""
+
+import contextvars
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Iterator
+
+from stockagent.config import get_settings
+from stockagent.utils.metrics import SCHEDULER_QUEUE_DEPTH, SCHEDULER_WAIT_SECONDS
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+PREFETCH = "prefetch"
+
+# Priority classes, most urgent first
+PRIORITIES = (INTERACTIVE, BATCH, PREFETCH)
+
+_request_class: contextvars.ContextVar[tuple[str, str]] = contextvars.ContextVar(
+    "stockagent_request_class", default=(INTERACTIVE, "")
+)
+
+
+def current_priority() -> tuple[str, str]:
+    """Priority class and flow of requests made from the current context."""
+    return _request_class.get()
+
+
+@contextmanager
+def request_priority(priority: str | None = None, flow: str | None = None) -> Iterator[None]:
+    """Set the priority class and/or flow of requests made inside the block.
+
+    Context variables follow the workflow into LangGraph's node threads;
+    code submitting work to its own executor must set the priority inside
+    the submitted function.
+
+    Args:
+        priority: INTERACTIVE, BATCH or PREFETCH (None keeps the current class)
+        flow: Fairness key within the class (None keeps the current flow)
+
+    Raises:
+        ValueError: If priority is not a known class
+    """
+    current_class, current_flow = _request_class.get()
+    if priority is not None and priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority {priority!r}; expected one of {', '.join(PRIORITIES)}")
+    token = _request_class.set((priority or current_class, current_flow if flow is None else flow))
+    try:
+        yield
+    finally:
+        _request_class.reset(token)
+
+
+class PriorityScheduler:
+    """Grants up to ``capacity`` concurrent turns in priority order.
+
+    A waiting request gets its turn when a turn is free and it is at the
+    head of the queue: the first waiter of the current flow in the most
+    urgent non-empty class. After a flow is served it moves to the back of
+    its class, giving round-robin fairness between flows.
+
+    Args:
+        name: Scheduler name used as a metrics label (e.g. "polygon")
+        capacity: Maximum number of requests holding a turn at once
+
+    Raises:
+        ValueError: If capacity is not positive
+    """
+
+    def __init__(self, name: str, capacity: int = 1):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.name = name
+        self.capacity = capacity
+        self._queues: dict[str, OrderedDict[str, deque]] = {p: OrderedDict() for p in PRIORITIES}
+        self._active = 0
+        self._condition = threading.Condition()
+
+    @property
+    def active(self) -> int:
+        """Requests currently holding a turn."""
+        return self._active
+
+    def waiting(self, priority: str | None = None) -> int:
+        """Requests waiting for a turn, in one class or in all of them."""
+        with self._condition:
+            classes = PRIORITIES if priority is None else (priority,)
+            return sum(len(queue) for p in classes for queue in self._queues[p].values())
+
+    def acquire(self, priority: str | None = None, flow: str | None = None) -> float:
+        """Wait for a turn.
+
+        Args:
+            priority: Priority class (default: from the calling context)
+            flow: Fairness key within the class (default: from the calling context)
+
+        Returns:
+            Seconds spent waiting
+        """
+        context_priority, context_flow = current_priority()
+        priority = priority or context_priority
+        flow = context_flow if flow is None else flow
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority {priority!r}")
+
+        start = time.perf_counter()
+        ticket = object()
+        depth = SCHEDULER_QUEUE_DEPTH.labels(self.name, priority)
+        with self._condition:
+            self._queues[priority].setdefault(flow, deque()).append(ticket)
+            depth.inc()
+            try:
+                while self._active >= self.capacity or self._head() is not ticket:
+                    self._condition.wait()
+            except BaseException:
+                self._discard(priority, flow, ticket)
+                self._condition.notify_all()
+                raise
+            finally:
+                depth.dec()
+            self._pop(priority, flow)
+            self._active += 1
+
+        waited = time.perf_counter() - start
+        SCHEDULER_WAIT_SECONDS.labels(self.name, priority).observe(waited)
+        return waited
+
+    def release(self) -> None:
+        """Give back a turn taken with acquire()."""
+        with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    @contextmanager
+    def turn(self, priority: str | None = None, flow: str | None = None) -> Iterator[float]:
+        """Hold a turn for the duration of the block; yields the seconds waited."""
+        waited = self.acquire(priority, flow)
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    def _head(self) -> object | None:
+        for priority in PRIORITIES:
+            queue = self._queues[priority]
+            if queue:
+                return next(iter(queue.values()))[0]
+        return None
+
+    def _pop(self, priority: str, flow: str) -> None:
+        queue = self._queues[priority]
+        queue[flow].popleft()
+        if queue[flow]:
+            queue.move_to_end(flow)
+        else:
+            del queue[flow]
+
+    def _discard(self, priority: str, flow: str, ticket: object) -> None:
+        queue = self._queues[priority]
+        queue[flow].remove(ticket)
+        if not queue[flow]:
+            del queue[flow]
+
+
+_schedulers: dict[str, PriorityScheduler] = {}
+_lock = threading.Lock()
+
+
+def get_scheduler(name: str) -> PriorityScheduler:
+    """Get a process-wide scheduler, created on first use.
+
+    "polygon" grants one turn at a time: the turn covers only waiting for
+    the rate and concurrency limiters, so the next request to reach the
+    quota is always the most urgent one. Other schedulers (e.g. "news")
+    hold a turn for the whole request and allow STOCKAGENT_MAX_WORKERS
+    requests at once.
+    """
+    scheduler = _schedulers.get(name)
+    if scheduler is None:
+        with _lock:
+            scheduler = _schedulers.get(name)
+            if scheduler is None:
+                capacity = 1 if name == "polygon" else get_settings().max_workers
+                scheduler = _schedulers[name] = PriorityScheduler(name, capacity)
+    return scheduler
+
+
+def set_scheduler(name: str, scheduler: PriorityScheduler | None) -> PriorityScheduler | None:
+    """Install a process-wide scheduler.
+
+    Args:
+        name: Scheduler name ("polygon" or "news")
+        scheduler: Scheduler to use, or None to recreate the default on next use
+
+    Returns:
+        The previously installed scheduler, if any
+    """
+    with _lock:
+        previous = _schedulers.pop(name, None)
+        if scheduler is not None:
+            _schedulers[name] = scheduler
+    return previous
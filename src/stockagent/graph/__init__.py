@@ -1,8 +1,42 @@
 """LangGraph workflow orchestration."""
 
-from stockagent.graph.workflow import create_workflow, run_analysis
+from typing import TYPE_CHECKING
+
+from stockagent.utils.lazy import lazy_exports
+
+# Public name -> defining submodule. Submodules (and their third-party
+# dependencies) are imported on first attribute access.
+_EXPORTS = {
+    "NODE_NAMES": "workflow",
+    "checkpoint_thread_id": "checkpoint",
+    "sqlite_checkpointer": "checkpoint",
+    "create_initial_state": "workflow",
+    "create_workflow": "workflow",
+    "instrument_node": "workflow",
+    "run_analysis": "workflow",
+    "run_batch_analysis": "workflow",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from stockagent.graph.checkpoint import checkpoint_thread_id, sqlite_checkpointer
+    from stockagent.graph.workflow import (
+        NODE_NAMES,
+        create_initial_state,
+        create_workflow,
+        instrument_node,
+        run_analysis,
+        run_batch_analysis,
+    )
 
 __all__ = [
+    "NODE_NAMES",
+    "checkpoint_thread_id",
+    "sqlite_checkpointer",
+    "create_initial_state",
     "create_workflow",
+    "instrument_node",
     "run_analysis",
+    "run_batch_analysis",
 ]
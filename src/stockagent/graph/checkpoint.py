@@ -0,0 +1,55 @@
+"""Persistent workflow checkpoints for resumable batch runs.
+
+With a checkpointer, LangGraph saves the workflow state after every step,
+keyed by a thread id. StockAgent uses one thread per (run id, ticker), so a
+restarted batch returns finished tickers from the checkpoint and resumes
+interrupted ones at the first incomplete node (e.g. after fetch_data),
+without repeating API calls.
+
+SQLite checkpoints need the optional ``langgraph-checkpoint-sqlite`` package.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+
+def checkpoint_thread_id(run_id: str, ticker: str) -> str:
+    """Checkpoint thread id for one ticker in a run."""
+    return f"{run_id}:{ticker.upper().strip()}"
+
+
+@contextmanager
+def sqlite_checkpointer(path: str | Path) -> Iterator[BaseCheckpointSaver]:
+    """Open a SQLite checkpoint database, creating it if needed.
+
+    The connection is shared by all worker threads (the saver serializes
+    access) and closed on exit.
+
+    Args:
+        path: Database file
+
+    Yields:
+        SqliteSaver for create_workflow(checkpointer=...)
+
+    Raises:
+        ImportError: If langgraph-checkpoint-sqlite is not installed
+    """
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError as e:
+        raise ImportError(
+            "SQLite checkpoints require langgraph-checkpoint-sqlite: "
+            "pip install langgraph-checkpoint-sqlite"
+        ) from e
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), check_same_thread=False)
+    try:
+        yield SqliteSaver(conn)
+    finally:
+        conn.close()
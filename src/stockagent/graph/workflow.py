@@ -1,21 +1,37 @@
 """LangGraph workflow for stock analysis."""
 
+import functools
+import itertools
+import json
 import logging
-from typing import Annotated, Any
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Annotated, Any, Callable, Iterable, Iterator, get_type_hints
 
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
 from stockagent.analysis import (
     analyze_news_sentiment,
-    calculate_all_indicators,
     calculate_composite_score,
     generate_recommendation,
     generate_report,
     get_explanation_factors,
+    memoized_indicators,
 )
-from stockagent.data import PolygonClient, PolygonAPIError
-from stockagent.models import StockAnalysisState
+from stockagent.config import get_settings
+from stockagent.data import BATCH, PolygonClient, PolygonAPIError, request_priority
+from stockagent.graph.checkpoint import checkpoint_thread_id
+from stockagent.models import NodeTiming, StockAnalysisState
+from stockagent.utils.metrics import (
+    ANALYSES,
+    ANALYSES_IN_PROGRESS,
+    ANALYSIS_SECONDS,
+    NODE_ERRORS,
+    NODE_SECONDS,
+)
+from stockagent.utils.tracing import Span, get_span_exporter, start_span
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +41,29 @@ def merge_lists(left: list, right: list) -> list:
     return left + right
 
 
-# Define state with reducer for errors
+def merge_dicts(left: dict, right: dict) -> dict:
+    """Merge two dicts, used for per-node timing accumulation."""
+    return {**left, **right}
+
+
+# Define state with reducers for errors and timings
 class WorkflowState(StockAnalysisState):
-    """Workflow state with error accumulation."""
+    """Workflow state with error and timing accumulation."""
     errors: Annotated[list[str], merge_lists]
+    timings: Annotated[dict[str, NodeTiming], merge_dicts]
+
+
+# State key -> reducer, for applying streamed node updates outside the graph
+_REDUCERS = {
+    name: hint.__metadata__[0]
+    for name, hint in get_type_hints(WorkflowState, include_extras=True).items()
+    if hasattr(hint, "__metadata__")
+}
+
+# Workflow nodes in execution order (technical_analysis and news_sentiment run in parallel)
+NODE_NAMES = ("fetch_data", "technical_analysis", "news_sentiment", "recommend", "synthesize")
+
+NodeCallback = Callable[[str, dict[str, Any]], None]
 
 
 def fetch_data(state: WorkflowState) -> dict[str, Any]:
@@ -90,6 +125,9 @@ def fetch_data(state: WorkflowState) -> dict[str, Any]:
 def technical_analysis(state: WorkflowState) -> dict[str, Any]:
     """Calculate technical indicators from price data.
 
+    Identical price data (e.g. repeated analyses of the same ticker) is
+    served from the indicator memo instead of being recomputed.
+
     Args:
         state: Current workflow state with price_data
 
@@ -114,7 +152,7 @@ def technical_analysis(state: WorkflowState) -> dict[str, Any]:
         }
 
     try:
-        signals = calculate_all_indicators(price_data)
+        signals = memoized_indicators(price_data)
         # Update current_price from state if available
         if state.get("current_price"):
             signals["current_price"] = state["current_price"]
@@ -197,7 +235,7 @@ def recommend(state: WorkflowState) -> dict[str, Any]:
         state: Current workflow state
 
     Returns:
-        Updated state fields: recommendation, confidence, explanation_factors
+        Updated state fields: recommendation, confidence, score, explanation_factors
     """
     technical_signals = state.get("technical_signals", {})
     sentiment = state.get("news_sentiment", {})
@@ -219,6 +257,7 @@ def recommend(state: WorkflowState) -> dict[str, Any]:
         return {
             "recommendation": recommendation,
             "confidence": confidence,
+            "score": score,
             "explanation_factors": factors,
         }
     except Exception as e:
@@ -226,30 +265,108 @@ def recommend(state: WorkflowState) -> dict[str, Any]:
         return {
             "recommendation": "HOLD",
             "confidence": 0.0,
+            "score": 0.0,
             "explanation_factors": [f"Error generating recommendation: {e}"],
             "errors": [f"Recommendation error: {e}"],
         }
 
 
-def create_workflow() -> CompiledStateGraph:
+def _span_timing(span: Span, payload_bytes: int) -> NodeTiming:
+    return {
+        "wall_ms": round(span.wall_ms, 3),
+        "cpu_ms": round(span.cpu_ms, 3),
+        "api_calls": span.counters.get("api_calls", 0),
+        "cache_hits": span.counters.get("cache_hits", 0),
+        "cache_misses": span.counters.get("cache_misses", 0),
+        "payload_bytes": payload_bytes,
+    }
+
+
+def instrument_node(name: str, node: Callable[[WorkflowState], dict[str, Any]]) -> Callable:
+    """Wrap a node so each run records a span and a timing summary.
+
+    The node runs inside a ``node.<name>`` span (a child of the run's span
+    when called via run_analysis). Its wall/CPU time, API calls, indicator
+    cache hits/misses and the JSON size of its output are added to the
+    state under ``timings[name]``. Serializing the output is not free, so
+    its size is only measured when a span exporter or debug logging is
+    active (0 otherwise).
+
+    Args:
+        name: Node name in the graph
+        node: Node function
+
+    Returns:
+        Instrumented node function
+    """
+
+    @functools.wraps(node)
+    def instrumented(state: WorkflowState) -> dict[str, Any]:
+        attributes = {"stockagent.node": name, "stockagent.ticker": state.get("ticker", "")}
+        with start_span(f"node.{name}", attributes) as span:
+            result = node(state)
+
+        NODE_SECONDS.labels(name).observe(span.wall_ms / 1000)
+        if result.get("errors"):
+            NODE_ERRORS.labels(name).inc(len(result["errors"]))
+
+        payload_bytes = 0
+        if get_span_exporter() is not None or logger.isEnabledFor(logging.DEBUG):
+            payload_bytes = len(json.dumps(result, default=str))
+            span.set_attribute("stockagent.payload_bytes", payload_bytes)
+        timing = _span_timing(span, payload_bytes)
+        logger.debug(f"{name} for {attributes['stockagent.ticker']}: {timing}")
+
+        return {**result, "timings": {name: timing}}
+
+    return instrumented
+
+
+# Wraps a node function given its graph name, e.g. to time each node
+NodeWrapper = Callable[[str, Callable[[WorkflowState], dict[str, Any]]], Callable]
+
+
+def create_workflow(
+    node_wrapper: NodeWrapper | None = None,
+    instrument: bool = True,
+    checkpointer: BaseCheckpointSaver | None = None,
+) -> CompiledStateGraph:
     """Create and compile the stock analysis workflow graph.
 
     The workflow follows this structure:
     START -> fetch_data -> [technical_analysis, news_sentiment] (parallel)
           -> recommend -> synthesize -> END
 
+    Args:
+        node_wrapper: Optional callable ``(name, node) -> node`` applied to
+            every node function before it is added to the graph
+        instrument: Record a span and timing summary for every node
+            (see instrument_node)
+        checkpointer: Optional saver persisting state after every step,
+            which lets run_analysis(run_id=...) resume interrupted runs
+            (see stockagent.graph.checkpoint)
+
     Returns:
         Compiled LangGraph StateGraph
     """
     # Create the graph
     graph = StateGraph(WorkflowState)
 
+    nodes = {
+        "fetch_data": fetch_data,
+        "technical_analysis": technical_analysis,
+        "news_sentiment": news_sentiment_node,
+        "synthesize": synthesize,
+        "recommend": recommend,
+    }
+
     # Add nodes
-    graph.add_node("fetch_data", fetch_data)
-    graph.add_node("technical_analysis", technical_analysis)
-    graph.add_node("news_sentiment", news_sentiment_node)
-    graph.add_node("synthesize", synthesize)
-    graph.add_node("recommend", recommend)
+    for name, node in nodes.items():
+        if instrument:
+            node = instrument_node(name, node)
+        if node_wrapper:
+            node = node_wrapper(name, node)
+        graph.add_node(name, node)
 
     # Wire edges
     # START -> fetch_data
@@ -268,20 +385,19 @@ def create_workflow() -> CompiledStateGraph:
     graph.add_edge("synthesize", END)
 
     # Compile and return
-    return graph.compile()
+    return graph.compile(checkpointer=checkpointer)
 
 
-def run_analysis(ticker: str) -> dict[str, Any]:
-    """Run complete stock analysis for a ticker.
+def create_initial_state(ticker: str) -> WorkflowState:
+    """Build the initial workflow state for a ticker.
 
     Args:
         ticker: Stock ticker symbol (e.g., 'AAPL')
 
     Returns:
-        Complete StockAnalysisState with all analysis results
+        WorkflowState with all fields initialized
     """
-    # Initialize state
-    initial_state: WorkflowState = {
+    return {
         "ticker": ticker.upper().strip(),
         "price_data": [],
         "company_name": "",
@@ -292,12 +408,179 @@ def run_analysis(ticker: str) -> dict[str, Any]:
         "synthesis": "",
         "recommendation": "",
         "confidence": 0.0,
+        "score": 0.0,
         "explanation_factors": [],
         "errors": [],
+        "timings": {},
     }
 
-    # Create and run workflow
-    workflow = create_workflow()
-    result = workflow.invoke(initial_state)
+
+def _stream_updates(
+    workflow: CompiledStateGraph,
+    workflow_input: WorkflowState | None,
+    config: dict | None,
+    state: dict[str, Any],
+    on_node: NodeCallback,
+) -> dict[str, Any]:
+    """Run the workflow in "updates" streaming mode, reporting each node.
+
+    Node updates are merged into ``state`` with the same reducers the graph
+    uses, so the returned state matches what invoke() would return.
+    """
+    for update in workflow.stream(workflow_input, config, stream_mode="updates"):
+        for node, values in update.items():
+            if node not in NODE_NAMES:
+                continue
+            for key, value in (values or {}).items():
+                reducer = _REDUCERS.get(key)
+                state[key] = reducer(state[key], value) if reducer and key in state else value
+            on_node(node, state)
+    return state
+
+
+def run_analysis(
+    ticker: str,
+    workflow: CompiledStateGraph | None = None,
+    run_id: str | None = None,
+    on_node: NodeCallback | None = None,
+) -> dict[str, Any]:
+    """Run complete stock analysis for a ticker.
+
+    Args:
+        ticker: Stock ticker symbol (e.g., 'AAPL')
+        workflow: Compiled workflow to run. A new one is created if not
+            provided; pass one in to reuse it across many analyses.
+        run_id: Checkpointed run this analysis belongs to. Requires a
+            workflow created with a checkpointer. A ticker already finished
+            with price data in this run is returned from its checkpoint; an
+            interrupted one resumes at its first incomplete node.
+        on_node: Optional callback ``(node_name, state)`` called as soon as
+            each node finishes, with the state accumulated so far (e.g. to
+            render partial results). The state must not be modified.
+
+    Returns:
+        Complete StockAnalysisState with all analysis results. When the
+        workflow is instrumented, ``timings`` holds one NodeTiming per node
+        plus a "total" entry for the whole run.
+
+    Raises:
+        ValueError: If run_id is given without a checkpointed workflow
+    """
+    # Initialize state
+    initial_state = create_initial_state(ticker)
+
+    # Create and run workflow inside a root span so node spans share a trace
+    if workflow is None:
+        workflow = create_workflow()
+
+    config = None
+    workflow_input: WorkflowState | None = initial_state
+    state: dict[str, Any] = dict(initial_state)
+    if run_id is not None:
+        if workflow.checkpointer is None:
+            raise ValueError("run_id requires a workflow created with a checkpointer")
+        thread_id = checkpoint_thread_id(run_id, ticker)
+        config = {"configurable": {"thread_id": thread_id}}
+        snapshot = workflow.get_state(config)
+        if snapshot.values and not snapshot.next:
+            if snapshot.values.get("price_data"):
+                logger.info(f"{initial_state['ticker']} already completed in run {run_id}")
+                return dict(snapshot.values)
+            # Finished without data (e.g. rate limited): start over
+            workflow.checkpointer.delete_thread(thread_id)
+        elif snapshot.next:
+            logger.info(f"Resuming {initial_state['ticker']} at {', '.join(snapshot.next)}")
+            workflow_input = None
+            state = dict(snapshot.values)
+
+    ANALYSES_IN_PROGRESS.inc()
+    outcome = "failed"
+    start = time.perf_counter()
+    try:
+        # Requests from this analysis share a fair-queueing flow within their priority class
+        with (
+            request_priority(flow=initial_state["ticker"]),
+            start_span("run_analysis", {"stockagent.ticker": initial_state["ticker"]}) as span,
+        ):
+            if on_node is None:
+                result = workflow.invoke(workflow_input, config)
+            else:
+                result = _stream_updates(workflow, workflow_input, config, state, on_node)
+        outcome = "partial" if result.get("errors") else "ok"
+    finally:
+        ANALYSES_IN_PROGRESS.dec()
+        ANALYSES.labels(outcome).inc()
+        ANALYSIS_SECONDS.observe(time.perf_counter() - start)
+
+    timings = result.get("timings")
+    if timings:
+        total = _span_timing(span, sum(t["payload_bytes"] for t in timings.values()))
+        for field in ("cpu_ms", "api_calls", "cache_hits", "cache_misses"):
+            total[field] = sum(t[field] for t in timings.values())
+        total["cpu_ms"] = round(total["cpu_ms"], 3)
+        result["timings"] = {**timings, "total": total}
 
     return result
+
+
+def _run_with_priority(priority: str, *args: Any) -> dict[str, Any]:
+    # Executor threads do not inherit the submitter's context
+    with request_priority(priority):
+        return run_analysis(*args)
+
+
+def run_batch_analysis(
+    tickers: Iterable[str],
+    max_workers: int | None = None,
+    workflow: CompiledStateGraph | None = None,
+    run_id: str | None = None,
+    priority: str = BATCH,
+) -> Iterator[dict[str, Any]]:
+    """Analyze many tickers concurrently.
+
+    Results are yielded as soon as each analysis completes, so callers can
+    process them incrementally. Tickers are consumed lazily and at most
+    2 * max_workers analyses are queued or running at a time, so long (or
+    streamed) inputs are not held in memory. A failed analysis yields a
+    state with only the ticker and its errors instead of raising.
+
+    Args:
+        tickers: Ticker symbols to analyze (any iterable, e.g. a file)
+        max_workers: Maximum number of concurrent analyses (default:
+            STOCKAGENT_MAX_WORKERS from the settings)
+        workflow: Compiled workflow to share across analyses (created if
+            not provided)
+        run_id: Checkpointed run id (see run_analysis); requires a workflow
+            created with a checkpointer
+        priority: Scheduling class of the analyses' API requests (see
+            stockagent.data.scheduler); interactive requests go first
+
+    Yields:
+        StockAnalysisState dicts in completion order
+    """
+    if workflow is None:
+        workflow = create_workflow()
+    if max_workers is None:
+        max_workers = get_settings().max_workers
+
+    pending_tickers = iter(tickers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: dict[Future, str] = {}
+
+        def fill() -> None:
+            for ticker in itertools.islice(pending_tickers, 2 * max_workers - len(futures)):
+                future = executor.submit(_run_with_priority, priority, ticker, workflow, run_id)
+                futures[future] = ticker.upper().strip()
+
+        fill()
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                ticker = futures.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Error analyzing {ticker}: {e}")
+                    result = {"ticker": ticker, "errors": [f"Analysis failed: {e}"]}
+                fill()
+                yield result
@@ -0,0 +1,308 @@
+"""Real-time bar ingestion with incremental re-scoring.
+
+Intraday refreshes used to mean re-running the whole workflow per ticker.
+LiveIngestor instead subscribes to Polygon's per-minute aggregate stream
+("AM" events over the stocks websocket) and pushes each message's bars
+into LiveScorer, which keeps a StreamingIndicators state per ticker and
+re-scores only the tickers the message carried. Whenever a ticker's
+recommendation changes, a RecommendationChange event is emitted, typically
+within a millisecond of the message arriving.
+
+Scores use the intraday (minute-bar) indicators plus the ticker's news
+sentiment, if one has been set; prime the states with recent minute bars
+(prime_from_api) so the indicators are meaningful from the first live bar.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+from urllib.parse import urlsplit
+
+import numpy as np
+from polygon import WebSocketClient
+from polygon.exceptions import AuthError
+
+from stockagent.analysis.scoring import calculate_composite_score, generate_recommendation
+from stockagent.analysis.streaming import StreamingIndicators
+from stockagent.config import get_polygon_api_key, get_settings
+from stockagent.data.bars import BarColumns
+from stockagent.data.calendar import EXCHANGE_TZ, previous_trading_day
+from stockagent.data.polygon_client import PolygonAPIError, PolygonClient
+from stockagent.models import SentimentResult
+from stockagent.utils.metrics import LIVE_BARS, LIVE_CHANGES, LIVE_UPDATE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WS_URL = "wss://socket.polygon.io/stocks"
+
+
+@dataclass(frozen=True)
+class RecommendationChange:
+    """A ticker's recommendation changed on a new bar."""
+
+    ticker: str
+    previous: str
+    recommendation: str
+    confidence: float
+    score: float
+    price: float
+    bar_time: datetime
+    latency_ms: float
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form (bar_time as ISO 8601)."""
+        return {**asdict(self), "bar_time": self.bar_time.isoformat()}
+
+
+class _TickerState:
+    def __init__(self, sentiment: SentimentResult | None):
+        self.indicators = StreamingIndicators()
+        self.sentiment = sentiment
+        self.last_timestamp: np.datetime64 | None = None
+        self.recommendation: str | None = None
+        self.confidence = 0.0
+        self.score = 0.0
+
+    def add(self, columns: BarColumns) -> None:
+        # Bars at or before the last one seen (replays, duplicates) are dropped
+        if self.last_timestamp is not None:
+            newer = columns["timestamp"] > self.last_timestamp
+            if not newer.all():
+                columns = {name: values[newer] for name, values in columns.items()}
+        if len(columns["timestamp"]):
+            self.indicators.update(columns)
+            self.last_timestamp = columns["timestamp"][-1]
+
+    def rescore(self) -> str | None:
+        """Update the score; returns the previous recommendation."""
+        previous = self.recommendation
+        self.score = calculate_composite_score(self.indicators.signals(), self.sentiment)
+        self.recommendation, self.confidence = generate_recommendation(self.score)
+        return previous
+
+
+class LiveScorer:
+    """Incremental indicator states and recommendations per ticker.
+
+    Args:
+        sentiments: News sentiment per ticker to include in scores (default: none)
+    """
+
+    def __init__(self, sentiments: dict[str, SentimentResult] | None = None):
+        self._sentiments = {ticker.upper(): s for ticker, s in (sentiments or {}).items()}
+        self._states: dict[str, _TickerState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, ticker: str) -> _TickerState:
+        state = self._states.get(ticker)
+        if state is None:
+            state = self._states[ticker] = _TickerState(self._sentiments.get(ticker))
+        return state
+
+    def prime(self, ticker: str, columns: BarColumns) -> str:
+        """Feed historical bars without emitting events.
+
+        Args:
+            ticker: Ticker symbol
+            columns: Bars older than any live bar, oldest first (may be called per chunk)
+
+        Returns:
+            The ticker's recommendation after these bars
+        """
+        with self._lock:
+            state = self._state(ticker.upper())
+            state.add(columns)
+            state.rescore()
+            return state.recommendation
+
+    def set_sentiment(self, ticker: str, sentiment: SentimentResult | None) -> None:
+        """Set the news sentiment included in a ticker's score from its next bar on."""
+        with self._lock:
+            ticker = ticker.upper()
+            self._sentiments[ticker] = sentiment
+            if ticker in self._states:
+                self._states[ticker].sentiment = sentiment
+
+    def recommendation(self, ticker: str) -> str | None:
+        """A ticker's current recommendation, or None before its first bar."""
+        with self._lock:
+            state = self._states.get(ticker.upper())
+            return state.recommendation if state else None
+
+    def update(self, bars: dict[str, BarColumns], received: float | None = None) -> list[RecommendationChange]:
+        """Add new bars and re-score the tickers they belong to.
+
+        Args:
+            bars: New bars by ticker, oldest first
+            received: time.perf_counter() when the bars arrived (for latency)
+
+        Returns:
+            Recommendation changes, one per ticker at most
+        """
+        received = time.perf_counter() if received is None else received
+        changes = []
+        with self._lock:
+            for ticker, columns in bars.items():
+                state = self._state(ticker)
+                state.add(columns)
+                previous = state.rescore()
+                if previous is not None and previous != state.recommendation:
+                    bar_ms = int(state.last_timestamp.astype("datetime64[ms]").astype(np.int64))
+                    changes.append(
+                        RecommendationChange(
+                            ticker=ticker,
+                            previous=previous,
+                            recommendation=state.recommendation,
+                            confidence=state.confidence,
+                            score=state.score,
+                            price=state.indicators.current_price,
+                            bar_time=datetime.fromtimestamp(bar_ms / 1000, timezone.utc),
+                            latency_ms=(time.perf_counter() - received) * 1000,
+                        )
+                    )
+        return changes
+
+
+def decode_aggregate_events(events: Iterable[dict]) -> dict[str, BarColumns]:
+    """Group per-minute aggregate ("AM") events into bar columns by ticker.
+
+    Args:
+        events: Decoded websocket events; other event types are ignored
+
+    Returns:
+        BarColumns per ticker, in message order (timestamps are bar starts)
+    """
+    by_ticker: dict[str, list[dict]] = {}
+    for event in events:
+        if event.get("ev") == "AM":
+            by_ticker.setdefault(event["sym"].upper(), []).append(event)
+    return {
+        ticker: {
+            "timestamp": np.array([e["s"] for e in items], dtype=np.int64).astype("datetime64[ms]"),
+            "open": np.array([e["o"] for e in items], dtype=np.float64),
+            "high": np.array([e["h"] for e in items], dtype=np.float64),
+            "low": np.array([e["l"] for e in items], dtype=np.float64),
+            "close": np.array([e["c"] for e in items], dtype=np.float64),
+            "volume": np.array([e["v"] for e in items], dtype=np.float64).astype(np.int64),
+        }
+        for ticker, items in by_ticker.items()
+    }
+
+
+def prime_from_api(scorer: LiveScorer, tickers: Iterable[str], sessions: int = 2, client: PolygonClient | None = None) -> None:
+    """Prime a scorer with minute bars of the last trading sessions.
+
+    Args:
+        scorer: Scorer to prime
+        tickers: Ticker symbols
+        sessions: Completed trading sessions to fetch (today's bars so far are included)
+        client: Polygon client (default: a new PolygonClient)
+
+    Tickers that cannot be fetched are logged and left unprimed.
+    """
+    client = client or PolygonClient()
+    today = datetime.now(EXCHANGE_TZ).date()
+    start = today
+    for _ in range(sessions):
+        start = previous_trading_day(start)
+    for ticker in tickers:
+        try:
+            for page in client.iter_aggregates(ticker, start, today, "minute"):
+                scorer.prime(ticker, page)
+        except PolygonAPIError as e:
+            logger.warning(f"Could not prime {ticker}: {e}")
+            continue
+        logger.info(f"Primed {ticker}: {scorer.recommendation(ticker)}")
+
+
+class LiveIngestor:
+    """Streams per-minute bars for tickers from Polygon into a LiveScorer.
+
+    Args:
+        tickers: Ticker symbols to subscribe to
+        scorer: Scorer receiving the bars
+        on_change: Called with each RecommendationChange (on the ingestion thread)
+        url: Stocks stream URL (default: POLYGON_WS_URL or Polygon's real-time feed)
+        api_key: Polygon API key (default: POLYGON_API_KEY)
+    """
+
+    def __init__(
+        self,
+        tickers: Iterable[str],
+        scorer: LiveScorer,
+        on_change: Callable[[RecommendationChange], None],
+        url: str | None = None,
+        api_key: str | None = None,
+    ):
+        self.tickers = list(dict.fromkeys(t.upper().strip() for t in tickers if t.strip()))
+        self.scorer = scorer
+        self.on_change = on_change
+        parts = urlsplit(url or get_settings().polygon_ws_url or DEFAULT_WS_URL)
+        self._client = WebSocketClient(
+            api_key=api_key or get_polygon_api_key(),
+            feed=parts.netloc,
+            market=parts.path.strip("/") or "stocks",
+            secure=parts.scheme == "wss",
+            subscriptions=[f"AM.{ticker}" for ticker in self.tickers],
+            raw=True,
+        )
+        self.error: Exception | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    async def _process(self, message: str | bytes) -> None:
+        received = time.perf_counter()
+        bars = decode_aggregate_events(json.loads(message))
+        if not bars:
+            return
+        changes = self.scorer.update(bars, received)
+        LIVE_BARS.inc(sum(len(columns["timestamp"]) for columns in bars.values()))
+        LIVE_UPDATE_SECONDS.observe(time.perf_counter() - received)
+        for change in changes:
+            LIVE_CHANGES.labels(change.recommendation).inc()
+            logger.info(f"{change.ticker}: {change.previous} -> {change.recommendation} at {change.price:.2f}")
+            try:
+                self.on_change(change)
+            except Exception as e:
+                logger.error(f"Recommendation change handler failed: {e}")
+
+    def run(self) -> None:
+        """Ingest until stop() is called or the connection cannot be re-established.
+
+        A rejected API key ends the run with ``error`` set rather than raising.
+        """
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self._client.connect(self._process))
+        except AuthError as e:
+            self.error = e
+            logger.error(f"Polygon stream rejected the API key: {e}")
+        finally:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+
+    def start(self) -> "LiveIngestor":
+        """Run the ingestion loop in a background thread."""
+        self._thread = threading.Thread(target=self.run, name="live-ingestor", daemon=True)
+        self._thread.start()
+        return self
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait for the ingestion thread; True if it has finished."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Close the connection and wait for the ingestion thread to finish."""
+        if self._loop is not None and not self._loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._client.close(), self._loop)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -63,6 +63,17 @@ class SentimentResult(TypedDict):
     headline_count: int
 
 
+class NodeTiming(TypedDict):
+    """Timing summary for one workflow node (or the whole run)."""
+
+    wall_ms: float
+    cpu_ms: float
+    api_calls: int
+    cache_hits: int
+    cache_misses: int
+    payload_bytes: int
+
+
 class StockAnalysisState(TypedDict, total=False):
     """Complete state for stock analysis workflow."""
 
@@ -83,7 +94,11 @@ class StockAnalysisState(TypedDict, total=False):
     synthesis: str
     recommendation: str
     confidence: float
+    score: float  # Composite score, -100 to +100
     explanation_factors: list[str]
 
     # Errors
     errors: list[str]
+
+    # Instrumentation (per node name, plus "total")
+    timings: dict[str, NodeTiming]
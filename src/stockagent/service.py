@@ -0,0 +1,366 @@
+"""Local HTTP/JSON analysis service.
+
+Analyses run on a bounded worker pool. Concurrent requests for the same
+ticker share one workflow execution (singleflight), and completed results
+are reused for a freshness window (until the next open while the market
+is closed), so many dashboard users asking for the
+same tickers cost one set of Polygon calls.
+
+Endpoints:
+    GET  /analyze/<TICKER>[?max_age=SECONDS]
+    POST /analyze  {"tickers": [...], "max_age": SECONDS}
+    GET  /health
+    GET  /metrics  (Prometheus text format)
+"""
+
+import json
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from stockagent.config import get_settings
+from stockagent.data.freshness import OPEN, FreshnessPolicy
+from stockagent.graph import create_workflow, run_analysis
+from stockagent.utils.cache import TTLCache
+from stockagent.utils.metrics import CONTENT_TYPE, REGISTRY, SERVICE_REQUESTS, SERVICE_RESULTS
+from stockagent.utils.tickers import normalize_ticker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PENDING = 100
+DEFAULT_TIMEOUT = 120.0
+MAX_BATCH_SIZE = 100
+
+SOURCE_CACHE = "cache"
+SOURCE_COALESCED = "coalesced"
+SOURCE_NEW = "new"
+
+
+class ServiceBusyError(Exception):
+    """Raised when the pending-analysis limit is reached."""
+
+
+class AnalysisService:
+    """Runs analyses with bounded concurrency, coalescing and result reuse.
+
+    Args:
+        max_workers: Concurrent workflow executions (default: settings)
+        ttl: Seconds a completed analysis is reused during market hours
+            (default: settings); analyses made while the market is closed
+            are reused until the next open. 0 disables reuse
+        max_pending: Maximum distinct tickers queued or running (default
+            100); further new work raises ServiceBusyError
+        cache_size: Maximum number of cached results
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        ttl: float | None = None,
+        max_pending: int | None = None,
+        cache_size: int = 1024,
+    ):
+        settings = get_settings()
+        self.max_workers = settings.max_workers if max_workers is None else max_workers
+        self.max_pending = DEFAULT_MAX_PENDING if max_pending is None else max_pending
+        self.ttl = settings.result_ttl if ttl is None else ttl
+        self._cache = (
+            TTLCache(cache_size, self.ttl, ttl_for=FreshnessPolicy(self.ttl, OPEN).seconds) if self.ttl > 0 else None
+        )
+        self._workflow = create_workflow()
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="analysis")
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Distinct tickers queued or running."""
+        with self._lock:
+            return len(self._inflight)
+
+    def submit(self, ticker: str, max_age: float | None = None) -> tuple[Future, str]:
+        """Start (or join) an analysis.
+
+        Args:
+            ticker: Ticker symbol (normalized)
+            max_age: Only reuse a cached result at most this old
+
+        Returns:
+            Tuple of (future resolving to (result, age_seconds), source)
+
+        Raises:
+            ServiceBusyError: If new work is needed and the queue is full
+        """
+        with self._lock:
+            entry = None if self._cache is None else self._cache.get_entry(ticker, max_age)
+            if entry is not None:
+                future: Future = Future()
+                future.set_result(entry)
+                return future, SOURCE_CACHE
+
+            future = self._inflight.get(ticker)
+            if future is not None:
+                return future, SOURCE_COALESCED
+
+            if len(self._inflight) >= self.max_pending:
+                raise ServiceBusyError(f"{len(self._inflight)} analyses pending")
+
+            future = self._executor.submit(self._run, ticker)
+            self._inflight[ticker] = future
+            return future, SOURCE_NEW
+
+    def _run(self, ticker: str) -> tuple[dict, float]:
+        try:
+            result = run_analysis(ticker, self._workflow)
+            with self._lock:
+                # Failed fetches (e.g. rate limits) are retried on the next request
+                if self._cache is not None and result.get("price_data"):
+                    self._cache.put(ticker, result)
+                del self._inflight[ticker]
+            return result, 0.0
+        except BaseException:
+            with self._lock:
+                del self._inflight[ticker]
+            raise
+
+    def analyze(self, ticker: str, max_age: float | None = None, timeout: float | None = DEFAULT_TIMEOUT) -> dict:
+        """Analyze one ticker, waiting for the result.
+
+        Args:
+            ticker: Ticker symbol
+            max_age: Only reuse a cached result at most this old
+            timeout: Seconds to wait for a running analysis
+
+        Returns:
+            dict with ticker, source ("cache", "coalesced" or "new"),
+            age_seconds and the analysis result
+
+        Raises:
+            ValueError: If the ticker is invalid
+            ServiceBusyError: If the queue is full
+            concurrent.futures.TimeoutError: If the analysis takes too long
+        """
+        return self._response(*self.submit(normalize_ticker(ticker), max_age), timeout)
+
+    def analyze_batch(
+        self, tickers: list[str], max_age: float | None = None, timeout: float | None = DEFAULT_TIMEOUT
+    ) -> list[dict]:
+        """Analyze several tickers concurrently.
+
+        Per-ticker failures are reported as {"ticker", "error"} entries
+        instead of raising.
+
+        Returns:
+            One response dict per ticker, in request order
+        """
+        submitted = []
+        for ticker in tickers:
+            try:
+                ticker = normalize_ticker(ticker)
+                submitted.append((ticker, self.submit(ticker, max_age)))
+            except (ValueError, ServiceBusyError) as e:
+                submitted.append((ticker, e))
+
+        responses = []
+        for ticker, item in submitted:
+            if isinstance(item, Exception):
+                responses.append({"ticker": ticker, "error": str(item)})
+                continue
+            try:
+                responses.append(self._response(*item, timeout))
+            except FutureTimeoutError:
+                responses.append({"ticker": ticker, "error": "Timed out waiting for analysis"})
+            except Exception as e:
+                logger.error(f"Analysis failed for {ticker}: {e}")
+                responses.append({"ticker": ticker, "error": str(e)})
+        return responses
+
+    def _response(self, future: Future, source: str, timeout: float | None) -> dict:
+        result, age = future.result(timeout)
+        SERVICE_RESULTS.labels(source).inc()
+        return {
+            "ticker": result["ticker"],
+            "source": source,
+            "age_seconds": round(age, 3),
+            "result": result,
+        }
+
+    def health(self) -> dict:
+        """Service status for /health."""
+        return {
+            "status": "ok",
+            "workers": self.max_workers,
+            "pending": self.pending,
+            "cached": 0 if self._cache is None else len(self._cache),
+            "ttl_seconds": self.ttl,
+        }
+
+    def close(self) -> None:
+        """Stop accepting work and wait for running analyses."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class AnalysisServer:
+    """Background HTTP server for an AnalysisService.
+
+    Args:
+        service: Service handling the requests
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        timeout: Seconds a request waits for its analysis
+    """
+
+    def __init__(
+        self, service: AnalysisService, host: str = "127.0.0.1", port: int = 0, timeout: float = DEFAULT_TIMEOUT
+    ):
+        self.service = service
+        self.timeout = timeout
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the service."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "AnalysisServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="analysis-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until shutdown() or KeyboardInterrupt."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the socket (the service is left open)."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "AnalysisServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                if url.path == "/health":
+                    self._send_json("health", 200, server.service.health())
+                elif url.path == "/metrics":
+                    self._send("metrics", 200, REGISTRY.render().encode(), CONTENT_TYPE)
+                elif url.path.startswith("/analyze/"):
+                    query = parse_qs(url.query)
+                    self._analyze(url.path[len("/analyze/"):], query.get("max_age", [None])[0])
+                else:
+                    self._send_json("other", 404, {"error": "Not found"})
+
+            def do_POST(self):
+                if urlsplit(self.path).path != "/analyze":
+                    self._send_json("other", 404, {"error": "Not found"})
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                    tickers = body["tickers"]
+                    max_age = _parse_max_age(body.get("max_age"))
+                    if not isinstance(tickers, list) or not 0 < len(tickers) <= MAX_BATCH_SIZE:
+                        raise ValueError(f"'tickers' must be a list of 1 to {MAX_BATCH_SIZE} symbols")
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    self._send_json("batch", 400, {"error": f"Invalid request: {e}"})
+                    return
+                results = server.service.analyze_batch(tickers, max_age, server.timeout)
+                self._send_json("batch", 200, {"results": results})
+
+            def _analyze(self, ticker: str, max_age: str | None):
+                try:
+                    response = server.service.analyze(ticker, _parse_max_age(max_age), server.timeout)
+                except ValueError as e:
+                    self._send_json("analyze", 400, {"error": str(e)})
+                except ServiceBusyError as e:
+                    self._send_json("analyze", 503, {"error": f"Service busy: {e}"}, {"Retry-After": "1"})
+                except FutureTimeoutError:
+                    self._send_json("analyze", 504, {"error": "Timed out waiting for analysis"})
+                except Exception as e:
+                    logger.error(f"Analysis failed for {ticker}: {e}")
+                    self._send_json("analyze", 500, {"error": str(e)})
+                else:
+                    self._send_json("analyze", 200, response)
+
+            def _send_json(self, route: str, code: int, payload: dict, headers: dict | None = None):
+                body = json.dumps(payload, default=str).encode()
+                self._send(route, code, body, "application/json", headers)
+
+            def _send(self, route: str, code: int, body: bytes, content_type: str, headers: dict | None = None):
+                SERVICE_REQUESTS.labels(route, str(code)).inc()
+                self.send_response(code)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"{self.address_string()} {format % args}")
+
+        return Handler
+
+
+def _parse_max_age(value: Any) -> float | None:
+    """Parse the optional max_age parameter.
+
+    Raises:
+        ValueError: If the value is not a non-negative number
+    """
+    if value is None:
+        return None
+    max_age = float(value)
+    if max_age < 0:
+        raise ValueError("max_age must not be negative")
+    return max_age
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    max_workers: int | None = None,
+    ttl: float | None = None,
+    max_pending: int | None = None,
+) -> None:
+    """Run the analysis service until interrupted.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+        max_workers: Concurrent workflow executions (default: settings)
+        ttl: Seconds a completed analysis is reused (default: settings)
+        max_pending: Maximum distinct tickers queued or running
+    """
+    service = AnalysisService(max_workers, ttl, max_pending)
+    server = AnalysisServer(service, host, port)
+    logger.info(f"StockAgent service listening on {server.url}")
+    print(f"Serving StockAgent analyses on {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        service.close()
@@ -0,0 +1,18 @@
+"""Local stand-ins for external services (Polygon.io REST and websocket,
+news search, OpenTelemetry collector).
+
+Used by benchmarks and tests to exercise the full workflow without network
+access or API keys.
+"""
+
+from stockagent.testing.fake_collector import FakeCollector
+from stockagent.testing.fake_news import FakeNewsClient
+from stockagent.testing.fake_polygon import FakePolygonServer
+from stockagent.testing.fake_socket import FakePolygonSocket
+
+__all__ = [
+    "FakeCollector",
+    "FakeNewsClient",
+    "FakePolygonServer",
+    "FakePolygonSocket",
+]
@@ -0,0 +1,104 @@
+"""Local stand-in for an OpenTelemetry collector's OTLP/HTTP JSON endpoint.
+
+Accepts ``POST /v1/traces`` and keeps the decoded requests in memory.
+Point the tracer at it with ``OTLPHttpSpanExporter(collector.url)`` or
+OTEL_EXPORTER_OTLP_ENDPOINT.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeCollector:
+    """Threaded HTTP server collecting OTLP/JSON trace exports.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._lock = threading.Lock()
+        self._requests: list[dict] = []
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Collector base URL."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self) -> list[dict]:
+        """Decoded export requests, in arrival order."""
+        with self._lock:
+            return list(self._requests)
+
+    @property
+    def spans(self) -> list[dict]:
+        """All received OTLP span objects."""
+        return [
+            span
+            for request in self.requests
+            for resource in request.get("resourceSpans", [])
+            for scope in resource.get("scopeSpans", [])
+            for span in scope.get("spans", [])
+        ]
+
+    def start(self) -> "FakeCollector":
+        """Start serving in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="fake-collector", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeCollector":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        collector = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if self.path != "/v1/traces":
+                    status = 404
+                else:
+                    try:
+                        request = json.loads(body)
+                    except ValueError:
+                        status = 400
+                    else:
+                        with collector._lock:
+                            collector._requests.append(request)
+                        status = 200
+                payload = b"{}"
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
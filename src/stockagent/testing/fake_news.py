@@ -0,0 +1,106 @@
+"""Local stand-in for the DuckDuckGo news search client.
+
+Install with ``set_news_client_factory(FakeNewsClient(...))``; the instance
+is its own factory and context manager, so fetch_news() uses it exactly
+like DDGS.
+"""
+
+import random
+import threading
+import time
+import zlib
+from typing import Any
+
+from stockagent.utils.synthetic import generate_headlines
+
+
+class FakeNewsClient:
+    """DDGS-compatible news client returning synthetic headlines.
+
+    Args:
+        latency: Seconds to sleep before each search
+        jitter: Extra random latency in seconds, uniform in [0, jitter]
+        error_rate: Fraction of searches raising DuckDuckGoSearchException
+        rate_limit_rate: Fraction of searches raising RatelimitException
+        seed: Random seed for latency and fault injection
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "ok": 0, "errors": 0, "rate_limited": 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Snapshot of search counters by outcome."""
+        with self._lock:
+            return dict(self._stats)
+
+    def __call__(self) -> "FakeNewsClient":
+        return self
+
+    def __enter__(self) -> "FakeNewsClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats[outcome] += 1
+
+    def news(self, keywords: str, max_results: int | None = None, **kwargs: Any) -> list[dict]:
+        """Search news, returning results in the DDGS.news() format.
+
+        Args:
+            keywords: Search query
+            max_results: Number of results (default 10)
+
+        Returns:
+            List of dicts with date, title, body, url, image, source
+
+        Raises:
+            RatelimitException: When rate limit injection triggers
+            DuckDuckGoSearchException: When error injection triggers
+        """
+        from duckduckgo_search.exceptions import DuckDuckGoSearchException, RatelimitException
+
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.jitter) if self.jitter else self.latency
+            roll = self._random.random()
+        if delay:
+            time.sleep(delay)
+
+        if roll < self.rate_limit_rate:
+            self._count("rate_limited")
+            raise RatelimitException("https://duckduckgo.com/news.js 202 Ratelimit")
+        if roll < self.rate_limit_rate + self.error_rate:
+            self._count("errors")
+            raise DuckDuckGoSearchException("https://duckduckgo.com/news.js 500 Server Error")
+
+        self._count("ok")
+        seed = zlib.crc32(keywords.encode())
+        return [
+            {
+                "date": "2024-01-02T14:30:00+00:00",
+                "title": title,
+                "body": title,
+                "url": f"https://news.example.com/{seed}/{i}",
+                "image": "",
+                "source": "Synthetic Wire",
+            }
+            for i, title in enumerate(generate_headlines(max_results or 10, seed))
+        ]
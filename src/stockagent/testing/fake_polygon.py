@@ -0,0 +1,367 @@
+"""Local HTTP stand-in for the Polygon.io REST endpoints used by PolygonClient.
+
+Serves deterministic synthetic data for any ticker (daily bars, and minute
+or hour bars of a 390-minute session from 14:30 UTC), with optional latency,
+server error and rate limit injection. Stock splits added with add_split()
+are listed by the splits endpoint and applied to every bar served after
+the call, as Polygon's adjusted aggregates are. Point PolygonClient at it with
+``PolygonClient(base_url=server.url)`` or the POLYGON_BASE_URL setting.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from stockagent.utils.synthetic import generate_bar_columns
+
+_AGGS_RANGE = re.compile(r"^/v2/aggs/ticker/([^/]+)/range/(\d+)/(\w+)/([^/]+)/([^/]+)$")
+_AGGS_PREV = re.compile(r"^/v2/aggs/ticker/([^/]+)/prev$")
+_TICKER_DETAILS = re.compile(r"^/v3/reference/tickers/([^/]+)$")
+_SPLITS = "/v3/reference/splits"
+
+# Synthetic bars for every ticker start here, so ranges are reproducible
+_HISTORY_START = "2000-01-03"
+
+# Aggregates page size when the request has no limit (as Polygon)
+_DEFAULT_LIMIT = 5000
+
+# Intraday bars cover a regular session of 390 minutes from 14:30 UTC
+_SESSION_START_MS = (14 * 60 + 30) * 60_000
+_SESSION_MINUTES = 390
+_INTRADAY_MS = {"minute": 60_000, "hour": 3_600_000}
+
+
+def _ticker_seed(ticker: str) -> int:
+    """Stable per-ticker seed (unlike hash(), not randomized per process)."""
+    return zlib.crc32(ticker.encode())
+
+
+class FakePolygonServer:
+    """Threaded HTTP server mimicking the Polygon.io REST API.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        latency: Seconds to sleep before each response
+        jitter: Extra random latency in seconds, uniform in [0, jitter]
+        error_rate: Fraction of requests answered with HTTP 500
+        rate_limit_rate: Fraction of requests answered with HTTP 429
+        retry_after: Retry-After header value (seconds) sent with 429s
+        unknown_tickers: Tickers answered with HTTP 404
+        seed: Random seed for latency and fault injection
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int | None = None,
+        unknown_tickers: set[str] | None = None,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.unknown_tickers = {t.upper() for t in unknown_tickers or ()}
+
+        self._splits: dict[str, list[dict]] = {}
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "ok": 0, "not_found": 0, "errors": 0, "rate_limited": 0}
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to PolygonClient."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Snapshot of request counters by outcome."""
+        with self._lock:
+            return dict(self._stats)
+
+    def start(self) -> "FakePolygonServer":
+        """Start serving in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="fake-polygon", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakePolygonServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def add_split(self, ticker: str, execution_date: str, split_from: float, split_to: float) -> None:
+        """Record a stock split, effective from this call.
+
+        The synthetic series is taken as the ticker's pre-split prices:
+        from now on every bar is served divided by the split ratio (volumes
+        multiplied), as Polygon's adjusted aggregates are after a split, so
+        bars fetched before the call are on the old basis.
+        """
+        with self._lock:
+            splits = self._splits.setdefault(ticker.upper(), [])
+            splits.append({"execution_date": execution_date, "split_from": split_from, "split_to": split_to})
+            splits.sort(key=lambda split: split["execution_date"])
+
+    def _adjust(self, ticker: str, cols: dict) -> dict:
+        """Apply a ticker's splits to its synthetic bars."""
+        with self._lock:
+            ratio = float(np.prod([split["split_to"] / split["split_from"] for split in self._splits.get(ticker.upper(), ())]))
+        if ratio == 1:
+            return cols
+        adjusted = {name: cols[name] / ratio for name in ("open", "high", "low", "close")}
+        adjusted["volume"] = np.rint(cols["volume"] * ratio).astype(np.int64)
+        return {**cols, **adjusted}
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats[outcome] += 1
+
+    def _draw(self) -> tuple[float, float]:
+        """Draw (delay, fault roll) for one request."""
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.jitter) if self.jitter else self.latency
+            return delay, self._random.random()
+
+    def respond(self, path: str, query: str = "") -> tuple[int, dict, dict[str, str]]:
+        """Build the response for a request.
+
+        Args:
+            path: Request path without query string
+            query: Query string; aggregates honor ``limit`` and the
+                ``cursor`` of the ``next_url`` they return
+
+        Returns:
+            Tuple of (status code, JSON body, extra headers)
+        """
+        delay, roll = self._draw()
+        if delay:
+            time.sleep(delay)
+
+        if roll < self.rate_limit_rate:
+            self._count("rate_limited")
+            headers = {"Retry-After": str(self.retry_after)} if self.retry_after is not None else {}
+            return 429, {"status": "ERROR", "error": "You've exceeded the maximum requests per minute."}, headers
+        if roll < self.rate_limit_rate + self.error_rate:
+            self._count("errors")
+            return 500, {"status": "ERROR", "error": "Internal server error"}, {}
+
+        if match := _AGGS_RANGE.match(path):
+            ticker, multiplier, timespan, from_, to = match.groups()
+            params = {name: values[-1] for name, values in parse_qs(query).items()}
+            body = self._aggs(ticker, int(multiplier), timespan, from_, to, path, params)
+        elif match := _AGGS_PREV.match(path):
+            body = self._previous_close(match.group(1))
+        elif match := _TICKER_DETAILS.match(path):
+            body = self._ticker_details(match.group(1))
+        elif path == _SPLITS:
+            params = {name: values[-1] for name, values in parse_qs(query).items()}
+            body = self._list_splits(params.get("ticker", ""))
+        else:
+            self._count("not_found")
+            return 404, {"status": "NOT_FOUND", "message": "Not found"}, {}
+
+        if body is None:
+            self._count("not_found")
+            return 404, {"status": "NOT_FOUND", "message": "Ticker not found"}, {}
+
+        self._count("ok")
+        return 200, body, {}
+
+    def _history(self, ticker: str, to: np.datetime64) -> dict:
+        n_bars = int(np.busday_count(np.datetime64(_HISTORY_START), to + 1))
+        return generate_bar_columns(max(n_bars, 1), seed=_ticker_seed(ticker), start=_HISTORY_START)
+
+    def _intraday(self, ticker: str, multiplier: int, timespan: str, start: np.datetime64, end: np.datetime64) -> dict:
+        """Minute bars for each business day in [start, end], aggregated to the bar size.
+
+        Each day's path is seeded by ticker and date and starts at that day's
+        daily open, so any range yields the same bars for a given day.
+        """
+        daily = self._history(ticker, end)
+        days = daily["timestamp"].astype("datetime64[D]")
+        selected = (days >= start) & (days <= end)
+        minutes = np.arange(_SESSION_MINUTES, dtype=np.int64) * 60_000 + _SESSION_START_MS
+        chunks = []
+        for day, day_open in zip(days[selected], daily["open"][selected]):
+            rng = np.random.default_rng((_ticker_seed(ticker), int(day.astype(np.int64))))
+            close = day_open * np.exp(np.cumsum(rng.normal(0, 0.0008, _SESSION_MINUTES)))
+            open_ = np.concatenate(([day_open], close[:-1]))
+            spread = np.abs(rng.normal(0, 0.0004, _SESSION_MINUTES)) * close
+            chunks.append({
+                "timestamp": day.astype("datetime64[ms]").astype(np.int64) + minutes,
+                "open": open_,
+                "high": np.maximum(open_, close) + spread,
+                "low": np.minimum(open_, close) - spread,
+                "close": close,
+                "volume": rng.integers(1_000, 100_000, _SESSION_MINUTES, dtype=np.int64),
+            })
+        if not chunks:
+            return {**{name: np.array([]) for name in ("open", "high", "low", "close", "volume")},
+                    "timestamp": np.array([], dtype="datetime64[ms]")}
+        cols = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
+        # Bars start on multiples of their size, as Polygon's do
+        size = multiplier * _INTRADAY_MS[timespan]
+        keys = cols["timestamp"] // size
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        ends = np.concatenate((starts[1:], [len(keys)])) - 1
+        return {
+            "timestamp": (keys[starts] * size).astype("datetime64[ms]"),
+            "open": cols["open"][starts],
+            "high": np.maximum.reduceat(cols["high"], starts),
+            "low": np.minimum.reduceat(cols["low"], starts),
+            "close": cols["close"][ends],
+            "volume": np.add.reduceat(cols["volume"], starts),
+        }
+
+    def _aggs(
+        self, ticker: str, multiplier: int, timespan: str, from_: str, to: str, path: str, params: dict[str, str]
+    ) -> dict | None:
+        if ticker.upper() in self.unknown_tickers:
+            return None
+        start = np.datetime64(from_[:10], "D")
+        end = np.datetime64(to[:10], "D")
+        limit = int(params.get("limit", _DEFAULT_LIMIT))
+        offset = int(params.get("cursor", 0))
+        if timespan in _INTRADAY_MS:
+            cols = self._intraday(ticker, multiplier, timespan, start, end)
+        else:
+            cols = self._history(ticker, end)
+        cols = self._adjust(ticker, cols)
+        timestamps = cols["timestamp"]
+        (in_range,) = np.nonzero(
+            (timestamps >= start.astype("datetime64[ms]")) & (timestamps < (end + 1).astype("datetime64[ms]"))
+        )
+        mask = in_range[offset : offset + limit]
+        results = [
+            {
+                "o": float(o),
+                "h": float(h),
+                "l": float(lo),
+                "c": float(c),
+                "v": int(v),
+                "vw": float((h + lo + c) / 3),
+                "t": int(t),
+                "n": int(v // 100),
+            }
+            for o, h, lo, c, v, t in zip(
+                cols["open"][mask],
+                cols["high"][mask],
+                cols["low"][mask],
+                cols["close"][mask],
+                cols["volume"][mask],
+                cols["timestamp"][mask].astype(np.int64),
+            )
+        ]
+        body = {
+            "ticker": ticker,
+            "status": "OK",
+            "adjusted": True,
+            "queryCount": len(in_range),
+            "resultsCount": len(results),
+            "results": results,
+        }
+        if offset + limit < len(in_range):
+            body["next_url"] = f"{self.url}{path}?cursor={offset + limit}&limit={limit}"
+        return body
+
+    def _previous_close(self, ticker: str) -> dict | None:
+        if ticker.upper() in self.unknown_tickers:
+            return None
+        today = np.datetime64("today", "D")
+        last = np.busday_offset(today, -1, roll="backward")
+        cols = self._adjust(ticker, self._history(ticker, last))
+        return {
+            "ticker": ticker,
+            "status": "OK",
+            "resultsCount": 1,
+            "results": [
+                {
+                    "T": ticker,
+                    "o": float(cols["open"][-1]),
+                    "h": float(cols["high"][-1]),
+                    "l": float(cols["low"][-1]),
+                    "c": float(cols["close"][-1]),
+                    "v": int(cols["volume"][-1]),
+                    "t": int(cols["timestamp"][-1].astype(np.int64)),
+                }
+            ],
+        }
+
+    def _list_splits(self, ticker: str) -> dict:
+        with self._lock:
+            splits = self._splits.get(ticker.upper(), [])
+            results = [{"ticker": ticker.upper(), **split} for split in splits]
+        return {"status": "OK", "results": results}
+
+    def _ticker_details(self, ticker: str) -> dict | None:
+        if ticker.upper() in self.unknown_tickers:
+            return None
+        return {
+            "status": "OK",
+            "results": {
+                "ticker": ticker,
+                "name": f"{ticker} Holdings Inc.",
+                "market": "stocks",
+                "active": True,
+                "sic_description": "SYNTHETIC DATA SERVICES",
+            },
+        }
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are separate writes; avoid delayed-ACK stalls
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                status, body, headers = server.respond(*urlsplit(self.path)[2:4])
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,199 @@
+"""Local websocket stand-in for the Polygon.io stocks stream.
+
+Speaks the Polygon websocket protocol (connected status, ``auth`` and
+``subscribe``/``unsubscribe`` actions, JSON arrays of events) and pushes
+per-minute aggregate (``AM``) events that tests publish. Point
+LiveIngestor at it with ``url=server.url`` or the POLYGON_WS_URL setting.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+from websockets.asyncio.server import ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+
+
+def _status(status: str, message: str) -> str:
+    return json.dumps([{"ev": "status", "status": status, "message": message}])
+
+
+class FakePolygonSocket:
+    """Websocket server mimicking Polygon's real-time stocks feed.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        api_key: Key clients must authenticate with (None accepts any)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, api_key: str | None = None):
+        self.host = host
+        self.port = port
+        self.api_key = api_key
+        self._loop = asyncio.new_event_loop()
+        self._server = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._clients: dict[ServerConnection, set[str]] = {}
+        self._stats = {"connections": 0, "auth_failed": 0, "events": 0}
+
+    @property
+    def url(self) -> str:
+        """URL of the stocks stream, e.g. ws://127.0.0.1:PORT/stocks."""
+        return f"ws://{self.host}:{self.port}/stocks"
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Snapshot of connection and event counters."""
+        with self._lock:
+            return dict(self._stats)
+
+    def subscriptions(self) -> set[str]:
+        """Topics (e.g. "AM.AAPL") subscribed by any authenticated client."""
+        with self._lock:
+            return set().union(*self._clients.values())
+
+    def wait_subscribed(self, topics: set[str], timeout: float = 5.0) -> bool:
+        """Block until all ``topics`` are subscribed; False on timeout."""
+        with self._changed:
+            return self._changed.wait_for(lambda: topics <= set().union(*self._clients.values()), timeout)
+
+    def start(self) -> "FakePolygonSocket":
+        """Start serving in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="fake-polygon-socket", daemon=True)
+            self._thread.start()
+            self._ready.wait()
+        return self
+
+    def stop(self) -> None:
+        """Close client connections and stop serving."""
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "FakePolygonSocket":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        try:
+            self._loop.run_until_complete(self._serve())
+        finally:
+            self._ready.set()
+            self._loop.close()
+
+    async def _serve(self) -> None:
+        async with serve(self._handle, self.host, self.port) as server:
+            self._server = server
+            self.port = server.sockets[0].getsockname()[1]
+            self._ready.set()
+            await server.wait_closed()
+
+    async def _handle(self, connection: ServerConnection) -> None:
+        with self._lock:
+            self._stats["connections"] += 1
+        await connection.send(_status("connected", "Connected Successfully"))
+        try:
+            async for raw in connection:
+                message = json.loads(raw)
+                action, params = message.get("action"), message.get("params", "")
+                if action == "auth":
+                    if self.api_key is not None and params != self.api_key:
+                        with self._lock:
+                            self._stats["auth_failed"] += 1
+                        await connection.send(_status("auth_failed", "authentication failed"))
+                        await connection.close()
+                        return
+                    with self._changed:
+                        self._clients[connection] = set()
+                    await connection.send(_status("auth_success", "authenticated"))
+                elif connection not in self._clients:
+                    await connection.send(_status("error", "not authorized"))
+                elif action in ("subscribe", "unsubscribe"):
+                    topics = {topic.strip() for topic in params.split(",") if topic.strip()}
+                    with self._changed:
+                        if action == "subscribe":
+                            self._clients[connection] |= topics
+                        else:
+                            self._clients[connection] -= topics
+                        self._changed.notify_all()
+                    for topic in sorted(topics):
+                        await connection.send(_status("success", f"{action}d to: {topic}"))
+        except ConnectionClosed:
+            pass
+        finally:
+            with self._changed:
+                self._clients.pop(connection, None)
+                self._changed.notify_all()
+
+    def publish(self, events: list[dict]) -> None:
+        """Send events (as one JSON array per client) to clients subscribed to them."""
+        asyncio.run_coroutine_threadsafe(self._publish(events), self._loop).result()
+
+    async def _publish(self, events: list[dict]) -> None:
+        with self._lock:
+            clients = list(self._clients.items())
+            self._stats["events"] += len(events)
+        for connection, topics in clients:
+            wanted = [
+                event
+                for event in events
+                if f"{event['ev']}.{event['sym']}" in topics or f"{event['ev']}.*" in topics
+            ]
+            if wanted:
+                try:
+                    await connection.send(json.dumps(wanted))
+                except ConnectionClosed:
+                    pass
+
+    def publish_bar(
+        self,
+        ticker: str,
+        close: float,
+        start_ms: int | None = None,
+        open_: float | None = None,
+        high: float | None = None,
+        low: float | None = None,
+        volume: int = 1000,
+    ) -> dict:
+        """Publish one per-minute aggregate ("AM") event.
+
+        Args:
+            ticker: Ticker symbol
+            close: Closing price (also the default open, high and low)
+            start_ms: Bar start in Unix milliseconds (default: the current minute)
+            open_, high, low: Other prices of the bar
+            volume: Bar volume
+
+        Returns:
+            The published event
+        """
+        if start_ms is None:
+            start_ms = int(time.time() // 60 * 60_000)
+        open_ = close if open_ is None else open_
+        event = {
+            "ev": "AM",
+            "sym": ticker.upper(),
+            "v": volume,
+            "av": volume,
+            "op": open_,
+            "vw": close,
+            "o": open_,
+            "c": close,
+            "h": max(open_, close) if high is None else high,
+            "l": min(open_, close) if low is None else low,
+            "a": close,
+            "z": 100,
+            "s": start_ms,
+            "e": start_ms + 60_000,
+        }
+        self.publish([event])
+        return event
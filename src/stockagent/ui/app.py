@@ -1,10 +1,22 @@
 """Streamlit UI for StockAgent."""
 
 import json
+import time
+from datetime import datetime
+from typing import Collection
 
 import streamlit as st
 
+from stockagent.config import get_settings
+from stockagent.data import INTERACTIVE, ensure_rate_limiter, request_priority
+from stockagent.data.freshness import OPEN, FreshnessPolicy
 from stockagent.graph import run_analysis
+from stockagent.graph.workflow import NODE_NAMES, NodeCallback
+from stockagent.utils.cache import TTLCache
+from stockagent.utils.metrics import ensure_metrics_server
+
+# Tickers whose latest analysis is kept for all sessions
+RESULT_CACHE_SIZE = 256
 
 
 # Page configuration
@@ -16,6 +28,17 @@ st.set_page_config(
 )
 
 
+@st.cache_resource
+def get_result_cache() -> TTLCache:
+    """Analyses shared by every browser session, reused for STOCKAGENT_RESULT_TTL seconds.
+
+    Analyses made while the market is closed are reused until the next open.
+    Values are (result, analyzed_at) tuples, with analyzed_at a Unix timestamp.
+    """
+    ttl = get_settings().result_ttl
+    return TTLCache(RESULT_CACHE_SIZE, ttl, ttl_for=FreshnessPolicy(ttl, OPEN).seconds)
+
+
 def init_session_state():
     """Initialize session state variables."""
     if "analysis_result" not in st.session_state:
@@ -24,6 +47,8 @@ def init_session_state():
         st.session_state.current_ticker = ""
     if "last_analyzed_ticker" not in st.session_state:
         st.session_state.last_analyzed_ticker = ""
+    if "analyzed_at" not in st.session_state:
+        st.session_state.analyzed_at = None
     if "pending_ticker" not in st.session_state:
         st.session_state.pending_ticker = None
 
@@ -76,76 +101,102 @@ def render_ticker_input():
     return st.session_state.current_ticker
 
 
-def render_metrics(result: dict):
-    """Render metrics row with analysis results."""
+def render_metrics(result: dict, pending: Collection[str] = ()):
+    """Render metrics row with analysis results.
+
+    Args:
+        result: Analysis state (complete, or partial while streaming)
+        pending: Workflow nodes that have not finished; their metrics are
+            shown as in progress
+    """
     col1, col2, col3, col4 = st.columns(4)
 
     # Price metric
     with col1:
         current_price = result.get("current_price", 0.0)
         previous_close = result.get("previous_close", 0.0)
-        if current_price and previous_close:
-            price_change = current_price - previous_close
-            price_delta = f"{price_change:+.2f}"
+        if "fetch_data" in pending:
+            st.metric(label="Current Price", value="…", delta="Fetching prices", delta_color="off")
         else:
-            price_delta = None
-        st.metric(
-            label="Current Price",
-            value=f"${current_price:.2f}" if current_price else "N/A",
-            delta=price_delta,
-        )
+            if current_price and previous_close:
+                price_change = current_price - previous_close
+                price_delta = f"{price_change:+.2f}"
+            else:
+                price_delta = None
+            st.metric(
+                label="Current Price",
+                value=f"${current_price:.2f}" if current_price else "N/A",
+                delta=price_delta,
+            )
 
     # RSI metric
     with col2:
         technical = result.get("technical_signals", {})
         rsi = technical.get("rsi")
         rsi_interp = technical.get("rsi_interpretation", "N/A")
-        st.metric(
-            label="RSI (14)",
-            value=f"{rsi:.1f}" if rsi is not None else "N/A",
-            delta=rsi_interp.capitalize() if rsi is not None else None,
-            delta_color="off",
-        )
+        if "technical_analysis" in pending:
+            st.metric(label="RSI (14)", value="…", delta="Calculating", delta_color="off")
+        else:
+            st.metric(
+                label="RSI (14)",
+                value=f"{rsi:.1f}" if rsi is not None else "N/A",
+                delta=rsi_interp.capitalize() if rsi is not None else None,
+                delta_color="off",
+            )
 
     # Sentiment metric
     with col3:
         sentiment = result.get("news_sentiment", {})
         sentiment_score = sentiment.get("overall_score", 0.0)
         sentiment_label = sentiment.get("overall_label", "neutral")
-        delta_color = "normal" if sentiment_score >= 0 else "inverse"
-        st.metric(
-            label="News Sentiment",
-            value=f"{sentiment_score:+.2f}",
-            delta=sentiment_label.capitalize(),
-            delta_color="off",
-        )
+        if "news_sentiment" in pending:
+            st.metric(label="News Sentiment", value="…", delta="Reading news", delta_color="off")
+        else:
+            st.metric(
+                label="News Sentiment",
+                value=f"{sentiment_score:+.2f}",
+                delta=sentiment_label.capitalize(),
+                delta_color="off",
+            )
 
     # Recommendation metric
     with col4:
         recommendation = result.get("recommendation") or "N/A"
         confidence = result.get("confidence") or 0.0
-        st.metric(
-            label="Recommendation",
-            value=recommendation,
-            delta=f"{confidence:.0f}% confidence",
-            delta_color="off",
-        )
+        if "recommend" in pending:
+            st.metric(label="Recommendation", value="…", delta="Scoring", delta_color="off")
+        else:
+            st.metric(
+                label="Recommendation",
+                value=recommendation,
+                delta=f"{confidence:.0f}% confidence",
+                delta_color="off",
+            )
+
 
+def render_tabs(result: dict, pending: Collection[str] = ()):
+    """Render tabbed interface with analysis details.
 
-def render_tabs(result: dict):
-    """Render tabbed interface with analysis details."""
+    Args:
+        result: Analysis state (complete, or partial while streaming)
+        pending: Workflow nodes that have not finished
+    """
     tab1, tab2, tab3 = st.tabs(["📄 Full Report", "📊 Technical Data", "📰 News Headlines"])
 
     with tab1:
         synthesis = result.get("synthesis", "")
-        if synthesis:
+        if "synthesize" in pending:
+            st.info("Generating report...")
+        elif synthesis:
             st.markdown(synthesis)
         else:
             st.info("No report generated.")
 
     with tab2:
         technical = result.get("technical_signals", {})
-        if technical:
+        if "technical_analysis" in pending:
+            st.info("Calculating indicators...")
+        elif technical:
             st.json(technical)
         else:
             st.info("No technical data available.")
@@ -153,7 +204,9 @@ def render_tabs(result: dict):
     with tab3:
         sentiment = result.get("news_sentiment", {})
         headlines = sentiment.get("headlines", [])
-        if headlines:
+        if "news_sentiment" in pending:
+            st.info("Fetching headlines...")
+        elif headlines:
             for headline in headlines:
                 title = headline.get("title", "")
                 label = headline.get("label", "neutral")
@@ -189,6 +242,67 @@ def render_errors(result: dict):
                 st.warning(error)
 
 
+def render_results(result: dict, ticker: str, pending: Collection[str] = ()):
+    """Render the results section for a complete or in-progress analysis.
+
+    Args:
+        result: Analysis state
+        ticker: Ticker symbol (title fallback before the company name is known)
+        pending: Workflow nodes that have not finished
+    """
+    st.markdown("")  # Spacer
+    st.subheader(f"Analysis Results: {result.get('company_name') or ticker}")
+
+    # Render components
+    render_errors(result)
+    render_metrics(result, pending)
+    st.markdown("")  # Spacer
+    render_tabs(result, pending)
+
+
+def format_as_of(analyzed_at: float, now: float | None = None) -> str:
+    """Describe when an analysis was run, e.g. "Data as of 14:05:12 (3 min ago)"."""
+    age = max(0.0, (time.time() if now is None else now) - analyzed_at)
+    if age < 60:
+        ago = "just now"
+    elif age < 3600:
+        ago = f"{age // 60:.0f} min ago"
+    else:
+        ago = f"{age // 3600:.0f} h ago"
+    return f"Data as of {datetime.fromtimestamp(analyzed_at):%H:%M:%S} ({ago})"
+
+
+def get_analysis(
+    ticker: str, refresh: bool = False, on_node: NodeCallback | None = None
+) -> tuple[dict, float]:
+    """Get an analysis from the shared cache, running the workflow on a miss.
+
+    Only analyses with price data are cached, so failures (e.g. rate
+    limits) are retried on the next request.
+
+    Args:
+        ticker: Ticker symbol
+        refresh: Ignore any cached analysis and run the workflow again
+        on_node: Streaming callback passed to run_analysis (not called on a hit)
+
+    Returns:
+        Tuple of (result, analyzed_at Unix timestamp)
+    """
+    cache = get_result_cache()
+    if not refresh:
+        cached = cache.get(ticker)
+        if cached is not None:
+            return cached
+
+    # A user is waiting: go ahead of batch and watchlist requests
+    with request_priority(INTERACTIVE):
+        result = run_analysis(ticker, on_node=on_node)
+    analyzed_at = time.time()
+    if result.get("price_data"):
+        cache.put(ticker, (result, analyzed_at))
+    return result, analyzed_at
+
+
 def render_disclaimer():
     """Render disclaimer footer."""
     st.divider()
@@ -202,6 +316,8 @@ def render_disclaimer():
 
 def main():
     """Main application entry point."""
+    ensure_metrics_server()
+    ensure_rate_limiter()
     init_session_state()
     render_header()
 
@@ -218,34 +334,47 @@ def main():
             use_container_width=True,
             type="primary",
         )
+    with col3:
+        refresh_button = st.button(
+            "🔄 Refresh",
+            disabled=not ticker,
+            help="Fetch new data instead of reusing a recent analysis",
+        )
+
+    # Placeholder redrawn as each workflow node finishes
+    results_area = st.empty()
 
     # Handle analysis
-    if run_button and ticker:
+    if (run_button or refresh_button) and ticker:
         # Clear previous results if ticker changed
         if ticker != st.session_state.last_analyzed_ticker:
             st.session_state.analysis_result = None
 
+        finished: list[str] = []
+
+        def show_progress(node: str, state: dict):
+            finished.append(node)
+            pending = [name for name in NODE_NAMES if name not in finished]
+            with results_area.container():
+                render_results(state, ticker, pending)
+
         with st.spinner(f"Analyzing {ticker}..."):
             try:
-                result = run_analysis(ticker)
+                result, analyzed_at = get_analysis(ticker, refresh=refresh_button, on_node=show_progress)
                 st.session_state.analysis_result = result
+                st.session_state.analyzed_at = analyzed_at
                 st.session_state.last_analyzed_ticker = ticker
             except Exception as e:
+                results_area.empty()
                 st.error(f"Error analyzing {ticker}: {str(e)}")
                 st.session_state.analysis_result = None
 
     # Display results
     if st.session_state.analysis_result:
-        result = st.session_state.analysis_result
-
-        st.markdown("")  # Spacer
-        st.subheader(f"Analysis Results: {result.get('company_name', ticker)}")
-
-        # Render components
-        render_errors(result)
-        render_metrics(result)
-        st.markdown("")  # Spacer
-        render_tabs(result)
+        with results_area.container():
+            render_results(st.session_state.analysis_result, ticker)
+            if st.session_state.analyzed_at:
+                st.caption(format_as_of(st.session_state.analyzed_at))
 
     # Always show disclaimer
     render_disclaimer()
@@ -0,0 +1,5 @@
+"""Watchlist page, listed in the sidebar when running ui/app.py."""
+
+from stockagent.ui.watchlist import main
+
+main()
@@ -0,0 +1,257 @@
+"""Watchlist dashboard: many tickers analyzed and refreshed in the background.
+
+A WatchlistRefresher thread runs the batch analysis path over the watchlist
+and publishes each result as it completes; the page redraws its table from
+the refresher's snapshot every few seconds, so rows fill in incrementally
+without blocking the page.
+
+Both pages install the same process-wide Polygon rate limiter
+(STOCKAGENT_POLYGON_CALLS_PER_MINUTE) at start-up, since a watchlist easily
+exceeds the quota; interactive analyses share it but are scheduled ahead
+of the refresher's prefetch requests.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Iterable
+
+import streamlit as st
+
+from stockagent.config import get_settings
+from stockagent.data import PREFETCH, ensure_rate_limiter
+from stockagent.graph import create_workflow, run_batch_analysis
+from stockagent.utils.metrics import ensure_metrics_server
+from stockagent.utils.tickers import read_tickers, result_status
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATCHLIST = (
+    "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA", "AMD",
+    "NFLX", "JPM", "BAC", "V", "MA", "JNJ", "UNH", "PG",
+    "KO", "PEP", "WMT", "COST", "HD", "DIS", "XOM", "CVX",
+)
+
+# Seconds between redraws of the watchlist table
+TABLE_REFRESH_SECONDS = 2.0
+
+STATUS_PENDING = "pending"
+STATUS_STALE = "stale"
+
+
+def watchlist_row(ticker: str, result: dict[str, Any] | None, status: str, updated_at: float | None) -> dict:
+    """Build one watchlist table row.
+
+    Args:
+        ticker: Ticker symbol
+        result: Latest usable analysis, or None if none has completed
+        status: "pending", "ok", "partial", "failed" or "stale"
+        updated_at: Unix time the result was produced
+
+    Returns:
+        dict of column name -> value (None for unknown values)
+    """
+    result = result or {}
+    technical = result.get("technical_signals") or {}
+    sentiment = result.get("news_sentiment") or {}
+    price = result.get("current_price") or None
+    previous = result.get("previous_close") or None
+    return {
+        "Ticker": ticker,
+        "Company": result.get("company_name") or None,
+        "Price": price,
+        "Change %": (price - previous) / previous * 100 if price and previous else None,
+        "Recommendation": result.get("recommendation") or None,
+        "Confidence": result.get("confidence") if result.get("recommendation") else None,
+        "Score": result.get("score") if result.get("recommendation") else None,
+        "RSI": technical.get("rsi"),
+        "MACD": technical.get("macd_interpretation"),
+        "Sentiment": sentiment.get("overall_score"),
+        "Status": status,
+        "Updated": datetime.fromtimestamp(updated_at).strftime("%H:%M:%S") if updated_at else None,
+    }
+
+
+class WatchlistRefresher:
+    """Keeps analyses for a watchlist up to date in a background thread.
+
+    Each cycle runs run_batch_analysis() over the watchlist and publishes
+    every result as soon as it completes, then waits ``interval`` seconds
+    (or until refresh() or set_tickers() is called; with an interval of 0,
+    cycles run only then). When a refresh fails
+    to fetch price data, the previous result is kept and marked stale.
+    Refresh requests are scheduled as prefetch, so they yield the API quota
+    to analyses a user is waiting for.
+
+    Args:
+        tickers: Ticker symbols to watch
+        interval: Seconds between refresh cycles, 0 to refresh only on
+            request (default: STOCKAGENT_RESULT_TTL)
+        max_workers: Concurrent analyses (default: STOCKAGENT_MAX_WORKERS)
+    """
+
+    def __init__(self, tickers: Iterable[str], interval: float | None = None, max_workers: int | None = None):
+        self.interval = get_settings().result_ttl if interval is None else interval
+        self.max_workers = max_workers
+        self.cycles = 0
+        self._tickers = list(read_tickers(tickers))
+        self._entries: dict[str, tuple[dict, str, float]] = {}
+        self._workflow = create_workflow()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._busy = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def tickers(self) -> list[str]:
+        """Watched tickers, in display order."""
+        with self._lock:
+            return list(self._tickers)
+
+    @property
+    def busy(self) -> bool:
+        """Whether a refresh cycle is running."""
+        return self._busy
+
+    def set_tickers(self, tickers: Iterable[str]) -> None:
+        """Replace the watchlist and analyze new tickers promptly.
+
+        Results for tickers still on the list are kept.
+        """
+        tickers = list(read_tickers(tickers))
+        with self._lock:
+            self._tickers = tickers
+            self._entries = {t: entry for t, entry in self._entries.items() if t in tickers}
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Start the next refresh cycle now (or right after the running one)."""
+        self._wake.set()
+
+    def run_cycle(self) -> int:
+        """Analyze every watched ticker once, publishing results as they complete.
+
+        Returns:
+            Number of results published
+        """
+        self._busy = True
+        published = 0
+        try:
+            for result in run_batch_analysis(self.tickers, self.max_workers, self._workflow, priority=PREFETCH):
+                self._publish(result)
+                published += 1
+                if self._stopping.is_set():
+                    break
+        finally:
+            self._busy = False
+            self.cycles += 1
+        return published
+
+    def _publish(self, result: dict[str, Any]) -> None:
+        ticker = result["ticker"]
+        status = result_status(result)
+        with self._lock:
+            if ticker not in self._tickers:
+                return
+            previous = self._entries.get(ticker)
+            if status == "failed" and previous is not None and previous[0].get("price_data"):
+                logger.warning(f"Refresh failed for {ticker}; keeping previous result")
+                self._entries[ticker] = (previous[0], STATUS_STALE, previous[2])
+            else:
+                self._entries[ticker] = (result, status, time.time())
+
+    def snapshot(self) -> list[dict]:
+        """Current table rows in watchlist order (pending rows for tickers not yet analyzed)."""
+        with self._lock:
+            entries = [(ticker, self._entries.get(ticker)) for ticker in self._tickers]
+        return [
+            watchlist_row(ticker, *entry) if entry else watchlist_row(ticker, None, STATUS_PENDING, None)
+            for ticker, entry in entries
+        ]
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.clear()
+            try:
+                self.run_cycle()
+            except Exception as e:
+                logger.error(f"Watchlist refresh failed: {e}")
+            self._wake.wait(self.interval if self.interval > 0 else None)
+
+    def start(self) -> "WatchlistRefresher":
+        """Start refreshing in a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="watchlist-refresher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop after the analyses in progress finish."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+@st.cache_resource
+def get_refresher() -> WatchlistRefresher:
+    """The process-wide watchlist refresher, started on first use."""
+    return WatchlistRefresher(DEFAULT_WATCHLIST).start()
+
+
+def render_controls(refresher: WatchlistRefresher):
+    """Render the watchlist editor and refresh button."""
+    with st.expander("✏️ Edit Watchlist", expanded=False):
+        text = st.text_area(
+            "Tickers",
+            value=" ".join(refresher.tickers),
+            help="Ticker symbols separated by spaces, commas or newlines",
+        )
+        if st.button("Save Watchlist"):
+            refresher.set_tickers([text])
+
+    if st.button("🔄 Refresh Now", disabled=refresher.busy):
+        refresher.refresh()
+
+
+def render_table(refresher: WatchlistRefresher):
+    """Render the watchlist table from the refresher's current snapshot."""
+    rows = refresher.snapshot()
+    done = sum(row["Status"] != STATUS_PENDING for row in rows)
+    if refresher.busy:
+        activity = "refreshing..."
+    elif refresher.interval > 0:
+        activity = f"next refresh within {refresher.interval:.0f}s"
+    else:
+        activity = "refreshed on request"
+    st.caption(f"{done}/{len(rows)} tickers analyzed · {activity}")
+    st.dataframe(
+        rows,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Price": st.column_config.NumberColumn(format="$%.2f"),
+            "Change %": st.column_config.NumberColumn(format="%+.2f%%"),
+            "Confidence": st.column_config.ProgressColumn(min_value=0, max_value=100, format="%.0f%%"),
+            "Score": st.column_config.NumberColumn(format="%+.1f"),
+            "RSI": st.column_config.NumberColumn(format="%.1f"),
+            "Sentiment": st.column_config.NumberColumn(format="%+.2f"),
+        },
+    )
+
+
+def main():
+    """Watchlist page entry point."""
+    st.set_page_config(page_title="StockAgent - Watchlist", page_icon="📋", layout="wide")
+    ensure_metrics_server()
+    ensure_rate_limiter()
+    st.title("📋 Watchlist")
+    st.markdown("*Recommendations and key indicators, refreshed in the background. Click a column to sort.*")
+
+    refresher = get_refresher()
+    render_controls(refresher)
+    # Redraw just the table every few seconds, without rerunning the page
+    st.fragment(render_table, run_every=TABLE_REFRESH_SECONDS)(refresher)
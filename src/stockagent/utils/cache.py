@@ -0,0 +1,168 @@
+"""In-memory caching helpers."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class LRUCache:
+    """Thread-safe bounded mapping with least-recently-used eviction.
+
+    Tracks hit and miss counts so callers can report cache effectiveness.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the
+                least recently used one. Must be positive.
+
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value and mark it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing
+
+        Returns:
+            Cached value, or default if not present
+        """
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a key and return its value.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing
+
+        Returns:
+            Removed value, or default if not present
+        """
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """Remove all entries and reset hit/miss counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class TTLCache(LRUCache):
+    """LRUCache whose entries expire a set time after they are stored.
+
+    The lifetime is fixed, or computed per entry when it is stored (e.g.
+    by a market-hours FreshnessPolicy). Expired entries count as misses
+    and are dropped when looked up.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        ttl_for: Callable[[], float] | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries (see LRUCache)
+            ttl: Seconds an entry stays fresh after put()
+            clock: Monotonic time source (injectable for tests)
+            ttl_for: Optional function returning the seconds an entry stored
+                now stays fresh, used instead of ``ttl``
+
+        Raises:
+            ValueError: If maxsize or ttl is not positive
+        """
+        super().__init__(maxsize)
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.ttl = ttl
+        self._clock = clock
+        self._ttl_for = ttl_for
+
+    def get_entry(self, key: Hashable, max_age: float | None = None) -> tuple[Any, float] | None:
+        """Get a fresh value together with its age.
+
+        Args:
+            key: Cache key
+            max_age: Optional stricter freshness limit in seconds (the
+                entry's lifetime always applies)
+
+        Returns:
+            Tuple of (value, age in seconds), or None if missing or too old
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                stored_at, ttl, value = entry
+                age = self._clock() - stored_at
+                if age < ttl and (max_age is None or age <= max_age):
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value, age
+                if age >= ttl:
+                    del self._data[key]
+            self.misses += 1
+            return None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self.get_entry(key)
+        return default if entry is None else entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        ttl = self.ttl if self._ttl_for is None else self._ttl_for()
+        super().put(key, (self._clock(), ttl, value))
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = super().pop(key)
+        return default if entry is None else entry[2]
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and self._clock() - entry[0] < entry[1]
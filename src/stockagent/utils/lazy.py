@@ -0,0 +1,40 @@
+"""Lazy package exports (PEP 562).
+
+Package ``__init__`` modules map each public name to the submodule that
+defines it; the submodule is only imported when the name is first
+accessed. This keeps ``import stockagent.analysis.scoring`` from loading
+numpy, langgraph, polygon or duckduckgo_search.
+"""
+
+import importlib
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Mapping of public name to defining submodule (relative to
+            the package, e.g. ``"scoring"``)
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign at package level
+    """
+    module = importlib.import_module(package)
+    namespace = vars(module)
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f"{package}.{submodule}"), name)
+        namespace[name] = value  # Cache so later lookups skip __getattr__
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
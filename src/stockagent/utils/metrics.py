@@ -0,0 +1,609 @@
+"""Prometheus-style metrics with a text-format scrape endpoint.
+
+A small, dependency-free registry of counters, gauges and histograms.
+Recording a sample is a dict lookup plus a lock-protected add, so metrics
+can stay enabled on the hot path. ``REGISTRY.render()`` produces the
+Prometheus text exposition format (version 0.0.4) and
+``start_metrics_server()`` serves it at ``/metrics``.
+
+The metrics StockAgent itself records are defined at the bottom of this
+module.
+"""
+
+import bisect
+import logging
+import math
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+from stockagent.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Prometheus client default buckets (seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return f"{int(value)}.0"
+    return repr(float(value))
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Base class: a named metric family with optional labels."""
+
+    type_name = ""
+    suffix = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: dict[tuple[str, ...], object] = {}
+        if not self.labelnames:
+            self._default = self._new_child()
+            self._children[()] = self._default
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str, **kwargs: str):
+        """Return the child metric for a set of label values.
+
+        Args:
+            *values: Label values in labelnames order
+            **kwargs: Label values by name
+
+        Raises:
+            ValueError: If the labels don't match labelnames
+        """
+        if kwargs:
+            if values or set(kwargs) != set(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            values = tuple(str(kwargs[name]) for name in self.labelnames)
+        else:
+            values = tuple(str(v) for v in values)
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        family = self.name + self.suffix
+        lines = [
+            f"# HELP {family} {_escape(self.documentation)}",
+            f"# TYPE {family} {self.type_name}",
+            *self._samples(),
+        ]
+        return "\n".join(lines)
+
+    def _items(self) -> list[tuple[tuple[str, ...], object]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class Counter(_Metric):
+    """Monotonically increasing count (exported with a ``_total`` suffix)."""
+
+    type_name = "counter"
+    suffix = "_total"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment an unlabelled counter."""
+        self._default.inc(amount)
+
+    @property
+    def value(self) -> float:
+        return self._default.value
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}_total{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+            for values, child in self._items()
+        ]
+
+
+class _GaugeChild:
+    __slots__ = ("_lock", "_value", "_function")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = 0.0
+        self._function: Callable[[], float] | None = None
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the value at scrape time instead of storing it."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        return float(self._function()) if self._function else self._value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._default.set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default.dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._default.set_function(function)
+
+    @property
+    def value(self) -> float:
+        return self._default.value
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+            for values, child in self._items()
+        ]
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "_upper_bounds", "_counts", "_sum")
+
+    def __init__(self, upper_bounds: tuple[float, ...]):
+        self._lock = threading.Lock()
+        self._upper_bounds = upper_bounds
+        self._counts = [0] * (len(upper_bounds) + 1)
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> tuple[list[int], float]:
+        """Cumulative bucket counts (last is +Inf) and the sum."""
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        cumulative, running = [], 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return cumulative, total
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets.
+
+    Args:
+        name: Metric name
+        documentation: Help text
+        labelnames: Label names
+        buckets: Sorted bucket upper bounds (+Inf is implicit)
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record an observation on an unlabelled histogram."""
+        self._default.observe(value)
+
+    def _samples(self) -> list[str]:
+        samples = []
+        bounds = [*self.buckets, math.inf]
+        for values, child in self._items():
+            cumulative, total = child.snapshot()
+            for bound, count in zip(bounds, cumulative):
+                labels = _format_labels(self.labelnames, values, f'le="{_format_value(bound)}"')
+                samples.append(f"{self.name}_bucket{labels} {_format_value(count)}")
+            labels = _format_labels(self.labelnames, values)
+            samples.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            samples.append(f"{self.name}_count{labels} {_format_value(cumulative[-1])}")
+        return samples
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: dict[str, _Metric] = {}
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.type_name}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def get(self, name: str) -> _Metric | None:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+class MetricsServer:
+    """Background HTTP server exposing a registry at ``/metrics``.
+
+    Args:
+        registry: Registry to expose
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+    """
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 0):
+        self.registry = registry
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        """Scrape URL."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self._httpd.shutdown()
+        self._thread.join()
+        self._httpd.server_close()
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                payload = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+REGISTRY = MetricsRegistry()
+
+
+def start_metrics_server(
+    port: int = 0, host: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY
+) -> MetricsServer:
+    """Serve a registry's metrics at ``http://host:port/metrics``.
+
+    Args:
+        port: Port to bind (0 picks a free port)
+        host: Interface to bind (use "0.0.0.0" to allow remote scrapes)
+        registry: Registry to expose (defaults to StockAgent's metrics)
+
+    Returns:
+        Running MetricsServer
+    """
+    return MetricsServer(registry, host, port)
+
+
+_server: MetricsServer | None = None
+_server_lock = threading.Lock()
+
+
+def ensure_metrics_server() -> MetricsServer | None:
+    """Start the configured metrics endpoint once per process.
+
+    Safe to call repeatedly (e.g. on every Streamlit rerun). Does nothing
+    unless STOCKAGENT_METRICS_PORT is set.
+
+    Returns:
+        The running MetricsServer, or None if metrics export is disabled
+    """
+    global _server
+    with _server_lock:
+        if _server is None:
+            settings = get_settings()
+            if settings.metrics_port is not None:
+                try:
+                    _server = start_metrics_server(settings.metrics_port, settings.metrics_host)
+                except OSError as e:
+                    logger.warning(f"Could not start metrics server on port {settings.metrics_port}: {e}")
+        return _server
+
+
+class _SlidingWindowCount:
+    """Number of events in the trailing window, for quota gauges."""
+
+    def __init__(self, window: float):
+        self.window = window
+        self._lock = threading.Lock()
+        self._events: deque[float] = deque()
+
+    def add(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._events.append(now)
+            self._trim(now)
+
+    def count(self) -> int:
+        with self._lock:
+            self._trim(time.monotonic())
+            return len(self._events)
+
+    def _trim(self, now: float) -> None:
+        while self._events and self._events[0] <= now - self.window:
+            self._events.popleft()
+
+
+# --- StockAgent metrics -----------------------------------------------------
+
+POLYGON_REQUESTS = REGISTRY.counter(
+    "stockagent_polygon_requests",
+    "Polygon.io API requests by endpoint and outcome",
+    ("endpoint", "status"),
+)
+POLYGON_REQUEST_SECONDS = REGISTRY.histogram(
+    "stockagent_polygon_request_seconds",
+    "Polygon.io API request latency",
+    ("endpoint",),
+)
+RATE_LIMIT_ERRORS = REGISTRY.counter(
+    "stockagent_rate_limit_errors",
+    "RateLimitError raised by the Polygon client",
+)
+RATE_LIMIT_WAIT_SECONDS = REGISTRY.histogram(
+    "stockagent_rate_limit_wait_seconds",
+    "Time Polygon requests waited for the client-side rate limiter",
+    buckets=(0.0, 0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0),
+)
+POLYGON_RETRIES = REGISTRY.counter(
+    "stockagent_polygon_retries",
+    "Polygon.io requests retried, by endpoint and reason (rate_limited, server_error)",
+    ("endpoint", "reason"),
+)
+POLYGON_RETRIES_EXHAUSTED = REGISTRY.counter(
+    "stockagent_polygon_retries_exhausted",
+    "Polygon.io requests that still failed when the retry policy gave up",
+    ("endpoint", "reason"),
+)
+POLYGON_RETRY_WAIT_SECONDS = REGISTRY.histogram(
+    "stockagent_polygon_retry_wait_seconds",
+    "Backoff before retrying a Polygon.io request",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 15.0, 30.0, 60.0),
+)
+POLYGON_CONCURRENCY_LIMIT = REGISTRY.gauge(
+    "stockagent_polygon_concurrency_limit",
+    "Current adaptive limit on concurrent Polygon.io requests (0 when disabled)",
+)
+POLYGON_IN_FLIGHT = REGISTRY.gauge(
+    "stockagent_polygon_in_flight",
+    "Polygon.io requests currently holding a concurrency slot",
+)
+POLYGON_CONCURRENCY_DECREASES = REGISTRY.counter(
+    "stockagent_polygon_concurrency_decreases",
+    "Multiplicative decreases of the Polygon.io concurrency limit by reason (throttled, latency)",
+    ("reason",),
+)
+SCHEDULER_QUEUE_DEPTH = REGISTRY.gauge(
+    "stockagent_scheduler_queue_depth",
+    "Requests waiting for a scheduler turn by scheduler and priority class",
+    ("scheduler", "priority"),
+)
+SCHEDULER_WAIT_SECONDS = REGISTRY.histogram(
+    "stockagent_scheduler_wait_seconds",
+    "Time requests waited for a scheduler turn by scheduler and priority class",
+    ("scheduler", "priority"),
+    buckets=(0.0, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0),
+)
+POLYGON_CALLS_LAST_MINUTE = REGISTRY.gauge(
+    "stockagent_polygon_calls_last_minute",
+    "Polygon.io requests in the trailing 60 seconds (free tier quota is 5)",
+)
+_polygon_window = _SlidingWindowCount(60.0)
+POLYGON_CALLS_LAST_MINUTE.set_function(_polygon_window.count)
+
+NEWS_REQUESTS = REGISTRY.counter(
+    "stockagent_news_requests",
+    "News searches by outcome",
+    ("status",),
+)
+NEWS_REQUEST_SECONDS = REGISTRY.histogram(
+    "stockagent_news_request_seconds",
+    "News search latency",
+)
+
+RESPONSE_CACHE_REQUESTS = REGISTRY.counter(
+    "stockagent_response_cache_requests",
+    "Market data and news cache lookups by kind and result (hit, miss)",
+    ("kind", "result"),
+)
+CACHE_WARM_TICKERS = REGISTRY.counter(
+    "stockagent_cache_warm_tickers",
+    "Tickers pre-fetched by the cache warmer by outcome (ok, failed)",
+    ("status",),
+)
+BACKFILL_SHARDS = REGISTRY.counter(
+    "stockagent_backfill_shards",
+    "History backfill date shards by outcome (fetched, skipped, failed)",
+    ("status",),
+)
+BACKFILL_BARS = REGISTRY.counter(
+    "stockagent_backfill_bars",
+    "Bars written to the local bar store by history backfills",
+)
+BAR_ADJUSTMENTS = REGISTRY.counter(
+    "stockagent_bar_store_adjustments",
+    "Bar store partitions re-adjusted or invalidated after stock splits by action",
+    ("action",),
+)
+LIVE_BARS = REGISTRY.counter(
+    "stockagent_live_bars",
+    "Real-time bars received from the Polygon stream",
+)
+LIVE_CHANGES = REGISTRY.counter(
+    "stockagent_live_recommendation_changes",
+    "Recommendation changes emitted by live ingestion by new recommendation",
+    ("recommendation",),
+)
+LIVE_UPDATE_SECONDS = REGISTRY.histogram(
+    "stockagent_live_update_seconds",
+    "Time from receiving a stream message to re-scoring its tickers",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0),
+)
+
+NODE_SECONDS = REGISTRY.histogram(
+    "stockagent_node_seconds",
+    "Workflow node wall time",
+    ("node",),
+)
+NODE_ERRORS = REGISTRY.counter(
+    "stockagent_node_errors",
+    "Errors added to the workflow state by each node",
+    ("node",),
+)
+
+ANALYSES = REGISTRY.counter(
+    "stockagent_analyses",
+    "Completed run_analysis calls by outcome (ok, partial, failed)",
+    ("outcome",),
+)
+ANALYSIS_SECONDS = REGISTRY.histogram(
+    "stockagent_analysis_seconds",
+    "End-to-end run_analysis latency",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+ANALYSES_IN_PROGRESS = REGISTRY.gauge(
+    "stockagent_analyses_in_progress",
+    "run_analysis calls currently executing",
+)
+
+SERVICE_REQUESTS = REGISTRY.counter(
+    "stockagent_service_requests",
+    "Analysis service HTTP requests by route and status code",
+    ("route", "code"),
+)
+SERVICE_RESULTS = REGISTRY.counter(
+    "stockagent_service_results",
+    "Analysis service results by source (cache, coalesced, new)",
+    ("source",),
+)
+
+
+def record_polygon_request(endpoint: str, status: str, seconds: float) -> None:
+    """Record one Polygon.io request.
+
+    Args:
+        endpoint: Client method name (e.g. "aggregates")
+        status: "ok", "not_found", "rate_limited" or "error"
+        seconds: Request latency
+    """
+    POLYGON_REQUESTS.labels(endpoint, status).inc()
+    POLYGON_REQUEST_SECONDS.labels(endpoint).observe(seconds)
+    _polygon_window.add()
@@ -0,0 +1,217 @@
+"""Seeded synthetic market data for benchmarks and local testing.
+
+All generators are deterministic for a given seed so results are
+comparable across runs and commits.
+"""
+
+import numpy as np
+
+from stockagent.data.bars import BarColumns, columns_to_bars
+from stockagent.models import OHLCV, SentimentResult, TechnicalSignals
+
+DEFAULT_START = "2000-01-03"
+
+_HEADLINE_SUBJECTS = ["Shares", "Stock", "Company", "Analysts", "Investors", "Quarterly results"]
+_HEADLINE_VERBS = [
+    "surge", "decline", "rally", "drop", "jump", "tumble", "rise", "fall",
+    "beat", "miss", "hold", "steady", "upgrade", "downgrade",
+]
+_HEADLINE_TAILS = [
+    "after earnings", "on strong growth", "amid lawsuit concern", "as record profits",
+    "following analyst upgrade", "on weak guidance", "in volatile session", "ahead of report",
+]
+
+
+def generate_bar_columns(
+    n_bars: int, seed: int = 0, start: str = DEFAULT_START, start_price: float = 100.0
+) -> BarColumns:
+    """Generate a geometric random walk of daily bars on business days.
+
+    Args:
+        n_bars: Number of bars to generate
+        seed: Random seed
+        start: First trading date (YYYY-MM-DD)
+        start_price: Opening price of the first bar
+
+    Returns:
+        BarColumns with consistent OHLC values (low <= open, close <= high)
+    """
+    rng = np.random.default_rng(seed)
+
+    returns = rng.normal(0.0003, 0.015, n_bars)
+    close = start_price * np.exp(np.cumsum(returns))
+    open_ = np.concatenate(([start_price], close[:-1])) * np.exp(rng.normal(0, 0.003, n_bars))
+    spread = np.abs(rng.normal(0, 0.01, n_bars)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.maximum(np.minimum(open_, close) - spread, 0.01)
+    volume = rng.integers(100_000, 10_000_000, n_bars, dtype=np.int64)
+
+    days = np.busday_offset(np.datetime64(start, "D"), np.arange(n_bars), roll="forward")
+
+    return {
+        "timestamp": days.astype("datetime64[ms]"),
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": volume,
+    }
+
+
+def generate_bars(
+    n_bars: int, seed: int = 0, start: str = DEFAULT_START, start_price: float = 100.0
+) -> list[OHLCV]:
+    """Generate daily OHLCV bars in the Polygon client's output format.
+
+    Args:
+        n_bars: Number of bars to generate
+        seed: Random seed
+        start: First trading date (YYYY-MM-DD)
+        start_price: Opening price of the first bar
+
+    Returns:
+        List of OHLCV dicts (most recent last)
+    """
+    return columns_to_bars(generate_bar_columns(n_bars, seed, start, start_price))
+
+
+def generate_tickers(n_tickers: int) -> list[str]:
+    """Generate unique synthetic ticker symbols (A, B, ..., AA, AB, ...).
+
+    Args:
+        n_tickers: Number of tickers
+
+    Returns:
+        List of ticker symbols
+    """
+    tickers = []
+    for i in range(n_tickers):
+        symbol = ""
+        i += 1
+        while i:
+            i, rem = divmod(i - 1, 26)
+            symbol = chr(ord("A") + rem) + symbol
+        tickers.append(symbol)
+    return tickers
+
+
+def generate_universe(n_tickers: int, n_bars: int, seed: int = 0) -> dict[str, list[OHLCV]]:
+    """Generate bars for a universe of tickers.
+
+    Args:
+        n_tickers: Number of tickers
+        n_bars: Bars per ticker
+        seed: Base random seed (each ticker gets seed + index)
+
+    Returns:
+        dict mapping ticker symbol to its bars
+    """
+    rng = np.random.default_rng(seed)
+    start_prices = rng.uniform(5, 500, n_tickers)
+    return {
+        ticker: generate_bars(n_bars, seed + i, start_price=float(start_prices[i]))
+        for i, ticker in enumerate(generate_tickers(n_tickers))
+    }
+
+
+def generate_headlines(n_headlines: int, seed: int = 0) -> list[str]:
+    """Generate news-style headlines containing sentiment keywords.
+
+    Args:
+        n_headlines: Number of headlines
+        seed: Random seed
+
+    Returns:
+        List of headline strings
+    """
+    rng = np.random.default_rng(seed)
+    return [
+        f"{_HEADLINE_SUBJECTS[s]} {_HEADLINE_VERBS[v]} {_HEADLINE_TAILS[t]}"
+        for s, v, t in zip(
+            rng.integers(0, len(_HEADLINE_SUBJECTS), n_headlines),
+            rng.integers(0, len(_HEADLINE_VERBS), n_headlines),
+            rng.integers(0, len(_HEADLINE_TAILS), n_headlines),
+        )
+    ]
+
+
+def generate_news_articles(n_articles: int, seed: int = 0) -> list[dict]:
+    """Generate articles in the format returned by fetch_news().
+
+    Args:
+        n_articles: Number of articles
+        seed: Random seed
+
+    Returns:
+        List of article dicts with title, url, date, source
+    """
+    return [
+        {
+            "title": title,
+            "url": f"https://news.example.com/{seed}/{i}",
+            "date": "2024-01-02T14:30:00+00:00",
+            "source": "Synthetic Wire",
+        }
+        for i, title in enumerate(generate_headlines(n_articles, seed))
+    ]
+
+
+def generate_technical_signals(n: int, seed: int = 0) -> list[TechnicalSignals]:
+    """Generate plausible TechnicalSignals dicts for scoring benchmarks.
+
+    Args:
+        n: Number of signal dicts
+        seed: Random seed
+
+    Returns:
+        List of TechnicalSignals
+    """
+    rng = np.random.default_rng(seed)
+    signals = []
+    for _ in range(n):
+        price = float(rng.uniform(10, 500))
+        sma_20, sma_50, sma_200 = (price * float(rng.uniform(0.85, 1.15)) for _ in range(3))
+        middle = sma_20
+        width = middle * float(rng.uniform(0.02, 0.1))
+        macd_line = float(rng.normal(0, 2))
+        signal_line = float(rng.normal(0, 2))
+        rsi = float(rng.uniform(5, 95))
+        signals.append({
+            "rsi": rsi,
+            "rsi_interpretation": "neutral",
+            "macd": {
+                "macd_line": macd_line,
+                "signal_line": signal_line,
+                "histogram": macd_line - signal_line,
+            },
+            "macd_interpretation": "neutral",
+            "bollinger": {"upper": middle + width, "middle": middle, "lower": middle - width},
+            "sma_20": sma_20,
+            "sma_50": sma_50,
+            "sma_200": sma_200,
+            "current_price": price,
+        })
+    return signals
+
+
+def generate_sentiments(n: int, seed: int = 0) -> list[SentimentResult]:
+    """Generate SentimentResult dicts for scoring benchmarks.
+
+    Args:
+        n: Number of sentiment results
+        seed: Random seed
+
+    Returns:
+        List of SentimentResult
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+    for score in rng.uniform(-1, 1, n).tolist():
+        label = "positive" if score > 0.2 else "negative" if score < -0.2 else "neutral"
+        results.append({
+            "overall_score": score,
+            "overall_label": label,
+            "headlines": [],
+            "headline_count": 8,
+        })
+    return results
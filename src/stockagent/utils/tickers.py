@@ -0,0 +1,57 @@
+"""Ticker symbol parsing and analysis result classification.
+
+Shared by the CLI, the HTTP service and the watchlist page, so none of
+them has to import another's entry point.
+"""
+
+import logging
+import re
+from typing import Any, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+_TICKER_PATTERN = re.compile(r"^[A-Z][A-Z0-9.\-]{0,9}$")
+
+
+def normalize_ticker(ticker: Any) -> str:
+    """Uppercase and validate a ticker symbol.
+
+    Raises:
+        ValueError: If the ticker is not a plausible symbol
+    """
+    if not isinstance(ticker, str) or not _TICKER_PATTERN.match(ticker.strip().upper()):
+        raise ValueError(f"Invalid ticker: {ticker!r}")
+    return ticker.strip().upper()
+
+
+def read_tickers(lines: Iterable[str]) -> Iterator[str]:
+    """Parse ticker symbols lazily from text.
+
+    Symbols may be separated by newlines, commas or whitespace; text after
+    '#' is ignored. Tickers are uppercased and yielded once each; invalid
+    symbols are logged and skipped.
+
+    Args:
+        lines: Text lines (e.g. an open file or sys.stdin)
+
+    Yields:
+        Normalized ticker symbols in input order
+    """
+    seen = set()
+    for line in lines:
+        for token in line.split("#", 1)[0].replace(",", " ").split():
+            try:
+                ticker = normalize_ticker(token)
+            except ValueError as e:
+                logger.warning(f"Skipping {e}")
+                continue
+            if ticker not in seen:
+                seen.add(ticker)
+                yield ticker
+
+
+def result_status(result: dict[str, Any]) -> str:
+    """Classify an analysis: "failed" (no price data), "partial" (errors) or "ok"."""
+    if not result.get("price_data"):
+        return "failed"
+    return "partial" if result.get("errors") else "ok"
@@ -0,0 +1,380 @@
+"""Lightweight tracing with OpenTelemetry-compatible (OTLP/JSON) export.
+
+Spans measure wall and CPU time and carry named counters (API calls, cache
+hits, ...) that instrumented code bumps with increment(). The current span
+is tracked in a context variable, so counters land on the span of whichever
+workflow node is running, including nodes LangGraph runs in worker threads.
+
+When a root span finishes, the whole trace is handed to the configured
+exporter (see set_span_exporter / STOCKAGENT_TRACE_FILE /
+OTEL_EXPORTER_OTLP_ENDPOINT). No OpenTelemetry packages are required.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Iterator, Protocol
+
+from stockagent.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "stockagent"
+
+# OTLP status codes
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """A timed operation within a trace.
+
+    Attributes:
+        name: Operation name
+        trace_id: 32 hex character trace id shared by all spans of a run
+        span_id: 16 hex character span id
+        parent_id: span_id of the parent span (None for the root)
+        attributes: Arbitrary key/value attributes
+        counters: Named integer counters bumped via increment()
+        status: STATUS_OK or STATUS_ERROR
+    """
+
+    def __init__(self, name: str, parent: "Span | None" = None, attributes: dict | None = None):
+        self.name = name
+        self.parent_id = parent.span_id if parent else None
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.attributes: dict[str, Any] = dict(attributes or {})
+        self.counters: dict[str, int] = {}
+        self.status = STATUS_OK
+        self.status_message = ""
+
+        # Finished spans of the trace, shared with the root span
+        self._finished: list[Span] = parent._finished if parent else []
+
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self._perf_start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+        self.wall_ms = 0.0
+        self.cpu_ms = 0.0
+
+    @property
+    def is_root(self) -> bool:
+        return self.parent_id is None
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Add to a named counter on this span."""
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self, error: BaseException | None = None) -> None:
+        """Finish the span, recording durations and error status."""
+        self.wall_ms = (time.perf_counter() - self._perf_start) * 1000
+        self.cpu_ms = (time.thread_time() - self._cpu_start) * 1000
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.status = STATUS_ERROR
+            self.status_message = f"{type(error).__name__}: {error}"
+        self._finished.append(self)
+
+    @property
+    def trace_spans(self) -> list["Span"]:
+        """Finished spans of this span's trace, in completion order."""
+        return list(self._finished)
+
+
+_current_span: ContextVar[Span | None] = ContextVar("stockagent_current_span", default=None)
+
+
+def current_span() -> Span | None:
+    """Return the active span, if any."""
+    return _current_span.get()
+
+
+def increment(counter: str, amount: int = 1) -> None:
+    """Bump a counter on the active span (no-op outside a span).
+
+    Args:
+        counter: Counter name, e.g. "api_calls" or "cache_hits"
+        amount: Amount to add
+    """
+    span = _current_span.get()
+    if span is not None:
+        span.increment(counter, amount)
+
+
+@contextmanager
+def start_span(name: str, attributes: dict | None = None) -> Iterator[Span]:
+    """Run a block inside a new span.
+
+    The span is a child of the active span, or the root of a new trace.
+    When a root span ends, its trace is exported.
+
+    Args:
+        name: Operation name
+        attributes: Initial attributes
+
+    Yields:
+        The new Span
+    """
+    span = Span(name, _current_span.get(), attributes)
+    token = _current_span.set(span)
+    error = None
+    try:
+        yield span
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end(error)
+        if span.is_root:
+            _export(span.trace_spans)
+
+
+def _otlp_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def span_to_otlp(span: Span) -> dict:
+    """Convert a finished span to an OTLP/JSON span object.
+
+    Wall/CPU time and counters are exported as ``stockagent.*`` attributes.
+
+    Args:
+        span: Finished span
+
+    Returns:
+        dict in the OTLP/JSON Span format
+    """
+    attributes = {
+        **span.attributes,
+        "stockagent.wall_ms": span.wall_ms,
+        "stockagent.cpu_ms": span.cpu_ms,
+        **{f"stockagent.{name}": value for name, value in span.counters.items()},
+    }
+    otlp = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()],
+        "status": {"code": span.status},
+    }
+    if span.parent_id:
+        otlp["parentSpanId"] = span.parent_id
+    if span.status_message:
+        otlp["status"]["message"] = span.status_message
+    return otlp
+
+
+def spans_to_otlp(spans: list[Span]) -> dict:
+    """Wrap spans in an OTLP/JSON ExportTraceServiceRequest.
+
+    Args:
+        spans: Finished spans
+
+    Returns:
+        dict with a single resourceSpans entry for this service
+    """
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "stockagent.tracing"},
+                        "spans": [span_to_otlp(span) for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class SpanExporter(Protocol):
+    """Receives the spans of each finished trace."""
+
+    def export(self, spans: list[Span]) -> None: ...
+
+
+class FileSpanExporter:
+    """Append each trace as one OTLP/JSON line to a local file.
+
+    Args:
+        path: Output file (parent directories are created)
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        line = json.dumps(spans_to_otlp(spans), separators=(",", ":"))
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+# Traces an OTLPHttpSpanExporter holds while the collector catches up
+DEFAULT_EXPORT_QUEUE = 1000
+
+
+class OTLPHttpSpanExporter:
+    """POST each trace to an OTLP/HTTP collector using the JSON encoding.
+
+    Traces are queued and sent from a background thread, so a slow or
+    unreachable collector does not delay the traced analysis. While the
+    queue is full, new traces are dropped.
+
+    Args:
+        endpoint: Collector base URL (``/v1/traces`` is appended)
+        timeout: Request timeout in seconds
+        max_queue: Traces waiting to be sent before new ones are dropped
+    """
+
+    def __init__(self, endpoint: str, timeout: float = 5.0, max_queue: int = DEFAULT_EXPORT_QUEUE):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.timeout = timeout
+        self.dropped = 0
+        self._queue: queue.Queue[list[Span]] = queue.Queue(max_queue)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def export(self, spans: list[Span]) -> None:
+        """Queue a trace for sending."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="otlp-export", daemon=True)
+                self._thread.start()
+                # Send what is queued before the interpreter exits
+                atexit.register(self.flush, self.timeout)
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(f"Trace export queue full; dropped {self.dropped} traces")
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued trace has been sent (or failed).
+
+        Args:
+            timeout: Seconds to wait at most (default: no limit)
+
+        Returns:
+            True if the queue drained in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _run(self) -> None:
+        while True:
+            spans = self._queue.get()
+            try:
+                self._post(spans)
+            except Exception as e:
+                logger.warning(f"Error exporting trace spans: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _post(self, spans: list[Span]) -> None:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(spans_to_otlp(spans)).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+class InMemorySpanExporter:
+    """Keep exported traces in memory (useful for tests and notebooks)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.traces: list[list[Span]] = []
+
+    def export(self, spans: list[Span]) -> None:
+        with self._lock:
+            self.traces.append(spans)
+
+    @property
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return [span for trace in self.traces for span in trace]
+
+
+_exporter: SpanExporter | None = None
+_exporter_configured = False
+
+
+def _exporter_from_config() -> SpanExporter | None:
+    settings = get_settings()
+    if settings.otlp_endpoint:
+        return OTLPHttpSpanExporter(settings.otlp_endpoint)
+    if settings.trace_file:
+        return FileSpanExporter(settings.trace_file)
+    return None
+
+
+def get_span_exporter() -> SpanExporter | None:
+    """Return the active exporter, configuring it from the environment on first use."""
+    global _exporter, _exporter_configured
+    if not _exporter_configured:
+        _exporter = _exporter_from_config()
+        _exporter_configured = True
+    return _exporter
+
+
+def set_span_exporter(exporter: SpanExporter | None) -> SpanExporter | None:
+    """Replace the span exporter.
+
+    Args:
+        exporter: New exporter, or None to disable export
+
+    Returns:
+        The previously active exporter
+    """
+    global _exporter, _exporter_configured
+    previous = get_span_exporter()
+    _exporter, _exporter_configured = exporter, True
+    return previous
+
+
+def _export(spans: list[Span]) -> None:
+    exporter = get_span_exporter()
+    if exporter is None:
+        return
+    try:
+        exporter.export(spans)
+    except Exception as e:
+        logger.warning(f"Error exporting trace spans: {e}")
@@ -0,0 +1,133 @@
+"""Pre-market cache warmer.
+
+Users analyze much the same tickers every morning, and each first analysis
+paid for a cold Polygon and news fetch. CacheWarmer fetches bars, ticker
+details and headlines for a watchlist into the local response cache at a
+set time on each trading day, so the first analyses of the day are cache
+hits. Its requests are paced evenly over the Polygon quota and scheduled
+as prefetch, so they yield to anything a user is waiting for.
+"""
+
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time
+from typing import Iterable
+
+from stockagent.analysis.news_sentiment import fetch_news
+from stockagent.config import get_settings
+from stockagent.data import PREFETCH, PolygonAPIError, PolygonClient, TokenBucket, request_priority, set_rate_limiter
+from stockagent.data.calendar import EXCHANGE_TZ, next_trading_time
+from stockagent.data.response_cache import get_response_cache
+from stockagent.utils.metrics import CACHE_WARM_TICKERS
+
+logger = logging.getLogger(__name__)
+
+# Exchange-local time of the daily warm-up (an hour before the open)
+DEFAULT_WARM_TIME = time(8, 30)
+
+# Polygon requests per ticker: aggregates, ticker details, previous close
+REQUESTS_PER_TICKER = 3
+
+
+def warm_ticker(ticker: str, client: PolygonClient) -> bool:
+    """Fetch the data an analysis of ``ticker`` needs into the response cache.
+
+    Args:
+        ticker: Ticker symbol
+        client: Polygon client to fetch with
+
+    Returns:
+        True if all Polygon data was fetched (headlines are best effort)
+    """
+    try:
+        client.get_stock_aggregates(ticker)
+        details = client.get_ticker_details(ticker)
+        client.get_previous_close(ticker)
+    except PolygonAPIError as e:
+        logger.warning(f"Could not warm {ticker}: {e}")
+        return False
+    # Same query as the workflow's news node, so its search is a cache hit
+    fetch_news(ticker, details.get("company_name", ticker))
+    return True
+
+
+class CacheWarmer:
+    """Fills the response cache for a watchlist before the market opens.
+
+    Args:
+        tickers: Ticker symbols to warm
+        at: Exchange-local time of day to warm on trading days
+        calls_per_minute: Polygon requests per minute, spread evenly (default:
+            STOCKAGENT_POLYGON_CALLS_PER_MINUTE; 0 for no pacing)
+        max_workers: Tickers fetched concurrently (default: STOCKAGENT_MAX_WORKERS)
+
+    Raises:
+        ValueError: If no on-disk cache is configured (STOCKAGENT_CACHE_DIR)
+    """
+
+    def __init__(
+        self,
+        tickers: Iterable[str],
+        at: time = DEFAULT_WARM_TIME,
+        calls_per_minute: int | None = None,
+        max_workers: int | None = None,
+    ):
+        if get_response_cache() is None:
+            raise ValueError("Cache warming requires STOCKAGENT_CACHE_DIR to be set")
+        settings = get_settings()
+        self.tickers = list(dict.fromkeys(t.upper().strip() for t in tickers if t.strip()))
+        self.at = at
+        self.calls_per_minute = settings.polygon_calls_per_minute if calls_per_minute is None else calls_per_minute
+        self.max_workers = max_workers or settings.max_workers
+
+    def next_run(self, now: datetime | None = None) -> datetime:
+        """When the next warm-up is due (the next trading day's ``at`` time)."""
+        return next_trading_time(self.at, now)
+
+    def run_once(self) -> Counter:
+        """Warm every ticker now.
+
+        Returns:
+            Counter of tickers by outcome ("ok", "failed")
+        """
+        if self.calls_per_minute > 0:
+            minutes = len(self.tickers) * REQUESTS_PER_TICKER / self.calls_per_minute
+            logger.info(f"Warming {len(self.tickers)} tickers at {self.calls_per_minute} calls/min (~{minutes:.0f} min)")
+            # Capacity 1: requests are spaced evenly instead of bursting
+            limiter = TokenBucket(self.calls_per_minute / 60, 1)
+        else:
+            limiter = None
+        previous_limiter = set_rate_limiter(limiter)
+        client = PolygonClient()
+
+        def warm(ticker: str) -> bool:
+            with request_priority(PREFETCH, flow=ticker):
+                return warm_ticker(ticker, client)
+
+        counts: Counter = Counter()
+        try:
+            with ThreadPoolExecutor(self.max_workers, thread_name_prefix="warmer") as executor:
+                for ok in executor.map(warm, self.tickers):
+                    status = "ok" if ok else "failed"
+                    counts[status] += 1
+                    CACHE_WARM_TICKERS.labels(status).inc()
+        finally:
+            set_rate_limiter(previous_limiter)
+
+        logger.info(f"Warmed {counts['ok']} tickers, {counts['failed']} failed")
+        return counts
+
+    def run_forever(self, stop: threading.Event | None = None) -> None:
+        """Warm the cache at ``at`` on every trading day until ``stop`` is set."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            when = self.next_run()
+            logger.info(f"Next cache warm-up at {when:%Y-%m-%d %H:%M %Z}")
+            if stop.wait((when - datetime.now(EXCHANGE_TZ)).total_seconds()):
+                break
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Cache warm-up failed: {e}")
@@ -10,6 +10,57 @@ src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
 
+@pytest.fixture(autouse=True)
+def fresh_settings(monkeypatch):
+    """Parse settings afresh in each test so environment changes apply."""
+    from stockagent import config
+
+    monkeypatch.setattr(config, "_settings", None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_concurrency_limiter(monkeypatch):
+    """Start each test with a new adaptive concurrency limiter."""
+    from stockagent.data import concurrency
+
+    monkeypatch.setattr(concurrency, "_limiter", None)
+    monkeypatch.setattr(concurrency, "_configured", False)
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiter(monkeypatch):
+    """Start each test without a Polygon rate limiter (e.g. one the UI installed)."""
+    from stockagent.data import rate_limit
+
+    monkeypatch.setattr(rate_limit, "_limiter", None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_schedulers(monkeypatch):
+    """Start each test with new request schedulers."""
+    from stockagent.data import scheduler
+
+    monkeypatch.setattr(scheduler, "_schedulers", {})
+
+
+@pytest.fixture(autouse=True)
+def fresh_response_cache(monkeypatch):
+    """Start each test with the response cache configured from the settings."""
+    from stockagent.data import response_cache
+
+    monkeypatch.setattr(response_cache, "_default_cache", None)
+    monkeypatch.setattr(response_cache, "_configured", False)
+
+
+@pytest.fixture(autouse=True)
+def fresh_bar_store(monkeypatch):
+    """Start each test with the bar store configured from the settings."""
+    from stockagent.data import bar_store
+
+    monkeypatch.setattr(bar_store, "_default_store", None)
+    monkeypatch.setattr(bar_store, "_configured", False)
+
+
 @pytest.fixture
 def mock_env_with_api_key(monkeypatch):
     """Set up environment with valid API key."""
@@ -22,6 +73,64 @@ def mock_env_without_api_key(monkeypatch):
     monkeypatch.delenv("POLYGON_API_KEY", raising=False)
 
 
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Enable the on-disk response cache and bar store under a temporary directory."""
+    monkeypatch.setenv("STOCKAGENT_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def bar_columns():
+    """Build bar columns from timestamps and close prices.
+
+    Returns:
+        Function ``(timestamps, close) -> BarColumns`` with open equal to
+        close, high/low one above/below it and a volume of 100
+    """
+    import numpy as np
+
+    def build(timestamps, close):
+        close = np.asarray(close, dtype=np.float64)
+        return {
+            "timestamp": np.array(timestamps, dtype="datetime64[ms]"),
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": np.full(len(close), 100, dtype=np.int64),
+        }
+
+    return build
+
+
+@pytest.fixture
+def fake_polygon():
+    """Running local Polygon stand-in ("NOPE" is an unknown ticker)."""
+    from stockagent.testing import FakePolygonServer
+
+    with FakePolygonServer(unknown_tickers={"NOPE"}) as server:
+        yield server
+
+
+@pytest.fixture
+def fake_env(fake_polygon, monkeypatch):
+    """Route PolygonClient and fetch_news to local stand-ins.
+
+    Yields:
+        Tuple of (FakePolygonServer, FakeNewsClient)
+    """
+    from stockagent.analysis import set_news_client_factory
+    from stockagent.testing import FakeNewsClient
+
+    monkeypatch.setenv("POLYGON_API_KEY", "test")
+    monkeypatch.setenv("POLYGON_BASE_URL", fake_polygon.url)
+    news = FakeNewsClient()
+    previous = set_news_client_factory(news)
+    yield fake_polygon, news
+    set_news_client_factory(previous)
+
+
 @pytest.fixture
 def sample_ohlcv_data():
     """Sample OHLCV price data for testing."""
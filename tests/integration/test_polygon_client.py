@@ -1,10 +1,17 @@
 """Integration tests for Polygon client with mocked API."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 
+def _raw_aggregates(*aggs):
+    """Raw aggregates response (as requested with raw=True) for mock aggregates."""
+    results = [{"o": a.open, "h": a.high, "l": a.low, "c": a.close, "v": a.volume, "t": a.timestamp} for a in aggs]
+    return MagicMock(data=json.dumps({"results": results}).encode())
+
+
 class TestPolygonClientSuccess:
     """Test Polygon client successful API calls."""
 
@@ -75,7 +82,7 @@ class TestPolygonClientSuccess:
         mock_agg2.timestamp = 1704153600000  # 2024-01-02
 
         mock_client = MagicMock()
-        mock_client.get_aggs.return_value = [mock_agg1, mock_agg2]
+        mock_client.get_aggs.return_value = _raw_aggregates(mock_agg1, mock_agg2)
 
         with patch("stockagent.data.polygon_client.RESTClient", return_value=mock_client):
             client = PolygonClient()
@@ -93,7 +100,7 @@ class TestPolygonClientSuccess:
         from stockagent.data import PolygonClient, TickerNotFoundError
 
         mock_client = MagicMock()
-        mock_client.get_aggs.return_value = []
+        mock_client.get_aggs.return_value = _raw_aggregates()
 
         with patch("stockagent.data.polygon_client.RESTClient", return_value=mock_client):
             client = PolygonClient()
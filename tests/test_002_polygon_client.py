@@ -1,5 +1,6 @@
 """Tests for Feature 002: Polygon Client."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -229,6 +230,14 @@ class TestGetTickerDetails:
 class TestGetStockAggregates:
     """Test get_stock_aggregates method."""
 
+    @staticmethod
+    def _raw(*aggs):
+        """Raw aggregates response (as requested with raw=True) for mock aggregates."""
+        results = [
+            {"o": a.open, "h": a.high, "l": a.low, "c": a.close, "v": a.volume, "t": a.timestamp} for a in aggs
+        ]
+        return MagicMock(data=json.dumps({"results": results}).encode())
+
     @pytest.mark.feature002
     def test_get_stock_aggregates_success(self, mock_env_with_api_key):
         """Test successful aggregates fetch."""
@@ -257,7 +266,7 @@ class TestGetStockAggregates:
             client = PolygonClient()
             client._api_key = "test_key"
             client._client = MagicMock()
-            client._client.get_aggs.return_value = [mock_agg1, mock_agg2]
+            client._client.get_aggs.return_value = self._raw(mock_agg1, mock_agg2)
 
             result = client.get_stock_aggregates("AAPL", days=30)
 
@@ -280,7 +289,7 @@ class TestGetStockAggregates:
             client = PolygonClient()
             client._api_key = "test_key"
             client._client = MagicMock()
-            client._client.get_aggs.return_value = []
+            client._client.get_aggs.return_value = self._raw()
 
             with pytest.raises(TickerNotFoundError):
                 client.get_stock_aggregates("INVALID")
@@ -304,7 +313,7 @@ class TestGetStockAggregates:
             client = PolygonClient()
             client._api_key = "test_key"
             client._client = MagicMock()
-            client._client.get_aggs.return_value = [mock_agg]
+            client._client.get_aggs.return_value = self._raw(mock_agg)
 
             result = client.get_stock_aggregates("AAPL", days=10)
 
@@ -0,0 +1,157 @@
+"""Tests for Feature 010: Multi-Timeframe Resampling."""
+
+import numpy as np
+import pytest
+
+
+def _daily_bars(start: str, days: int) -> list[dict]:
+    """Build consecutive daily bars (weekends included) with rising prices."""
+    dates = np.arange(np.datetime64(start), np.datetime64(start) + days)
+    return [
+        {
+            "open": 100.0 + i,
+            "high": 101.0 + i,
+            "low": 99.0 + i,
+            "close": 100.5 + i,
+            "volume": 1000 + i,
+            "timestamp": str(date),
+        }
+        for i, date in enumerate(dates)
+    ]
+
+
+class TestBarColumns:
+    """Test conversion between bar dicts and columns."""
+
+    @pytest.mark.feature010
+    def test_round_trip(self, sample_ohlcv_data):
+        """Test bars survive a round trip through columns."""
+        from stockagent.data import bars_to_columns, columns_to_bars
+
+        columns = bars_to_columns(sample_ohlcv_data)
+        assert columns["close"].dtype == np.float64
+        assert columns["volume"].dtype == np.int64
+        assert columns_to_bars(columns) == sample_ohlcv_data
+
+    @pytest.mark.feature010
+    def test_close_only_bars(self):
+        """Test missing OHLV fields fall back to close and zero volume."""
+        from stockagent.data import bars_to_columns
+
+        columns = bars_to_columns([{"close": 10.0, "timestamp": "2024-01-02"}])
+        assert columns["open"][0] == 10.0
+        assert columns["high"][0] == 10.0
+        assert columns["volume"][0] == 0
+
+    @pytest.mark.feature010
+    def test_empty_bars(self):
+        """Test empty input produces empty columns."""
+        from stockagent.data import bars_to_columns
+
+        columns = bars_to_columns([])
+        assert len(columns["close"]) == 0
+
+    @pytest.mark.feature010
+    def test_missing_timestamp_raises(self):
+        """Test bars without timestamps cannot be converted."""
+        from stockagent.data import bars_to_columns
+
+        with pytest.raises(ValueError):
+            bars_to_columns([{"close": 10.0}])
+
+
+class TestResampleBars:
+    """Test weekly and monthly aggregation."""
+
+    @pytest.mark.feature010
+    def test_weekly_aggregation(self):
+        """Test daily bars aggregate into Monday-based weeks."""
+        from stockagent.analysis import resample_bars
+
+        # 2024-01-01 is a Monday; 14 days = exactly two weeks
+        weekly = resample_bars(_daily_bars("2024-01-01", 14), "week")
+
+        assert len(weekly) == 2
+        first = weekly[0]
+        assert first["open"] == 100.0
+        assert first["high"] == 107.0
+        assert first["low"] == 99.0
+        assert first["close"] == 106.5
+        assert first["volume"] == sum(1000 + i for i in range(7))
+        assert first["timestamp"] == "2024-01-07"
+
+    @pytest.mark.feature010
+    def test_partial_weeks(self):
+        """Test periods at the edges may be partial."""
+        from stockagent.analysis import resample_bars
+
+        # Wednesday start: Wed-Sun, full week, Mon-Tue
+        weekly = resample_bars(_daily_bars("2024-01-03", 14), "week")
+        assert [bar["timestamp"] for bar in weekly] == [
+            "2024-01-07",
+            "2024-01-14",
+            "2024-01-16",
+        ]
+
+    @pytest.mark.feature010
+    def test_monthly_aggregation(self):
+        """Test daily bars aggregate into calendar months."""
+        from stockagent.analysis import resample_bars
+
+        monthly = resample_bars(_daily_bars("2024-01-15", 40), "month")
+
+        assert len(monthly) == 2
+        assert monthly[0]["timestamp"] == "2024-01-31"
+        assert monthly[0]["open"] == 100.0
+        assert monthly[1]["close"] == 100.5 + 39
+
+    @pytest.mark.feature010
+    def test_unsorted_input(self):
+        """Test out-of-order bars are sorted before grouping."""
+        from stockagent.analysis import resample_bars
+
+        bars = _daily_bars("2024-01-01", 14)
+        assert resample_bars(bars[::-1], "week") == resample_bars(bars, "week")
+
+    @pytest.mark.feature010
+    def test_day_is_identity(self, sample_ohlcv_data):
+        """Test the daily timeframe returns bars unchanged."""
+        from stockagent.analysis import resample_bars
+
+        assert resample_bars(sample_ohlcv_data, "day") is sample_ohlcv_data
+
+    @pytest.mark.feature010
+    def test_invalid_timeframe(self, sample_ohlcv_data):
+        """Test unsupported timeframes raise ValueError."""
+        from stockagent.analysis import resample_bars
+
+        with pytest.raises(ValueError):
+            resample_bars(sample_ohlcv_data, "quarter")
+
+
+class TestIndicatorsOnTimeframes:
+    """Test calculate_all_indicators on resampled data."""
+
+    @pytest.mark.feature010
+    def test_weekly_indicators_use_weekly_closes(self):
+        """Test weekly RSI/SMA are computed from weekly closes."""
+        from stockagent.analysis import calculate_all_indicators, calculate_sma, resample_bars
+
+        bars = _daily_bars("2024-01-01", 7 * 30)
+        weekly_closes = [bar["close"] for bar in resample_bars(bars, "week")]
+
+        signals = calculate_all_indicators(bars, timeframe="week")
+
+        assert signals["current_price"] == weekly_closes[-1]
+        assert signals["sma_20"] == calculate_sma(weekly_closes, 20)
+        assert signals["rsi"] is not None
+
+    @pytest.mark.feature010
+    def test_default_timeframe_unchanged(self, sample_price_series):
+        """Test the default timeframe does not require timestamps."""
+        from stockagent.analysis import calculate_all_indicators
+
+        bars = [{"close": price} for price in sample_price_series]
+        signals = calculate_all_indicators(bars)
+
+        assert signals["current_price"] == sample_price_series[-1]
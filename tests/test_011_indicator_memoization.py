@@ -0,0 +1,178 @@
+"""Tests for Feature 011: Indicator Memoization."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def price_bars():
+    """Enough bars for every indicator."""
+    return [{"close": 100.0 + (i % 13) * 0.7, "timestamp": f"2024-01-{i % 28 + 1:02d}"} for i in range(220)]
+
+
+class TestLRUCache:
+    """Test the bounded LRU cache."""
+
+    @pytest.mark.feature011
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted first."""
+        from stockagent.utils.cache import LRUCache
+
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    @pytest.mark.feature011
+    def test_counts_hits_and_misses(self):
+        """Test hit/miss counters."""
+        from stockagent.utils.cache import LRUCache
+
+        cache = LRUCache(maxsize=4)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.feature011
+    def test_rejects_non_positive_size(self):
+        """Test maxsize must be positive."""
+        from stockagent.utils.cache import LRUCache
+
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)
+
+
+class TestIndicatorKey:
+    """Test content-addressed keys."""
+
+    @pytest.mark.feature011
+    def test_same_bars_same_key(self, price_bars):
+        """Test identical content produces identical keys."""
+        from stockagent.analysis import make_indicator_key
+
+        copy = [dict(bar) for bar in price_bars]
+        assert make_indicator_key(price_bars) == make_indicator_key(copy)
+
+    @pytest.mark.feature011
+    def test_changed_price_changes_key(self, price_bars):
+        """Test any price change produces a different key."""
+        from stockagent.analysis import make_indicator_key
+
+        changed = [dict(bar) for bar in price_bars]
+        changed[-1]["close"] += 0.01
+        assert make_indicator_key(price_bars) != make_indicator_key(changed)
+
+    @pytest.mark.feature011
+    def test_timeframe_changes_key(self, price_bars):
+        """Test the timeframe is part of the key."""
+        from stockagent.analysis import make_indicator_key
+
+        assert make_indicator_key(price_bars, "day") != make_indicator_key(price_bars, "week")
+
+
+class TestMemoizedIndicators:
+    """Test memoized indicator computation."""
+
+    @pytest.mark.feature011
+    def test_matches_direct_calculation(self, price_bars):
+        """Test memoized results equal calculate_all_indicators."""
+        from stockagent.analysis import IndicatorMemo, calculate_all_indicators, memoized_indicators
+
+        memo = IndicatorMemo()
+        assert memoized_indicators(price_bars, memo=memo) == calculate_all_indicators(price_bars)
+
+    @pytest.mark.feature011
+    def test_repeat_skips_indicator_math(self, price_bars):
+        """Test a repeated call does not recompute indicators."""
+        from stockagent.analysis import IndicatorMemo, memoized_indicators
+
+        memo = IndicatorMemo()
+        first = memoized_indicators(price_bars, memo=memo)
+
+        with patch("stockagent.analysis.memo.calculate_all_indicators") as mock_calc:
+            second = memoized_indicators(price_bars, memo=memo)
+            mock_calc.assert_not_called()
+
+        assert first == second
+        assert memo.hits == 1
+
+    @pytest.mark.feature011
+    def test_returned_results_are_copies(self, price_bars):
+        """Test mutating a result does not corrupt the memo."""
+        from stockagent.analysis import IndicatorMemo, memoized_indicators
+
+        memo = IndicatorMemo()
+        first = memoized_indicators(price_bars, memo=memo)
+        first["current_price"] = -1.0
+        first["macd"]["histogram"] = 999.0
+
+        second = memoized_indicators(price_bars, memo=memo)
+        assert second["current_price"] != -1.0
+        assert second["macd"]["histogram"] != 999.0
+
+    @pytest.mark.feature011
+    def test_bounded_size(self, price_bars):
+        """Test the memo never exceeds its size bound."""
+        from stockagent.analysis import IndicatorMemo, memoized_indicators
+
+        memo = IndicatorMemo(maxsize=3)
+        for i in range(10):
+            memoized_indicators(price_bars[i:], memo=memo)
+
+        assert len(memo) == 3
+
+    @pytest.mark.feature011
+    def test_disk_persistence(self, price_bars, tmp_path):
+        """Test results persist across memo instances via disk."""
+        from stockagent.analysis import IndicatorMemo, memoized_indicators
+
+        first = memoized_indicators(price_bars, memo=IndicatorMemo(path=tmp_path))
+
+        fresh = IndicatorMemo(path=tmp_path)
+        with patch("stockagent.analysis.memo.calculate_all_indicators") as mock_calc:
+            second = memoized_indicators(price_bars, memo=fresh)
+            mock_calc.assert_not_called()
+
+        assert first == second
+
+    @pytest.mark.feature011
+    def test_corrupt_disk_entry_recomputes(self, price_bars, tmp_path):
+        """Test unreadable disk entries are ignored."""
+        from stockagent.analysis import IndicatorMemo, make_indicator_key, memoized_indicators
+
+        key = make_indicator_key(price_bars)
+        (tmp_path / key[:2]).mkdir()
+        (tmp_path / key[:2] / f"{key}.json").write_text("{not json")
+
+        signals = memoized_indicators(price_bars, memo=IndicatorMemo(path=tmp_path))
+        assert signals["rsi"] is not None
+
+
+class TestWorkflowUsesMemo:
+    """Test the technical_analysis node uses the memo."""
+
+    @pytest.mark.feature011
+    def test_technical_analysis_memoized(self, price_bars):
+        """Test repeated node runs hit the memo."""
+        from stockagent.analysis import IndicatorMemo, set_indicator_memo
+        from stockagent.graph.workflow import technical_analysis
+
+        memo = IndicatorMemo()
+        previous = set_indicator_memo(memo)
+        try:
+            state = {"price_data": price_bars, "current_price": 150.0, "errors": []}
+            first = technical_analysis(state)
+            second = technical_analysis(state)
+        finally:
+            set_indicator_memo(previous)
+
+        assert memo.hits == 1
+        assert first == second
+        assert second["technical_signals"]["current_price"] == 150.0
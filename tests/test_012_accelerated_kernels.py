@@ -0,0 +1,154 @@
+"""Tests for Feature 012: Accelerated Indicator Kernels.
+
+Every available backend (NumPy always, Numba when installed) is checked
+against straightforward reference implementations.
+"""
+
+import numpy as np
+import pytest
+
+from stockagent.analysis.kernels import available_backends
+
+BACKENDS = available_backends()
+
+
+def _reference_ema(prices, period):
+    """Original sequential EMA seeded with an SMA."""
+    prices_arr = np.array(prices)
+    multiplier = 2 / (period + 1)
+    ema = np.mean(prices_arr[:period])
+    for price in prices_arr[period:]:
+        ema = (price - ema) * multiplier + ema
+    return float(ema)
+
+
+def _reference_macd_values(prices):
+    """Original O(n^2) MACD history: EMAs recomputed for every prefix."""
+    return [
+        _reference_ema(prices[:i], 12) - _reference_ema(prices[:i], 26)
+        for i in range(26, len(prices) + 1)
+    ]
+
+
+@pytest.fixture
+def prices():
+    """Seeded random walk."""
+    rng = np.random.default_rng(7)
+    return (100 + np.cumsum(rng.normal(0, 1, 300))).tolist()
+
+
+class TestBackendSelection:
+    """Test backend discovery and selection."""
+
+    @pytest.mark.feature012
+    def test_numpy_always_available(self):
+        """Test the NumPy fallback is always present."""
+        assert "numpy" in BACKENDS
+
+    @pytest.mark.feature012
+    def test_active_backend_is_available(self):
+        """Test the import-time backend is one of the available ones."""
+        from stockagent.analysis.kernels import BACKEND
+
+        assert BACKEND in BACKENDS
+
+    @pytest.mark.feature012
+    def test_unknown_backend_raises(self):
+        """Test requesting an unknown backend raises ValueError."""
+        from stockagent.analysis.kernels import get_kernels
+
+        with pytest.raises(ValueError):
+            get_kernels("fortran")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestKernelParity:
+    """Test each backend against the reference implementations."""
+
+    @pytest.mark.feature012
+    def test_ema_series(self, backend, prices):
+        """Test every EMA prefix matches the sequential reference exactly."""
+        from stockagent.analysis.kernels import ema_series
+
+        series = ema_series(prices, 12, backend=backend)
+        assert len(series) == len(prices) - 11
+        for i in (0, 1, 50, len(series) - 1):
+            assert series[i] == _reference_ema(prices[: 12 + i], 12)
+
+    @pytest.mark.feature012
+    def test_macd_series(self, backend, prices):
+        """Test the O(n) MACD history matches the O(n^2) reference."""
+        from stockagent.analysis.kernels import macd_series
+
+        expected = _reference_macd_values(prices[:120])
+        np.testing.assert_array_equal(macd_series(prices[:120], backend=backend), expected)
+
+    @pytest.mark.feature012
+    def test_rsi_series(self, backend, prices):
+        """Test every RSI prefix matches calculate_rsi."""
+        from stockagent.analysis import calculate_rsi
+        from stockagent.analysis.kernels import rsi_series
+
+        series = rsi_series(prices, 14, backend=backend)
+        expected = [calculate_rsi(prices[: 15 + i], 14) for i in range(len(series))]
+        np.testing.assert_allclose(series, expected, rtol=1e-12)
+
+    @pytest.mark.feature012
+    def test_rsi_flat_prices(self, backend):
+        """Test RSI edge cases for flat and rising prices."""
+        from stockagent.analysis.kernels import rsi_series
+
+        assert rsi_series([5.0] * 20, 14, backend=backend)[-1] == 50.0
+        assert rsi_series(list(range(20)), 14, backend=backend)[-1] == 100.0
+
+    @pytest.mark.feature012
+    def test_rolling_std(self, backend, prices):
+        """Test rolling std matches np.std of each window."""
+        from stockagent.analysis.kernels import rolling_std
+
+        series = rolling_std(prices, 20, backend=backend)
+        expected = [np.std(prices[i : i + 20]) for i in range(len(prices) - 19)]
+        np.testing.assert_allclose(series, expected, rtol=1e-10)
+
+    @pytest.mark.feature012
+    def test_rolling_mean(self, backend, prices):
+        """Test rolling mean matches calculate_sma of each prefix."""
+        from stockagent.analysis import calculate_sma
+        from stockagent.analysis.kernels import rolling_mean
+
+        series = rolling_mean(prices, 20, backend=backend)
+        assert series[-1] == pytest.approx(calculate_sma(prices, 20), rel=1e-12)
+
+    @pytest.mark.feature012
+    def test_short_input_returns_empty(self, backend):
+        """Test inputs shorter than the period return empty arrays."""
+        from stockagent.analysis.kernels import ema_series, macd_series, rolling_std, rsi_series
+
+        assert len(ema_series([1.0] * 5, 12, backend=backend)) == 0
+        assert len(macd_series([1.0] * 25, backend=backend)) == 0
+        assert len(rolling_std([1.0] * 5, 20, backend=backend)) == 0
+        assert len(rsi_series([1.0] * 14, 14, backend=backend)) == 0
+
+
+class TestIndicatorIntegration:
+    """Test indicators built on the kernels keep their results."""
+
+    @pytest.mark.feature012
+    def test_calculate_macd_matches_reference(self, prices):
+        """Test calculate_macd equals the original O(n^2) algorithm."""
+        from stockagent.analysis import calculate_macd
+
+        macd_values = _reference_macd_values(prices)
+        signal = _reference_ema(macd_values, 9)
+        result = calculate_macd(prices)
+
+        assert result["macd_line"] == macd_values[-1]
+        assert result["signal_line"] == signal
+        assert result["histogram"] == macd_values[-1] - signal
+
+    @pytest.mark.feature012
+    def test_calculate_ema_matches_reference(self, prices):
+        """Test calculate_ema equals the sequential reference."""
+        from stockagent.analysis import calculate_ema
+
+        assert calculate_ema(prices, 26) == _reference_ema(prices, 26)
@@ -0,0 +1,142 @@
+"""Tests for Feature 013: Benchmark Suite."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "benchmark_indicators.py"
+
+
+@pytest.fixture(scope="module")
+def bench():
+    """Import the standalone benchmark runner."""
+    spec = importlib.util.spec_from_file_location("benchmark_indicators", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestSyntheticBars:
+    """Test synthetic OHLCV generators."""
+
+    @pytest.mark.feature013
+    def test_seeded_generation_is_deterministic(self):
+        """Test the same seed produces identical bars."""
+        from stockagent.utils.synthetic import generate_bars
+
+        assert generate_bars(50, seed=3) == generate_bars(50, seed=3)
+        assert generate_bars(50, seed=3) != generate_bars(50, seed=4)
+
+    @pytest.mark.feature013
+    def test_bars_are_consistent(self):
+        """Test OHLC relationships hold for every bar."""
+        from stockagent.utils.synthetic import generate_bar_columns
+
+        cols = generate_bar_columns(1_000, seed=1)
+        assert np.all(cols["high"] >= np.maximum(cols["open"], cols["close"]))
+        assert np.all(cols["low"] <= np.minimum(cols["open"], cols["close"]))
+        assert np.all(cols["low"] > 0)
+        assert np.all(cols["volume"] > 0)
+
+    @pytest.mark.feature013
+    def test_bars_fall_on_business_days(self):
+        """Test generated timestamps skip weekends."""
+        from stockagent.utils.synthetic import generate_bar_columns
+
+        days = generate_bar_columns(30, seed=1)["timestamp"].astype("datetime64[D]")
+        assert np.all(np.is_busday(days))
+        assert np.all(np.diff(days).astype(int) > 0)
+
+    @pytest.mark.feature013
+    def test_bars_match_client_format(self):
+        """Test generated bars use the Polygon client's dict format."""
+        from stockagent.utils.synthetic import generate_bars
+
+        bar = generate_bars(1)[0]
+        assert set(bar) == {"open", "high", "low", "close", "volume", "timestamp"}
+        assert bar["timestamp"] == "2000-01-03"
+
+
+class TestSyntheticUniverse:
+    """Test universe, headline and signal generators."""
+
+    @pytest.mark.feature013
+    def test_unique_tickers(self):
+        """Test ticker symbols are unique."""
+        from stockagent.utils.synthetic import generate_tickers
+
+        tickers = generate_tickers(5_000)
+        assert len(set(tickers)) == 5_000
+        assert tickers[:3] == ["A", "B", "C"]
+        assert tickers[26] == "AA"
+
+    @pytest.mark.feature013
+    def test_universe_shape(self):
+        """Test each ticker has the requested number of bars."""
+        from stockagent.utils.synthetic import generate_universe
+
+        universe = generate_universe(5, 20, seed=1)
+        assert len(universe) == 5
+        assert all(len(bars) == 20 for bars in universe.values())
+
+    @pytest.mark.feature013
+    def test_headlines_carry_sentiment(self):
+        """Test headlines exercise the keyword matcher."""
+        from stockagent.analysis import analyze_sentiment
+        from stockagent.utils.synthetic import generate_headlines
+
+        labels = {analyze_sentiment(h)["label"] for h in generate_headlines(200, seed=1)}
+        assert {"positive", "negative"} <= labels
+
+    @pytest.mark.feature013
+    def test_signals_are_scoreable(self):
+        """Test generated signals and sentiments work with the scoring engine."""
+        from stockagent.analysis import calculate_composite_score
+        from stockagent.utils.synthetic import generate_sentiments, generate_technical_signals
+
+        for signals, sentiment in zip(generate_technical_signals(20), generate_sentiments(20)):
+            assert -100 <= calculate_composite_score(signals, sentiment) <= 100
+
+
+class TestBenchmarkRunner:
+    """Test the standalone benchmark runner."""
+
+    @pytest.mark.feature013
+    def test_run_covers_all_functions(self, bench):
+        """Test every indicator, scoring and sentiment function is benchmarked."""
+        from stockagent.analysis import indicators, scoring
+
+        report = bench.run(bar_sizes=[100], ticker_counts=[1], min_time=0)
+        names = {r["name"] for r in report["results"]}
+
+        public = [
+            f"indicators.{n}" for n in dir(indicators)
+            if n.startswith(("calculate_", "interpret_"))
+        ] + [
+            f"scoring.{n}" for n in dir(scoring)
+            if n.startswith(("score_", "calculate_", "generate_", "get_"))
+        ]
+        assert set(public) <= names
+        assert "news_sentiment.analyze_sentiment" in names
+
+    @pytest.mark.feature013
+    def test_results_are_json_serializable(self, bench):
+        """Test the report can be saved and compared."""
+        report = bench.run(bar_sizes=[100], ticker_counts=[1], name_filter="macd", min_time=0)
+        saved = json.loads(json.dumps(report))
+
+        assert saved["meta"]["kernel_backend"]
+        assert all(r["median_ms"] >= 0 for r in saved["results"])
+
+        rows = bench.compare(report, saved)
+        assert rows and all(row["ratio"] == pytest.approx(1.0) for row in rows)
+
+    @pytest.mark.feature013
+    def test_measure_respects_repeat_bounds(self, bench):
+        """Test measure() runs between min_repeat and max_repeat times."""
+        stats = bench.measure(lambda: None, min_time=0, min_repeat=3, max_repeat=5)
+        assert stats["repeat"] == 3
+        assert stats["min_ms"] <= stats["median_ms"]
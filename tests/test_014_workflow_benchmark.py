@@ -0,0 +1,187 @@
+"""Tests for Feature 014: Workflow Benchmark with Local Stand-ins."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "benchmark_workflow.py"
+
+
+@pytest.fixture(scope="module")
+def bench():
+    """Import the standalone workflow benchmark."""
+    spec = importlib.util.spec_from_file_location("benchmark_workflow", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestFakePolygonServer:
+    """Test the real PolygonClient against the fake server."""
+
+    @pytest.mark.feature014
+    def test_aggregates(self, fake_polygon):
+        """Test daily bars are returned in the client's format."""
+        from stockagent.data import PolygonClient
+
+        client = PolygonClient(api_key="test", base_url=fake_polygon.url)
+        bars = client.get_stock_aggregates("AAPL", days=30)
+
+        assert 15 <= len(bars) <= 23
+        assert all(bar["low"] <= bar["close"] <= bar["high"] for bar in bars)
+        assert bars == client.get_stock_aggregates("AAPL", days=30)
+
+    @pytest.mark.feature014
+    def test_details_and_previous_close(self, fake_polygon):
+        """Test ticker details and previous close endpoints."""
+        from stockagent.data import PolygonClient
+
+        client = PolygonClient(api_key="test", base_url=fake_polygon.url)
+
+        assert client.get_ticker_details("msft")["company_name"] == "MSFT Holdings Inc."
+        assert client.get_previous_close("MSFT")["previous_close"] > 0
+
+    @pytest.mark.feature014
+    def test_unknown_ticker_raises_not_found(self, fake_polygon):
+        """Test 404 responses map to TickerNotFoundError."""
+        from stockagent.data import PolygonClient, TickerNotFoundError
+
+        client = PolygonClient(api_key="test", base_url=fake_polygon.url)
+
+        with pytest.raises(TickerNotFoundError):
+            client.get_ticker_details("NOPE")
+        assert fake_polygon.stats["not_found"] == 1
+
+    @pytest.mark.feature014
+    def test_fault_injection(self):
+        """Test 429 responses carry Retry-After and are counted."""
+        from stockagent.testing import FakePolygonServer
+
+        server = FakePolygonServer(rate_limit_rate=1.0, retry_after=7)
+        status, _, headers = server.respond("/v3/reference/tickers/AAPL")
+        server.stop()
+
+        assert status == 429
+        assert headers == {"Retry-After": "7"}
+        assert server.stats["rate_limited"] == 1
+
+    @pytest.mark.feature014
+    def test_base_url_from_environment(self, fake_polygon, monkeypatch):
+        """Test POLYGON_BASE_URL routes the client to the stand-in."""
+        from stockagent.data import PolygonClient
+
+        monkeypatch.setenv("POLYGON_BASE_URL", fake_polygon.url)
+        PolygonClient(api_key="test").get_ticker_details("AAPL")
+
+        assert fake_polygon.stats["ok"] == 1
+
+
+class TestFakeNewsClient:
+    """Test the fake news client through fetch_news()."""
+
+    @pytest.mark.feature014
+    def test_fetch_news_uses_factory(self, fake_env):
+        """Test fetch_news returns synthetic articles from the stand-in."""
+        from stockagent.analysis import fetch_news
+
+        _, news = fake_env
+        articles = fetch_news("AAPL", max_results=5)
+
+        assert len(articles) == 5
+        assert all(a["source"] == "Synthetic Wire" for a in articles)
+        assert news.stats["ok"] == 1
+
+    @pytest.mark.feature014
+    def test_injected_errors_are_handled(self):
+        """Test injected failures degrade to no articles."""
+        from stockagent.analysis import fetch_news, set_news_client_factory
+        from stockagent.testing import FakeNewsClient
+
+        news = FakeNewsClient(rate_limit_rate=1.0)
+        previous = set_news_client_factory(news)
+        try:
+            assert fetch_news("AAPL") == []
+        finally:
+            set_news_client_factory(previous)
+        assert news.stats["rate_limited"] == 1
+
+
+class TestWorkflowHooks:
+    """Test workflow extension points used by the benchmark."""
+
+    @pytest.mark.feature014
+    def test_run_analysis_end_to_end(self, fake_env):
+        """Test the full workflow runs against the stand-ins."""
+        from stockagent.graph import run_analysis
+
+        result = run_analysis("AAPL")
+
+        assert result["errors"] == []
+        assert result["company_name"] == "AAPL Holdings Inc."
+        assert result["recommendation"] in ("BUY", "HOLD", "SELL")
+        assert result["news_sentiment"]["headline_count"] == 8
+
+    @pytest.mark.feature014
+    def test_node_wrapper_sees_every_node(self, fake_env):
+        """Test node_wrapper is applied to all workflow nodes."""
+        from stockagent.graph import create_workflow, run_analysis
+
+        calls = []
+
+        def wrapper(name, node):
+            def wrapped(state):
+                calls.append(name)
+                return node(state)
+
+            return wrapped
+
+        run_analysis("AAPL", create_workflow(node_wrapper=wrapper))
+
+        assert sorted(calls) == [
+            "fetch_data", "news_sentiment", "recommend", "synthesize", "technical_analysis",
+        ]
+
+    @pytest.mark.feature014
+    def test_batch_analysis(self, fake_env):
+        """Test batch analysis yields one result per ticker."""
+        from stockagent.graph import run_batch_analysis
+
+        results = list(run_batch_analysis(["aapl", "MSFT", "NOPE"], max_workers=3))
+        by_ticker = {r["ticker"]: r for r in results}
+
+        assert set(by_ticker) == {"AAPL", "MSFT", "NOPE"}
+        assert by_ticker["AAPL"]["errors"] == []
+        assert by_ticker["NOPE"]["errors"]
+
+
+class TestBenchmarkRunner:
+    """Test the standalone workflow benchmark."""
+
+    @pytest.mark.feature014
+    def test_run_reports_per_node_percentiles(self, bench):
+        """Test each level reports latency percentiles per node."""
+        report = bench.run(n_tickers=4, concurrency_levels=[1, 2])
+        saved = json.loads(json.dumps(report))
+
+        assert [level["concurrency"] for level in saved["levels"]] == [1, 2]
+        for level in saved["levels"]:
+            assert level["errors"] == 0
+            assert level["analysis"]["count"] == 4
+            assert set(level["nodes"]) == {
+                "fetch_data", "news_sentiment", "recommend", "synthesize", "technical_analysis",
+            }
+            fetch = level["nodes"]["fetch_data"]
+            assert fetch["p50_ms"] <= fetch["p95_ms"] <= fetch["p99_ms"]
+        assert saved["stand_ins"]["polygon"]["requests"] == 3 * (1 + 4 * 2)
+
+    @pytest.mark.feature014
+    def test_summarize(self, bench):
+        """Test percentile and throughput math."""
+        stats = bench.summarize([float(i) for i in range(1, 101)], wall_s=2.0)
+
+        assert stats["count"] == 100
+        assert stats["throughput_per_s"] == 50.0
+        assert stats["p50_ms"] == pytest.approx(50.5)
+        assert stats["p99_ms"] == pytest.approx(99.01)
@@ -0,0 +1,275 @@
+"""Tests for Feature 015: Workflow Instrumentation and Tracing."""
+
+import json
+
+import pytest
+
+NODES = {"fetch_data", "technical_analysis", "news_sentiment", "recommend", "synthesize"}
+
+
+@pytest.fixture
+def memory_exporter():
+    """Capture exported traces in memory."""
+    from stockagent.utils.tracing import InMemorySpanExporter, set_span_exporter
+
+    exporter = InMemorySpanExporter()
+    previous = set_span_exporter(exporter)
+    yield exporter
+    set_span_exporter(previous)
+
+
+@pytest.fixture
+def fresh_memo():
+    """Empty indicator memo so cache hits are predictable."""
+    from stockagent.analysis import IndicatorMemo, set_indicator_memo
+
+    previous = set_indicator_memo(IndicatorMemo())
+    yield
+    set_indicator_memo(previous)
+
+
+class TestSpans:
+    """Test span timing, nesting and counters."""
+
+    @pytest.mark.feature015
+    def test_nested_spans_share_trace(self, memory_exporter):
+        """Test child spans link to their parent and export with the root."""
+        from stockagent.utils.tracing import start_span
+
+        with start_span("root") as root:
+            with start_span("child") as child:
+                pass
+
+        assert child.trace_id == root.trace_id
+        assert child.parent_id == root.span_id
+        assert [s.name for s in memory_exporter.traces[0]] == ["child", "root"]
+
+    @pytest.mark.feature015
+    def test_counters_go_to_active_span(self, memory_exporter):
+        """Test increment() bumps the innermost span and is a no-op outside."""
+        from stockagent.utils.tracing import increment, start_span
+
+        increment("api_calls")  # No active span
+        with start_span("root") as root:
+            increment("api_calls")
+            with start_span("child") as child:
+                increment("api_calls", 2)
+
+        assert root.counters == {"api_calls": 1}
+        assert child.counters == {"api_calls": 2}
+
+    @pytest.mark.feature015
+    def test_error_sets_status(self, memory_exporter):
+        """Test exceptions mark the span as failed and propagate."""
+        from stockagent.utils.tracing import STATUS_ERROR, start_span
+
+        with pytest.raises(RuntimeError):
+            with start_span("root") as root:
+                raise RuntimeError("boom")
+
+        assert root.status == STATUS_ERROR
+        assert "boom" in root.status_message
+        assert root.wall_ms >= 0
+
+    @pytest.mark.feature015
+    def test_otlp_format(self, memory_exporter):
+        """Test spans convert to OTLP/JSON with typed attributes."""
+        from stockagent.utils.tracing import increment, spans_to_otlp, start_span
+
+        with start_span("root", {"stockagent.ticker": "AAPL", "flag": True}):
+            increment("api_calls", 3)
+
+        request = spans_to_otlp(memory_exporter.spans)
+        resource = request["resourceSpans"][0]
+        span = resource["scopeSpans"][0]["spans"][0]
+        attributes = {a["key"]: a["value"] for a in span["attributes"]}
+
+        assert resource["resource"]["attributes"][0]["value"] == {"stringValue": "stockagent"}
+        assert len(span["traceId"]) == 32 and len(span["spanId"]) == 16
+        assert "parentSpanId" not in span
+        assert int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"])
+        assert attributes["stockagent.ticker"] == {"stringValue": "AAPL"}
+        assert attributes["flag"] == {"boolValue": True}
+        assert attributes["stockagent.api_calls"] == {"intValue": "3"}
+        assert "doubleValue" in attributes["stockagent.wall_ms"]
+
+
+class TestExporters:
+    """Test file and collector exporters."""
+
+    @pytest.mark.feature015
+    def test_file_exporter(self, tmp_path):
+        """Test each trace is appended as one OTLP/JSON line."""
+        from stockagent.utils.tracing import FileSpanExporter, set_span_exporter, start_span
+
+        path = tmp_path / "traces" / "spans.jsonl"
+        previous = set_span_exporter(FileSpanExporter(path))
+        try:
+            for _ in range(2):
+                with start_span("root"):
+                    pass
+        finally:
+            set_span_exporter(previous)
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] == "root"
+
+    @pytest.mark.feature015
+    def test_collector_exporter(self):
+        """Test traces are POSTed to an OTLP/HTTP collector."""
+        from stockagent.testing import FakeCollector
+        from stockagent.utils.tracing import OTLPHttpSpanExporter, set_span_exporter, start_span
+
+        with FakeCollector() as collector:
+            exporter = OTLPHttpSpanExporter(collector.url)
+            previous = set_span_exporter(exporter)
+            try:
+                with start_span("root"):
+                    with start_span("child"):
+                        pass
+            finally:
+                set_span_exporter(previous)
+
+            assert exporter.flush(5)
+            assert [s["name"] for s in collector.spans] == ["child", "root"]
+
+    @pytest.mark.feature015
+    def test_export_failure_is_logged(self, caplog):
+        """Test an unreachable collector does not break the traced code."""
+        from stockagent.utils.tracing import OTLPHttpSpanExporter, set_span_exporter, start_span
+
+        exporter = OTLPHttpSpanExporter("http://127.0.0.1:9", timeout=0.5)
+        previous = set_span_exporter(exporter)
+        try:
+            with start_span("root"):
+                pass
+        finally:
+            set_span_exporter(previous)
+
+        assert exporter.flush(5)
+        assert "Error exporting trace spans" in caplog.text
+
+    @pytest.mark.feature015
+    def test_stalled_collector_does_not_block(self):
+        """Test a collector that never answers does not delay the traced code."""
+        import socket
+        import time
+
+        from stockagent.utils.tracing import OTLPHttpSpanExporter, set_span_exporter, start_span
+
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            host, port = server.getsockname()
+            exporter = OTLPHttpSpanExporter(f"http://{host}:{port}", timeout=1.0, max_queue=1)
+            previous = set_span_exporter(exporter)
+            start = time.perf_counter()
+            try:
+                for _ in range(3):
+                    with start_span("root"):
+                        pass
+            finally:
+                set_span_exporter(previous)
+            elapsed = time.perf_counter() - start
+
+            assert elapsed < 0.5
+            assert exporter.dropped >= 1
+            assert exporter.flush(5)
+
+    @pytest.mark.feature015
+    def test_exporter_from_environment(self, tmp_path, monkeypatch):
+        """Test STOCKAGENT_TRACE_FILE configures a file exporter."""
+        from stockagent.utils import tracing
+
+        monkeypatch.setenv("STOCKAGENT_TRACE_FILE", str(tmp_path / "spans.jsonl"))
+        monkeypatch.delenv("OTEL_EXPORTER_OTLP_ENDPOINT", raising=False)
+        monkeypatch.setattr(tracing, "_exporter_configured", False)
+
+        exporter = tracing.get_span_exporter()
+        assert isinstance(exporter, tracing.FileSpanExporter)
+        tracing.set_span_exporter(None)
+
+
+class TestWorkflowInstrumentation:
+    """Test per-node timings and spans from run_analysis."""
+
+    @pytest.mark.feature015
+    def test_timing_summary_in_state(self, fake_env, fresh_memo, memory_exporter):
+        """Test every node and the total appear in result['timings']."""
+        from stockagent.graph import run_analysis
+
+        timings = run_analysis("AAPL")["timings"]
+
+        assert set(timings) == NODES | {"total"}
+        assert timings["fetch_data"]["api_calls"] == 3
+        assert timings["news_sentiment"]["api_calls"] == 1
+        assert timings["technical_analysis"]["cache_misses"] == 1
+        assert timings["total"]["api_calls"] == 4
+        assert timings["fetch_data"]["payload_bytes"] > 1000
+        for timing in timings.values():
+            assert timing["wall_ms"] >= 0 and timing["cpu_ms"] >= 0
+
+    @pytest.mark.feature015
+    def test_payload_size_skipped_without_exporter(self, fake_env, fresh_memo):
+        """Test node outputs are not serialized when no spans are exported."""
+        from stockagent.graph import run_analysis
+        from stockagent.utils.tracing import set_span_exporter
+
+        previous = set_span_exporter(None)
+        try:
+            timings = run_analysis("AAPL")["timings"]
+        finally:
+            set_span_exporter(previous)
+
+        assert all(timing["payload_bytes"] == 0 for timing in timings.values())
+
+    @pytest.mark.feature015
+    def test_cache_hits_recorded(self, fake_env, fresh_memo, memory_exporter):
+        """Test a repeated analysis reports an indicator cache hit."""
+        from stockagent.graph import run_analysis
+
+        run_analysis("AAPL")
+        timings = run_analysis("AAPL")["timings"]
+
+        assert timings["technical_analysis"]["cache_hits"] == 1
+        assert timings["technical_analysis"]["cache_misses"] == 0
+
+    @pytest.mark.feature015
+    def test_one_trace_per_run(self, fake_env, memory_exporter):
+        """Test node spans are children of the run span."""
+        from stockagent.graph import run_analysis
+
+        run_analysis("AAPL")
+
+        (trace,) = memory_exporter.traces
+        root = next(s for s in trace if s.name == "run_analysis")
+        nodes = [s for s in trace if s is not root]
+
+        assert {s.name for s in nodes} == {f"node.{n}" for n in NODES}
+        assert all(s.parent_id == root.span_id for s in nodes)
+        assert root.attributes["stockagent.ticker"] == "AAPL"
+
+    @pytest.mark.feature015
+    def test_instrumentation_can_be_disabled(self, fake_env, memory_exporter):
+        """Test instrument=False leaves timings empty."""
+        from stockagent.graph import create_workflow, run_analysis
+
+        result = run_analysis("AAPL", create_workflow(instrument=False))
+
+        assert result["timings"] == {}
+        assert [s.name for s in memory_exporter.spans] == ["run_analysis"]
+
+    @pytest.mark.feature015
+    def test_tracing_failure_propagates(self, fake_env, monkeypatch):
+        """Test an error starting the run's span is raised as is and still counted."""
+        from stockagent.graph import workflow
+        from stockagent.utils.metrics import ANALYSES
+
+        def broken_span(*args, **kwargs):
+            raise RuntimeError("tracing unavailable")
+
+        monkeypatch.setattr(workflow, "start_span", broken_span)
+        failed = ANALYSES.labels("failed").value
+
+        with pytest.raises(RuntimeError, match="tracing unavailable"):
+            workflow.run_analysis("AAPL")
+        assert ANALYSES.labels("failed").value == failed + 1
@@ -0,0 +1,239 @@
+"""Tests for Feature 016: Metrics Endpoint."""
+
+import time
+import urllib.request
+
+import pytest
+
+
+@pytest.fixture
+def registry():
+    """Empty registry."""
+    from stockagent.utils.metrics import MetricsRegistry
+
+    return MetricsRegistry()
+
+
+def _sample(text: str, line_prefix: str) -> float:
+    """Value of the first exposition line starting with line_prefix."""
+    for line in text.splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+class TestMetricTypes:
+    """Test counters, gauges and histograms."""
+
+    @pytest.mark.feature016
+    def test_counter_exposition(self, registry):
+        """Test counters render with HELP/TYPE and a _total suffix."""
+        requests = registry.counter("app_requests", "Requests", ("status",))
+        requests.labels("ok").inc()
+        requests.labels(status="ok").inc(2)
+        requests.labels("error").inc()
+
+        text = registry.render()
+
+        assert "# HELP app_requests_total Requests" in text
+        assert "# TYPE app_requests_total counter" in text
+        assert 'app_requests_total{status="ok"} 3.0' in text
+        assert 'app_requests_total{status="error"} 1.0' in text
+
+    @pytest.mark.feature016
+    def test_counter_rejects_decrease(self, registry):
+        """Test counters cannot go down."""
+        with pytest.raises(ValueError):
+            registry.counter("c", "C").inc(-1)
+
+    @pytest.mark.feature016
+    def test_label_validation(self, registry):
+        """Test wrong label names or counts raise ValueError."""
+        counter = registry.counter("c", "C", ("a", "b"))
+        with pytest.raises(ValueError):
+            counter.labels("x")
+        with pytest.raises(ValueError):
+            counter.labels(a="x", c="y")
+
+    @pytest.mark.feature016
+    def test_gauge(self, registry):
+        """Test gauge set/inc/dec and scrape-time functions."""
+        gauge = registry.gauge("in_progress", "In progress")
+        gauge.inc(3)
+        gauge.dec()
+        assert gauge.value == 2
+
+        computed = registry.gauge("computed", "Computed")
+        computed.set_function(lambda: 42)
+        assert "computed 42.0" in registry.render()
+
+    @pytest.mark.feature016
+    def test_histogram_buckets(self, registry):
+        """Test histogram buckets are cumulative with sum and count."""
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            latency.observe(value)
+
+        text = registry.render()
+
+        assert 'latency_seconds_bucket{le="0.1"} 2.0' in text
+        assert 'latency_seconds_bucket{le="1.0"} 3.0' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4.0' in text
+        assert "latency_seconds_count 4.0" in text
+        assert _sample(text, "latency_seconds_sum") == pytest.approx(5.65)
+
+    @pytest.mark.feature016
+    def test_label_values_are_escaped(self, registry):
+        """Test quotes, backslashes and newlines in label values are escaped."""
+        registry.counter("c", "C", ("v",)).labels('a"b\\c\nd').inc()
+        assert 'c_total{v="a\\"b\\\\c\\nd"} 1.0' in registry.render()
+
+    @pytest.mark.feature016
+    def test_registry_returns_existing_metric(self, registry):
+        """Test re-registering returns the same metric; a type clash raises."""
+        assert registry.counter("c", "C") is registry.counter("c", "C")
+        with pytest.raises(ValueError):
+            registry.gauge("c", "C")
+
+    @pytest.mark.feature016
+    def test_recording_overhead_is_negligible(self, registry):
+        """Test a labelled increment plus observation costs a few microseconds."""
+        counter = registry.counter("c", "C", ("endpoint",))
+        histogram = registry.histogram("h", "H", ("endpoint",))
+        n = 20_000
+
+        start = time.perf_counter()
+        for _ in range(n):
+            counter.labels("aggregates").inc()
+            histogram.labels("aggregates").observe(0.02)
+        per_call_us = (time.perf_counter() - start) / n * 1e6
+
+        assert per_call_us < 20
+
+
+class TestScrapeEndpoint:
+    """Test the HTTP endpoint."""
+
+    @pytest.mark.feature016
+    def test_serves_metrics(self, registry):
+        """Test /metrics returns the text format; other paths 404."""
+        from stockagent.utils.metrics import CONTENT_TYPE, start_metrics_server
+
+        registry.counter("scrapes", "Scrapes").inc()
+        server = start_metrics_server(registry=registry)
+        try:
+            with urllib.request.urlopen(server.url) as response:
+                body = response.read().decode()
+                content_type = response.headers["Content-Type"]
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(server.url.replace("/metrics", "/other"))
+        finally:
+            server.stop()
+
+        assert content_type == CONTENT_TYPE
+        assert "scrapes_total 1.0" in body
+
+    @pytest.mark.feature016
+    def test_ensure_server_disabled_without_port(self, monkeypatch):
+        """Test no endpoint is started unless STOCKAGENT_METRICS_PORT is set."""
+        from stockagent.utils import metrics
+
+        monkeypatch.delenv("STOCKAGENT_METRICS_PORT", raising=False)
+        monkeypatch.setattr(metrics, "_server", None)
+
+        assert metrics.ensure_metrics_server() is None
+
+    @pytest.mark.feature016
+    def test_ensure_server_starts_once(self, monkeypatch):
+        """Test the configured endpoint is started once and reused."""
+        from stockagent.utils import metrics
+
+        monkeypatch.setenv("STOCKAGENT_METRICS_PORT", "0")
+        monkeypatch.setattr(metrics, "_server", None)
+
+        server = metrics.ensure_metrics_server()
+        try:
+            assert server is not None
+            assert metrics.ensure_metrics_server() is server
+        finally:
+            server.stop()
+
+
+class TestStockAgentMetrics:
+    """Test metrics recorded by the client, news fetcher and workflow."""
+
+    @pytest.mark.feature016
+    def test_workflow_metrics(self, fake_env):
+        """Test a run records Polygon, news, node and analysis metrics."""
+        from stockagent.graph import run_analysis
+        from stockagent.utils.metrics import REGISTRY
+
+        before = REGISTRY.render()
+        run_analysis("AAPL")
+        after = REGISTRY.render()
+
+        def delta(prefix):
+            return _sample(after, prefix) - _sample(before, prefix)
+
+        assert delta('stockagent_polygon_requests_total{endpoint="aggregates",status="ok"}') == 1
+        assert delta('stockagent_polygon_request_seconds_count{endpoint="ticker_details"}') == 1
+        assert delta('stockagent_news_requests_total{status="ok"}') == 1
+        assert delta('stockagent_node_seconds_count{node="fetch_data"}') == 1
+        assert delta('stockagent_analyses_total{outcome="ok"}') == 1
+        assert delta("stockagent_analysis_seconds_count") == 1
+        assert _sample(after, "stockagent_polygon_calls_last_minute") >= 3
+        assert _sample(after, "stockagent_analyses_in_progress") == 0
+
+    @pytest.mark.feature016
+    def test_not_found_and_node_errors(self, fake_env):
+        """Test 404s and node errors are counted."""
+        from stockagent.graph import run_analysis
+        from stockagent.utils.metrics import NODE_ERRORS, POLYGON_REQUESTS
+
+        not_found = POLYGON_REQUESTS.labels("ticker_details", "not_found")
+        node_errors = NODE_ERRORS.labels("fetch_data")
+        before = not_found.value, node_errors.value
+
+        result = run_analysis("NOPE")
+
+        assert not_found.value - before[0] == 1
+        assert node_errors.value - before[1] == len(result["errors"])
+
+    @pytest.mark.feature016
+    def test_rate_limit_errors_counted(self):
+        """Test RateLimitError raises are counted."""
+        from unittest.mock import patch
+
+        from polygon.exceptions import BadResponse
+
+        from stockagent.data import PolygonClient, RateLimitError
+        from stockagent.utils.metrics import POLYGON_REQUESTS, RATE_LIMIT_ERRORS
+
+        with patch("stockagent.data.polygon_client.RESTClient") as mock_rest:
+            mock_rest.return_value.get_ticker_details.side_effect = BadResponse("429 Too Many Requests")
+            client = PolygonClient(api_key="test")
+            rate_limited = POLYGON_REQUESTS.labels("ticker_details", "rate_limited")
+            before = RATE_LIMIT_ERRORS.value, rate_limited.value
+
+            with pytest.raises(RateLimitError):
+                client.get_ticker_details("AAPL")
+
+        assert RATE_LIMIT_ERRORS.value - before[0] == 1
+        assert rate_limited.value - before[1] == 1
+
+    @pytest.mark.feature016
+    def test_news_failures_counted(self):
+        """Test failed and rate-limited news searches are counted."""
+        from stockagent.analysis import fetch_news, set_news_client_factory
+        from stockagent.testing import FakeNewsClient
+        from stockagent.utils.metrics import NEWS_REQUESTS
+
+        errors = NEWS_REQUESTS.labels("error")
+        before = errors.value
+        previous = set_news_client_factory(FakeNewsClient(error_rate=1.0))
+        try:
+            fetch_news("AAPL")
+        finally:
+            set_news_client_factory(previous)
+
+        assert errors.value - before == 1
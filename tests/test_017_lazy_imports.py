@@ -0,0 +1,113 @@
+"""Tests for Feature 017: Lazy Imports."""
+
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "benchmark_imports.py"
+SRC = Path(__file__).parent.parent / "src"
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("benchmark_imports", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bench = _load_script()
+
+
+def _loaded_after(code: str) -> set[str]:
+    """Top-level modules present in sys.modules after running code in a fresh interpreter."""
+    probe = f"{code}\nimport sys\nprint(' '.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+    )
+    return set(result.stdout.split())
+
+
+class TestImportBudgets:
+    """Enforce the import-time budgets defined in the benchmark script."""
+
+    @pytest.mark.feature017
+    @pytest.mark.parametrize("statement", list(bench.TARGETS))
+    def test_within_budget(self, statement):
+        """Test each entry point stays within its time budget and avoids forbidden packages."""
+        result = bench.measure(statement, repeat=1)
+        assert bench.check(result) == [], result
+
+
+class TestLazyPackages:
+    """Test PEP 562 lazy exports."""
+
+    @pytest.mark.feature017
+    def test_scoring_does_not_load_heavy_packages(self):
+        """Test importing scoring and synthesis loads no third-party packages."""
+        loaded = _loaded_after(
+            "from stockagent.analysis import scoring, synthesis\n"
+            "import stockagent.data, stockagent.graph"
+        )
+        assert not loaded & set(bench.HEAVY_PACKAGES)
+
+    @pytest.mark.feature017
+    def test_names_load_on_first_access(self):
+        """Test accessing a name imports only its submodule."""
+        loaded = _loaded_after("from stockagent.data import bars_to_columns")
+        assert "numpy" in loaded
+        assert "polygon" not in loaded
+
+    @pytest.mark.feature017
+    def test_numba_loads_on_first_kernel_call(self):
+        """Test Numba is imported only when a kernel runs with that backend."""
+        from stockagent.analysis.kernels import available_backends
+
+        if "numba" not in available_backends():
+            pytest.skip("Numba not installed")
+
+        assert "numba" not in _loaded_after("import stockagent.analysis.indicators")
+        assert "numba" in _loaded_after(
+            "from stockagent.analysis.kernels import ema_series\n"
+            "ema_series([1.0] * 30, 12, backend='numba')"
+        )
+
+    @pytest.mark.feature017
+    def test_public_api_unchanged(self):
+        """Test every name in __all__ resolves to the submodule's object."""
+        import stockagent.analysis
+        import stockagent.data
+        import stockagent.graph
+        from stockagent.analysis import scoring
+        from stockagent.graph import workflow
+
+        for package in (stockagent.analysis, stockagent.data, stockagent.graph):
+            for name in package.__all__:
+                assert getattr(package, name) is not None
+            assert set(package.__all__) <= set(dir(package))
+
+        assert stockagent.analysis.score_rsi is scoring.score_rsi
+        assert stockagent.graph.run_analysis is workflow.run_analysis
+
+    @pytest.mark.feature017
+    def test_unknown_name_raises_attribute_error(self):
+        """Test unknown names raise AttributeError, not ImportError."""
+        import stockagent.analysis
+
+        with pytest.raises(AttributeError, match="no attribute 'nope'"):
+            stockagent.analysis.nope  # noqa: B018
+
+    @pytest.mark.feature017
+    def test_submodule_import_still_works(self):
+        """Test 'from package import submodule' still imports the submodule."""
+        from stockagent.analysis import indicators, memo
+
+        assert indicators.__name__ == "stockagent.analysis.indicators"
+        assert memo.__name__ == "stockagent.analysis.memo"
@@ -0,0 +1,152 @@
+"""Tests for Feature 018: Cached Settings."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+class TestSettings:
+    """Test parsing and caching of settings."""
+
+    @pytest.mark.feature018
+    def test_defaults(self, monkeypatch):
+        """Test unset tunables fall back to their defaults."""
+        from stockagent.config import load_settings
+
+        for name in ("STOCKAGENT_MAX_WORKERS", "STOCKAGENT_POLYGON_TIMEOUT", "STOCKAGENT_CACHE_DIR"):
+            monkeypatch.delenv(name, raising=False)
+
+        settings = load_settings()
+
+        assert settings.max_workers == 4
+        assert settings.polygon_calls_per_minute == 5
+        assert settings.polygon_timeout is None
+        assert settings.cache_path("indicators") is None
+
+    @pytest.mark.feature018
+    def test_parses_tunables(self, monkeypatch, tmp_path):
+        """Test numeric and path settings are converted."""
+        from stockagent.config import load_settings
+
+        monkeypatch.setenv("STOCKAGENT_MAX_WORKERS", "8")
+        monkeypatch.setenv("STOCKAGENT_POLYGON_TIMEOUT", "2.5")
+        monkeypatch.setenv("STOCKAGENT_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("STOCKAGENT_KERNELS", " NumPy ")
+
+        settings = load_settings()
+
+        assert settings.max_workers == 8
+        assert settings.polygon_timeout == 2.5
+        assert settings.cache_path("indicators") == tmp_path / "indicators"
+        assert settings.kernels == "numpy"
+
+    @pytest.mark.feature018
+    def test_invalid_number_names_variable(self, monkeypatch):
+        """Test a malformed number raises ValueError naming the variable."""
+        from stockagent.config import load_settings
+
+        monkeypatch.setenv("STOCKAGENT_MAX_WORKERS", "many")
+
+        with pytest.raises(ValueError, match="STOCKAGENT_MAX_WORKERS"):
+            load_settings()
+
+    @pytest.mark.feature018
+    def test_cached_until_reload(self, monkeypatch):
+        """Test get_settings() ignores environment changes until reload_settings()."""
+        from stockagent.config import get_settings, reload_settings
+
+        monkeypatch.setenv("STOCKAGENT_MAX_WORKERS", "2")
+        first = get_settings()
+        monkeypatch.setenv("STOCKAGENT_MAX_WORKERS", "6")
+
+        assert get_settings() is first
+        assert reload_settings().max_workers == 6
+        assert get_settings().max_workers == 6
+
+    @pytest.mark.feature018
+    def test_settings_are_immutable(self):
+        """Test settings cannot be modified in place."""
+        from dataclasses import FrozenInstanceError
+
+        from stockagent.config import get_settings
+
+        with pytest.raises(FrozenInstanceError):
+            get_settings().max_workers = 1
+
+
+class TestHotPath:
+    """Test configuration is not re-read per request."""
+
+    @pytest.mark.feature018
+    def test_env_file_loaded_once(self, mock_env_with_api_key):
+        """Test constructing many clients loads .env only once."""
+        from stockagent.data import PolygonClient
+
+        with patch("stockagent.config.load_dotenv") as mock_load, \
+                patch("stockagent.data.polygon_client.RESTClient"):
+            for _ in range(50):
+                PolygonClient()
+
+        assert mock_load.call_count == 1
+
+    @pytest.mark.feature018
+    def test_missing_api_key(self, mock_env_without_api_key):
+        """Test the API key is still required."""
+        from stockagent.config import get_polygon_api_key
+
+        with patch("stockagent.config.load_dotenv"):
+            with pytest.raises(ValueError, match="POLYGON_API_KEY"):
+                get_polygon_api_key()
+
+    @pytest.mark.feature018
+    def test_client_options_from_settings(self, mock_env_with_api_key, monkeypatch):
+        """Test the timeout setting ends a stalled request and retries follow the retry policy."""
+        import socket
+        import time
+
+        from stockagent.data import PolygonAPIError, PolygonClient, get_retry_policy
+
+        monkeypatch.setenv("STOCKAGENT_POLYGON_TIMEOUT", "0.5")
+        monkeypatch.setenv("STOCKAGENT_POLYGON_RETRIES", "0")
+        # Accepts connections but never answers
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            host, port = server.getsockname()
+            client = PolygonClient(base_url=f"http://{host}:{port}")
+            start = time.perf_counter()
+            with pytest.raises(PolygonAPIError, match="after 1 attempts"):
+                client.get_ticker_details("AAPL")
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 3
+        assert get_retry_policy().rate_limits.max_attempts == 1
+        assert get_retry_policy().server_errors.max_attempts == 1
+
+    @pytest.mark.feature018
+    def test_indicator_memo_uses_cache_dir(self, monkeypatch, tmp_path):
+        """Test the default indicator memo persists under STOCKAGENT_CACHE_DIR."""
+        from stockagent.analysis import get_indicator_memo, set_indicator_memo
+        from stockagent.config import reload_settings
+
+        monkeypatch.setenv("STOCKAGENT_CACHE_DIR", str(tmp_path))
+        reload_settings()
+        previous = set_indicator_memo(None)
+        try:
+            memo = get_indicator_memo()
+            memo.put("ab" * 32, {"rsi": 50.0})
+        finally:
+            set_indicator_memo(previous)
+
+        assert (tmp_path / "indicators" / "ab" / f"{'ab' * 32}.json").exists()
+
+    @pytest.mark.feature018
+    def test_batch_workers_from_settings(self, fake_env, monkeypatch):
+        """Test run_batch_analysis defaults its concurrency to the settings."""
+        from stockagent.graph import workflow
+
+        monkeypatch.setenv("STOCKAGENT_MAX_WORKERS", "3")
+
+        with patch.object(workflow, "ThreadPoolExecutor", wraps=workflow.ThreadPoolExecutor) as pool:
+            results = list(workflow.run_batch_analysis(["AAPL", "MSFT"]))
+
+        pool.assert_called_once_with(max_workers=3)
+        assert len(results) == 2
@@ -0,0 +1,235 @@
+"""Tests for Feature 019: Analysis Service."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+REQUESTS_PER_ANALYSIS = 3
+
+
+@pytest.fixture
+def service(fake_env):
+    """AnalysisService routed to the local stand-ins."""
+    from stockagent.service import AnalysisService
+
+    service = AnalysisService(max_workers=4, ttl=60)
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def server(service):
+    """Running HTTP server for the service."""
+    from stockagent.service import AnalysisServer
+
+    with AnalysisServer(service, timeout=10) as server:
+        yield server
+
+
+def _request(url: str, payload: dict | None = None) -> tuple[int, dict]:
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+class TestTTLCache:
+    """Test the expiring cache."""
+
+    @pytest.mark.feature019
+    def test_entries_expire(self):
+        """Test entries are fresh for ttl seconds and report their age."""
+        from stockagent.utils.cache import TTLCache
+
+        now = [100.0]
+        cache = TTLCache(ttl=10, clock=lambda: now[0])
+        cache.put("a", 1)
+        now[0] += 4
+
+        assert cache.get_entry("a") == (1, 4.0)
+        assert cache.get_entry("a", max_age=3) is None
+        assert "a" in cache
+
+        now[0] += 6
+        assert cache.get("a") is None
+        assert "a" not in cache
+        assert len(cache) == 0
+
+    @pytest.mark.feature019
+    def test_rejects_non_positive_ttl(self):
+        """Test ttl must be positive."""
+        from stockagent.utils.cache import TTLCache
+
+        with pytest.raises(ValueError):
+            TTLCache(ttl=0)
+
+
+class TestAnalysisService:
+    """Test worker pool, coalescing and result reuse."""
+
+    @pytest.mark.feature019
+    def test_concurrent_requests_coalesce(self, service, fake_env):
+        """Test simultaneous requests for one ticker run the workflow once."""
+        polygon, _ = fake_env
+        polygon.latency = 0.2
+        responses = []
+        barrier = threading.Barrier(8)
+
+        def request():
+            barrier.wait()
+            responses.append(service.analyze("aapl"))
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert polygon.stats["requests"] == REQUESTS_PER_ANALYSIS
+        assert sorted(r["source"] for r in responses) == ["coalesced"] * 7 + ["new"]
+        assert len({id(r["result"]) for r in responses}) == 1
+
+    @pytest.mark.feature019
+    def test_results_reused_within_window(self, service, fake_env):
+        """Test a repeat request is served from cache unless max_age is exceeded."""
+        polygon, _ = fake_env
+
+        first = service.analyze("AAPL")
+        second = service.analyze("AAPL")
+        assert polygon.stats["requests"] == REQUESTS_PER_ANALYSIS
+
+        third = service.analyze("AAPL", max_age=0)
+
+        assert (first["source"], second["source"], third["source"]) == ("new", "cache", "new")
+        assert second["result"] is first["result"]
+        assert second["age_seconds"] >= 0
+        assert polygon.stats["requests"] == 2 * REQUESTS_PER_ANALYSIS
+
+    @pytest.mark.feature019
+    def test_zero_ttl_disables_reuse(self, fake_env):
+        """Test ttl=0 runs every request instead of falling back to the default window."""
+        from stockagent.service import AnalysisService
+
+        service = AnalysisService(max_workers=1, ttl=0)
+        try:
+            sources = [service.analyze("AAPL")["source"] for _ in range(2)]
+        finally:
+            service.close()
+
+        assert sources == ["new", "new"]
+        assert service.health()["ttl_seconds"] == 0
+
+    @pytest.mark.feature019
+    def test_failed_analyses_not_cached(self, service):
+        """Test analyses without price data are retried on the next request."""
+        first = service.analyze("NOPE")
+        second = service.analyze("NOPE")
+
+        assert first["result"]["errors"]
+        assert second["source"] == "new"
+
+    @pytest.mark.feature019
+    def test_pending_limit(self, fake_env):
+        """Test new work beyond max_pending is rejected while coalescing still works."""
+        from stockagent.service import AnalysisService, ServiceBusyError
+
+        polygon, _ = fake_env
+        polygon.latency = 0.2
+        service = AnalysisService(max_workers=1, max_pending=1)
+        try:
+            future, _ = service.submit("AAPL")
+            with pytest.raises(ServiceBusyError):
+                service.submit("MSFT")
+            assert service.submit("AAPL")[0] is future
+            future.result(10)
+            assert service.pending == 0
+        finally:
+            service.close()
+
+    @pytest.mark.feature019
+    def test_invalid_ticker(self, service):
+        """Test malformed tickers raise ValueError before any work starts."""
+        with pytest.raises(ValueError, match="Invalid ticker"):
+            service.analyze("not a ticker")
+        assert service.pending == 0
+
+
+class TestHTTPEndpoints:
+    """Test the JSON API."""
+
+    @pytest.mark.feature019
+    def test_single_analysis(self, server):
+        """Test GET /analyze/<ticker> returns the analysis."""
+        status, body = _request(f"{server.url}/analyze/aapl")
+
+        assert status == 200
+        assert body["ticker"] == "AAPL"
+        assert body["source"] == "new"
+        assert body["result"]["recommendation"] in ("BUY", "HOLD", "SELL")
+
+    @pytest.mark.feature019
+    def test_batch_analysis(self, server, fake_env):
+        """Test POST /analyze returns results in order with per-ticker errors."""
+        polygon, _ = fake_env
+
+        status, body = _request(f"{server.url}/analyze", {"tickers": ["AAPL", "bad ticker", "MSFT", "AAPL"]})
+
+        assert status == 200
+        results = body["results"]
+        assert [r["ticker"] for r in results] == ["AAPL", "bad ticker", "MSFT", "AAPL"]
+        assert "Invalid ticker" in results[1]["error"]
+        assert results[3]["source"] in ("coalesced", "cache")
+        assert polygon.stats["requests"] == 2 * REQUESTS_PER_ANALYSIS
+
+    @pytest.mark.feature019
+    def test_bad_requests(self, server):
+        """Test invalid input returns 400 and unknown paths 404."""
+        assert _request(f"{server.url}/analyze/not-valid!")[0] == 400
+        assert _request(f"{server.url}/analyze/AAPL?max_age=-1")[0] == 400
+        assert _request(f"{server.url}/analyze", {"tickers": []})[0] == 400
+        assert _request(f"{server.url}/analyze", {"symbols": ["AAPL"]})[0] == 400
+        assert _request(f"{server.url}/nope")[0] == 404
+
+    @pytest.mark.feature019
+    def test_health_and_metrics(self, server):
+        """Test /health reports the pool and /metrics exposes service counters."""
+        _request(f"{server.url}/analyze/AAPL")
+
+        status, health = _request(f"{server.url}/health")
+        with urllib.request.urlopen(f"{server.url}/metrics") as response:
+            metrics = response.read().decode()
+
+        assert status == 200
+        assert health == {"status": "ok", "workers": 4, "pending": 0, "cached": 1, "ttl_seconds": 60}
+        assert 'stockagent_service_results_total{source="new"}' in metrics
+
+
+class TestCLI:
+    """Test the command-line entry point."""
+
+    @pytest.mark.feature019
+    def test_serve_arguments(self):
+        """Test the serve subcommand parses its options."""
+        from stockagent.cli import build_parser
+
+        args = build_parser().parse_args(["serve", "--port", "9000", "--workers", "2", "--ttl", "30"])
+
+        assert (args.command, args.port, args.workers, args.ttl, args.max_pending) == ("serve", 9000, 2, 30.0, None)
+
+    @pytest.mark.feature019
+    def test_serve_invokes_service(self):
+        """Test main() starts the service with the parsed options."""
+        from unittest.mock import patch
+
+        from stockagent.cli import main
+
+        with patch("stockagent.service.serve") as mock_serve:
+            assert main(["serve", "--host", "0.0.0.0", "--max-pending", "5"]) == 0
+
+        mock_serve.assert_called_once_with("0.0.0.0", 8000, None, None, 5)
@@ -0,0 +1,185 @@
+"""Tests for Feature 020: Batch CLI."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+REQUESTS_PER_ANALYSIS = 3
+
+
+def _records(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestTokenBucket:
+    """Test the client-side rate limiter."""
+
+    @pytest.mark.feature020
+    def test_burst_then_paced(self):
+        """Test a full bucket allows a burst, then callers wait for refills."""
+        from stockagent.data import TokenBucket
+
+        now = [0.0]
+        waits = []
+        bucket = TokenBucket(rate=2, capacity=3, clock=lambda: now[0], sleep=waits.append)
+
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert bucket.acquire() == pytest.approx(1.0)  # Queued behind the previous waiter
+
+        now[0] = 10.0  # Refill is capped at capacity
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert waits == pytest.approx([0.5, 1.0])
+
+    @pytest.mark.feature020
+    def test_per_minute(self):
+        """Test per_minute() converts a quota to a rate and burst size."""
+        from stockagent.data import TokenBucket
+
+        bucket = TokenBucket.per_minute(5)
+
+        assert bucket.rate == pytest.approx(5 / 60)
+        assert bucket.capacity == 5
+
+    @pytest.mark.feature020
+    def test_polygon_requests_use_limiter(self, fake_env):
+        """Test every Polygon request takes a token from the installed limiter."""
+        from stockagent.data import PolygonClient, TokenBucket, set_rate_limiter
+
+        bucket = TokenBucket.per_minute(60)
+        previous = set_rate_limiter(bucket)
+        try:
+            with patch.object(bucket, "acquire", wraps=bucket.acquire) as acquire:
+                client = PolygonClient()
+                client.get_previous_close("AAPL")
+                client.get_ticker_details("AAPL")
+        finally:
+            set_rate_limiter(previous)
+
+        assert acquire.call_count == 2
+
+
+class TestInputOutput:
+    """Test ticker parsing and resume bookkeeping."""
+
+    @pytest.mark.feature020
+    def test_read_tickers(self):
+        """Test separators, comments, duplicates and invalid symbols."""
+        from stockagent.cli import read_tickers
+
+        lines = ["aapl, msft\n", "# watchlist\n", "GOOG msft  bad!! # trailing comment\n", "\n"]
+
+        assert list(read_tickers(lines)) == ["AAPL", "MSFT", "GOOG"]
+
+    @pytest.mark.feature020
+    def test_read_completed_truncates_partial_line(self, tmp_path):
+        """Test failed tickers and a truncated last line are not counted as done."""
+        from stockagent.cli import read_completed
+
+        path = tmp_path / "out.jsonl"
+        path.write_text(
+            '{"ticker": "AAPL", "status": "ok"}\n'
+            '{"ticker": "NOPE", "status": "failed"}\n'
+            '{"ticker": "MSFT", "sta'
+        )
+
+        assert read_completed(path) == {"AAPL"}
+        assert path.read_text().endswith('"failed"}\n')
+        assert read_completed(tmp_path / "missing.jsonl") == set()
+
+    @pytest.mark.feature020
+    def test_batch_consumes_input_lazily(self, fake_env):
+        """Test run_batch_analysis keeps at most 2 * max_workers tickers in flight."""
+        from stockagent.graph import run_batch_analysis
+
+        consumed = []
+
+        def tickers():
+            for i in range(20):
+                consumed.append(i)
+                yield f"T{i}"
+
+        results = run_batch_analysis(tickers(), max_workers=2)
+        next(results)
+        assert len(consumed) <= 5
+
+        assert len(list(results)) == 19
+
+
+class TestBatchCommand:
+    """Test `stockagent batch` end to end."""
+
+    @pytest.mark.feature020
+    def test_writes_one_line_per_ticker(self, fake_env, tmp_path):
+        """Test each ticker is written as a JSON line with its status."""
+        from stockagent.cli import main
+
+        tickers = tmp_path / "tickers.txt"
+        tickers.write_text("AAPL\nMSFT\nNOPE\n")
+        output = tmp_path / "out.jsonl"
+
+        status = main(["batch", str(tickers), "-o", str(output), "--calls-per-minute", "0"])
+
+        records = {r["ticker"]: r for r in _records(output)}
+        assert status == 1  # NOPE failed
+        assert set(records) == {"AAPL", "MSFT", "NOPE"}
+        assert records["AAPL"]["status"] == "ok"
+        assert records["AAPL"]["recommendation"] in ("BUY", "HOLD", "SELL")
+        assert "price_data" not in records["AAPL"]
+        assert records["NOPE"]["status"] == "failed"
+
+    @pytest.mark.feature020
+    def test_resume_skips_completed(self, fake_env, tmp_path):
+        """Test --resume appends only tickers missing from the output."""
+        from stockagent.cli import main
+
+        polygon, _ = fake_env
+        tickers = tmp_path / "tickers.txt"
+        tickers.write_text("AAPL MSFT")
+        output = tmp_path / "out.jsonl"
+        output.write_text('{"ticker": "AAPL", "status": "ok"}\n{"ticker": "MS')
+
+        status = main(["batch", str(tickers), "-o", str(output), "--resume", "--calls-per-minute", "0"])
+
+        assert status == 0
+        assert [r["ticker"] for r in _records(output)] == ["AAPL", "MSFT"]
+        assert polygon.stats["requests"] == REQUESTS_PER_ANALYSIS
+
+    @pytest.mark.feature020
+    def test_stdin_to_stdout_full(self, fake_env, monkeypatch, capsys):
+        """Test tickers from stdin stream to stdout, with --full state."""
+        from stockagent.cli import main
+
+        monkeypatch.setattr("sys.stdin", io.StringIO("aapl\n"))
+
+        assert main(["batch", "--full", "--calls-per-minute", "0"]) == 0
+
+        (record,) = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert record["ticker"] == "AAPL"
+        assert len(record["price_data"]) > 0
+
+    @pytest.mark.feature020
+    def test_rate_limiter_installed_for_run(self, fake_env, tmp_path):
+        """Test the batch run rate-limits Polygon calls and restores the limiter."""
+        from stockagent.cli import main
+        from stockagent.data import TokenBucket, get_rate_limiter
+
+        tickers = tmp_path / "tickers.txt"
+        tickers.write_text("AAPL MSFT")
+
+        with patch.object(TokenBucket, "acquire", return_value=0.0) as acquire:
+            main(["batch", str(tickers), "-o", str(tmp_path / "out.jsonl"), "--calls-per-minute", "600"])
+
+        assert acquire.call_count == 2 * REQUESTS_PER_ANALYSIS
+        assert get_rate_limiter() is None
+
+    @pytest.mark.feature020
+    def test_resume_requires_output(self, capsys):
+        """Test --resume without --output is a usage error."""
+        from stockagent.cli import main
+
+        with pytest.raises(SystemExit):
+            main(["batch", "--resume"])
+        assert "--resume requires --output" in capsys.readouterr().err
@@ -0,0 +1,124 @@
+"""Tests for Feature 021: Checkpointed Batch Runs."""
+
+import pytest
+
+REQUESTS_PER_ANALYSIS = 3
+
+
+@pytest.fixture
+def checkpointer(tmp_path):
+    """SQLite checkpointer in a temporary directory."""
+    from stockagent.graph import sqlite_checkpointer
+
+    with sqlite_checkpointer(tmp_path / "checkpoints.sqlite") as saver:
+        yield saver
+
+
+def _crash_in(node_name: str):
+    """Node wrapper that makes one node raise, simulating a crash."""
+
+    def wrapper(name, node):
+        if name != node_name:
+            return node
+
+        def crash(state):
+            raise RuntimeError("simulated crash")
+
+        return crash
+
+    return wrapper
+
+
+class TestResume:
+    """Test run_analysis with a checkpointed workflow."""
+
+    @pytest.mark.feature021
+    def test_resumes_at_incomplete_node(self, fake_env, checkpointer):
+        """Test a restarted analysis does not repeat completed nodes."""
+        from stockagent.graph import create_workflow, run_analysis
+
+        polygon, news = fake_env
+        crashing = create_workflow(_crash_in("news_sentiment"), checkpointer=checkpointer)
+        with pytest.raises(RuntimeError, match="simulated crash"):
+            run_analysis("AAPL", crashing, run_id="scan")
+        assert polygon.stats["requests"] == REQUESTS_PER_ANALYSIS
+
+        result = run_analysis("AAPL", create_workflow(checkpointer=checkpointer), run_id="scan")
+
+        assert polygon.stats["requests"] == REQUESTS_PER_ANALYSIS  # Data was not fetched again
+        assert news.stats["requests"] == 1
+        assert result["recommendation"] in ("BUY", "HOLD", "SELL")
+        assert result["price_data"]
+        assert {"fetch_data", "news_sentiment", "synthesize"} <= set(result["timings"])
+
+    @pytest.mark.feature021
+    def test_completed_ticker_returned_from_checkpoint(self, fake_env, checkpointer):
+        """Test a finished ticker is not analyzed again in the same run."""
+        from stockagent.graph import create_workflow, run_analysis
+
+        polygon, _ = fake_env
+        workflow = create_workflow(checkpointer=checkpointer)
+
+        first = run_analysis("AAPL", workflow, run_id="scan")
+        second = run_analysis("AAPL", workflow, run_id="scan")
+        other_run = run_analysis("AAPL", workflow, run_id="next-scan")
+
+        assert second["synthesis"] == first["synthesis"]
+        assert other_run["synthesis"] == first["synthesis"]
+        assert polygon.stats["requests"] == 2 * REQUESTS_PER_ANALYSIS
+
+    @pytest.mark.feature021
+    def test_failed_ticker_retried(self, fake_env, checkpointer):
+        """Test a ticker that finished without data starts over on restart."""
+        from stockagent.graph import create_workflow, run_analysis
+
+        polygon, _ = fake_env
+        workflow = create_workflow(checkpointer=checkpointer)
+
+        first = run_analysis("NOPE", workflow, run_id="scan")
+        requests = polygon.stats["requests"]
+        second = run_analysis("NOPE", workflow, run_id="scan")
+
+        assert polygon.stats["requests"] == 2 * requests
+        assert second["errors"] == first["errors"]  # Not accumulated across attempts
+
+    @pytest.mark.feature021
+    def test_run_id_requires_checkpointer(self):
+        """Test run_id with an in-memory workflow is rejected."""
+        from stockagent.graph import create_workflow, run_analysis
+
+        with pytest.raises(ValueError, match="checkpointer"):
+            run_analysis("AAPL", create_workflow(), run_id="scan")
+
+
+class TestBatchCheckpoint:
+    """Test `stockagent batch --checkpoint`."""
+
+    @pytest.mark.feature021
+    def test_restart_skips_checkpointed_tickers(self, fake_env, tmp_path):
+        """Test a rerun with the same run id makes no API calls."""
+        from stockagent.cli import main
+
+        polygon, _ = fake_env
+        tickers = tmp_path / "tickers.txt"
+        tickers.write_text("AAPL MSFT")
+        output = tmp_path / "scan.jsonl"
+        args = ["batch", str(tickers), "-o", str(output), "--checkpoint", str(tmp_path / "ck.sqlite")]
+        args += ["--calls-per-minute", "0"]
+
+        assert main(args) == 0
+        first = sorted(output.read_text().splitlines())
+        output.unlink()  # e.g. output lost in a crash; checkpoints survive
+        assert main(args) == 0
+
+        assert sorted(output.read_text().splitlines()) == first
+        assert polygon.stats["requests"] == 2 * REQUESTS_PER_ANALYSIS
+
+    @pytest.mark.feature021
+    def test_checkpoint_needs_run_id(self, capsys):
+        """Test --checkpoint without --run-id or --output is a usage error."""
+        from stockagent.cli import main
+
+        with pytest.raises(SystemExit):
+            main(["batch", "--checkpoint", "ck.sqlite"])
+        assert "--checkpoint requires --run-id or --output" in capsys.readouterr().err
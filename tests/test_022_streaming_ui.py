@@ -0,0 +1,135 @@
+"""Tests for Feature 022: Streaming UI."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+class _SessionState(dict):
+    """Dict with attribute access, like st.session_state."""
+
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+
+def _mock_streamlit(mock_st):
+    """Configure a patched st module for rendering whole pages."""
+    mock_st.session_state = _SessionState()
+    mock_st.columns.side_effect = lambda spec: [
+        MagicMock() for _ in range(spec if isinstance(spec, int) else len(spec))
+    ]
+    mock_st.tabs.side_effect = lambda labels: [MagicMock() for _ in labels]
+
+
+class TestStreamingWorkflow:
+    """Test run_analysis with an on_node callback."""
+
+    @pytest.mark.feature022
+    def test_nodes_reported_as_they_finish(self, fake_env):
+        """Test each node is reported once, with its outputs already in the state."""
+        from stockagent.graph import NODE_NAMES, run_analysis
+
+        seen = []
+
+        def on_node(node, state):
+            seen.append(node)
+            if node == "fetch_data":
+                assert state["price_data"]
+                assert not state["technical_signals"]
+            elif node == "technical_analysis":
+                assert state["technical_signals"]
+            elif node == "news_sentiment":
+                assert state["news_sentiment"]["headlines"]
+            elif node == "recommend":
+                assert state["recommendation"] in ("BUY", "HOLD", "SELL")
+
+        run_analysis("AAPL", on_node=on_node)
+
+        assert sorted(seen) == sorted(NODE_NAMES)
+        assert seen[0] == "fetch_data"
+        assert seen[-2:] == ["recommend", "synthesize"]
+
+    @pytest.mark.feature022
+    def test_streamed_result_matches_invoke(self, fake_env):
+        """Test the accumulated state equals the non-streaming result."""
+        from stockagent.graph import run_analysis
+
+        streamed = run_analysis("AAPL", on_node=lambda node, state: None)
+        invoked = run_analysis("AAPL")
+
+        for key in ("ticker", "current_price", "technical_signals", "recommendation", "confidence", "synthesis"):
+            assert streamed[key] == invoked[key]
+        assert streamed["errors"] == invoked["errors"]
+        assert set(streamed["timings"]) == set(invoked["timings"])
+
+    @pytest.mark.feature022
+    def test_errors_accumulate(self, fake_env):
+        """Test errors from several nodes are merged rather than replaced."""
+        from stockagent.graph import run_analysis
+
+        result = run_analysis("NOPE", on_node=lambda node, state: None)
+
+        assert result["price_data"] == []
+        assert len(result["errors"]) >= 2
+
+
+class TestPendingRendering:
+    """Test render functions with pending nodes."""
+
+    @pytest.mark.feature022
+    def test_pending_metrics_shown_in_progress(self):
+        """Test metrics for unfinished nodes are placeholders."""
+        from stockagent.ui.app import render_metrics
+
+        result = {"ticker": "AAPL", "current_price": 150.0, "previous_close": 148.0}
+
+        with patch("stockagent.ui.app.st") as mock_st:
+            mock_st.columns.return_value = [MagicMock() for _ in range(4)]
+            render_metrics(result, pending=["technical_analysis", "news_sentiment", "recommend", "synthesize"])
+
+        values = {c.kwargs["label"]: c.kwargs["value"] for c in mock_st.metric.call_args_list}
+        assert values["Current Price"] == "$150.00"
+        assert values["RSI (14)"] == "…"
+        assert values["News Sentiment"] == "…"
+        assert values["Recommendation"] == "…"
+
+    @pytest.mark.feature022
+    def test_pending_tabs_show_waiting_messages(self):
+        """Test tabs for unfinished nodes say what is still running."""
+        from stockagent.ui.app import render_tabs
+
+        with patch("stockagent.ui.app.st") as mock_st:
+            _mock_streamlit(mock_st)
+            render_tabs({"technical_signals": {"rsi": 55.0}}, pending=["news_sentiment", "synthesize"])
+
+        messages = [c.args[0] for c in mock_st.info.call_args_list]
+        assert messages == ["Generating report...", "Fetching headlines..."]
+        mock_st.json.assert_called_once_with({"rsi": 55.0})
+
+
+class TestStreamingMain:
+    """Test main() redraws results while the analysis runs."""
+
+    @pytest.mark.feature022
+    def test_results_redrawn_per_node(self, fake_env):
+        """Test the results placeholder is redrawn for every node and once at the end."""
+        from stockagent.graph import NODE_NAMES
+        from stockagent.ui import app
+
+        app.get_result_cache.clear()
+        with (
+            patch("stockagent.ui.app.st") as mock_st,
+            patch("stockagent.ui.app.ensure_metrics_server"),
+            patch("stockagent.ui.app.render_ticker_input", return_value="AAPL"),
+            patch("stockagent.ui.app.render_results", wraps=app.render_results) as render_results,
+        ):
+            _mock_streamlit(mock_st)
+            mock_st.button.return_value = True
+            app.main()
+
+        pending = [c.args[2] if len(c.args) > 2 else () for c in render_results.call_args_list]
+        assert len(pending) == len(NODE_NAMES) + 1
+        assert list(pending[0]) == list(NODE_NAMES[1:])
+        assert list(pending[-2]) == [] and list(pending[-1]) == []
+        assert mock_st.session_state.analysis_result["recommendation"] in ("BUY", "HOLD", "SELL")
+        mock_st.error.assert_not_called()
@@ -0,0 +1,141 @@
+"""Tests for Feature 023: UI Result Cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+REQUESTS_PER_ANALYSIS = 3
+
+
+class _SessionState(dict):
+    """Dict with attribute access, like st.session_state."""
+
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+
+@pytest.fixture(autouse=True)
+def empty_result_cache(fake_env):
+    """Start every test with a new shared result cache (after fake_env sets the environment)."""
+    from stockagent.ui.app import get_result_cache
+
+    get_result_cache.clear()
+    yield
+    get_result_cache.clear()
+
+
+def _run_main(session_state: dict, pressed: str) -> MagicMock:
+    """Run main() with a patched st where only the button labelled ``pressed`` is clicked."""
+    from stockagent.ui import app
+
+    with (
+        patch("stockagent.ui.app.st") as mock_st,
+        patch("stockagent.ui.app.ensure_metrics_server"),
+        patch("stockagent.ui.app.render_ticker_input", return_value="AAPL"),
+    ):
+        mock_st.session_state = session_state
+        mock_st.columns.side_effect = lambda spec: [
+            MagicMock() for _ in range(spec if isinstance(spec, int) else len(spec))
+        ]
+        mock_st.tabs.side_effect = lambda labels: [MagicMock() for _ in labels]
+        mock_st.button.side_effect = lambda label, **kwargs: pressed in label
+        app.main()
+    return mock_st
+
+
+class TestGetAnalysis:
+    """Test the shared analysis cache."""
+
+    @pytest.mark.feature023
+    def test_repeat_served_from_cache(self, fake_env):
+        """Test a second request for a ticker makes no API calls."""
+        from stockagent.ui.app import get_analysis
+
+        polygon, news = fake_env
+        first, first_at = get_analysis("AAPL")
+        second, second_at = get_analysis("AAPL")
+
+        assert second is first
+        assert second_at == first_at
+        assert polygon.stats["requests"] == REQUESTS_PER_ANALYSIS
+        assert news.stats["requests"] == 1
+
+    @pytest.mark.feature023
+    def test_refresh_runs_again(self, fake_env):
+        """Test refresh=True ignores and replaces the cached analysis."""
+        from stockagent.ui.app import get_analysis
+
+        polygon, _ = fake_env
+        first, _ = get_analysis("AAPL")
+        refreshed, _ = get_analysis("AAPL", refresh=True)
+
+        assert refreshed is not first
+        assert polygon.stats["requests"] == 2 * REQUESTS_PER_ANALYSIS
+        assert get_analysis("AAPL")[0] is refreshed
+
+    @pytest.mark.feature023
+    def test_failed_analysis_not_cached(self, fake_env):
+        """Test analyses without price data are retried."""
+        from stockagent.ui.app import get_analysis
+
+        polygon, _ = fake_env
+        get_analysis("NOPE")
+        requests = polygon.stats["requests"]
+        get_analysis("NOPE")
+
+        assert polygon.stats["requests"] == 2 * requests
+
+    @pytest.mark.feature023
+    def test_streaming_callback_only_on_miss(self, fake_env):
+        """Test cached results are returned without node callbacks."""
+        from stockagent.ui.app import get_analysis
+
+        nodes = []
+        get_analysis("AAPL", on_node=lambda node, state: nodes.append(node))
+        count = len(nodes)
+        get_analysis("AAPL", on_node=lambda node, state: nodes.append(node))
+
+        assert count == 5
+        assert len(nodes) == count
+
+
+class TestFormatAsOf:
+    """Test the freshness caption."""
+
+    @pytest.mark.feature023
+    @pytest.mark.parametrize(
+        "age, expected", [(5, "just now"), (150, "2 min ago"), (7300, "2 h ago")]
+    )
+    def test_relative_age(self, age, expected):
+        """Test the caption includes a human-readable age."""
+        from stockagent.ui.app import format_as_of
+
+        assert format_as_of(1_700_000_000.0, now=1_700_000_000.0 + age).endswith(f"({expected})")
+        assert format_as_of(1_700_000_000.0).startswith("Data as of ")
+
+
+class TestMainCache:
+    """Test main() uses the cache across sessions and shows freshness."""
+
+    @pytest.mark.feature023
+    def test_second_session_served_from_cache(self, fake_env):
+        """Test another session analyzing the same ticker makes no API calls."""
+        polygon, _ = fake_env
+
+        first = _run_main(_SessionState(), "Run Analysis")
+        second = _run_main(_SessionState(), "Run Analysis")
+
+        assert polygon.stats["requests"] == REQUESTS_PER_ANALYSIS
+        assert first.session_state.analyzed_at == second.session_state.analyzed_at
+        captions = [c.args[0] for c in second.caption.call_args_list]
+        assert any(caption.startswith("Data as of") for caption in captions)
+
+    @pytest.mark.feature023
+    def test_refresh_button_fetches_new_data(self, fake_env):
+        """Test the refresh button bypasses the cache."""
+        polygon, _ = fake_env
+
+        _run_main(_SessionState(), "Run Analysis")
+        _run_main(_SessionState(), "Refresh")
+
+        assert polygon.stats["requests"] == 2 * REQUESTS_PER_ANALYSIS
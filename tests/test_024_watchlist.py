@@ -0,0 +1,202 @@
+"""Tests for Feature 024: Watchlist Dashboard."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+REQUESTS_PER_ANALYSIS = 3
+
+
+def _wait_for(condition, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class TestWatchlistRow:
+    """Test table row construction."""
+
+    @pytest.mark.feature024
+    def test_row_from_result(self):
+        """Test a completed analysis fills every column."""
+        from stockagent.ui.watchlist import watchlist_row
+
+        result = {
+            "ticker": "AAPL",
+            "company_name": "Apple Inc.",
+            "current_price": 110.0,
+            "previous_close": 100.0,
+            "recommendation": "BUY",
+            "confidence": 72.0,
+            "score": 44.0,
+            "technical_signals": {"rsi": 61.5, "macd_interpretation": "bullish"},
+            "news_sentiment": {"overall_score": 0.3},
+        }
+
+        row = watchlist_row("AAPL", result, "ok", 1_700_000_000.0)
+
+        assert row["Change %"] == pytest.approx(10.0)
+        assert (row["Recommendation"], row["Confidence"], row["Score"]) == ("BUY", 72.0, 44.0)
+        assert (row["RSI"], row["MACD"], row["Sentiment"]) == (61.5, "bullish", 0.3)
+        assert row["Updated"] is not None
+
+    @pytest.mark.feature024
+    def test_pending_row_is_empty(self):
+        """Test a ticker without a result has only its symbol and status."""
+        from stockagent.ui.watchlist import watchlist_row
+
+        row = watchlist_row("MSFT", None, "pending", None)
+
+        assert row["Ticker"] == "MSFT"
+        assert row["Status"] == "pending"
+        assert all(value is None for key, value in row.items() if key not in ("Ticker", "Status"))
+
+
+class TestWatchlistRefresher:
+    """Test the background refresher."""
+
+    @pytest.mark.feature024
+    def test_cycle_fills_rows_in_watchlist_order(self, fake_env):
+        """Test one cycle analyzes every ticker through the batch path."""
+        from stockagent.ui.watchlist import WatchlistRefresher
+
+        polygon, _ = fake_env
+        refresher = WatchlistRefresher(["msft", "AAPL", "NOPE"], interval=60, max_workers=2)
+        assert [row["Status"] for row in refresher.snapshot()] == ["pending"] * 3
+
+        assert refresher.run_cycle() == 3
+
+        rows = refresher.snapshot()
+        assert [row["Ticker"] for row in rows] == ["MSFT", "AAPL", "NOPE"]
+        assert rows[0]["Status"] in ("ok", "partial")
+        assert rows[0]["Recommendation"] in ("BUY", "HOLD", "SELL")
+        assert rows[0]["Score"] is not None
+        assert rows[2]["Status"] == "failed"
+        assert polygon.stats["requests"] >= 2 * REQUESTS_PER_ANALYSIS
+
+    @pytest.mark.feature024
+    def test_failed_refresh_keeps_previous_result(self, fake_env):
+        """Test a ticker that fails to refresh keeps its last good row, marked stale."""
+        from stockagent.ui.watchlist import WatchlistRefresher
+
+        polygon, _ = fake_env
+        refresher = WatchlistRefresher(["AAPL"], interval=60)
+        refresher.run_cycle()
+        before = refresher.snapshot()[0]
+
+        polygon.unknown_tickers.add("AAPL")
+        refresher.run_cycle()
+        after = refresher.snapshot()[0]
+
+        assert after["Status"] == "stale"
+        assert after["Price"] == before["Price"]
+        assert after["Updated"] == before["Updated"]
+
+    @pytest.mark.feature024
+    def test_set_tickers_keeps_existing_results(self, fake_env):
+        """Test editing the watchlist drops removed tickers and adds pending rows."""
+        from stockagent.ui.watchlist import WatchlistRefresher
+
+        refresher = WatchlistRefresher(["AAPL", "MSFT"], interval=60)
+        refresher.run_cycle()
+
+        refresher.set_tickers(["AAPL TSLA"])
+
+        rows = {row["Ticker"]: row["Status"] for row in refresher.snapshot()}
+        assert rows["AAPL"] in ("ok", "partial")
+        assert rows["TSLA"] == "pending"
+        assert "MSFT" not in rows
+
+    @pytest.mark.feature024
+    def test_background_thread_publishes_and_refreshes(self, fake_env):
+        """Test the thread fills the table and refresh() starts another cycle early."""
+        from stockagent.ui.watchlist import WatchlistRefresher
+
+        polygon, _ = fake_env
+        refresher = WatchlistRefresher(["AAPL", "MSFT"], interval=60).start()
+        try:
+            _wait_for(lambda: refresher.cycles == 1)
+            assert all(row["Status"] != "pending" for row in refresher.snapshot())
+
+            refresher.refresh()
+            _wait_for(lambda: refresher.cycles == 2)
+            assert polygon.stats["requests"] == 4 * REQUESTS_PER_ANALYSIS
+        finally:
+            refresher.stop(timeout=10)
+
+
+    @pytest.mark.feature024
+    def test_zero_interval_refreshes_on_request(self, fake_env):
+        """Test an interval of 0 runs no periodic cycles, only requested ones."""
+        from stockagent.ui.watchlist import WatchlistRefresher, render_table
+
+        refresher = WatchlistRefresher(["AAPL"], interval=0).start()
+        try:
+            _wait_for(lambda: refresher.cycles == 1)
+            time.sleep(0.2)
+            assert refresher.cycles == 1
+
+            refresher.refresh()
+            _wait_for(lambda: refresher.cycles == 2)
+            with patch("stockagent.ui.watchlist.st") as mock_st:
+                render_table(refresher)
+            assert mock_st.caption.call_args.args[0].endswith("refreshed on request")
+        finally:
+            refresher.stop(timeout=10)
+
+
+class TestWatchlistPage:
+    """Test rendering with mocked Streamlit."""
+
+    @pytest.mark.feature024
+    def test_table_renders_snapshot(self, fake_env):
+        """Test the table shows every row and progress."""
+        from stockagent.ui.watchlist import WatchlistRefresher, render_table
+
+        refresher = WatchlistRefresher(["AAPL", "MSFT"], interval=60)
+        refresher.run_cycle()
+
+        with patch("stockagent.ui.watchlist.st") as mock_st:
+            render_table(refresher)
+
+        rows = mock_st.dataframe.call_args.args[0]
+        assert [row["Ticker"] for row in rows] == ["AAPL", "MSFT"]
+        assert mock_st.caption.call_args.args[0].startswith("2/2 tickers analyzed")
+
+    @pytest.mark.feature024
+    def test_save_watchlist(self, fake_env):
+        """Test the editor replaces the refresher's tickers."""
+        from stockagent.ui.watchlist import WatchlistRefresher, render_controls
+
+        refresher = WatchlistRefresher(["AAPL"], interval=60)
+
+        with patch("stockagent.ui.watchlist.st") as mock_st:
+            mock_st.text_area.return_value = "aapl, nvda\nAMD"
+            mock_st.button.side_effect = lambda label, **kwargs: label == "Save Watchlist"
+            mock_st.expander.return_value = MagicMock()
+            render_controls(refresher)
+
+        assert refresher.tickers == ["AAPL", "NVDA", "AMD"]
+
+    @pytest.mark.feature024
+    def test_pages_share_rate_limiter(self, monkeypatch):
+        """Test the limiter is installed once at page start-up, not by opening the watchlist."""
+        from stockagent.data import ensure_rate_limiter
+
+        monkeypatch.setenv("STOCKAGENT_POLYGON_CALLS_PER_MINUTE", "5")
+
+        limiter = ensure_rate_limiter()
+
+        assert limiter is not None and limiter.rate == pytest.approx(5 / 60)
+        assert ensure_rate_limiter() is limiter
+
+    @pytest.mark.feature024
+    def test_zero_quota_installs_no_limiter(self, monkeypatch):
+        """Test a quota of 0 leaves Polygon requests unlimited."""
+        from stockagent.data import ensure_rate_limiter
+
+        monkeypatch.setenv("STOCKAGENT_POLYGON_CALLS_PER_MINUTE", "0")
+
+        assert ensure_rate_limiter() is None
@@ -0,0 +1,161 @@
+"""Tests for Feature 025: Retry Policy."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+
+@pytest.fixture
+def sleeps():
+    """Install a retry policy that records delays instead of sleeping (no jitter)."""
+    from stockagent.data import RetryPolicy, set_retry_policy
+
+    recorded: list[float] = []
+    previous = set_retry_policy(RetryPolicy(sleep=recorded.append, random=lambda: 0.0))
+    yield recorded
+    set_retry_policy(previous)
+
+
+def _client(server):
+    from stockagent.data import PolygonClient
+
+    return PolygonClient(api_key="test", base_url=server.url)
+
+
+class TestBackoff:
+    """Test delay calculation."""
+
+    @pytest.mark.feature025
+    def test_exponential_with_cap(self):
+        """Test delays double per retry up to max_delay."""
+        from stockagent.data import Backoff
+
+        backoff = Backoff(max_attempts=10, base_delay=0.5, max_delay=3.0)
+
+        assert [backoff.delay(n, 0.0) for n in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    @pytest.mark.feature025
+    def test_jitter_reduces_delay(self):
+        """Test jitter removes up to its fraction of the delay."""
+        from stockagent.data import Backoff
+
+        assert Backoff(3, 4.0, 60.0, jitter=1.0).delay(1, 0.75) == pytest.approx(1.0)
+        assert Backoff(3, 4.0, 60.0, jitter=0.5).delay(1, 0.999) == pytest.approx(2.002)
+
+    @pytest.mark.feature025
+    def test_policy_gives_up(self):
+        """Test delay() returns None once attempts are exhausted or Retry-After is too long."""
+        from stockagent.data import RetryPolicy
+
+        policy = RetryPolicy.with_retries(2, random=lambda: 0.0)
+
+        assert policy.delay("server_error", 1) is not None
+        assert policy.delay("server_error", 2) is not None
+        assert policy.delay("server_error", 3) is None
+        assert policy.delay("rate_limited", 1, retry_after=12.0) == 12.0
+        assert policy.delay("rate_limited", 1, retry_after=600.0) is None
+
+    @pytest.mark.feature025
+    def test_parse_retry_after(self):
+        """Test Retry-After in seconds and HTTP-date forms."""
+        from stockagent.data.retry import parse_retry_after
+
+        now = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after("Tue, 02 Jan 2024 03:04:35 GMT", now=now) == 30.0
+        assert parse_retry_after("Tue, 02 Jan 2024 03:00:00 GMT", now=now) == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestClientRetries:
+    """Test PolygonClient against a faulty local server."""
+
+    @pytest.mark.feature025
+    def test_recovers_from_intermittent_throttling(self, sleeps):
+        """Test requests succeed when some attempts are rate limited."""
+        from stockagent.testing import FakePolygonServer
+        from stockagent.utils.metrics import POLYGON_RETRIES
+
+        retries = POLYGON_RETRIES.labels("aggregates", "rate_limited")
+        before = retries.value
+        with FakePolygonServer(rate_limit_rate=0.5, seed=3) as server:
+            client = _client(server)
+            for _ in range(5):
+                assert client.get_stock_aggregates("AAPL", days=30)
+            stats = server.stats
+
+        assert stats["rate_limited"] > 0
+        assert stats["ok"] == 5
+        assert retries.value - before == stats["rate_limited"]
+        assert len(sleeps) == stats["rate_limited"]
+
+    @pytest.mark.feature025
+    def test_honors_retry_after(self, sleeps):
+        """Test 429 retries wait for Retry-After, then raise RateLimitError carrying it."""
+        from stockagent.data import RateLimitError
+        from stockagent.testing import FakePolygonServer
+
+        with FakePolygonServer(rate_limit_rate=1.0, retry_after=7) as server:
+            with pytest.raises(RateLimitError) as excinfo:
+                _client(server).get_previous_close("AAPL")
+            requests = server.stats["requests"]
+
+        assert requests == 5
+        assert sleeps == [7.0] * 4
+        assert excinfo.value.retry_after == 7.0
+
+    @pytest.mark.feature025
+    def test_server_errors_use_their_own_backoff(self, sleeps):
+        """Test 5xx responses are retried with exponential backoff, then reported."""
+        from stockagent.data import PolygonAPIError, RateLimitError
+        from stockagent.testing import FakePolygonServer
+
+        with FakePolygonServer(error_rate=1.0) as server:
+            with pytest.raises(PolygonAPIError) as excinfo:
+                _client(server).get_ticker_details("AAPL")
+            requests = server.stats["requests"]
+
+        assert not isinstance(excinfo.value, RateLimitError)
+        assert requests == 3
+        assert sleeps == [0.5, 1.0]
+
+    @pytest.mark.feature025
+    def test_not_found_is_not_retried(self, sleeps):
+        """Test 404 fails immediately."""
+        from stockagent.data import TickerNotFoundError
+        from stockagent.testing import FakePolygonServer
+
+        with FakePolygonServer(unknown_tickers={"NOPE"}) as server:
+            with pytest.raises(TickerNotFoundError):
+                _client(server).get_previous_close("NOPE")
+            requests = server.stats["requests"]
+
+        assert requests == 1
+        assert sleeps == []
+
+    @pytest.mark.feature025
+    def test_connection_errors_retried_then_wrapped(self, sleeps):
+        """Test an unreachable server raises PolygonAPIError, not a urllib3 exception."""
+        from stockagent.data import PolygonAPIError
+        from stockagent.testing import FakePolygonServer
+
+        server = FakePolygonServer()
+        server.stop()  # Port is released; connections are refused
+
+        with pytest.raises(PolygonAPIError, match="after 3 attempts"):
+            _client(server).get_previous_close("AAPL")
+        assert sleeps == [0.5, 1.0]
+
+    @pytest.mark.feature025
+    def test_batch_completes_under_throttling(self, fake_env, sleeps):
+        """Test every analysis gets full data when a third of requests are throttled."""
+        from stockagent.graph import run_batch_analysis
+
+        polygon, _ = fake_env
+        polygon.rate_limit_rate = 0.3
+
+        results = list(run_batch_analysis(["AAPL", "MSFT", "GOOGL", "TSLA", "AMD"], max_workers=3))
+
+        assert polygon.stats["rate_limited"] > 0
+        assert all(result["price_data"] and not result["errors"] for result in results)
@@ -0,0 +1,211 @@
+"""Tests for Feature 026: Adaptive Concurrency."""
+
+import threading
+
+import pytest
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _complete(limiter, count: int, status: str = "ok", latency: float = 0.01):
+    """Run ``count`` requests through the limiter with every slot in use."""
+    for _ in range(count):
+        holders = limiter.limit
+        for _ in range(holders):
+            limiter.acquire()
+        for _ in range(holders):
+            limiter.release(status, latency)
+
+
+class TestAdaptiveLimiter:
+    """Test the AIMD rules."""
+
+    @pytest.mark.feature026
+    def test_additive_increase_when_saturated(self):
+        """Test the limit grows by about one per round of full-limit requests."""
+        from stockagent.data import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=4)
+        _complete(limiter, 2)
+        assert limiter.limit == 3
+        _complete(limiter, 2)
+        assert limiter.limit == 4
+        _complete(limiter, 5)
+        assert limiter.limit == 4
+
+    @pytest.mark.feature026
+    def test_no_increase_when_not_saturated(self):
+        """Test sequential requests do not inflate the limit."""
+        from stockagent.data import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter(initial_limit=4, max_limit=8)
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release("ok", 0.01)
+
+        assert limiter.limit == 4
+
+    @pytest.mark.feature026
+    def test_multiplicative_decrease_on_throttle(self):
+        """Test a 429 halves the limit, once per cooldown, down to min_limit."""
+        from stockagent.data import AdaptiveLimiter
+
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial_limit=8, max_limit=16, cooldown=1.0, clock=clock)
+
+        for _ in range(3):
+            limiter.acquire()
+        for _ in range(3):
+            limiter.release("rate_limited", 0.01)
+        assert limiter.limit == 4
+
+        for _ in range(3):
+            clock.now += 1.0
+            limiter.acquire()
+            limiter.release("rate_limited", 0.01)
+        assert limiter.limit == 1
+
+    @pytest.mark.feature026
+    def test_errors_leave_limit_unchanged(self):
+        """Test server errors are neither success nor throttling."""
+        from stockagent.data import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=4)
+        _complete(limiter, 3, status="error")
+
+        assert limiter.limit == 2
+
+    @pytest.mark.feature026
+    def test_decrease_on_rising_latency(self):
+        """Test a sustained latency increase backs off like a 429."""
+        from stockagent.data import AdaptiveLimiter
+        from stockagent.utils.metrics import POLYGON_CONCURRENCY_DECREASES
+
+        decreases = POLYGON_CONCURRENCY_DECREASES.labels("latency")
+        before = decreases.value
+        limiter = AdaptiveLimiter(initial_limit=8, max_limit=8, warmup=10)
+        for _ in range(30):
+            limiter.acquire()
+            limiter.release("ok", 0.01)
+        assert limiter.limit == 8
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release("ok", 0.2)
+
+        assert limiter.limit == 4
+        assert decreases.value - before == 1
+
+    @pytest.mark.feature026
+    def test_acquire_blocks_at_limit(self):
+        """Test a request waits until a slot is released."""
+        from stockagent.data import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+        limiter.acquire()
+        acquired = threading.Event()
+        waiter = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        waiter.start()
+
+        assert not acquired.wait(0.05)
+        limiter.release("ok", 0.01)
+        assert acquired.wait(5)
+        waiter.join()
+        assert limiter.in_flight == 1
+
+    @pytest.mark.feature026
+    def test_invalid_limits(self):
+        """Test inconsistent limits are rejected."""
+        from stockagent.data import AdaptiveLimiter
+
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(initial_limit=10, max_limit=4)
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(backoff=1.5)
+
+
+class TestProcessLimiter:
+    """Test the shared limiter used by PolygonClient."""
+
+    @pytest.mark.feature026
+    def test_default_from_settings(self, monkeypatch):
+        """Test the default limiter follows STOCKAGENT_POLYGON_MAX_CONCURRENCY."""
+        from stockagent.data import get_concurrency_limiter
+        from stockagent.utils.metrics import POLYGON_CONCURRENCY_LIMIT
+
+        monkeypatch.setenv("STOCKAGENT_POLYGON_MAX_CONCURRENCY", "6")
+        limiter = get_concurrency_limiter()
+
+        assert limiter is get_concurrency_limiter()
+        assert (limiter.limit, limiter.max_limit) == (4, 6)
+        assert POLYGON_CONCURRENCY_LIMIT.value == 4
+
+    @pytest.mark.feature026
+    def test_disabled_with_zero(self, monkeypatch):
+        """Test a maximum of 0 disables the limiter."""
+        from stockagent.data import get_concurrency_limiter
+
+        monkeypatch.setenv("STOCKAGENT_POLYGON_MAX_CONCURRENCY", "0")
+
+        assert get_concurrency_limiter() is None
+
+    @pytest.mark.feature026
+    def test_client_backs_off_on_rate_limits(self):
+        """Test 429s from the provider shrink the shared limit."""
+        from stockagent.data import (
+            AdaptiveLimiter,
+            PolygonClient,
+            RateLimitError,
+            RetryPolicy,
+            set_concurrency_limiter,
+            set_retry_policy,
+        )
+        from stockagent.testing import FakePolygonServer
+
+        limiter = AdaptiveLimiter(initial_limit=8, max_limit=8, cooldown=0.0)
+        set_concurrency_limiter(limiter)
+        previous = set_retry_policy(RetryPolicy(sleep=lambda seconds: None))
+        try:
+            with FakePolygonServer(rate_limit_rate=1.0) as server:
+                with pytest.raises(RateLimitError):
+                    PolygonClient(api_key="test", base_url=server.url).get_previous_close("AAPL")
+        finally:
+            set_retry_policy(previous)
+
+        assert limiter.limit == 1
+        assert limiter.in_flight == 0
+
+    @pytest.mark.feature026
+    def test_batch_shares_limit(self, fake_env):
+        """Test batch workers never exceed the limit and grow it while requests succeed."""
+        from stockagent.data import AdaptiveLimiter, set_concurrency_limiter
+        from stockagent.graph import run_batch_analysis
+
+        polygon, _ = fake_env
+        polygon.latency = 0.02
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=6)
+        set_concurrency_limiter(limiter)
+
+        peak = 0
+        original_acquire = limiter.acquire
+
+        def tracking_acquire():
+            nonlocal peak
+            waited = original_acquire()
+            peak = max(peak, limiter.in_flight)
+            return waited
+
+        limiter.acquire = tracking_acquire
+        results = list(run_batch_analysis([f"T{i}" for i in range(12)], max_workers=8))
+
+        assert all(result["price_data"] for result in results)
+        assert limiter.limit > 2
+        assert peak <= limiter.max_limit
@@ -0,0 +1,177 @@
+"""Tests for Feature 027: Priority Scheduler."""
+
+import threading
+import time
+
+import pytest
+
+
+def _enqueue(scheduler, granted: list, priority: str, flow: str = "") -> threading.Thread:
+    """Start a thread that takes a turn, records it and gives it back; return once it is queued."""
+    queued = scheduler.waiting() + 1
+
+    def take_turn():
+        with scheduler.turn(priority, flow):
+            granted.append((priority, flow))
+
+    thread = threading.Thread(target=take_turn)
+    thread.start()
+    while scheduler.waiting() < queued:
+        time.sleep(0.001)
+    return thread
+
+
+def _wait_count(name: str, priority: str) -> int:
+    from stockagent.utils.metrics import SCHEDULER_WAIT_SECONDS
+
+    counts, _ = SCHEDULER_WAIT_SECONDS.labels(name, priority).snapshot()
+    return counts[-1]
+
+
+class TestPriorityScheduler:
+    """Test turn ordering."""
+
+    @pytest.mark.feature027
+    def test_more_urgent_class_goes_first(self):
+        """Test waiters are served interactive, then batch, then prefetch, regardless of arrival."""
+        from stockagent.data import BATCH, INTERACTIVE, PREFETCH, PriorityScheduler
+
+        scheduler = PriorityScheduler("test")
+        granted: list = []
+        scheduler.acquire()
+        threads = [_enqueue(scheduler, granted, p) for p in (PREFETCH, BATCH, BATCH, INTERACTIVE)]
+        scheduler.release()
+        for thread in threads:
+            thread.join(5)
+
+        assert [priority for priority, _ in granted] == [INTERACTIVE, BATCH, BATCH, PREFETCH]
+
+    @pytest.mark.feature027
+    def test_round_robin_between_flows(self):
+        """Test one flow with many queued requests does not hold back another in its class."""
+        from stockagent.data import BATCH, PriorityScheduler
+
+        scheduler = PriorityScheduler("test")
+        granted: list = []
+        scheduler.acquire()
+        threads = [_enqueue(scheduler, granted, BATCH, flow) for flow in ("A", "A", "A", "B", "C")]
+        scheduler.release()
+        for thread in threads:
+            thread.join(5)
+
+        assert [flow for _, flow in granted] == ["A", "B", "C", "A", "A"]
+
+    @pytest.mark.feature027
+    def test_capacity(self):
+        """Test up to capacity turns are held at once."""
+        from stockagent.data import PriorityScheduler
+
+        scheduler = PriorityScheduler("test", capacity=2)
+        scheduler.acquire()
+        scheduler.acquire()
+        granted: list = []
+        waiter = _enqueue(scheduler, granted, "batch")
+
+        assert scheduler.active == 2 and not granted
+        scheduler.release()
+        waiter.join(5)
+        assert granted == [("batch", "")]
+        assert scheduler.active == 1
+
+    @pytest.mark.feature027
+    def test_queue_depth_and_wait_metrics(self):
+        """Test waiting requests are counted per class and their waits observed."""
+        from stockagent.data import PriorityScheduler
+        from stockagent.utils.metrics import SCHEDULER_QUEUE_DEPTH
+
+        depth = SCHEDULER_QUEUE_DEPTH.labels("metrics-test", "batch")
+        scheduler = PriorityScheduler("metrics-test")
+        scheduler.acquire("interactive")
+        threads = [_enqueue(scheduler, [], "batch") for _ in range(3)]
+
+        assert depth.value == 3
+        scheduler.release()
+        for thread in threads:
+            thread.join(5)
+        assert depth.value == 0
+        assert _wait_count("metrics-test", "batch") == 3
+        assert _wait_count("metrics-test", "interactive") == 1
+
+    @pytest.mark.feature027
+    def test_priority_from_context(self):
+        """Test request_priority() sets the class and flow, nests, and rejects unknown classes."""
+        from stockagent.data import request_priority
+        from stockagent.data.scheduler import current_priority
+
+        assert current_priority() == ("interactive", "")
+        with request_priority("batch", flow="AAPL"):
+            with request_priority(flow="MSFT"):
+                assert current_priority() == ("batch", "MSFT")
+            assert current_priority() == ("batch", "AAPL")
+        assert current_priority() == ("interactive", "")
+
+        with pytest.raises(ValueError):
+            with request_priority("urgent"):
+                pass
+
+
+class TestRequestPriorities:
+    """Test the classes assigned to analyses."""
+
+    @pytest.mark.feature027
+    def test_batch_analyses_are_batch_class(self, fake_env):
+        """Test every Polygon and news request from a batch run is scheduled as batch."""
+        from stockagent.graph import run_batch_analysis
+
+        polygon_before = _wait_count("polygon", "batch")
+        news_before = _wait_count("news", "batch")
+        results = list(run_batch_analysis(["AAPL", "MSFT"], max_workers=2))
+
+        assert all(result["price_data"] for result in results)
+        assert _wait_count("polygon", "batch") - polygon_before == 6
+        assert _wait_count("news", "batch") - news_before == 2
+
+    @pytest.mark.feature027
+    def test_watchlist_refresh_is_prefetch(self, fake_env):
+        """Test the watchlist refresher yields to other work."""
+        from stockagent.ui.watchlist import WatchlistRefresher
+
+        before = _wait_count("polygon", "prefetch")
+        WatchlistRefresher(["AAPL"], max_workers=1).run_cycle()
+
+        assert _wait_count("polygon", "prefetch") - before == 3
+
+    @pytest.mark.feature027
+    def test_interactive_overtakes_batch_scan(self, fake_env):
+        """Test a single analysis finishes quickly while a rate-limited batch is queued."""
+        from stockagent.data import TokenBucket, get_scheduler, set_rate_limiter
+        from stockagent.graph import create_workflow, run_analysis, run_batch_analysis
+
+        polygon, _ = fake_env
+        workflow = create_workflow()
+        run_analysis("MSFT", workflow)  # Warm up imports outside the timed run
+        # 10 requests per second: the 8-ticker batch needs about 2.4 seconds
+        previous = set_rate_limiter(TokenBucket(rate=10, capacity=1))
+        try:
+            batch = threading.Thread(target=lambda: list(run_batch_analysis([f"T{i}" for i in range(8)], 8, workflow)))
+            batch.start()
+            while get_scheduler("polygon").waiting("batch") < 4:
+                time.sleep(0.005)
+
+            before = polygon.stats["requests"]
+            start = time.perf_counter()
+            result = run_analysis("AAPL", workflow)
+            elapsed = time.perf_counter() - start
+            served = polygon.stats["requests"] - before
+            batch_running = batch.is_alive()
+            batch.join(30)
+        finally:
+            set_rate_limiter(previous)
+
+        assert result["price_data"]
+        assert batch_running
+        # About 0.3s for three requests at 10/s; in arrival order they would
+        # wait behind the batch's queued requests (about 2.5s)
+        assert elapsed < 1.5
+        assert served - 3 <= 6
+        assert polygon.stats["requests"] == 3 + 24 + 3
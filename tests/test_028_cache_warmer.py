@@ -0,0 +1,206 @@
+"""Tests for Feature 028: Cache Warmer."""
+
+from datetime import date, datetime, time
+
+import pytest
+
+
+class TestMarketCalendar:
+    """Test exchange holidays and session times."""
+
+    @pytest.mark.feature028
+    def test_holidays_2024(self):
+        """Test the 2024 NYSE holidays, including Good Friday and Juneteenth."""
+        from stockagent.data.calendar import market_holidays
+
+        assert sorted(market_holidays(2024)) == [
+            date(2024, 1, 1),
+            date(2024, 1, 15),
+            date(2024, 2, 19),
+            date(2024, 3, 29),
+            date(2024, 5, 27),
+            date(2024, 6, 19),
+            date(2024, 7, 4),
+            date(2024, 9, 2),
+            date(2024, 11, 28),
+            date(2024, 12, 25),
+        ]
+
+    @pytest.mark.feature028
+    def test_observed_holidays(self):
+        """Test weekend holidays move to the nearest weekday, except a Saturday New Year's Day."""
+        from stockagent.data.calendar import is_trading_day, market_holidays
+
+        assert date(2022, 12, 26) in market_holidays(2022)  # Christmas on Sunday
+        assert date(2027, 12, 24) in market_holidays(2027)  # Christmas on Saturday
+        assert is_trading_day(date(2021, 12, 31))  # New Year's Day 2022 on Saturday
+        assert date(2021, 6, 18) not in market_holidays(2021)  # Juneteenth from 2022
+
+    @pytest.mark.feature028
+    def test_trading_day_navigation(self):
+        """Test next/previous trading days skip weekends and holidays."""
+        from stockagent.data.calendar import next_trading_day, previous_trading_day
+
+        assert next_trading_day(date(2024, 3, 28)) == date(2024, 4, 1)
+        assert previous_trading_day(date(2024, 1, 2)) == date(2023, 12, 29)
+
+    @pytest.mark.feature028
+    def test_next_trading_time(self):
+        """Test the next warm-up time in exchange time, across weekends and time zones."""
+        from stockagent.data.calendar import EXCHANGE_TZ, next_trading_time
+
+        friday_early = datetime(2024, 3, 1, 7, 0, tzinfo=EXCHANGE_TZ)
+        friday_late = datetime(2024, 3, 1, 9, 0, tzinfo=EXCHANGE_TZ)
+
+        assert next_trading_time(time(8, 30), friday_early) == datetime(2024, 3, 1, 8, 30, tzinfo=EXCHANGE_TZ)
+        assert next_trading_time(time(8, 30), friday_late) == datetime(2024, 3, 4, 8, 30, tzinfo=EXCHANGE_TZ)
+        # Naive times are UTC: 12:00 UTC is 07:00 in New York in March before DST
+        assert next_trading_time(time(8, 30), datetime(2024, 3, 1, 12, 0)).day == 1
+
+
+class TestResponseCache:
+    """Test the local response cache."""
+
+    @pytest.mark.feature028
+    def test_expiry_and_persistence(self, tmp_path):
+        """Test entries expire per kind and are shared through the cache directory."""
+        from stockagent.data.response_cache import RESPONSE_FRESHNESS, ResponseCache
+
+        now = [1000.0]
+        cache = ResponseCache(path=tmp_path, clock=lambda: now[0])
+        cache.put("ticker_details", "AAPL", {"company_name": "Apple"})
+
+        other_process = ResponseCache(path=tmp_path, clock=lambda: now[0])
+        assert other_process.get("ticker_details", "AAPL") == {"company_name": "Apple"}
+        now[0] += RESPONSE_FRESHNESS["ticker_details"].ttl
+        assert other_process.get("ticker_details", "AAPL") is None
+
+    @pytest.mark.feature028
+    def test_returns_copies(self):
+        """Test callers cannot modify cached responses."""
+        from stockagent.data.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        cache.put("ticker_details", "AAPL", {"company_name": "Apple"})
+        cache.get("ticker_details", "AAPL")["company_name"] = "changed"
+
+        assert cache.get("ticker_details", "AAPL") == {"company_name": "Apple"}
+
+    @pytest.mark.feature028
+    def test_disabled_without_cache_dir(self, fake_env):
+        """Test every request is fetched when STOCKAGENT_CACHE_DIR is unset."""
+        from stockagent.data import PolygonClient
+        from stockagent.data.response_cache import get_response_cache
+
+        polygon, _ = fake_env
+        client = PolygonClient()
+        client.get_ticker_details("AAPL")
+        client.get_ticker_details("AAPL")
+
+        assert get_response_cache() is None
+        assert polygon.stats["requests"] == 2
+
+    @pytest.mark.feature028
+    def test_client_and_news_use_cache(self, fake_env, cache_dir):
+        """Test repeated analyses are served from the cache."""
+        from stockagent.graph import run_analysis
+
+        polygon, news = fake_env
+        first = run_analysis("AAPL")
+        second = run_analysis("AAPL")
+
+        assert polygon.stats["requests"] == 3
+        assert news.stats["requests"] == 1
+        assert second["price_data"] == first["price_data"]
+        assert second["news_sentiment"]["headline_count"] == first["news_sentiment"]["headline_count"]
+
+    @pytest.mark.feature028
+    def test_errors_are_not_cached(self, fake_env, cache_dir):
+        """Test a failed request is retried on the next call."""
+        from stockagent.data import PolygonClient, TickerNotFoundError
+
+        polygon, _ = fake_env
+        client = PolygonClient()
+        for _ in range(2):
+            with pytest.raises(TickerNotFoundError):
+                client.get_previous_close("NOPE")
+
+        assert polygon.stats["requests"] == 2
+
+
+class TestCacheWarmer:
+    """Test pre-fetching a watchlist."""
+
+    @pytest.mark.feature028
+    def test_requires_cache_dir(self, fake_env):
+        """Test warming without a persistent cache is rejected."""
+        from stockagent.warmer import CacheWarmer
+
+        with pytest.raises(ValueError, match="STOCKAGENT_CACHE_DIR"):
+            CacheWarmer(["AAPL"])
+
+    @pytest.mark.feature028
+    def test_first_analyses_are_cache_hits(self, fake_env, cache_dir, monkeypatch):
+        """Test analyses after a warm-up (in another process) make no API calls."""
+        from stockagent.data import response_cache
+        from stockagent.graph import run_batch_analysis
+        from stockagent.warmer import CacheWarmer
+
+        polygon, news = fake_env
+        counts = CacheWarmer(["AAPL", "MSFT", "NOPE"], calls_per_minute=0).run_once()
+        assert counts == {"ok": 2, "failed": 1}
+        warm_requests = polygon.stats["requests"], news.stats["requests"]
+
+        # As in a fresh process: the cache is read back from disk
+        monkeypatch.setattr(response_cache, "_default_cache", None)
+        monkeypatch.setattr(response_cache, "_configured", False)
+        results = list(run_batch_analysis(["AAPL", "MSFT"]))
+
+        assert all(result["price_data"] and not result["errors"] for result in results)
+        assert (polygon.stats["requests"], news.stats["requests"]) == warm_requests
+
+    @pytest.mark.feature028
+    def test_requests_are_paced_and_prefetch(self, fake_env, cache_dir, monkeypatch):
+        """Test the warm-up spreads requests over the rate budget at prefetch priority."""
+        from stockagent.data import rate_limit
+        from stockagent.utils.metrics import SCHEDULER_WAIT_SECONDS
+        from stockagent.warmer import CacheWarmer
+
+        installed = []
+        original = rate_limit.set_rate_limiter
+        monkeypatch.setattr(
+            "stockagent.warmer.set_rate_limiter", lambda limiter: installed.append(limiter) or original(limiter)
+        )
+        prefetch = SCHEDULER_WAIT_SECONDS.labels("polygon", "prefetch")
+        before = prefetch.snapshot()[0][-1]
+
+        CacheWarmer(["AAPL"], calls_per_minute=6000).run_once()
+
+        assert (installed[0].rate, installed[0].capacity) == (100, 1)
+        assert installed[1] is None  # Previous limiter restored
+        assert prefetch.snapshot()[0][-1] - before == 3
+
+    @pytest.mark.feature028
+    def test_next_run_skips_holidays(self, fake_env, cache_dir):
+        """Test the daily schedule follows the market calendar."""
+        from stockagent.data.calendar import EXCHANGE_TZ
+        from stockagent.warmer import CacheWarmer
+
+        warmer = CacheWarmer(["AAPL"], at=time(8, 0))
+        good_friday_eve = datetime(2024, 3, 28, 12, 0, tzinfo=EXCHANGE_TZ)
+
+        assert warmer.next_run(good_friday_eve) == datetime(2024, 4, 1, 8, 0, tzinfo=EXCHANGE_TZ)
+
+    @pytest.mark.feature028
+    def test_cli_once(self, fake_env, cache_dir, tmp_path):
+        """Test `stockagent warm --once` warms a ticker file and reports failures."""
+        from stockagent.cli import main
+
+        polygon, _ = fake_env
+        tickers = tmp_path / "watchlist.txt"
+        tickers.write_text("AAPL, MSFT\n")
+
+        assert main(["warm", str(tickers), "--once", "--calls-per-minute", "0"]) == 0
+        assert polygon.stats["requests"] == 6
+        tickers.write_text("NOPE\n")
+        assert main(["warm", str(tickers), "--once", "--calls-per-minute", "0"]) == 1
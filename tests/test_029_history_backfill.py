@@ -0,0 +1,195 @@
+"""Tests for Feature 029: History Backfill."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+
+class TestBarStore:
+    """Test the partitioned bar store."""
+
+    @pytest.mark.feature029
+    def test_merge_dedupes_newest_wins(self, tmp_path, bar_columns):
+        """Test overlapping writes keep one bar per timestamp, from the latest write."""
+        from stockagent.data.bar_store import BarStore
+
+        store = BarStore(tmp_path)
+        store.write("aapl", bar_columns(["2023-12-28", "2023-12-29", "2024-01-02"], [1, 2, 3]))
+        store.write("AAPL", bar_columns(["2024-01-02", "2024-01-03"], [30, 4]))
+
+        columns = store.read("AAPL")
+        assert store.partitions("AAPL") == ["2023", "2024"]
+        assert columns["close"].tolist() == [1, 2, 30, 4]
+        assert columns["timestamp"].dtype == np.dtype("datetime64[ms]")
+
+    @pytest.mark.feature029
+    def test_range_reads(self, tmp_path, bar_columns):
+        """Test reads are bounded by start and an inclusive end date."""
+        from stockagent.data.bar_store import BarStore
+
+        store = BarStore(tmp_path)
+        store.write("AAPL", bar_columns(["2022-06-01", "2023-03-01", "2023-03-02", "2024-01-02"], [1, 2, 3, 4]))
+
+        assert store.read("AAPL", start="2023-01-01", end="2023-03-01")["close"].tolist() == [2]
+        assert len(list(store.iter_partitions("AAPL", start="2023-01-01"))) == 2
+
+    @pytest.mark.feature029
+    def test_intraday_bars_partitioned_by_month(self, tmp_path, bar_columns):
+        """Test minute bars are stored in monthly partitions, apart from daily bars."""
+        from stockagent.data.bar_store import BarStore
+
+        store = BarStore(tmp_path)
+        store.write("AAPL", bar_columns(["2024-01-31T20:59", "2024-02-01T14:30"], [1, 2]), "minute")
+
+        assert store.partitions("AAPL", "minute") == ["2024-01", "2024-02"]
+        assert store.partitions("AAPL") == []
+
+
+class TestPagination:
+    """Test fetching a range page by page."""
+
+    @pytest.mark.feature029
+    def test_follows_next_url(self, fake_env):
+        """Test every page of a range is fetched and decoded in order."""
+        from stockagent.data import PolygonClient
+
+        polygon, _ = fake_env
+        client = PolygonClient()
+        pages = list(client.iter_aggregates("AAPL", "2020-01-01", "2021-12-31", page_size=200))
+
+        timestamps = np.concatenate([page["timestamp"] for page in pages])
+        assert [len(page["close"]) for page in pages] == [200, 200, 123]
+        assert polygon.stats["requests"] == 3
+        assert np.all(np.diff(timestamps.astype(np.int64)) > 0)
+        assert timestamps[-1] == np.datetime64("2021-12-31", "ms")
+
+    @pytest.mark.feature029
+    def test_empty_range(self, fake_env):
+        """Test a range without bars yields nothing."""
+        from stockagent.data import PolygonClient
+
+        assert list(PolygonClient().iter_aggregates("AAPL", "1999-01-01", "1999-12-31")) == []
+
+    @pytest.mark.feature029
+    def test_unknown_ticker(self, fake_env):
+        """Test an unknown ticker raises TickerNotFoundError."""
+        from stockagent.data import PolygonClient, TickerNotFoundError
+
+        with pytest.raises(TickerNotFoundError):
+            list(PolygonClient().iter_aggregates("NOPE", "2020-01-01", "2020-12-31"))
+
+
+class TestBackfill:
+    """Test date-sharded backfills into the bar store."""
+
+    @pytest.mark.feature029
+    def test_date_shards(self):
+        """Test shards follow calendar years for daily bars and months for intraday bars."""
+        from stockagent.data.backfill import date_shards
+
+        assert date_shards(date(2019, 6, 1), date(2021, 3, 31)) == [
+            (date(2019, 6, 1), date(2019, 12, 31)),
+            (date(2020, 1, 1), date(2020, 12, 31)),
+            (date(2021, 1, 1), date(2021, 3, 31)),
+        ]
+        assert date_shards(date(2023, 11, 15), date(2024, 1, 10), "minute") == [
+            (date(2023, 11, 15), date(2023, 11, 30)),
+            (date(2023, 12, 1), date(2023, 12, 31)),
+            (date(2024, 1, 1), date(2024, 1, 10)),
+        ]
+
+    @pytest.mark.feature029
+    def test_round_trip(self, fake_env, cache_dir):
+        """Test a multi-year backfill stores the same bars as a single fetch of the range."""
+        from stockagent.data import PolygonClient, backfill_ticker, get_bar_store
+
+        client = PolygonClient()
+        result = backfill_ticker("AAPL", date(2019, 6, 1), date(2021, 3, 31), client=client, max_workers=3)
+        expected = np.concatenate(
+            [page["close"] for page in client.iter_aggregates("AAPL", "2019-06-01", "2021-03-31")]
+        )
+
+        store = get_bar_store()
+        assert (result.shards, result.failed, result.bars) == (3, 0, len(expected))
+        assert store.partitions("AAPL") == ["2019", "2020", "2021"]
+        np.testing.assert_array_equal(store.read("AAPL")["close"], expected)
+
+    @pytest.mark.feature029
+    def test_resumes_after_failure(self, fake_env, cache_dir):
+        """Test a rerun fetches only the shards that did not complete."""
+        from stockagent.data import PolygonAPIError, PolygonClient, backfill_ticker
+
+        polygon, _ = fake_env
+
+        class FlakyClient(PolygonClient):
+            def iter_aggregates(self, ticker, start, end, *args, **kwargs):
+                if start == date(2020, 1, 1):
+                    raise PolygonAPIError("connection reset")
+                return super().iter_aggregates(ticker, start, end, *args, **kwargs)
+
+        first = backfill_ticker("AAPL", date(2019, 1, 1), date(2021, 12, 31), client=FlakyClient())
+        assert (first.failed, len(first.errors)) == (1, 1)
+        requests = polygon.stats["requests"]
+
+        second = backfill_ticker("AAPL", date(2019, 1, 1), date(2021, 12, 31))
+        assert (second.skipped, second.failed) == (2, 0)
+        assert polygon.stats["requests"] - requests == 1
+
+    @pytest.mark.feature029
+    def test_current_shard_is_refetched(self, fake_env, cache_dir):
+        """Test a shard reaching today is fetched on every run."""
+        from stockagent.data import backfill_ticker
+        from stockagent.data.backfill import date_shards
+
+        polygon, _ = fake_env
+        start = date(date.today().year - 1, 1, 1)
+        backfill_ticker("AAPL", start)
+        requests = polygon.stats["requests"]
+        result = backfill_ticker("AAPL", start)
+
+        assert result.skipped == len(date_shards(start, date.today())) - 1
+        assert polygon.stats["requests"] - requests == 1
+
+    @pytest.mark.feature029
+    def test_requests_scheduled_as_batch(self, fake_env, cache_dir):
+        """Test every page request takes a batch turn through the Polygon scheduler."""
+        from stockagent.data import PolygonClient, backfill_ticker
+        from stockagent.utils.metrics import BACKFILL_SHARDS, SCHEDULER_WAIT_SECONDS
+
+        polygon, _ = fake_env
+        batch = SCHEDULER_WAIT_SECONDS.labels("polygon", "batch")
+        before = batch.snapshot()[0][-1], BACKFILL_SHARDS.labels("fetched").value
+
+        client = PolygonClient()
+        client.iter_aggregates = lambda *args, **kwargs: PolygonClient.iter_aggregates(
+            client, *args, **{**kwargs, "page_size": 100}
+        )
+        backfill_ticker("AAPL", date(2022, 1, 1), date(2023, 12, 31), client=client)
+
+        assert polygon.stats["requests"] == 6
+        assert batch.snapshot()[0][-1] - before[0] == 6
+        assert BACKFILL_SHARDS.labels("fetched").value - before[1] == 2
+
+    @pytest.mark.feature029
+    def test_requires_bar_store(self, fake_env):
+        """Test backfilling without STOCKAGENT_CACHE_DIR is rejected."""
+        from stockagent.data import backfill_ticker
+
+        with pytest.raises(ValueError, match="STOCKAGENT_CACHE_DIR"):
+            backfill_ticker("AAPL", date(2023, 1, 1))
+
+    @pytest.mark.feature029
+    def test_cli(self, fake_env, cache_dir, tmp_path):
+        """Test `stockagent backfill` fills the store and reports unknown tickers."""
+        from stockagent.cli import main
+        from stockagent.data import get_bar_store
+
+        tickers = tmp_path / "tickers.txt"
+        tickers.write_text("AAPL MSFT\n")
+        args = ["backfill", str(tickers), "--from", "2023-01-01", "--to", "2023-12-31", "--calls-per-minute", "0"]
+
+        assert main(args) == 0
+        assert get_bar_store().partitions("MSFT") == ["2023"]
+        tickers.write_text("NOPE\n")
+        assert main(args) == 1
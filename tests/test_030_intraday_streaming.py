@@ -0,0 +1,146 @@
+"""Tests for Feature 030: Intraday Streaming."""
+
+import numpy as np
+import pytest
+
+
+def _chunks(columns, sizes):
+    """Split bar columns into consecutive chunks of the given sizes."""
+    start = 0
+    for size in sizes:
+        yield {name: values[start : start + size] for name, values in columns.items()}
+        start += size
+
+
+def _flatten(signals):
+    """Flatten nested indicator dicts (MACD, Bollinger) for pytest.approx."""
+    flat = {}
+    for name, value in signals.items():
+        if isinstance(value, dict):
+            flat.update({f"{name}.{key}": item for key, item in value.items()})
+        else:
+            flat[name] = value
+    return flat
+
+
+class TestStreamingIndicators:
+    """Test indicators computed chunk by chunk against the batch functions."""
+
+    @pytest.mark.feature030
+    @pytest.mark.parametrize("sizes", [[1] * 60, [7, 3, 50, 13, 1200, 1], [1274]])
+    def test_signals_match_batch(self, sizes):
+        """Test the final signals equal calculate_all_indicators() however the bars are chunked."""
+        from stockagent.analysis import StreamingIndicators, calculate_all_indicators
+        from stockagent.data.bars import columns_to_bars
+        from stockagent.utils.synthetic import generate_bar_columns
+
+        columns = generate_bar_columns(sum(sizes), seed=3)
+        indicators = StreamingIndicators()
+        for chunk in _chunks(columns, sizes):
+            indicators.update(chunk)
+
+        assert indicators.count == sum(sizes)
+        expected = calculate_all_indicators(columns_to_bars(columns))
+        assert _flatten(indicators.signals()) == pytest.approx(_flatten(expected), rel=1e-12)
+
+    @pytest.mark.feature030
+    def test_series_match_every_prefix(self):
+        """Test each bar's RSI and MACD equal the batch values on the history up to it."""
+        from stockagent.analysis import calculate_macd, calculate_rsi, stream_indicators
+        from stockagent.utils.synthetic import generate_bar_columns
+
+        columns = generate_bar_columns(300, seed=5)
+        closes = columns["close"].tolist()
+        chunks = list(stream_indicators(_chunks(columns, [10, 20, 5, 265])))
+        rsi = np.concatenate([chunk["rsi"] for chunk in chunks])
+        macd = np.concatenate([chunk["macd_line"] for chunk in chunks])
+        signal = np.concatenate([chunk["macd_signal"] for chunk in chunks])
+
+        assert np.isnan(rsi[:14]).all() and np.isnan(macd[:25]).all()
+        for i in (14, 25, 30, 33, 34, 120, 299):
+            expected = calculate_macd(closes[: i + 1])
+            assert rsi[i] == calculate_rsi(closes[: i + 1])
+            if expected:
+                assert (macd[i], signal[i]) == (expected["macd_line"], expected["signal_line"])
+
+    @pytest.mark.feature030
+    def test_streaming_ema(self):
+        """Test the EMA continues across chunks exactly as ema_series() over the whole input."""
+        from stockagent.analysis import StreamingEMA
+        from stockagent.analysis.kernels import ema_series
+
+        values = np.linspace(1, 50, 100) ** 1.5
+        ema = StreamingEMA(12)
+        streamed = np.concatenate([ema.update(values[:5]), ema.update(values[5:40]), ema.update(values[40:])])
+
+        np.testing.assert_array_equal(streamed[11:], ema_series(values, 12))
+        assert ema.value == streamed[-1]
+
+    @pytest.mark.feature030
+    def test_short_stream(self):
+        """Test a stream shorter than the indicator periods returns no values."""
+        from stockagent.analysis import StreamingIndicators
+
+        indicators = StreamingIndicators()
+        out = indicators.update({"timestamp": np.arange(5), "close": np.arange(5.0) + 10})
+
+        assert np.isnan(out["sma_20"]).all()
+        assert indicators.signals()["rsi"] is None
+        assert indicators.signals()["current_price"] == 14.0
+
+
+class TestIntradayFetch:
+    """Test fetching minute and hour bars."""
+
+    @pytest.mark.feature030
+    def test_minute_pages(self, fake_env):
+        """Test minute bars of a session arrive in pages, in order."""
+        from stockagent.data import PolygonClient
+
+        pages = list(PolygonClient().iter_aggregates("AAPL", "2024-03-01", "2024-03-04", "minute", page_size=500))
+        timestamps = np.concatenate([page["timestamp"] for page in pages])
+
+        assert len(timestamps) == 2 * 390
+        assert timestamps[0] == np.datetime64("2024-03-01T14:30", "ms")
+        assert np.all(np.diff(timestamps.astype(np.int64)) > 0)
+
+    @pytest.mark.feature030
+    def test_bar_sizes(self, fake_env):
+        """Test hour and 5-minute bars aggregate the same minute bars."""
+        from stockagent.data import PolygonClient
+
+        client = PolygonClient()
+        (minute,) = client.iter_aggregates("AAPL", "2024-03-04", "2024-03-04", "minute")
+        (five,) = client.iter_aggregates("AAPL", "2024-03-04", "2024-03-04", "minute", multiplier=5)
+        (hour,) = client.iter_aggregates("AAPL", "2024-03-04", "2024-03-04", "hour")
+
+        assert (len(five["close"]), len(hour["close"])) == (78, 7)
+        assert hour["volume"].sum() == five["volume"].sum() == minute["volume"].sum()
+        assert hour["close"][-1] == minute["close"][-1]
+
+    @pytest.mark.feature030
+    def test_unsupported_timespan(self, fake_env):
+        """Test an unknown timespan is rejected before any request."""
+        from stockagent.data import PolygonClient
+
+        polygon, _ = fake_env
+        with pytest.raises(ValueError, match="timespan"):
+            next(PolygonClient().iter_aggregates("AAPL", "2024-03-01", "2024-03-01", "tick"))
+        assert polygon.stats["requests"] == 0
+
+    @pytest.mark.feature030
+    def test_pages_feed_indicators(self, fake_env):
+        """Test indicators streamed over fetched pages equal the batch result on all bars."""
+        from stockagent.analysis import StreamingIndicators, calculate_all_indicators
+        from stockagent.data import PolygonClient
+        from stockagent.data.bar_store import concat_columns
+        from stockagent.data.bars import columns_to_bars
+
+        pages = list(PolygonClient().iter_aggregates("AAPL", "2024-03-01", "2024-03-08", "minute", page_size=700))
+        indicators = StreamingIndicators()
+        for page in pages:
+            indicators.update(page)
+
+        assert len(pages) == 4
+        expected = calculate_all_indicators(columns_to_bars(concat_columns(pages)))
+        assert _flatten(indicators.signals()) == pytest.approx(_flatten(expected), rel=1e-12)
@@ -0,0 +1,193 @@
+"""Tests for Feature 031: Live Ingestion."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def fake_socket(monkeypatch):
+    """Run a FakePolygonSocket accepting the key "test"."""
+    from stockagent.testing import FakePolygonSocket
+
+    monkeypatch.setenv("POLYGON_API_KEY", "test")
+    with FakePolygonSocket(api_key="test") as server:
+        yield server
+
+
+def _bar(ticker, close, minute):
+    """Build an AM event for the given minute after 2024-03-04 14:30 UTC."""
+    start = int(np.datetime64("2024-03-04T14:30", "ms").astype(np.int64)) + minute * 60_000
+    return {"ev": "AM", "sym": ticker, "o": close, "h": close, "l": close, "c": close, "v": 100, "s": start}
+
+
+def _primed_scorer(*tickers):
+    """A LiveScorer primed with 300 synthetic bars per ticker."""
+    from stockagent.live import LiveScorer
+    from stockagent.utils.synthetic import generate_bar_columns
+
+    scorer = LiveScorer()
+    for ticker in tickers:
+        scorer.prime(ticker, generate_bar_columns(300, seed=1))
+    return scorer
+
+
+def _falling(scorer, ticker, start_minute=1000):
+    """Feed falling bars one at a time until the ticker's recommendation changes."""
+    from stockagent.live import decode_aggregate_events
+
+    price = scorer._states[ticker].indicators.current_price
+    for minute in range(start_minute, start_minute + 100):
+        price *= 0.99
+        changes = scorer.update(decode_aggregate_events([_bar(ticker, price, minute)]))
+        if changes:
+            return changes
+    return []
+
+
+class TestDecode:
+    """Test decoding websocket events into bar columns."""
+
+    @pytest.mark.feature031
+    def test_groups_by_ticker(self):
+        """Test AM events are grouped per ticker in message order and status events ignored."""
+        from stockagent.live import decode_aggregate_events
+
+        bars = decode_aggregate_events(
+            [_bar("AAPL", 10.0, 0), {"ev": "status", "status": "success"}, _bar("msft", 20.0, 0), _bar("AAPL", 11.0, 1)]
+        )
+
+        assert sorted(bars) == ["AAPL", "MSFT"]
+        assert bars["AAPL"]["close"].tolist() == [10.0, 11.0]
+        assert bars["AAPL"]["timestamp"][1] == np.datetime64("2024-03-04T14:31", "ms")
+        assert bars["MSFT"]["volume"].dtype == np.int64
+
+
+class TestLiveScorer:
+    """Test incremental re-scoring."""
+
+    @pytest.mark.feature031
+    def test_change_emitted_on_new_label(self):
+        """Test a change is emitted only when a bar moves the recommendation."""
+        scorer = _primed_scorer("AAPL")
+        before = scorer.recommendation("AAPL")
+
+        (change,) = _falling(scorer, "AAPL")
+
+        assert (change.ticker, change.previous) == ("AAPL", before)
+        assert change.recommendation == scorer.recommendation("AAPL") != before
+        assert change.latency_ms < 100
+        assert change.to_dict()["bar_time"].startswith("2024-03-")
+
+    @pytest.mark.feature031
+    def test_only_affected_tickers_rescored(self):
+        """Test a bar for one ticker leaves the others' indicator state untouched."""
+        from stockagent.live import decode_aggregate_events
+
+        scorer = _primed_scorer("AAPL", "MSFT")
+        msft = scorer._states["MSFT"].indicators.count
+
+        scorer.update(decode_aggregate_events([_bar("AAPL", 50.0, 1000)]))
+
+        assert scorer._states["AAPL"].indicators.count == 301
+        assert scorer._states["MSFT"].indicators.count == msft
+
+    @pytest.mark.feature031
+    def test_first_bar_emits_nothing(self):
+        """Test a ticker without earlier bars gets a recommendation but no change event."""
+        from stockagent.live import LiveScorer, decode_aggregate_events
+
+        scorer = LiveScorer()
+
+        assert scorer.update(decode_aggregate_events([_bar("AAPL", 50.0, 0)])) == []
+        assert scorer.recommendation("AAPL") is not None
+
+    @pytest.mark.feature031
+    def test_replayed_bars_dropped(self):
+        """Test bars at or before the last seen timestamp are ignored."""
+        from stockagent.live import decode_aggregate_events
+
+        scorer = _primed_scorer("AAPL")
+        scorer.update(decode_aggregate_events([_bar("AAPL", 50.0, 1000), _bar("AAPL", 51.0, 1001)]))
+        scorer.update(decode_aggregate_events([_bar("AAPL", 1.0, 1001), _bar("AAPL", 52.0, 1002)]))
+
+        indicators = scorer._states["AAPL"].indicators
+        assert (indicators.count, indicators.current_price) == (303, 52.0)
+
+
+class TestLiveIngestor:
+    """Test streaming bars from the websocket feed."""
+
+    @pytest.mark.feature031
+    def test_end_to_end(self, fake_socket):
+        """Test published bars reach the scorer and changes are emitted within a second."""
+        from stockagent.live import LiveIngestor
+        from stockagent.utils.metrics import LIVE_BARS
+
+        scorer = _primed_scorer("AAPL")
+        before = scorer.recommendation("AAPL")
+        bars = LIVE_BARS.value
+        changes = []
+        changed = threading.Event()
+
+        def on_change(change):
+            changes.append((time.perf_counter(), change))
+            changed.set()
+
+        ingestor = LiveIngestor(["AAPL", "MSFT"], scorer, on_change, url=fake_socket.url).start()
+        try:
+            assert fake_socket.wait_subscribed({"AM.AAPL", "AM.MSFT"})
+            price = scorer._states["AAPL"].indicators.current_price
+            for minute in range(1000, 1100):
+                price *= 0.99
+                sent = time.perf_counter()
+                fake_socket.publish([_bar("AAPL", price, minute)])
+                if changed.wait(0.5):
+                    break
+        finally:
+            ingestor.stop()
+
+        received, change = changes[0]
+        assert change.previous == before
+        assert received - sent < 1.0
+        assert LIVE_BARS.value - bars == minute - 999
+        assert ingestor.error is None
+
+    @pytest.mark.feature031
+    def test_rejected_key(self, fake_socket):
+        """Test a rejected API key ends the run with the error recorded."""
+        from stockagent.live import LiveIngestor, LiveScorer
+
+        ingestor = LiveIngestor(["AAPL"], LiveScorer(), print, url=fake_socket.url, api_key="wrong").start()
+
+        assert ingestor.join(5)
+        assert "authentication failed" in str(ingestor.error)
+        assert fake_socket.stats["auth_failed"] == 1
+
+    @pytest.mark.feature031
+    def test_prime_from_api(self, fake_env):
+        """Test priming reads recent minute bars and skips unknown tickers."""
+        from stockagent.live import LiveScorer, prime_from_api
+
+        scorer = LiveScorer()
+        prime_from_api(scorer, ["AAPL", "NOPE"], sessions=2)
+
+        assert scorer._states["AAPL"].indicators.count >= 2 * 390
+        assert scorer.recommendation("NOPE") is None
+
+    @pytest.mark.feature031
+    def test_cli(self, fake_socket, tmp_path, capsys):
+        """Test `stockagent live` subscribes, runs for --duration and exits cleanly."""
+        from stockagent.cli import main
+
+        tickers = tmp_path / "tickers.txt"
+        tickers.write_text("AAPL\n")
+        args = ["live", str(tickers), "--sessions", "0", "--url", fake_socket.url, "--duration", "0.5"]
+
+        assert main(args) == 0
+        assert fake_socket.stats["connections"] == 1
+        assert capsys.readouterr().out == ""
+        tickers.write_text("# none\n")
+        assert main(args) == 2
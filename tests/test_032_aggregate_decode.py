@@ -0,0 +1,97 @@
+"""Tests for Feature 032: Aggregate Decode."""
+
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+
+def _payload(results, **extra):
+    """Raw aggregates response body."""
+    return json.dumps({"ticker": "AAPL", "status": "OK", "results": results, **extra}).encode()
+
+
+class TestDecodeAggregates:
+    """Test decoding raw aggregates JSON into columns."""
+
+    @pytest.mark.feature032
+    def test_columns(self):
+        """Test each field lands in its column with the BarColumns dtypes."""
+        from stockagent.data.bars import decode_aggregates
+
+        payload = _payload(
+            [
+                {"v": 1500.0, "vw": 10.2, "o": 10.0, "c": 10.5, "h": 11.0, "l": 9.5, "t": 1704085200000, "n": 7},
+                {"v": 2000.7, "o": 10.5, "c": 10.1, "h": 10.9, "l": 10.0, "t": 1704171600000},
+            ],
+            next_url="https://api.polygon.io/v2/aggs/cursor",
+        )
+
+        columns, next_url = decode_aggregates(payload)
+
+        assert next_url == "https://api.polygon.io/v2/aggs/cursor"
+        assert columns["close"].tolist() == [10.5, 10.1]
+        assert columns["volume"].tolist() == [1500, 2000]
+        assert columns["timestamp"][0] == np.datetime64("2024-01-01T05:00", "ms")
+        assert {name: str(values.dtype) for name, values in columns.items()} == {
+            "timestamp": "datetime64[ms]",
+            "open": "float64",
+            "high": "float64",
+            "low": "float64",
+            "close": "float64",
+            "volume": "int64",
+        }
+
+    @pytest.mark.feature032
+    def test_no_results(self):
+        """Test a response without results decodes to empty columns and no next page."""
+        from stockagent.data.bars import decode_aggregates
+
+        columns, next_url = decode_aggregates(json.dumps({"status": "OK", "resultsCount": 0}))
+
+        assert next_url is None
+        assert len(columns["close"]) == 0 and columns["timestamp"].dtype == np.dtype("datetime64[ms]")
+
+
+class TestGetStockAggregates:
+    """Test get_stock_aggregates on the raw decode path."""
+
+    @pytest.mark.feature032
+    def test_matches_model_path(self, fake_env):
+        """Test the bars equal those built from RESTClient model objects."""
+        from datetime import datetime, timezone
+
+        from stockagent.data import PolygonClient
+
+        client = PolygonClient()
+        bars = client.get_stock_aggregates("AAPL", days=60)
+        aggs = client._client.get_aggs("AAPL", 1, "day", bars[0]["timestamp"], bars[-1]["timestamp"], limit=100)
+        expected = [
+            {
+                "open": float(agg.open),
+                "high": float(agg.high),
+                "low": float(agg.low),
+                "close": float(agg.close),
+                "volume": int(agg.volume),
+                "timestamp": datetime.fromtimestamp(agg.timestamp / 1000, timezone.utc).strftime("%Y-%m-%d"),
+            }
+            for agg in aggs
+        ]
+
+        assert bars == expected
+        assert type(bars[0]["close"]) is float and type(bars[0]["volume"]) is int
+
+    @pytest.mark.feature032
+    def test_eastern_midnight_keeps_date(self, mock_env_with_api_key):
+        """Test daily bars stamped at midnight US/Eastern keep their calendar date."""
+        from stockagent.data import PolygonClient
+
+        client = PolygonClient()
+        client._client = MagicMock()
+        client._client.get_aggs.return_value = MagicMock(
+            data=_payload([{"o": 1.0, "h": 1.0, "l": 1.0, "c": 1.0, "v": 1, "t": 1704085200000}])
+        )
+
+        assert client.get_stock_aggregates("AAPL", days=5)[0]["timestamp"] == "2024-01-01"
+        assert client._client.get_aggs.call_args.kwargs["raw"] is True
@@ -0,0 +1,226 @@
+"""Tests for Feature 033: Split Adjustments."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+
+def _store_before_split(client, store):
+    """Store AAPL bars for 2019 to May 2020 as fetched on 2020-06-01."""
+    for page in client.iter_aggregates("AAPL", "2019-01-01", "2020-05-29"):
+        store.write("AAPL", page, basis="2020-06-01")
+
+
+class TestBarStoreBasis:
+    """Test adjustment bases recorded by the bar store."""
+
+    @pytest.mark.feature033
+    def test_write_records_basis(self, tmp_path, bar_columns):
+        """Test each partition reports its oldest basis, today by default."""
+        from stockagent.data.bar_store import BarStore
+
+        store = BarStore(tmp_path)
+        store.write("AAPL", bar_columns(["2019-12-31", "2020-01-02"], [1, 2]), basis="2020-01-05")
+        store.write("AAPL", bar_columns(["2020-01-03"], [3]))
+
+        bases = store.adjustment_basis("AAPL")
+        assert bases["2019"] == np.datetime64("2020-01-05")
+        assert bases["2020"] == np.datetime64("2020-01-05")
+        assert store.basis_at("AAPL", "2020-01-03") == np.datetime64(date.today())
+
+    @pytest.mark.feature033
+    def test_apply_split_only_stale_bars(self, tmp_path, bar_columns):
+        """Test a split re-adjusts older-basis bars before it and leaves other partitions alone."""
+        from stockagent.data.bar_store import BarStore
+
+        store = BarStore(tmp_path)
+        store.write("AAPL", bar_columns(["2019-12-31", "2020-01-02"], [100, 102]), basis="2020-01-05")
+        store.write("AAPL", bar_columns(["2020-08-28", "2020-09-01"], [52, 50]), basis="2020-09-05")
+        store.write("AAPL", bar_columns(["2021-01-04"], [60]), basis="2021-01-05")
+        untouched = (tmp_path / "AAPL" / "1day" / "2021.npz").stat().st_mtime_ns
+
+        assert store.apply_split("AAPL", "2020-08-31", 2.0) == (["2019", "2020"], [])
+        columns = store.read("AAPL")
+        assert columns["close"].tolist() == [50, 51, 52, 50, 60]
+        assert columns["volume"].tolist() == [200, 200, 100, 100, 100]
+        assert store.basis_at("AAPL", "2019-12-31") == np.datetime64("2020-08-31")
+        assert (tmp_path / "AAPL" / "1day" / "2021.npz").stat().st_mtime_ns == untouched
+        assert store.apply_split("AAPL", "2020-08-31", 2.0) == ([], [])
+
+    @pytest.mark.feature033
+    def test_intraday_split_at_exchange_midnight(self, tmp_path, bar_columns):
+        """Test evening bars before a split are adjusted although they fall on the split's UTC date."""
+        from stockagent.data.bar_store import BarStore
+
+        store = BarStore(tmp_path)
+        # 15:30 and 19:30 EST on 2024-01-09, then 09:30 EST on 2024-01-10
+        timestamps = ["2024-01-09T20:30", "2024-01-10T00:30", "2024-01-10T14:30"]
+        store.write("AAPL", bar_columns(timestamps, [100, 100, 50]), "minute", basis="2024-01-09")
+
+        assert store.apply_split("AAPL", "2024-01-10", 2.0, "minute") == (["2024-01"], [])
+        assert store.read("AAPL", "minute")["close"].tolist() == [50, 50, 50]
+
+    @pytest.mark.feature033
+    def test_intraday_partitions_by_trading_day(self, tmp_path, bar_columns):
+        """Test a month's last evening bars stay in its partition and in date-bounded reads."""
+        from stockagent.data.bar_store import BarStore
+
+        store = BarStore(tmp_path)
+        # 19:30 EST on 2024-01-31 is 00:30 UTC on 2024-02-01
+        store.write("AAPL", bar_columns(["2024-01-31T20:30", "2024-02-01T00:30", "2024-02-01T14:30"], [1, 2, 3]), "minute")
+
+        assert store.partitions("AAPL", "minute") == ["2024-01", "2024-02"]
+        assert store.read("AAPL", "minute", end="2024-01-31")["close"].tolist() == [1, 2]
+        assert store.read("AAPL", "minute", start="2024-02-01")["close"].tolist() == [3]
+
+    @pytest.mark.feature033
+    def test_unrecorded_basis_invalidated(self, tmp_path, bar_columns):
+        """Test partitions written without a basis are deleted and their shards forgotten."""
+        from stockagent.data import reconcile_splits
+        from stockagent.data.backfill import MANIFEST_NAME, BackfillManifest
+        from stockagent.data.bar_store import BarStore
+
+        store = BarStore(tmp_path)
+        store.write("AAPL", bar_columns(["2021-03-01"], [10]))
+        legacy = tmp_path / "AAPL" / "1day" / "2019.npz"
+        np.savez(legacy, **bar_columns(["2019-03-01"], [40]))
+        manifest = BackfillManifest(store.series_dir("AAPL") / MANIFEST_NAME)
+        manifest.add((date(2019, 1, 1), date(2019, 12, 31)))
+        manifest.add((date(2021, 1, 1), date(2021, 12, 31)))
+
+        class Client:
+            def get_splits(self, ticker):
+                return [{"execution_date": "2020-08-31", "split_from": 1.0, "split_to": 4.0}]
+
+        result = reconcile_splits("AAPL", store=store, client=Client())
+
+        assert (result.adjusted, result.invalidated) == ([], ["2019"])
+        assert store.partitions("AAPL") == ["2021"]
+        manifest = BackfillManifest(manifest.path)
+        assert (date(2019, 1, 1), date(2019, 12, 31)) not in manifest
+        assert (date(2021, 1, 1), date(2021, 12, 31)) in manifest
+
+
+class TestDiscontinuities:
+    """Test split detection from prices."""
+
+    @pytest.mark.feature033
+    def test_split_like_jumps(self, bar_columns):
+        """Test forward, fractional and reverse split jumps are found, and a plain drop is not."""
+        from stockagent.data.adjustments import find_discontinuities
+
+        days = np.arange("2024-01-01", "2024-01-08", dtype="datetime64[D]")
+        close = [100, 50, 51, 34, 25, 250, 249]
+        columns = bar_columns(days, close)
+
+        found = find_discontinuities(columns)
+
+        assert [(str(ts.astype("datetime64[D]")), ratio) for ts, ratio in found] == [
+            ("2024-01-02", 2.0),
+            ("2024-01-04", 1.5),
+            ("2024-01-06", 0.1),
+        ]
+        assert find_discontinuities({name: values[1:2] for name, values in columns.items()}, previous_close=100.0)
+
+    @pytest.mark.feature033
+    def test_synthetic_history_has_none(self):
+        """Test ordinary price moves are not mistaken for splits."""
+        from stockagent.data.adjustments import find_discontinuities
+        from stockagent.utils.synthetic import generate_bar_columns
+
+        assert find_discontinuities(generate_bar_columns(6000, seed=11)) == []
+
+
+class TestReconcile:
+    """Test bringing stored series onto the current basis."""
+
+    @pytest.mark.feature033
+    def test_splits_endpoint(self, fake_env, cache_dir):
+        """Test bars stored before a split match a fresh fetch after reconciling."""
+        from stockagent.data import PolygonClient, backfill_ticker, get_bar_store, reconcile_splits
+        from stockagent.data.bar_store import concat_columns
+
+        polygon, _ = fake_env
+        client, store = PolygonClient(), get_bar_store()
+        _store_before_split(client, store)
+        before = store.read("AAPL")
+        polygon.add_split("AAPL", "2020-08-31", 1, 4)
+        backfill_ticker("AAPL", date(2020, 6, 1), date(2021, 12, 31), client=client)
+
+        result = reconcile_splits("AAPL", client=client)
+
+        fresh = concat_columns(list(client.iter_aggregates("AAPL", "2019-01-01", "2021-12-31")))
+        after = store.read("AAPL")
+        assert result.splits == [{"execution_date": "2020-08-31", "ratio": 4.0}]
+        assert (result.source, result.adjusted, result.invalidated) == ("splits", ["2019", "2020"], [])
+        np.testing.assert_allclose(after["close"], fresh["close"], rtol=1e-12)
+        np.testing.assert_array_equal(after["volume"][: len(before["volume"])], before["volume"] * 4)
+        assert reconcile_splits("AAPL", client=client).adjusted == []
+
+    @pytest.mark.feature033
+    def test_discontinuity_fallback(self, fake_env, cache_dir):
+        """Test a split is found from the stored prices when splits cannot be listed."""
+        from stockagent.data import PolygonAPIError, PolygonClient, backfill_ticker, get_bar_store, reconcile_splits
+        from stockagent.data.bar_store import concat_columns
+
+        class NoSplitsClient(PolygonClient):
+            def get_splits(self, ticker):
+                raise PolygonAPIError("splits unavailable")
+
+        polygon, _ = fake_env
+        client, store = NoSplitsClient(), get_bar_store()
+        _store_before_split(client, store)
+        polygon.add_split("AAPL", "2020-08-31", 1, 4)
+        backfill_ticker("AAPL", date(2020, 6, 1), date(2021, 12, 31), client=client)
+
+        result = reconcile_splits("AAPL", client=client)
+
+        fresh = concat_columns(list(client.iter_aggregates("AAPL", "2019-01-01", "2021-12-31")))
+        assert (result.source, [split["ratio"] for split in result.splits]) == ("discontinuities", [4.0])
+        np.testing.assert_allclose(store.read("AAPL")["close"], fresh["close"], rtol=1e-12)
+
+    @pytest.mark.feature033
+    def test_nothing_stored(self, fake_env, cache_dir):
+        """Test a series without stored bars is left alone without a request."""
+        from stockagent.data import reconcile_splits
+
+        polygon, _ = fake_env
+
+        assert reconcile_splits("AAPL").splits == []
+        assert polygon.stats["requests"] == 0
+
+    @pytest.mark.feature033
+    def test_get_splits(self, fake_env):
+        """Test splits are listed oldest first with their ratios."""
+        from stockagent.data import PolygonClient
+
+        polygon, _ = fake_env
+        polygon.add_split("AAPL", "2022-08-25", 1, 3)
+        polygon.add_split("AAPL", "2014-06-09", 1, 7)
+
+        assert PolygonClient().get_splits("aapl") == [
+            {"execution_date": "2014-06-09", "split_from": 1.0, "split_to": 7.0},
+            {"execution_date": "2022-08-25", "split_from": 1.0, "split_to": 3.0},
+        ]
+        assert PolygonClient().get_splits("MSFT") == []
+
+    @pytest.mark.feature033
+    def test_cli_backfill_adjusts(self, fake_env, cache_dir, tmp_path):
+        """Test `stockagent backfill` re-adjusts stored bars unless --no-adjust is given."""
+        from stockagent.cli import main
+        from stockagent.data import PolygonClient, get_bar_store
+
+        polygon, _ = fake_env
+        store = get_bar_store()
+        _store_before_split(PolygonClient(), store)
+        stored = store.read("AAPL", end="2019-12-31")["close"]
+        polygon.add_split("AAPL", "2020-08-31", 1, 4)
+        tickers = tmp_path / "tickers.txt"
+        tickers.write_text("AAPL\n")
+        args = ["backfill", str(tickers), "--from", "2020-06-01", "--to", "2020-12-31", "--calls-per-minute", "0"]
+
+        assert main([*args, "--no-adjust"]) == 0
+        np.testing.assert_array_equal(store.read("AAPL", end="2019-12-31")["close"], stored)
+        assert main(args) == 0
+        np.testing.assert_allclose(store.read("AAPL", end="2019-12-31")["close"], stored / 4)
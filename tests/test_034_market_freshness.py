@@ -0,0 +1,126 @@
+"""Tests for Feature 034: Market Freshness."""
+
+from datetime import date, datetime
+
+import pytest
+
+
+def _et(*args):
+    """A datetime in the exchange time zone."""
+    from stockagent.data.calendar import EXCHANGE_TZ
+
+    return datetime(*args, tzinfo=EXCHANGE_TZ)
+
+
+class TestSessions:
+    """Test early closes and session boundaries."""
+
+    @pytest.mark.feature034
+    def test_early_closes(self):
+        """Test 1 p.m. closes before Independence Day, after Thanksgiving and on Christmas Eve."""
+        from stockagent.data.calendar import early_closes, session_close
+
+        assert sorted(early_closes(2024)) == [date(2024, 7, 3), date(2024, 11, 29), date(2024, 12, 24)]
+        # July 3, 2026 is the observed Independence Day holiday
+        assert sorted(early_closes(2026)) == [date(2026, 11, 27), date(2026, 12, 24)]
+        assert session_close(date(2024, 11, 29)) == _et(2024, 11, 29, 13, 0)
+        assert session_close(date(2024, 11, 27)) == _et(2024, 11, 27, 16, 0)
+
+    @pytest.mark.feature034
+    def test_session_boundaries(self):
+        """Test the market is open only in regular sessions and the next open and close skip closed days."""
+        from stockagent.data.calendar import is_market_open, next_session_close, next_session_open
+
+        assert is_market_open(_et(2024, 3, 1, 9, 30))
+        assert not is_market_open(_et(2024, 3, 1, 16, 0))
+        assert not is_market_open(_et(2024, 11, 29, 14, 0))
+        assert not is_market_open(_et(2024, 3, 29, 11, 0))  # Good Friday
+        assert next_session_open(_et(2024, 3, 28, 10, 0)) == _et(2024, 4, 1, 9, 30)
+        assert next_session_close(_et(2024, 3, 28, 10, 0)) == _et(2024, 3, 28, 16, 0)
+        assert next_session_close(_et(2024, 11, 27, 16, 0)) == _et(2024, 11, 29, 13, 0)
+        # Naive times are UTC: 15:00 UTC is 10:00 in New York in March before DST
+        assert is_market_open(datetime(2024, 3, 1, 15, 0))
+
+
+class TestFreshnessPolicy:
+    """Test calendar-aware expiry."""
+
+    @pytest.mark.feature034
+    @pytest.mark.parametrize(
+        "stored, expires",
+        [
+            ((2024, 3, 1, 10, 0), (2024, 3, 1, 16, 15)),
+            ((2024, 3, 1, 16, 10), (2024, 3, 1, 16, 15)),
+            ((2024, 3, 1, 17, 0), (2024, 3, 4, 16, 15)),
+            ((2024, 3, 2, 12, 0), (2024, 3, 4, 16, 15)),
+            ((2024, 3, 28, 20, 0), (2024, 4, 1, 16, 15)),
+            ((2024, 11, 29, 9, 0), (2024, 11, 29, 13, 15)),
+        ],
+    )
+    def test_until_close(self, stored, expires):
+        """Test daily bars stay fresh until the next close has settled, across weekends and holidays."""
+        from stockagent.data.freshness import CLOSE, FreshnessPolicy
+
+        assert FreshnessPolicy(until=CLOSE).expires(_et(*stored)) == _et(*expires)
+
+    @pytest.mark.feature034
+    def test_ttl_in_session_open_outside(self):
+        """Test a TTL applies during the session and is extended to the next open outside it."""
+        from stockagent.data.freshness import OPEN, FreshnessPolicy
+
+        policy = FreshnessPolicy(2 * 3600.0, OPEN)
+
+        assert policy.expires(_et(2024, 3, 1, 11, 0)) == _et(2024, 3, 1, 13, 0)
+        assert policy.expires(_et(2024, 3, 1, 20, 0)) == _et(2024, 3, 4, 9, 30)
+        assert policy.expires(_et(2024, 3, 4, 8, 30)) == _et(2024, 3, 4, 10, 30)
+        assert policy.seconds(_et(2024, 3, 3, 9, 30)) == 24 * 3600
+        assert FreshnessPolicy(60.0).expires(_et(2024, 3, 2, 12, 0)) == _et(2024, 3, 2, 12, 1)
+
+    @pytest.mark.feature034
+    def test_invalid(self):
+        """Test a policy needs a known boundary or a TTL."""
+        from stockagent.data.freshness import FreshnessPolicy
+
+        with pytest.raises(ValueError):
+            FreshnessPolicy(until="noon")
+        with pytest.raises(ValueError):
+            FreshnessPolicy()
+
+
+class TestCaches:
+    """Test caches using the freshness policies."""
+
+    @pytest.mark.feature034
+    def test_weekend_response_cache(self):
+        """Test bars and headlines fetched on Friday evening are not fetched again over the weekend."""
+        from stockagent.data.response_cache import ResponseCache
+
+        now = [_et(2024, 3, 1, 18, 0).timestamp()]
+        cache = ResponseCache(clock=lambda: now[0])
+        cache.put("aggregates", "AAPL:90", [{"close": 1.0}])
+        cache.put("news", "Apple stock:10", [{"title": "Apple"}])
+
+        now[0] = _et(2024, 3, 4, 9, 0).timestamp()
+        assert cache.get("aggregates", "AAPL:90") == [{"close": 1.0}]
+        assert cache.get("news", "Apple stock:10") == [{"title": "Apple"}]
+        now[0] = _et(2024, 3, 4, 9, 30).timestamp()
+        assert cache.get("news", "Apple stock:10") is None
+        now[0] = _et(2024, 3, 4, 16, 15).timestamp()
+        assert cache.get("aggregates", "AAPL:90") is None
+
+    @pytest.mark.feature034
+    def test_ttl_cache_per_entry_lifetime(self):
+        """Test TTLCache entries keep the lifetime computed when they were stored."""
+        from stockagent.utils.cache import TTLCache
+
+        now = [0.0]
+        ttls = iter([10.0, 100.0])
+        cache = TTLCache(ttl=10, clock=lambda: now[0], ttl_for=lambda: next(ttls))
+        cache.put("short", 1)
+        cache.put("long", 2)
+
+        now[0] = 50.0
+        assert "short" not in cache
+        assert cache.get_entry("long") == (2, 50.0)
+        assert cache.get_entry("long", max_age=20) is None
+        assert cache.pop("long") == 2